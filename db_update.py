@@ -19,6 +19,8 @@
 #======================================================================
 
 
+import concurrent.futures
+import contextlib
 import functools
 import itertools
 import json
@@ -26,9 +28,11 @@ import os
 import re
 import sqlite3
 import sys
+import time
 
 import sqlalchemy.orm
 from sqlalchemy import or_, and_
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 
 # todo: need to set the EOS language to en, becasuse this assumes it's being run within an English context
@@ -39,6 +43,22 @@ JSON_DIR = os.path.join(ROOT_DIR, 'staticdata')
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 GAMEDATA_SCHEMA_VERSION = 4
+# Phobos dumps read during DB build, in order they are needed
+JSON_SOURCES = (
+    ('fsd_binary', 'types'),
+    ('fsd_binary', 'groups'),
+    ('fsd_binary', 'categories'),
+    ('fsd_binary', 'dogmaattributes'),
+    ('fsd_binary', 'typedogma'),
+    ('fsd_binary', 'dynamicitemattributes'),
+    ('fsd_binary', 'dogmaeffects'),
+    ('fsd_binary', 'dogmaunits'),
+    ('fsd_binary', 'marketgroups'),
+    ('fsd_binary', 'metagroups'),
+    ('fsd_lite', 'clonegrades'),
+    ('phobos', 'traits'),
+    ('phobos', 'metadata'),
+    ('fsd_binary', 'requiredskillsfortypes'))
 
 
 def db_needs_update():
@@ -81,34 +101,221 @@ def db_needs_update():
     return False
 
 
+def _getJsonPaths(minerName, jsonName):
+    paths = []
+    for i in itertools.count(0):
+        path = os.path.join(JSON_DIR, minerName, '{}.{}.json'.format(jsonName, i))
+        if not os.path.isfile(path):
+            break
+        paths.append(path)
+    return paths
+
+
+def _loadJson(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _getJsonExecutor():
+    """Return executor to parse JSON files with, in worker processes when possible"""
+    # Frozen builds cannot spawn copies of themselves to run workers
+    if not getattr(sys, 'frozen', False) and (os.cpu_count() or 1) > 1:
+        try:
+            return concurrent.futures.ProcessPoolExecutor(max_workers=min(os.cpu_count(), 4))
+        except (NotImplementedError, OSError):
+            pass
+    # Still lets parsing go in parallel with DB inserts in some measure
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+
+def _setBuildPragmas(dbapiConnection, connectionRecord):
+    # DB without schema version is rebuilt from scratch anyway, so there is
+    # no point to pay for crash safety during build
+    cursor = dbapiConnection.cursor()
+    cursor.execute('PRAGMA synchronous = OFF')
+    cursor.execute('PRAGMA journal_mode = MEMORY')
+    cursor.close()
+
+
+def findReplacements(eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData):
+    """
+    Find types which can replace each other, i.e. ones of the same group, with
+    the same skill requirements, effects and attributes.
+    Format: {type ID: set(type IDs)}
+    """
+    skillReqAttribs = {
+        182: 277,
+        183: 278,
+        184: 279,
+        1285: 1286,
+        1289: 1287,
+        1290: 1288}
+    skillReqAttribsFlat = set(skillReqAttribs.keys()).union(skillReqAttribs.values())
+    # Get data on type groups
+    # Format: {type ID: group ID}
+    typesGroups = {}
+    for row in eveTypesData:
+        typesGroups[row['typeID']] = row['groupID']
+    # Get data on item effects
+    # Format: {type ID: set(effect, IDs)}
+    typesEffects = {}
+    for row in dogmaTypeEffectsData:
+        typesEffects.setdefault(row['typeID'], set()).add(row['effectID'])
+    # Get data on type attributes
+    # Format: {type ID: {attribute ID: attribute value}}
+    typesNormalAttribs = {}
+    typesSkillAttribs = {}
+    for row in dogmaTypeAttributesData:
+        attributeID = row['attributeID']
+        if attributeID in skillReqAttribsFlat:
+            typeSkillAttribs = typesSkillAttribs.setdefault(row['typeID'], {})
+            typeSkillAttribs[row['attributeID']] = row['value']
+        # Ignore these attributes for comparison purposes
+        elif attributeID in (
+            # We do not need mass as it affects final ship stats only when carried by ship itself
+            # (and we're not going to replace ships), but it's wildly inconsistent for other items,
+            # which otherwise would be the same
+            4,  # mass
+            124,  # mainColor
+            162,  # radius
+            422,  # techLevel
+            633,  # metaLevel
+            1692,  # metaGroupID
+            1768  # typeColorScheme
+        ):
+            continue
+        else:
+            typeNormalAttribs = typesNormalAttribs.setdefault(row['typeID'], {})
+            typeNormalAttribs[row['attributeID']] = row['value']
+    # Get data on skill requirements
+    # Format: {type ID: {skill type ID: skill level}}
+    typesSkillReqs = {}
+    for typeID, typeAttribs in typesSkillAttribs.items():
+        typeSkillAttribs = typesSkillAttribs.get(typeID, {})
+        if not typeSkillAttribs:
+            continue
+        typeSkillReqs = typesSkillReqs.setdefault(typeID, {})
+        for skillreqTypeAttr, skillreqLevelAttr in skillReqAttribs.items():
+            try:
+                skillType = int(typeSkillAttribs[skillreqTypeAttr])
+                skillLevel = int(typeSkillAttribs[skillreqLevelAttr])
+            except (KeyError, ValueError):
+                continue
+            typeSkillReqs[skillType] = skillLevel
+    # Format: {group ID: category ID}
+    groupCategories = {}
+    for row in eveGroupsData:
+        groupCategories[row['groupID']] = row['categoryID']
+    # As EVE affects various types mostly depending on their group or skill requirements,
+    # we're going to group various types up this way. Attributes are part of the key too,
+    # so every group contains only types which are the same, and it takes single pass
+    # over types to find all of them
+    # Format: {(group ID, frozenset(skillreq, type, IDs), frozenset(type, effect, IDs),
+    # frozenset((attribute ID, attribute value) pairs)): [type IDs]}
+    groupedData = {}
+    for row in eveTypesData:
+        typeID = row['typeID']
+        # Ignore items outside of categories we need
+        if groupCategories[typesGroups[typeID]] not in (
+            6,  # Ship
+            7,  # Module
+            8,  # Charge
+            18,  # Drone
+            20,  # Implant
+            22,  # Deployable
+            23,  # Starbase
+            32,  # Subsystem
+            35,  # Decryptors
+            65,  # Structure
+            66,  # Structure Module
+            87,  # Fighter
+        ):
+            continue
+        typeAttribs = typesNormalAttribs.get(typeID, {})
+        # Ignore items w/o attributes
+        if not typeAttribs:
+            continue
+        # We need only skill types, not levels for keys
+        typeSkillreqs = frozenset(typesSkillReqs.get(typeID, {}))
+        typeGroup = typesGroups[typeID]
+        typeEffects = frozenset(typesEffects.get(typeID, ()))
+        typeAttribsKey = frozenset(typeAttribs.items())
+        groupData = groupedData.setdefault((typeGroup, typeSkillreqs, typeEffects, typeAttribsKey), [])
+        groupData.append(typeID)
+    # Format: {type ID: set(type IDs)}
+    replacements = {}
+    # Every type in composed group can be replaced by any other in it
+    for groupData in groupedData.values():
+        if len(groupData) < 2:
+            continue
+        for typeID in groupData:
+            replacements[typeID] = set(groupData).difference((typeID,))
+    return replacements
+
+
 def update_db():
 
     print('Building gamedata DB...')
+    buildStart = time.perf_counter()
+    timings = []
 
     if os.path.isfile(DB_PATH):
         os.remove(DB_PATH)
 
     import eos.db
+
+    # Build can run within pyfa process, which keeps using the DB afterwards
+    sqlalchemy.event.listen(eos.db.gamedata_engine, 'connect', _setBuildPragmas)
+    try:
+        _buildDb(timings)
+    finally:
+        sqlalchemy.event.remove(eos.db.gamedata_engine, 'connect', _setBuildPragmas)
+        # Pooled connections keep pragmas they were opened with
+        eos.db.gamedata_engine.dispose()
+
+    print('stage timings:')
+    for name, duration in timings:
+        print('  {}: {:.2f}s'.format(name, duration))
+    print('done in {:.2f}s'.format(time.perf_counter() - buildStart))
+
+
+def _buildDb(timings):
+    import eos.db
     import eos.gamedata
     import eos.config
 
-    # Create the database tables
-    eos.db.gamedata_meta.create_all()
+    # Drop connection session might have opened when DB did not exist yet
+    eos.db.gamedata_session.rollback()
+
+    # Create the database tables; indexes are created after data is loaded,
+    # which is much faster than keeping them up to date on every insert
+    for table in eos.db.gamedata_meta.sorted_tables:
+        eos.db.gamedata_engine.execute(CreateTable(table))
+
+    executor = _getJsonExecutor()
+    # Parse all files up front in background, build consumes them in order
+    # Format: {(miner name, JSON name): [future of parsed file]}
+    jsonFutures = {
+        source: [executor.submit(_loadJson, path) for path in _getJsonPaths(*source)]
+        for source in JSON_SOURCES}
+
+    @contextlib.contextmanager
+    def _stage(name):
+        start = time.perf_counter()
+        yield
+        timings.append((name, time.perf_counter() - start))
 
     def _readData(minerName, jsonName, keyIdName=None):
         compiled_data = None
-        for i in itertools.count(0):
-            try:
-                with open(os.path.join(JSON_DIR, minerName, '{}.{}.json'.format(jsonName, i)), encoding='utf-8') as f:
-                    rawData = json.load(f)
-                    if i == 0:
-                        compiled_data = {} if type(rawData) == dict else []
-                    if type(rawData) == dict:
-                        compiled_data.update(rawData)
-                    else:
-                        compiled_data.extend(rawData)
-            except FileNotFoundError:
-                break
+        # Release parsed data once it has been used
+        for i, future in enumerate(jsonFutures.pop((minerName, jsonName))):
+            rawData = future.result()
+            if i == 0:
+                compiled_data = {} if type(rawData) == dict else []
+            if type(rawData) == dict:
+                compiled_data.update(rawData)
+            else:
+                compiled_data.extend(rawData)
 
         if not keyIdName:
             return compiled_data
@@ -121,16 +328,52 @@ def update_db():
             data.append(row)
         return data
 
+    def _getColumnKeys(cls):
+        """Map names of attributes of gamedata class to keys of columns they are stored in"""
+        mapper = sqlalchemy.inspect(cls)
+        columnKeys = {}
+        for prop in mapper.column_attrs:
+            column = prop.columns[0]
+            if column.table is mapper.local_table:
+                columnKeys[prop.key] = column.key
+        for synonym in mapper.synonyms:
+            if synonym.name in columnKeys:
+                columnKeys[synonym.key] = columnKeys[synonym.name]
+        return columnKeys
+
+    def _insertRows(table, rows):
+        # Executemany needs the same fields in all rows; group rows instead of
+        # filling the gaps, so that missing fields get column defaults
+        for _, group in itertools.groupby(rows, key=lambda r: frozenset(r)):
+            eos.db.gamedata_session.execute(table.insert(), list(group))
+
     def _addRows(data, cls, fieldMap=None):
         if fieldMap is None:
             fieldMap = {}
+        columnKeys = _getColumnKeys(cls)
+        rows = []
         for row in data:
-            instance = cls()
+            dbRow = {}
             for k, v in row.items():
+                columnKey = columnKeys.get(fieldMap.get(k, k))
+                # Fields we have no columns for are not stored anyway
+                if columnKey is None:
+                    continue
                 if isinstance(v, str):
                     v = v.strip()
-                setattr(instance, fieldMap.get(k, k), v)
-            eos.db.gamedata_session.add(instance)
+                dbRow[columnKey] = v
+            rows.append(dbRow)
+        _insertRows(sqlalchemy.inspect(cls).local_table, rows)
+
+    def _updateItems(fieldName, valuesByTypeID):
+        if not valuesByTypeID:
+            return
+        table = sqlalchemy.inspect(eos.gamedata.Item).local_table
+        statement = table.update().where(
+            table.c.typeID == sqlalchemy.bindparam('_typeID')
+        ).values({fieldName: sqlalchemy.bindparam('_value')})
+        eos.db.gamedata_session.execute(
+            statement, [{'_typeID': typeID, '_value': value} for typeID, value in valuesByTypeID.items()])
 
     def processEveTypes():
         print('processing evetypes')
@@ -206,9 +449,9 @@ def update_db():
         }
         _addRows(data, eos.gamedata.AttributeInfo, fieldMap=map)
 
-    def processDogmaTypeAttributes(eveTypesData):
+    def processDogmaTypeAttributes(eveTypesData, typeDogmaData):
         print('processing dogmatypeattributes')
-        data = _readData('fsd_binary', 'typedogma', keyIdName='typeID')
+        data = typeDogmaData
         eveTypeIds = set(r['typeID'] for r in eveTypesData)
         newData = []
         seenKeys = set()
@@ -237,34 +480,35 @@ def update_db():
     def processDynamicItemAttributes():
         print('processing dynamicitemattributes')
         data = _readData('fsd_binary', 'dynamicitemattributes')
+        mutaRows = []
+        mutaItemRows = []
+        mutaAttrRows = []
         for mutaID, mutaData in data.items():
-            muta = eos.gamedata.DynamicItem()
-            muta.typeID = mutaID
-            muta.resultingTypeID = mutaData['inputOutputMapping'][0]['resultingType']
-            eos.db.gamedata_session.add(muta)
+            mutaRows.append({
+                'typeID': mutaID,
+                'resultingTypeID': mutaData['inputOutputMapping'][0]['resultingType']})
 
             for x in mutaData['inputOutputMapping'][0]['applicableTypes']:
-                item = eos.gamedata.DynamicItemItem()
-                item.typeID = mutaID
-                item.applicableTypeID = x
-                eos.db.gamedata_session.add(item)
+                mutaItemRows.append({'typeID': mutaID, 'applicableTypeID': x})
 
             for attrID, attrData in mutaData['attributeIDs'].items():
-                attr = eos.gamedata.DynamicItemAttribute()
-                attr.typeID = mutaID
-                attr.attributeID = attrID
-                attr.min = attrData['min']
-                attr.max = attrData['max']
-                eos.db.gamedata_session.add(attr)
+                mutaAttrRows.append({
+                    'typeID': mutaID,
+                    'attributeID': attrID,
+                    'min': attrData['min'],
+                    'max': attrData['max']})
+        _addRows(mutaRows, eos.gamedata.DynamicItem)
+        _addRows(mutaItemRows, eos.gamedata.DynamicItemItem)
+        _addRows(mutaAttrRows, eos.gamedata.DynamicItemAttribute)
 
     def processDogmaEffects():
         print('processing dogmaeffects')
         data = _readData('fsd_binary', 'dogmaeffects', keyIdName='effectID')
         _addRows(data, eos.gamedata.Effect, fieldMap={'resistanceAttributeID': 'resistanceID'})
 
-    def processDogmaTypeEffects(eveTypesData):
+    def processDogmaTypeEffects(eveTypesData, typeDogmaData):
         print('processing dogmatypeeffects')
-        data = _readData('fsd_binary', 'typedogma', keyIdName='typeID')
+        data = typeDogmaData
         eveTypeIds = set(r['typeID'] for r in eveTypesData)
         newData = []
         for typeData in data:
@@ -328,13 +572,12 @@ def update_db():
             raise Exception('Alpha Clone processing failed')
 
         tmp = []
+        cloneParents = []
         for row in newData:
             if row['alphaCloneID'] not in tmp:
-                cloneParent = eos.gamedata.AlphaClone()
-                setattr(cloneParent, 'alphaCloneID', row['alphaCloneID'])
-                setattr(cloneParent, 'alphaCloneName', row['alphaCloneName'])
-                eos.db.gamedata_session.add(cloneParent)
+                cloneParents.append({'alphaCloneID': row['alphaCloneID'], 'alphaCloneName': row['alphaCloneName']})
                 tmp.append(row['alphaCloneID'])
+        _addRows(cloneParents, eos.gamedata.AlphaClone)
         _addRows(newData, eos.gamedata.AlphaCloneSkill)
 
     def processTraits():
@@ -402,134 +645,16 @@ def update_db():
             for skillTypeID, skillLevel in composeReqSkills(skillreqData).items():
                 reqsByItem.setdefault(typeID, {})[skillTypeID] = skillLevel
                 itemsByReq.setdefault(skillTypeID, {})[typeID] = skillLevel
-        for item in eos.db.gamedata_session.query(eos.gamedata.Item).all():
-            if item.typeID in reqsByItem:
-                item.reqskills = json.dumps(reqsByItem[item.typeID])
-            if item.typeID in itemsByReq:
-                item.requiredfor = json.dumps(itemsByReq[item.typeID])
+        _updateItems('reqskills', {typeID: json.dumps(reqs) for typeID, reqs in reqsByItem.items()})
+        _updateItems('requiredfor', {typeID: json.dumps(items) for typeID, items in itemsByReq.items()})
 
     def processReplacements(eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData):
         print('finding item replacements')
-
-        def compareAttrs(attrs1, attrs2):
-            # Consider items as different if they have no attrs
-            if len(attrs1) == 0 and len(attrs2) == 0:
-                return False
-            if set(attrs1) != set(attrs2):
-                return False
-            if all(attrs1[aid] == attrs2[aid] for aid in attrs1):
-                return True
-            return False
-
-        skillReqAttribs = {
-            182: 277,
-            183: 278,
-            184: 279,
-            1285: 1286,
-            1289: 1287,
-            1290: 1288}
-        skillReqAttribsFlat = set(skillReqAttribs.keys()).union(skillReqAttribs.values())
-        # Get data on type groups
-        # Format: {type ID: group ID}
-        typesGroups = {}
-        for row in eveTypesData:
-            typesGroups[row['typeID']] = row['groupID']
-        # Get data on item effects
-        # Format: {type ID: set(effect, IDs)}
-        typesEffects = {}
-        for row in dogmaTypeEffectsData:
-            typesEffects.setdefault(row['typeID'], set()).add(row['effectID'])
-        # Get data on type attributes
-        # Format: {type ID: {attribute ID: attribute value}}
-        typesNormalAttribs = {}
-        typesSkillAttribs = {}
-        for row in dogmaTypeAttributesData:
-            attributeID = row['attributeID']
-            if attributeID in skillReqAttribsFlat:
-                typeSkillAttribs = typesSkillAttribs.setdefault(row['typeID'], {})
-                typeSkillAttribs[row['attributeID']] = row['value']
-            # Ignore these attributes for comparison purposes
-            elif attributeID in (
-                # We do not need mass as it affects final ship stats only when carried by ship itself
-                # (and we're not going to replace ships), but it's wildly inconsistent for other items,
-                # which otherwise would be the same
-                4,  # mass
-                124,  # mainColor
-                162,  # radius
-                422,  # techLevel
-                633,  # metaLevel
-                1692,  # metaGroupID
-                1768  # typeColorScheme
-            ):
-                continue
-            else:
-                typeNormalAttribs = typesNormalAttribs.setdefault(row['typeID'], {})
-                typeNormalAttribs[row['attributeID']] = row['value']
-        # Get data on skill requirements
-        # Format: {type ID: {skill type ID: skill level}}
-        typesSkillReqs = {}
-        for typeID, typeAttribs in typesSkillAttribs.items():
-            typeSkillAttribs = typesSkillAttribs.get(typeID, {})
-            if not typeSkillAttribs:
-                continue
-            typeSkillReqs = typesSkillReqs.setdefault(typeID, {})
-            for skillreqTypeAttr, skillreqLevelAttr in skillReqAttribs.items():
-                try:
-                    skillType = int(typeSkillAttribs[skillreqTypeAttr])
-                    skillLevel = int(typeSkillAttribs[skillreqLevelAttr])
-                except (KeyError, ValueError):
-                    continue
-                typeSkillReqs[skillType] = skillLevel
-        # Format: {group ID: category ID}
-        groupCategories = {}
-        for row in eveGroupsData:
-            groupCategories[row['groupID']] = row['categoryID']
-        # As EVE affects various types mostly depending on their group or skill requirements,
-        # we're going to group various types up this way
-        # Format: {(group ID, frozenset(skillreq, type, IDs), frozenset(type, effect, IDs): [type ID, {attribute ID: attribute value}]}
-        groupedData = {}
-        for row in eveTypesData:
-            typeID = row['typeID']
-            # Ignore items outside of categories we need
-            if groupCategories[typesGroups[typeID]] not in (
-                6,  # Ship
-                7,  # Module
-                8,  # Charge
-                18,  # Drone
-                20,  # Implant
-                22,  # Deployable
-                23,  # Starbase
-                32,  # Subsystem
-                35,  # Decryptors
-                65,  # Structure
-                66,  # Structure Module
-                87,  # Fighter
-            ):
-                continue
-            typeAttribs = typesNormalAttribs.get(typeID, {})
-            # Ignore items w/o attributes
-            if not typeAttribs:
-                continue
-            # We need only skill types, not levels for keys
-            typeSkillreqs = frozenset(typesSkillReqs.get(typeID, {}))
-            typeGroup = typesGroups[typeID]
-            typeEffects = frozenset(typesEffects.get(typeID, ()))
-            groupData = groupedData.setdefault((typeGroup, typeSkillreqs, typeEffects), [])
-            groupData.append((typeID, typeAttribs))
-        # Format: {type ID: set(type IDs)}
-        replacements = {}
-        # Now, go through composed groups and for every item within it
-        # find items which are the same
-        for groupData in groupedData.values():
-            for type1, type2 in itertools.combinations(groupData, 2):
-                if compareAttrs(type1[1], type2[1]):
-                    replacements.setdefault(type1[0], set()).add(type2[0])
-                    replacements.setdefault(type2[0], set()).add(type1[0])
-        # Update DB session with data we generated
-        for item in eos.db.gamedata_session.query(eos.gamedata.Item).all():
-            itemReplacements = replacements.get(item.typeID)
-            if itemReplacements is not None:
-                item.replacements = ','.join('{}'.format(tid) for tid in sorted(itemReplacements))
+        replacements = findReplacements(eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData)
+        # Update DB with data we generated
+        _updateItems('replacements', {
+            typeID: ','.join('{}'.format(tid) for tid in sorted(typeReplacements))
+            for typeID, typeReplacements in replacements.items()})
 
     def processImplantSets(eveTypesData):
         print('composing implant sets')
@@ -563,34 +688,57 @@ def update_db():
             data.append(row)
         _addRows(data, eos.gamedata.ImplantSet)
 
-    eveTypesData = processEveTypes()
-    eveGroupsData = processEveGroups()
-    processEveCategories()
-    processDogmaAttributes()
-    dogmaTypeAttributesData = processDogmaTypeAttributes(eveTypesData)
-    processDynamicItemAttributes()
-    processDogmaEffects()
-    dogmaTypeEffectsData = processDogmaTypeEffects(eveTypesData)
-    processDogmaUnits()
-    processMarketGroups()
-    processMetaGroups()
-    processCloneGrades()
-    processTraits()
-    processMetadata()
-
-    eos.db.gamedata_session.flush()
-    processReqSkills(eveTypesData)
-    processReplacements(eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData)
-    processImplantSets(eveTypesData)
+    with executor:
+        with _stage('evetypes'):
+            eveTypesData = processEveTypes()
+        with _stage('evegroups'):
+            eveGroupsData = processEveGroups()
+        with _stage('evecategories'):
+            processEveCategories()
+        with _stage('dogmaattributes'):
+            processDogmaAttributes()
+        with _stage('typedogma'):
+            typeDogmaData = _readData('fsd_binary', 'typedogma', keyIdName='typeID')
+            dogmaTypeAttributesData = processDogmaTypeAttributes(eveTypesData, typeDogmaData)
+            dogmaTypeEffectsData = processDogmaTypeEffects(eveTypesData, typeDogmaData)
+            del typeDogmaData
+        with _stage('dynamicitemattributes'):
+            processDynamicItemAttributes()
+        with _stage('dogmaeffects'):
+            processDogmaEffects()
+        with _stage('dogmaunits'):
+            processDogmaUnits()
+        with _stage('marketgroups'):
+            processMarketGroups()
+        with _stage('metagroups'):
+            processMetaGroups()
+        with _stage('clonegrades'):
+            processCloneGrades()
+        with _stage('traits'):
+            processTraits()
+        with _stage('metadata'):
+            processMetadata()
+        with _stage('requiredskillsfortypes'):
+            processReqSkills(eveTypesData)
+
+    with _stage('replacements'):
+        processReplacements(eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData)
+    with _stage('implantsets'):
+        processImplantSets(eveTypesData)
 
     # Add schema version to prevent further updates
-    metadata_schema_version = eos.gamedata.MetaData()
-    metadata_schema_version.field_name = 'schema_version'
-    metadata_schema_version.field_value = GAMEDATA_SCHEMA_VERSION
-    eos.db.gamedata_session.add(metadata_schema_version)
-
-    eos.db.gamedata_session.flush()
-
+    _addRows([{'field_name': 'schema_version', 'field_value': GAMEDATA_SCHEMA_VERSION}], eos.gamedata.MetaData)
+
+    with _stage('commit'):
+        eos.db.gamedata_session.commit()
+    with _stage('indexes'):
+        print('creating indexes')
+        for table in eos.db.gamedata_meta.sorted_tables:
+            for index in table.indexes:
+                eos.db.gamedata_session.execute(CreateIndex(index))
+        eos.db.gamedata_session.commit()
+
+    postProcessingStart = time.perf_counter()
     # CCP still has 5 subsystems assigned to T3Cs, even though only 4 are available / usable. They probably have some
     # old legacy requirement or assumption that makes it difficult for them to change this value in the data. But for
     # pyfa, we can do it here as a post-processing step
@@ -798,9 +946,9 @@ def update_db():
     # hardcodeCybele()
 
     eos.db.gamedata_session.commit()
-    eos.db.gamedata_engine.execute('VACUUM')
-
-    print('done')
+    timings.append(('post-processing', time.perf_counter() - postProcessingStart))
+    with _stage('vacuum'):
+        eos.db.gamedata_engine.execute('VACUUM')
 
 
 if __name__ == '__main__':
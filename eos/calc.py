@@ -20,10 +20,49 @@
 
 import math
 
+import numpy
+
+
+# Stacking penalty coefficient for n-th strongest modifier in a chain:
+# exp(-(n ** 2) / 7.1289). Chains rarely get longer than a dozen modifiers,
+# longer ones get their coefficients calculated when needed
+PENALTY_COEFFICIENTS = tuple(math.exp(- i ** 2 / 7.1289) for i in range(32))
+# Chains at least this long are applied via numpy
+VECTORIZED_CHAIN_LENGTH = 32
+
+
+def getPenaltyCoefficients(length):
+    if length <= len(PENALTY_COEFFICIENTS):
+        return PENALTY_COEFFICIENTS
+    return PENALTY_COEFFICIENTS + tuple(math.exp(- i ** 2 / 7.1289) for i in range(len(PENALTY_COEFFICIENTS), length))
+
+
+def splitPenalizedChain(multipliers):
+    """
+    Split multipliers of stacking penalty group into bonuses and penalties,
+    as they are penalized separately, and sort each of them so that the most
+    significant multiplier goes first and takes the smallest penalty.
+    """
+    bonuses = sorted([m for m in multipliers if m > 1], reverse=True)
+    penalties = sorted([m for m in multipliers if m < 1])
+    return bonuses, penalties
+
+
+def applyPenalizedChain(val, chain):
+    """
+    Apply sorted chain of stacking penalized multipliers to value. The first
+    multiplier is not penalized at all, any after the first one is penalized
+    according to 1 + (multiplier - 1) * exp(- i ** 2 / 7.1289)
+    """
+    length = len(chain)
+    if length >= VECTORIZED_CHAIN_LENGTH:
+        coefficients = numpy.array(getPenaltyCoefficients(length)[:length])
+        return val * float(numpy.prod(1 + (numpy.array(chain) - 1) * coefficients))
+    for bonus, coefficient in zip(chain, getPenaltyCoefficients(length)):
+        val *= 1 + (bonus - 1) * coefficient
+    return val
+
 
-# Just copy-paste penalization chain calculation code (with some modifications,
-# as multipliers arrive in different form) in here to not make actual attribute
-# calculations slower than they already are due to extra function calls
 def calculateMultiplier(multipliers):
     """
     multipliers: dictionary in format:
@@ -31,22 +70,8 @@ def calculateMultiplier(multipliers):
     """
     val = 1
     for penalizedMultipliers in multipliers.values():
-        # A quick explanation of how this works:
-        # 1: Bonuses and penalties are calculated seperately, so we'll have to filter each of them
-        l1 = [v[0] for v in penalizedMultipliers if v[0] > 1]
-        l2 = [v[0] for v in penalizedMultipliers if v[0] < 1]
-        # 2: The most significant bonuses take the smallest penalty,
-        # This means we'll have to sort
-        abssort = lambda _val: -abs(_val - 1)
-        l1.sort(key=abssort)
-        l2.sort(key=abssort)
-        # 3: The first module doesn't get penalized at all
-        # Any module after the first takes penalties according to:
-        # 1 + (multiplier - 1) * math.exp(- math.pow(i, 2) / 7.1289)
-        for l in (l1, l2):
-            for i in range(len(l)):
-                bonus = l[i]
-                val *= 1 + (bonus - 1) * math.exp(- i ** 2 / 7.1289)
+        for chain in splitPenalizedChain([v[0] for v in penalizedMultipliers]):
+            val = applyPenalizedChain(val, chain)
     return val
 
 
@@ -65,6 +90,17 @@ def calculateRangeFactor(srcOptimalRange, srcFalloffRange, distance, restrictedR
         return 0
 
 
+def calculateRangeFactorArray(srcOptimalRange, srcFalloffRange, distances, restrictedRange=True):
+    """Same as calculateRangeFactor, but for numpy array of distances"""
+    distances = numpy.asarray(distances, dtype=float)
+    if srcFalloffRange > 0:
+        factors = 0.5 ** ((numpy.maximum(0, distances - srcOptimalRange) / srcFalloffRange) ** 2)
+        if restrictedRange:
+            factors[distances > srcOptimalRange + 3 * srcFalloffRange] = 0
+        return factors
+    return numpy.where(distances <= srcOptimalRange, 1.0, 0.0)
+
+
 def calculateLockTime(srcScanRes, tgtSigRadius):
     if not srcScanRes or not tgtSigRadius:
         return None
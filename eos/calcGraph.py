@@ -0,0 +1,364 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import threading
+from itertools import chain
+
+from logbook import Logger
+
+
+pyfalog = Logger(__name__)
+
+
+RUN_TIMES = ("early", "normal", "late")
+
+
+class _State(threading.local):
+    # Graph which is currently recording or replaying effects in this thread.
+    # Calculation of a fit runs in single thread, so attribute dictionaries
+    # and handled lists report to it directly instead of having to find out
+    # which fit they belong to; other threads can calculate other fits.
+    active = None
+
+
+state = _State()
+
+
+class CalcGraph:
+    """
+    Records which attributes every effect source (module, skill, ship etc.) has
+    read and written during local fit calculation. When state or charge of some
+    fit items changes, the graph is used to find out which attributes depend on
+    the change, and only sources affecting those attributes are re-run.
+
+    Only local calculations without projected or command fits are recorded;
+    anything graph does not know how to replay makes it invalid, and callers
+    have to fall back to full calculation.
+    """
+
+    # Graph tracks reads and writes of attributes, not operations themselves
+    recordsOperations = False
+
+    def __init__(self, fit):
+        self.fit = fit
+        self.valid = True
+        self.__runTime = None
+        self.__source = None
+        # Run order of sources, as list of (run time, source ID)
+        self.__order = []
+        self.__ordered = set()
+        # Strong references, so that IDs used as keys stay unique
+        self.__sources = {}
+        self.__dicts = {}
+        # {source ID: {run time: {(dict ID, attr name)}}}
+        self.__writes = {}
+        # {source ID: {(dict ID, attr name)}}
+        self.__reads = {}
+        # Reverse indices
+        # {(dict ID, attr name): {source ID}}
+        self.__writers = {}
+        self.__readers = {}
+        # {dict ID: {source ID}}
+        self.__dictWriters = {}
+        self.__dictReaders = {}
+        # {list ID: {source ID}}, sources which have filtered charges in the list
+        self.__chargeScans = {}
+        # Replay state
+        self.__probe = None
+        self.__mask = None
+        self.__maskDicts = None
+        self.__dirtySources = None
+        self.__escaped = False
+        self.__fitSignature = None
+        self.__itemSignatures = {}
+
+    # Recording interface, used by fit, attribute dictionaries and handled lists
+
+    def setRunTime(self, runTime):
+        self.__runTime = runTime
+
+    def setSource(self, source):
+        if source is None:
+            return
+        sourceID = id(source)
+        self.__source = sourceID
+        if self.__probe is not None or self.__mask is not None:
+            return
+        self.__sources[sourceID] = source
+        key = (self.__runTime, sourceID)
+        if key not in self.__ordered:
+            self.__ordered.add(key)
+            self.__order.append(key)
+
+    def recordWrite(self, attrDict, key):
+        """Register modification; returns False if modification should not be applied"""
+        dictID = id(attrDict)
+        pair = (dictID, key)
+        if self.__probe is not None:
+            self.__probe.add(pair)
+            return False
+        sourceID = self.__source
+        self.__dicts[dictID] = attrDict
+        self.__writes.setdefault(sourceID, {}).setdefault(self.__runTime, set()).add(pair)
+        self.__writers.setdefault(pair, set()).add(sourceID)
+        self.__dictWriters.setdefault(dictID, set()).add(sourceID)
+        if self.__mask is None:
+            return True
+        if pair in self.__mask or dictID in self.__maskDicts:
+            return True
+        # Source which is re-run due to changed inputs attempts to modify
+        # something it did not modify before - results of it can't be merged
+        if sourceID in self.__dirtySources:
+            self.__escaped = True
+        return False
+
+    def recordRead(self, attrDict, key):
+        if self.__probe is not None:
+            return
+        dictID = id(attrDict)
+        pair = (dictID, key)
+        sourceID = self.__source
+        self.__dicts[dictID] = attrDict
+        self.__reads.setdefault(sourceID, set()).add(pair)
+        self.__readers.setdefault(pair, set()).add(sourceID)
+        self.__dictReaders.setdefault(dictID, set()).add(sourceID)
+
+    def recordChargeScan(self, handledList):
+        if self.__probe is not None:
+            return
+        self.__chargeScans.setdefault(id(handledList), set()).add(self.__source)
+
+    def invalidate(self):
+        self.valid = False
+
+    # Snapshot of fit state graph was built for
+
+    def finalize(self):
+        """Called once recording calculation is over"""
+        self.__runTime = None
+        self.__source = None
+        self.__fitSignature = self.__getFitSignature()
+        self.__itemSignatures = {id(i): self.__getItemSignature(i) for i in self.__iterItems()}
+
+    def __iterItems(self):
+        fit = self.fit
+        for item in chain(
+            fit.modules, fit.drones, fit.fighters, fit.appliedImplants, fit.boosters,
+            fit.projectedModules, fit.projectedDrones, fit.projectedFighters
+        ):
+            # Dummies do not run any effects, and get added and removed when
+            # fit is filled, so just ignore them
+            if getattr(item, 'isEmpty', False):
+                continue
+            yield item
+
+    def __getFitSignature(self):
+        fit = self.fit
+        from eos.modifiedAttributeDict import ModifiedAttributeDict
+        character = fit.character
+        return (
+            id(fit.ship), id(fit.mode), id(character), tuple(s.level for s in character.skills),
+            fit.implantLocation, fit.getSystemSecurity(), fit.pilotSecurity, id(fit.damagePattern),
+            ModifiedAttributeDict.overrides_enabled,
+            tuple(id(i) for i in self.__iterItems()))
+
+    @staticmethod
+    def __getItemSignature(item):
+        """
+        Returns tuple of two signatures. First covers things which change item
+        attributes as a whole (charge, mutations), second covers things which
+        change only which effects item runs (state, amount, spool etc.)
+        """
+        mutators = getattr(item, 'mutators', None) or {}
+        wholeSig = (
+            getattr(item, 'chargeID', None),
+            tuple(sorted((k, m.value) for k, m in mutators.items())))
+        stateSig = (
+            getattr(item, 'state', None),
+            getattr(item, 'active', None),
+            getattr(item, 'amount', None),
+            getattr(item, 'amountActive', None),
+            getattr(item, 'spoolType', None),
+            getattr(item, 'spoolAmount', None),
+            id(getattr(item, 'rahPatternOverride', None)),
+            tuple(a.active for a in getattr(item, 'abilities', ())),
+            tuple(se.active for se in getattr(item, 'sideEffects', ())))
+        return wholeSig, stateSig
+
+    # Incremental update
+
+    def update(self):
+        """
+        Bring attributes of the fit up to date with its current state. Returns
+        False if the change can't be handled incrementally; in this case fit
+        state is undefined and it has to be calculated from scratch.
+        """
+        if not self.valid or self.__fitSignature != self.__getFitSignature():
+            return False
+        stateChanged = []
+        wholeChanged = []
+        for item in self.__iterItems():
+            oldWholeSig, oldStateSig = self.__itemSignatures[id(item)]
+            newWholeSig, newStateSig = self.__getItemSignature(item)
+            if newWholeSig != oldWholeSig:
+                wholeChanged.append(item)
+            elif newStateSig != oldStateSig:
+                stateChanged.append(item)
+        if not stateChanged and not wholeChanged:
+            return True
+        pyfalog.debug("Incremental update of {}: {} items changed state, {} changed completely",
+                      repr(self.fit), len(stateChanged), len(wholeChanged))
+        changedSourceIDs = set(id(i) for i in chain(stateChanged, wholeChanged))
+        if wholeChanged:
+            # Charges could have changed, and effects look them up via indices
+            self.fit.clearFilterIndexes()
+
+        # Find out what changed items would modify now
+        self.__probe = probed = set()
+        previous = state.active
+        state.active = self
+        try:
+            for runTime in RUN_TIMES:
+                self.__runTime = runTime
+                for item in chain(stateChanged, wholeChanged):
+                    self.fit.register(item)
+                    item.calculateModifiedAttributes(self.fit, runTime)
+        finally:
+            state.active = previous
+            self.__probe = None
+        # Changed items now store data on fit directly; graph can't undo or
+        # replay that, and the probe has already stored it once
+        if self.fit.hasUntrackedEffectData():
+            pyfalog.debug("Incremental update of {} failed, changed items store data on fit", repr(self.fit))
+            return False
+
+        # Everything changed items modified before and will modify now is dirty,
+        # as well as everything else which depends on dirty values
+        dirtySources = set(changedSourceIDs)
+        dirtyPairs = set(probed)
+        for sourceID in changedSourceIDs:
+            for pairs in self.__writes.get(sourceID, {}).values():
+                dirtyPairs.update(pairs)
+        dirtyDicts = set()
+        scanners = set()
+        for item in wholeChanged:
+            for attrDict in (getattr(item, 'itemModifiedAttributes', None), getattr(item, 'chargeModifiedAttributes', None)):
+                if attrDict is not None:
+                    self.__dicts[id(attrDict)] = attrDict
+                    dirtyDicts.add(id(attrDict))
+        if wholeChanged:
+            for listID, sourceIDs in self.__chargeScans.items():
+                scanners.update(sourceIDs)
+        queue = list(dirtyPairs)
+        for dictID in dirtyDicts:
+            for sourceID in self.__dictReaders.get(dictID, ()):
+                queue.extend(self.__markDirty(sourceID, dirtySources, dirtyPairs))
+        while queue:
+            pair = queue.pop()
+            for sourceID in self.__readers.get(pair, ()):
+                queue.extend(self.__markDirty(sourceID, dirtySources, dirtyPairs))
+
+        # Sources which have to be re-run: dirty ones, and those contributing to
+        # dirty values (with their other modifications masked out)
+        replaySources = set(dirtySources)
+        replaySources.update(scanners)
+        for pair in dirtyPairs:
+            replaySources.update(self.__writers.get(pair, ()))
+        for dictID in dirtyDicts:
+            replaySources.update(self.__dictWriters.get(dictID, ()))
+        replaySources = {s for s in replaySources if s in self.__sources}
+
+        # Drop stale data
+        for sourceID in replaySources:
+            self.__forgetSource(sourceID)
+        clearMap = {}
+        for dictID, key in dirtyPairs:
+            if dictID not in dirtyDicts:
+                clearMap.setdefault(dictID, set()).add(key)
+        for dictID, keys in clearMap.items():
+            self.__dicts[dictID].clearAttributes(keys)
+        for dictID in dirtyDicts:
+            self.__dicts[dictID].clear()
+        for owner in self.__getOwners(set(clearMap).union(dirtyDicts)):
+            owner.clearCalculatedStats()
+        # Effects set some data on items directly, it is set again on replay
+        for sourceID in replaySources:
+            clearEffectData = getattr(self.__sources[sourceID], 'clearEffectData', None)
+            if clearEffectData is not None:
+                clearEffectData()
+
+        # And replay, preserving original order
+        self.__mask = dirtyPairs
+        self.__maskDicts = dirtyDicts
+        self.__dirtySources = dirtySources
+        self.__escaped = False
+        state.active = self
+        try:
+            for runTime, sourceID in self.__order:
+                if sourceID not in replaySources:
+                    continue
+                self.__runTime = runTime
+                source = self.__sources[sourceID]
+                self.fit.register(source)
+                source.calculateModifiedAttributes(self.fit, runTime)
+        finally:
+            state.active = previous
+            self.__mask = None
+            self.__maskDicts = None
+            self.__dirtySources = None
+        if self.__escaped or not self.valid or self.fit.hasUntrackedEffectData():
+            pyfalog.debug("Incremental update of {} failed, full calculation needed", repr(self.fit))
+            return False
+        self.finalize()
+        return True
+
+    def __markDirty(self, sourceID, dirtySources, dirtyPairs):
+        """Mark source as dirty, return attributes which became dirty because of that"""
+        if sourceID in dirtySources:
+            return ()
+        dirtySources.add(sourceID)
+        newPairs = []
+        for pairs in self.__writes.get(sourceID, {}).values():
+            for pair in pairs:
+                if pair not in dirtyPairs:
+                    dirtyPairs.add(pair)
+                    newPairs.append(pair)
+        return newPairs
+
+    def __forgetSource(self, sourceID):
+        for pairs in self.__writes.pop(sourceID, {}).values():
+            for pair in pairs:
+                self.__writers.get(pair, set()).discard(sourceID)
+                self.__dictWriters.get(pair[0], set()).discard(sourceID)
+        for pair in self.__reads.pop(sourceID, ()):
+            self.__readers.get(pair, set()).discard(sourceID)
+            self.__dictReaders.get(pair[0], set()).discard(sourceID)
+        for sourceIDs in self.__chargeScans.values():
+            sourceIDs.discard(sourceID)
+
+    def __getOwners(self, dictIDs):
+        fit = self.fit
+        for item in chain((fit.ship, fit.mode), self.__iterItems()):
+            if item is None or not hasattr(item, 'clearCalculatedStats'):
+                continue
+            for attrDict in (getattr(item, 'itemModifiedAttributes', None), getattr(item, 'chargeModifiedAttributes', None)):
+                if attrDict is not None and id(attrDict) in dictIDs:
+                    yield item
+                    break
@@ -50,6 +50,12 @@ class CapSimulator:
         self.optimize_repeats = True
         self.result_optimized_repeats = None
 
+        # once activation pattern of the first period is known, replay it
+        # instead of going through activation queue? Only possible when there
+        # are no cap injectors, as their use depends on capacitor level
+        self.replay_periods = True
+        self.result_replayed_periods = None
+
     def scale_activation(self, duration, capNeed):
         for res in self.scale_resolutions:
             mod = duration % res
@@ -78,6 +84,8 @@ class CapSimulator:
         self.state = []
         self.saved_changes_internal = {}
         self.result_optimized_repeats = False
+        self.result_replayed_periods = 0
+        self.has_injectors = False
         mods = {}
         period = 1
         disable_period = False
@@ -102,12 +110,13 @@ class CapSimulator:
 
         # Loop over grouped modules, configure staggering and push to the simulation state
         for (duration, capNeed, clipSize, disableStagger, reloadTime, isInjector), amount in mods.items():
-            # period optimization doesn't work when reloads are active.
-            if clipSize:
-                disable_period = True
             # Just push multiple instances if item is injector. We do not want to stagger them as we will
             # use them as needed and want them to be available right away
             if isInjector:
+                # period optimization doesn't work with injectors, they are
+                # postponed depending on cap level
+                disable_period = True
+                self.has_injectors = True
                 for i in range(amount):
                     heapq.heappush(self.state, [0, duration, capNeed, 0, clipSize, reloadTime, isInjector])
                 continue
@@ -124,7 +133,12 @@ class CapSimulator:
             else:
                 capNeed *= amount
 
-            period = lcm(period, duration)
+            # Modules which have to be reloaded repeat their pattern once per
+            # clip, including reload
+            if clipSize:
+                period = lcm(period, duration * clipSize + reloadTime)
+            else:
+                period = lcm(period, duration)
 
             heapq.heappush(self.state, [0, duration, capNeed, 0, clipSize, reloadTime, isInjector])
 
@@ -162,6 +176,11 @@ class CapSimulator:
         t_last = 0
         t_max = self.t_max
 
+        # Activations of the first period as (time, cap need) pairs, to be
+        # replayed for all further periods
+        replay = self.replay_periods and not self.has_injectors and period < t_max
+        period_events = []
+
         while 1:
             # Nothing to pop - might happen when no mods are activated, or when
             # only cap injectors are active (and are postponed by code below)
@@ -192,9 +211,20 @@ class CapSimulator:
                     cap_wrap = round(cap, stability_precision)
                     awaitingInjectorsCounterWrap = awaitingInjectorsCounterNow
                     t_wrap += period
+                    if replay:
+                        # Schedule of all the next periods is the same as of
+                        # the first one, no need to maintain the queue anymore
+                        t_last = t_now
+                        push(state, activation)
+                        activation = None
+                        cap, cap_lowest, cap_lowest_pre, t_last, iterations = self.__replayPeriods(
+                            period_events, t_now, cap, cap_wrap, cap_lowest, cap_lowest_pre, iterations)
+                        break
 
             t_last = t_now
             iterations += 1
+            if replay and t_now < period:
+                period_events.append((t_now, capNeed))
 
             # If injecting cap will "overshoot" max cap, postpone it
             if isInjector and cap - capNeed > capCapacity:
@@ -306,3 +336,107 @@ class CapSimulator:
         self.saved_changes_internal = None
 
         self.runtime = time.time() - start
+
+    def __replayPeriods(self, events, t_start, cap, cap_wrap, cap_lowest, cap_lowest_pre, iterations):
+        """
+        Continue simulation from the start of the second period by repeating
+        activations of the first one. Recharge between activations follows
+        closed-form curve, and since intervals between activations are the
+        same in every period, their decay factors are calculated only once.
+        Returns cap, low water marks, time of last activation and iterations.
+
+        Cap at the start of every period depends only on cap at the start of
+        previous one, and the higher it was, the higher it will be. So when
+        cap keeps converging towards some level from above, it is enough to
+        check one period started a bit below the level: if it ends with at
+        least as much cap and never runs dry, no further period will either.
+        """
+        capCapacity = self.capacitorCapacity
+        tau = self.capacitorRecharge / 5.0
+        period = self.period
+        t_max = self.t_max
+        stability_precision = self.stability_precision
+        saved_changes = self.saved_changes_internal
+        # (offset in period, cap need, recharge decay since previous activation)
+        steps = []
+        t_prev = events[-1][0] - period
+        for t_event, capNeed in events:
+            decay = exp((t_prev - t_event) / tau) if t_event > t_prev else None
+            steps.append((t_event, capNeed, decay))
+            t_prev = t_event
+        t_last = t_start
+        period_start = t_start
+        first = True
+        wraps = []
+        while True:
+            for offset, capNeed, decay in steps:
+                t_now = period_start + offset
+                if t_now >= t_max:
+                    return cap, cap_lowest, cap_lowest_pre, t_last, iterations
+                # Activations at the start of the first replayed period were
+                # reached by the queue already, including regeneration
+                if decay is not None and not (first and offset == 0):
+                    cap = ((1.0 + (sqrt(cap / capCapacity) - 1.0) * decay) ** 2) * capCapacity
+                    if cap < cap_lowest_pre:
+                        cap_lowest_pre = cap
+                    if offset == 0:
+                        if self.optimize_repeats and cap >= cap_wrap:
+                            self.result_optimized_repeats = True
+                            return cap, cap_lowest, cap_lowest_pre, t_last, iterations
+                        cap_wrap = round(cap, stability_precision)
+                        wraps.append(cap)
+                        if self.optimize_repeats and len(wraps) >= 3:
+                            lows = self.__checkConvergence(steps, wraps)
+                            if lows is not None:
+                                self.result_optimized_repeats = True
+                                return (
+                                    cap, min(cap_lowest, lows[0]), min(cap_lowest_pre, lows[1]),
+                                    t_last, iterations)
+                t_last = t_now
+                iterations += 1
+                cap -= capNeed
+                if cap > capCapacity:
+                    cap = capCapacity
+                saved_changes[t_now] = cap
+                if cap < cap_lowest:
+                    # Negative cap - we're unstable, simulation is over
+                    if cap < 0.0:
+                        return cap, cap_lowest, cap_lowest_pre, t_last, iterations
+                    cap_lowest = cap
+            first = False
+            period_start += period
+            self.result_replayed_periods += 1
+
+    def __checkConvergence(self, steps, wraps):
+        """
+        Estimate level cap converges to at period starts, and check if period
+        started slightly below it is stable. Returns low water marks of that
+        period if it is, None otherwise.
+        """
+        cap0, cap1, cap2 = wraps[-3:]
+        drop1 = cap0 - cap1
+        drop2 = cap1 - cap2
+        if not drop1 > drop2 > 0:
+            return None
+        # Drops shrink roughly geometrically when converging
+        ratio = drop2 / drop1
+        limit = cap2 - drop2 * ratio / (1 - ratio)
+        start = limit - (cap2 - limit) * 0.1
+        if start <= 0:
+            return None
+        capCapacity = self.capacitorCapacity
+        cap = cap_lowest = cap_lowest_pre = start
+        for i, (offset, capNeed, decay) in enumerate(steps):
+            if i and decay is not None:
+                cap = ((1.0 + (sqrt(cap / capCapacity) - 1.0) * decay) ** 2) * capCapacity
+                cap_lowest_pre = min(cap_lowest_pre, cap)
+            cap -= capNeed
+            if cap > capCapacity:
+                cap = capCapacity
+            if cap < 0.0:
+                return None
+            cap_lowest = min(cap_lowest, cap)
+        cap = ((1.0 + (sqrt(cap / capCapacity) - 1.0) * steps[0][2]) ** 2) * capCapacity
+        if cap < start:
+            return None
+        return cap_lowest, cap_lowest_pre
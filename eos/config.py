@@ -9,6 +9,17 @@ pyfalog = Logger(__name__)
 
 debug = False
 gamedataCache = True
+# Max amount of results kept per gamedata query function when gamedata cache is
+# enabled, None means no limit. Point lookups are few and used all the time, so
+# they are not limited by default; search results are mostly one-off ones
+gamedataCacheSizes = {
+    "default": None,
+    "searchItems": 200,
+    "searchItemsRegex": 200,
+    "searchSkills": 100,
+    "getItemsByCategory": 100,
+    "getVariations": 500,
+    "directAttributeRequest": 500}
 saveddataCache = True
 gamedata_version = ""
 gamedata_date = ""
@@ -44,7 +55,9 @@ pyfalog.debug("Saveddata connection string: {0}", saveddata_connectionstring)
 settings = {
     "useStaticAdaptiveArmorHardener": False,
     "strictSkillLevels": True,
-    "globalDefaultSpoolupPercentage": 1.0
+    "globalDefaultSpoolupPercentage": 1.0,
+    "incrementalCalc": False,
+    "skillTemplates": True
 }
 
 # Autodetect path, only change if the autodetection bugs out.
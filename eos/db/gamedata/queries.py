@@ -17,6 +17,9 @@
 # along with eos.  If not, see <http://www.gnu.org/licenses/>.
 # ===============================================================================
 
+import threading
+from functools import wraps
+
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import aliased, exc, join
 from sqlalchemy.sql import and_, or_, select
@@ -24,15 +27,35 @@ from sqlalchemy.sql import and_, or_, select
 import eos.config
 from eos.db import get_gamedata_session
 from eos.db.gamedata.item import items_table
+from eos.db.gamedata.category import categories_table
 from eos.db.gamedata.group import groups_table
 from eos.db.util import processEager, processWhere
 from eos.gamedata import AlphaClone, Attribute, AttributeInfo, Category, DynamicItem, Group, Item, MarketGroup, MetaData, MetaGroup, ImplantSet
+from eos.utils.lruCache import LRUCache
+from eos.utils.searchIndex import SearchEntry, SearchIndex
 
+# Separate cache for every query function, {qualified function name: LRUCache}
 cache = {}
+
+
+def getQueryName(function):
+    """Return name query function's cache is registered under"""
+    return "{}.{}".format(function.__module__, function.__qualname__)
+
+
+def getQueryCache(function):
+    """Return results cache of query function, None if its results are not cached"""
+    return cache.get(getQueryName(function))
+
+
 configVal = getattr(eos.config, "gamedataCache", None)
 if configVal is True:
     def cachedQuery(amount, *keywords):
         def deco(function):
+            sizes = getattr(eos.config, "gamedataCacheSizes", {})
+            queryCache = cache[getQueryName(function)] = LRUCache(sizes.get(function.__name__, sizes.get("default")))
+
+            @wraps(function)
             def checkAndReturn(*args, **kwargs):
                 useCache = kwargs.pop("useCache", True)
                 cacheKey = []
@@ -41,9 +64,14 @@ if configVal is True:
                     cacheKey.append(kwargs.get(keyword))
 
                 cacheKey = tuple(cacheKey)
-                handler = cache.get(cacheKey)
-                if handler is None or not useCache:
-                    handler = cache[cacheKey] = function(*args, **kwargs)
+                try:
+                    handler = queryCache.get(cacheKey) if useCache else None
+                except TypeError:
+                    # Unhashable arguments, e.g. list of IDs
+                    return function(*args, **kwargs)
+                if handler is None:
+                    handler = function(*args, **kwargs)
+                    queryCache.set(cacheKey, handler)
 
                 return handler
 
@@ -56,6 +84,7 @@ elif callable(configVal):
 else:
     def cachedQuery(amount, *keywords):
         def deco(function):
+            @wraps(function)
             def checkAndReturn(*args, **kwargs):
                 return function(*args, **kwargs)
 
@@ -64,6 +93,21 @@ else:
         return deco
 
 
+def getQueryCacheStats():
+    """Return {qualified query function name: CacheStats} for all cached gamedata queries"""
+    return {name: queryCache.getStats() for name, queryCache in cache.items()}
+
+
+def setQueryCacheSize(function, maxSize):
+    """Change max amount of results kept for query function, None means no limit"""
+    getQueryCache(function).maxSize = maxSize
+
+
+def clearQueryCaches():
+    for queryCache in cache.values():
+        queryCache.clear()
+
+
 def sqlizeNormalString(line):
     # Escape backslashes first, as they will be as escape symbol in queries
     # Then escape percent and underscore signs
@@ -98,15 +142,30 @@ def getItem(lookfor, eager=None):
         raise TypeError("Need integer or string as argument")
     return item
 
-@cachedQuery(1, "itemIDs")
 def getItems(itemIDs, eager=None):
     if not isinstance(itemIDs, (tuple, list, set)) or not all(isinstance(t, int) for t in itemIDs):
         raise TypeError("Need iterable of integers as argument")
-    if eager is None:
-        items = get_gamedata_session().query(Item).filter(Item.ID.in_(itemIDs)).all()
-    else:
-        items = get_gamedata_session().query(Item).options(*processEager(eager)).filter(Item.ID.in_(itemIDs)).all()
-    return items
+    # Items are kept in cache of getItem, so that items fetched in bulk are
+    # not fetched again one by one, and the other way around
+    itemCache = getQueryCache(getItem)
+    items = {}
+    toGet = []
+    for itemID in itemIDs:
+        item = itemCache.get((itemID, None)) if itemCache is not None else None
+        if item is None:
+            toGet.append(itemID)
+        else:
+            items[itemID] = item
+    if toGet:
+        if eager is None:
+            fetched = get_gamedata_session().query(Item).filter(Item.ID.in_(toGet)).all()
+        else:
+            fetched = get_gamedata_session().query(Item).options(*processEager(eager)).filter(Item.ID.in_(toGet)).all()
+        for item in fetched:
+            items[item.ID] = item
+            if itemCache is not None:
+                itemCache.set((item.ID, None), item)
+    return [items[itemID] for itemID in dict.fromkeys(itemIDs) if itemID in items]
 
 
 def getMutaplasmid(lookfor, eager=None):
@@ -139,35 +198,6 @@ def getItemWithBaseItemAttribute(lookfor, baseItemID, eager=None):
     return item
 
 
-@cachedQuery(1, "lookfor")
-def getItems(lookfor, eager=None):
-    """
-    Gets a list of items. Does a bit of cache hackery to get working properly -- cache
-    is usually based on function calls with the parameters, needed to extract data directly.
-    Works well enough. Not currently used, but it's here for possible future inclusion
-    """
-
-    toGet = []
-    results = []
-
-    for id in lookfor:
-        if (id, None) in cache:
-            results.append(cache.get((id, None)))
-        else:
-            toGet.append(id)
-
-    if len(toGet) > 0:
-        # Get items that aren't currently cached, and store them in the cache
-        items = get_gamedata_session().query(Item).filter(Item.ID.in_(toGet)).all()
-        for item in items:
-            cache[(item.ID, None)] = item
-        results += items
-
-    # sort the results based on the original indexing
-    results.sort(key=lambda x: lookfor.index(x.ID))
-    return results
-
-
 @cachedQuery(1, "lookfor")
 def getAlphaClone(lookfor, eager=None):
     if isinstance(lookfor, int):
@@ -335,6 +365,39 @@ def searchItems(nameLike, where=None, join=None, eager=None):
     return items
 
 
+_searchIndex = None
+_searchIndexLang = None
+_searchIndexLock = threading.Lock()
+
+
+def getItemSearchIndex():
+    """Return in-memory index over names of all items, building it on first use"""
+    global _searchIndex, _searchIndexLang
+    with _searchIndexLock:
+        if _searchIndex is None or _searchIndexLang != eos.config.lang:
+            statement = select([
+                items_table.c.typeID,
+                items_table.c["typeName{}".format(eos.config.lang)],
+                items_table.c.typeName,
+                groups_table.c.name,
+                categories_table.c.name,
+                items_table.c.published
+            ]).select_from(items_table.join(groups_table).join(categories_table))
+            _searchIndex = SearchIndex(SearchEntry(*row) for row in get_gamedata_session().execute(statement))
+            _searchIndexLang = eos.config.lang
+        return _searchIndex
+
+
+def searchItemIDs(tokens, filters=None, forcePublished=None, limit=100):
+    """
+    Search items by regex tokens in memory, returning item IDs. Filters are
+    list of (category names, group names) pairs, see SearchIndex.search.
+    """
+    if not isinstance(tokens, (tuple, list)) or not all(isinstance(t, str) for t in tokens):
+        raise TypeError("Need tuple or list of strings as argument")
+    return getItemSearchIndex().search(tokens, filters=filters, forcePublished=forcePublished, limit=limit)
+
+
 @cachedQuery(3, "tokens", "where", "join")
 def searchItemsRegex(tokens, where=None, join=None, eager=None):
     if not isinstance(tokens, (tuple, list)) or not all(isinstance(t, str) for t in tokens):
@@ -346,13 +409,18 @@ def searchItemsRegex(tokens, where=None, join=None, eager=None):
     if not hasattr(join, "__iter__"):
         join = (join,)
 
-    items = get_gamedata_session().query(Item).options(*processEager(eager)).join(*join)
-    for token in tokens:
+    # Names are matched in memory, database is used only to apply filters
+    # and to load items
+    itemIDs = getItemSearchIndex().search(tokens)
+    items = []
+    for i in range(0, len(itemIDs), 500):
+        query = get_gamedata_session().query(Item).options(*processEager(eager)).join(*join).filter(
+            Item.ID.in_(itemIDs[i:i + 500]))
         if where is not None:
-            items = items.filter(and_(Item.name.op('regexp')(token), where))
-        else:
-            items = items.filter(Item.name.op('regexp')(token))
-    items = items.limit(100).all()
+            query = query.filter(where)
+        items.extend(query.limit(100 - len(items)).all())
+        if len(items) >= 100:
+            break
     return items
 
 
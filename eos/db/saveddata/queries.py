@@ -18,13 +18,17 @@
 # ===============================================================================
 
 import sys
+from itertools import chain, islice
 
 from sqlalchemy.sql import and_
 from sqlalchemy import desc, select
 from sqlalchemy import func
 
 from eos.db import saveddata_session, sd_lock
+from eos.db.saveddata.cargo import cargo_table
+from eos.db.saveddata.drone import drones_table
 from eos.db.saveddata.fit import fits_table, projectedFits_table
+from eos.db.saveddata.module import modules_table
 from eos.db.util import processEager, processWhere
 from eos.saveddata.price import Price
 from eos.saveddata.user import User
@@ -347,6 +351,18 @@ def getPrice(typeID):
     return price
 
 
+def getPrices(typeIDs):
+    """Return {type ID: price} of all passed type IDs which have prices stored"""
+    typeIDs = list(set(typeIDs))
+    prices = {}
+    with sd_lock:
+        # Stay well below SQLite limit of query parameters
+        for i in range(0, len(typeIDs), 500):
+            for price in saveddata_session.query(Price).filter(Price.typeID.in_(typeIDs[i:i + 500])).all():
+                prices[price.typeID] = price
+    return prices
+
+
 def clearPrices():
     with sd_lock:
         deleted_rows = saveddata_session.query(Price).delete()
@@ -552,6 +568,76 @@ def save(stuff):
     commit()
 
 
+def saveFits(fits, chunkSize=None, callback=None, attrs=None):
+    """
+    Save many new fits, committing once per chunkSize fits (or once for all of
+    them if chunkSize is None). Fits can be any iterable, e.g. generator which
+    parses them; it is consumed chunk by chunk, so fits are saved while the
+    rest are still being produced. Primary keys of fits and of their modules,
+    drones and cargo are assigned upfront, which lets ORM insert rows of each
+    table with single executemany statement instead of one by one.
+
+    attrs is a dict of attributes set on every fit right before it is added to
+    session, e.g. character; fits which get related to objects from session
+    this way are pending already, so it's done as part of saving transaction.
+
+    callback(savedAmount) is called after every committed chunk; if it returns
+    False, remaining fits are not saved. Returns amount of saved fits. On
+    error, fits of failed chunk are rolled back, earlier chunks stay saved.
+    """
+    fits = iter(fits)
+    if chunkSize:
+        chunks = iter(lambda: list(islice(fits, chunkSize)), [])
+    else:
+        chunks = [list(fits)]
+    saved = 0
+    for chunk in chunks:
+        if not chunk:
+            break
+        with sd_lock:
+            try:
+                for fit in chunk:
+                    for attrName, value in (attrs or {}).items():
+                        setattr(fit, attrName, value)
+                _assignFitIDs(chunk)
+                saveddata_session.add_all(chunk)
+                saveddata_session.commit()
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception:
+                saveddata_session.rollback()
+                exc_info = sys.exc_info()
+                raise exc_info[0](exc_info[1]).with_traceback(exc_info[2])
+        saved += len(chunk)
+        if callback is not None and callback(saved) is False:
+            break
+    return saved
+
+
+def _assignFitIDs(fits):
+    """Assign IDs to new fits and their modules, drones and cargo"""
+    nextIDs = {}
+
+    def assign(obj, column):
+        if obj.ID is not None:
+            return
+        tableName = column.table.name
+        if tableName not in nextIDs:
+            maxID = saveddata_session.execute(select([func.max(column)])).scalar()
+            nextIDs[tableName] = (maxID or 0) + 1
+        obj.ID = nextIDs[tableName]
+        nextIDs[tableName] += 1
+
+    for fit in fits:
+        assign(fit, fits_table.c.ID)
+        for mod in chain(fit.modules, fit.projectedModules):
+            assign(mod, modules_table.c.ID)
+        for drone in chain(fit.drones, fit.projectedDrones):
+            assign(drone, drones_table.c.groupID)
+        for cargo in fit.cargo:
+            assign(cargo, cargo_table.c.ID)
+
+
 def remove(stuff):
     removeCachedEntry(type(stuff), stuff.ID)
     with sd_lock:
@@ -559,6 +645,15 @@ def remove(stuff):
     commit()
 
 
+def removeFits(fits):
+    """Delete many fits, committing once for all of them"""
+    with sd_lock:
+        for fit in fits:
+            removeCachedEntry(type(fit), fit.ID)
+            saveddata_session.delete(fit)
+    commit()
+
+
 def commit():
     with sd_lock:
         try:
@@ -22,94 +22,240 @@ from logbook import Logger
 from sqlalchemy.orm.attributes import flag_dirty
 from sqlalchemy.orm.collections import collection
 
+from eos import calcGraph
+
 
 pyfalog = Logger(__name__)
 
 
+class IndexedFilter:
+    """
+    Element filter for filtered* methods of handled lists. Unlike arbitrary
+    callables, these filters are resolved via index of list elements by
+    required skill, group or category, instead of being tested against every
+    element of the list.
+    """
+
+    def __init__(self, target, kind, keys):
+        # Attribute of element to check, 'item' or 'charge'
+        self.target = target
+        # Type of index to use, 'skill', 'group' or 'category'
+        self.kind = kind
+        self.keys = tuple(self.__getKey(k) for k in keys)
+
+    @staticmethod
+    def __getKey(key):
+        # Skills and items are indexed by their type IDs, strings and
+        # integers are used as is (names and IDs are both in the index)
+        if hasattr(key, 'item'):
+            key = key.item
+        return getattr(key, 'ID', key)
+
+    def __call__(self, element):
+        item = getattr(element, self.target)
+        if self.kind == 'skill':
+            return any(item.requiresSkill(k) for k in self.keys)
+        if self.kind == 'group':
+            group = item.group
+            return group.ID in self.keys or group.name in self.keys
+        if self.kind == 'category':
+            category = item.category
+            return category.ID in self.keys or category.name in self.keys
+        return False
+
+
+def itemRequiresSkill(*skills):
+    return IndexedFilter('item', 'skill', skills)
+
+
+def chargeRequiresSkill(*skills):
+    return IndexedFilter('charge', 'skill', skills)
+
+
+def itemGroupIs(*groups):
+    return IndexedFilter('item', 'group', groups)
+
+
+def chargeGroupIs(*groups):
+    return IndexedFilter('charge', 'group', groups)
+
+
+def itemCategoryIs(*categories):
+    return IndexedFilter('item', 'category', categories)
+
+
 class HandledList(list):
-    def filteredItemPreAssign(self, filter, *args, **kwargs):
+    # Index of element positions, {(target, kind): {key: [position]}}. Built on
+    # demand, and dropped whenever list contents or charges of elements change
+    __filterIndex = None
+
+    def clearFilterIndex(self):
+        self.__filterIndex = None
+
+    def __getIndex(self, target, kind):
+        if self.__filterIndex is None:
+            self.__filterIndex = {}
+        try:
+            return self.__filterIndex[(target, kind)]
+        except KeyError:
+            pass
+        index = self.__filterIndex[(target, kind)] = {}
+        for position, element in enumerate(self):
+            item = getattr(element, target, None)
+            if item is None:
+                continue
+            try:
+                if kind == 'skill':
+                    keys = []
+                    for skill in item.requiredSkills:
+                        keys.append(skill.ID)
+                        keys.append(skill.typeName)
+                elif kind == 'group':
+                    keys = (item.group.ID, item.group.name)
+                elif kind == 'category':
+                    keys = (item.category.ID, item.category.name)
+                else:
+                    keys = ()
+            except AttributeError:
+                continue
+            for key in keys:
+                index.setdefault(key, []).append(position)
+        return index
+
+    def __iterFiltered(self, filter):
+        if isinstance(filter, IndexedFilter):
+            index = self.__getIndex(filter.target, filter.kind)
+            if len(filter.keys) == 1:
+                positions = index.get(filter.keys[0], ())
+            else:
+                positions = sorted(set().union(*(index.get(k, ()) for k in filter.keys)))
+            for position in positions:
+                yield self[position]
+            return
         for element in self:
             try:
                 if filter(element):
-                    element.preAssignItemAttr(*args, **kwargs)
+                    yield element
+            except AttributeError:
+                pass
+
+    def filteredItemPreAssign(self, filter, *args, **kwargs):
+        for element in self.__iterFiltered(filter):
+            try:
+                element.preAssignItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemIncrease(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.increaseItemAttr(*args, **kwargs)
+                element.increaseItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemMultiply(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.multiplyItemAttr(*args, **kwargs)
+                element.multiplyItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemBoost(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.boostItemAttr(*args, **kwargs)
+                element.boostItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemForce(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.forceItemAttr(*args, **kwargs)
+                element.forceItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargePreAssign(self, filter, *args, **kwargs):
-        for element in self:
+        graph = calcGraph.state.active
+        if graph is not None:
+            graph.recordChargeScan(self)
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.preAssignChargeAttr(*args, **kwargs)
+                element.preAssignChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeIncrease(self, filter, *args, **kwargs):
-        for element in self:
+        graph = calcGraph.state.active
+        if graph is not None:
+            graph.recordChargeScan(self)
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.increaseChargeAttr(*args, **kwargs)
+                element.increaseChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeMultiply(self, filter, *args, **kwargs):
-        for element in self:
+        graph = calcGraph.state.active
+        if graph is not None:
+            graph.recordChargeScan(self)
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.multiplyChargeAttr(*args, **kwargs)
+                element.multiplyChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeBoost(self, filter, *args, **kwargs):
-        for element in self:
+        graph = calcGraph.state.active
+        if graph is not None:
+            graph.recordChargeScan(self)
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.boostChargeAttr(*args, **kwargs)
+                element.boostChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeForce(self, filter, *args, **kwargs):
-        for element in self:
+        graph = calcGraph.state.active
+        if graph is not None:
+            graph.recordChargeScan(self)
+        for element in self.__iterFiltered(filter):
             try:
-                if filter(element):
-                    element.forceChargeAttr(*args, **kwargs)
+                element.forceChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
+    def append(self, thing):
+        self.__filterIndex = None
+        list.append(self, thing)
+
+    def insert(self, idx, thing):
+        self.__filterIndex = None
+        list.insert(self, idx, thing)
+
+    def extend(self, things):
+        self.__filterIndex = None
+        list.extend(self, things)
+
+    def pop(self, *args):
+        self.__filterIndex = None
+        return list.pop(self, *args)
+
+    def clear(self):
+        self.__filterIndex = None
+        list.clear(self)
+
+    def __setitem__(self, idx, thing):
+        self.__filterIndex = None
+        list.__setitem__(self, idx, thing)
+
+    def __delitem__(self, idx):
+        self.__filterIndex = None
+        list.__delitem__(self, idx)
+
     def remove(self, thing):
         # We must flag it as modified, otherwise it not be removed from the database
         flag_dirty(thing)
+        self.__filterIndex = None
         list.remove(self, thing)
 
     def sort(self, *args, **kwargs):
@@ -21,6 +21,7 @@
 import eos.config
 from eos.calc import calculateRangeFactor
 from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effectHandlerHelpers import chargeGroupIs, chargeRequiresSkill, itemGroupIs, itemRequiresSkill
 from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
 
 
@@ -497,7 +498,7 @@ class Effect89(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Projectile Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -514,7 +515,7 @@ class Effect91(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -531,7 +532,7 @@ class Effect92(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Projectile Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -548,7 +549,7 @@ class Effect93(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Hybrid Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -565,7 +566,7 @@ class Effect95(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -582,7 +583,7 @@ class Effect96(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Hybrid Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -655,7 +656,7 @@ class Effect157(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -675,7 +676,7 @@ class Effect159(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -695,7 +696,7 @@ class Effect160(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -715,7 +716,7 @@ class Effect161(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -736,7 +737,7 @@ class Effect162(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -756,7 +757,7 @@ class Effect172(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -776,7 +777,7 @@ class Effect173(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -796,7 +797,7 @@ class Effect174(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -815,7 +816,7 @@ class Effect212(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Electronics Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Electronics Upgrades'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
 
 
@@ -863,7 +864,7 @@ class Effect227(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus'), **kwargs)
 
 
@@ -884,7 +885,7 @@ class Effect230(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
 
 
@@ -917,7 +918,7 @@ class Effect242(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'speedFactor', implant.getModifiedItemAttr('speedFBonus'), **kwargs)
 
 
@@ -935,7 +936,7 @@ class Effect244(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -978,7 +979,7 @@ class Effect272(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'duration',
+            itemRequiresSkill('Repair Systems'), 'duration',
             container.getModifiedItemAttr('durationSkillBonus') * level, **kwargs)
 
 
@@ -997,7 +998,7 @@ class Effect273(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Upgrades'),
                                       'power', container.getModifiedItemAttr('powerNeedBonus') * level, **kwargs)
 
 
@@ -1031,7 +1032,7 @@ class Effect279(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Capital Shield Emission Systems'),
+            itemRequiresSkill('Shield Emission Systems', 'Capital Shield Emission Systems'),
             'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -1049,7 +1050,7 @@ class Effect287(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -1069,7 +1070,7 @@ class Effect290(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level, **kwargs)
 
 
@@ -1089,7 +1090,7 @@ class Effect298(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'falloff', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
 
 
@@ -1129,7 +1130,7 @@ class Effect391(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'miningAmount', container.getModifiedItemAttr('miningAmountBonus') * level, **kwargs)
 
 
@@ -1232,7 +1233,7 @@ class Effect396(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Grid Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Energy Grid Upgrades'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
 
 
@@ -1273,7 +1274,7 @@ class Effect408(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -1293,7 +1294,7 @@ class Effect414(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'speed', container.getModifiedItemAttr('turretSpeeBonus') * level, **kwargs)
 
 
@@ -1441,7 +1442,7 @@ class Effect506(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -1480,7 +1481,7 @@ class Effect508(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -1502,7 +1503,7 @@ class Effect511(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonus2AF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -1524,7 +1525,7 @@ class Effect512(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -1543,7 +1544,7 @@ class Effect514(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -1562,7 +1563,7 @@ class Effect516(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -1579,7 +1580,7 @@ class Effect521(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -1648,7 +1649,7 @@ class Effect542(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -1666,7 +1667,7 @@ class Effect549(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMB'),
                                       skill='Minmatar Battleship', **kwargs)
 
@@ -1687,7 +1688,7 @@ class Effect550(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGB'),
                                       skill='Gallente Battleship', **kwargs)
 
@@ -1704,7 +1705,7 @@ class Effect553(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB'),
                                       skill='Gallente Battleship', **kwargs)
 
@@ -1729,7 +1730,7 @@ class Effect562(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -1748,7 +1749,7 @@ class Effect581(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery') or mod.item.requiresSkill('Vorton Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery', 'Vorton Projector Operation'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
 
 
@@ -1764,7 +1765,7 @@ class Effect582(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'speed', skill.getModifiedItemAttr('rofBonus') * skill.level, **kwargs)
 
 
@@ -1783,7 +1784,7 @@ class Effect584(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'damageMultiplier', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -1799,7 +1800,7 @@ class Effect587(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1815,7 +1816,7 @@ class Effect588(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1831,7 +1832,7 @@ class Effect589(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1849,7 +1850,7 @@ class Effect590(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Energy Pulse Weapons'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
 
 
@@ -1947,7 +1948,7 @@ class Effect602(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -1966,7 +1967,7 @@ class Effect604(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB2'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -2005,7 +2006,7 @@ class Effect623(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount',
                                      container.getModifiedItemAttr('miningAmountBonus') * level, **kwargs)
 
@@ -2058,7 +2059,7 @@ class Effect660(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill(skill),
                                         'emDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2076,7 +2077,7 @@ class Effect661(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill(skill),
                                         'explosiveDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2094,7 +2095,7 @@ class Effect662(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill(skill),
                                         'thermalDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2112,7 +2113,7 @@ class Effect668(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill(skill),
                                         'kineticDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2128,7 +2129,7 @@ class Effect675(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Energy Pulse Weapons'),
                                       'cpu', skill.getModifiedItemAttr('cpuNeedBonus') * skill.level, **kwargs)
 
 
@@ -2146,7 +2147,7 @@ class Effect677(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
 
 
@@ -2330,7 +2331,7 @@ class Effect744(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('CPU Management'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('CPU Management'),
                                       'duration', container.getModifiedItemAttr('scanspeedBonus') * level, **kwargs)
 
 
@@ -2346,7 +2347,7 @@ class Effect754(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -2365,7 +2366,7 @@ class Effect757(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -2382,7 +2383,7 @@ class Effect760(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -2399,8 +2400,7 @@ class Effect763(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation') or
-                                                           mod.charge.requiresSkill('Defender Missiles'),
+            fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation', 'Defender Missiles'),
                                                '%sDamage' % dmgType,
                                                container.getModifiedItemAttr('missileDamageMultiplierBonus'),
                                                stackingPenalties=True, **kwargs)
@@ -2424,7 +2424,7 @@ class Effect784(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosionDelay', container.getModifiedItemAttr('maxFlightTimeBonus') * level,
                                         stackingPenalties=penalized, **kwargs)
 
@@ -2475,7 +2475,7 @@ class Effect848(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'),
                                       'cloakingTargetingDelay',
                                       skill.getModifiedItemAttr('cloakingTargetingDelayBonus') * skill.level, **kwargs)
 
@@ -2534,7 +2534,7 @@ class Effect882(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -2551,7 +2551,7 @@ class Effect887(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -2567,7 +2567,7 @@ class Effect889(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Missile Launcher Operation'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -2584,7 +2584,7 @@ class Effect891(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -2601,7 +2601,7 @@ class Effect892(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -2619,7 +2619,7 @@ class Effect896(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemMultiply(itemGroupIs('Cloaking Device'),
                                          'cpu', container.getModifiedItemAttr('cloakingCpuNeedBonus'), **kwargs)
 
 
@@ -2636,7 +2636,7 @@ class Effect898(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCF'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -2656,7 +2656,7 @@ class Effect899(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCC'),
                                         skill='Caldari Cruiser', **kwargs)
 
@@ -2674,7 +2674,7 @@ class Effect907(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAC2'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -2708,7 +2708,7 @@ class Effect912(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCC2'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -2743,7 +2743,7 @@ class Effect919(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -2827,7 +2827,7 @@ class Effect968(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMC2'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -2863,7 +2863,7 @@ class Effect989(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2880,7 +2880,7 @@ class Effect991(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2897,7 +2897,7 @@ class Effect996(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2914,7 +2914,7 @@ class Effect998(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2931,7 +2931,7 @@ class Effect999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2964,7 +2964,7 @@ class Effect1003(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2980,7 +2980,7 @@ class Effect1004(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2996,7 +2996,7 @@ class Effect1005(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Blaster Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3012,7 +3012,7 @@ class Effect1006(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Railgun Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3028,7 +3028,7 @@ class Effect1007(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Autocannon Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3044,7 +3044,7 @@ class Effect1008(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Artillery Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3060,7 +3060,7 @@ class Effect1009(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3076,7 +3076,7 @@ class Effect1010(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3092,7 +3092,7 @@ class Effect1011(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Blaster Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3108,7 +3108,7 @@ class Effect1012(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Railgun Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3124,7 +3124,7 @@ class Effect1013(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Autocannon Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3140,7 +3140,7 @@ class Effect1014(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Artillery Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3156,7 +3156,7 @@ class Effect1015(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3172,7 +3172,7 @@ class Effect1016(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3188,7 +3188,7 @@ class Effect1017(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Blaster Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3204,7 +3204,7 @@ class Effect1018(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Railgun Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3220,7 +3220,7 @@ class Effect1019(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Autocannon Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3236,7 +3236,7 @@ class Effect1020(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Artillery Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3252,7 +3252,7 @@ class Effect1021(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -3270,7 +3270,7 @@ class Effect1024(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'),
                                         skill='Caldari Cruiser', **kwargs)
 
@@ -3291,7 +3291,7 @@ class Effect1030(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            itemRequiresSkill('Remote Armor Repair Systems', 'Capital Remote Armor Repair Systems'),
             'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -3307,7 +3307,7 @@ class Effect1033(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -3324,7 +3324,7 @@ class Effect1034(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -3340,7 +3340,7 @@ class Effect1035(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -3357,7 +3357,7 @@ class Effect1036(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -3373,7 +3373,7 @@ class Effect1046(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -3389,7 +3389,7 @@ class Effect1047(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -3406,7 +3406,7 @@ class Effect1048(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -3422,7 +3422,7 @@ class Effect1049(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -3438,7 +3438,7 @@ class Effect1058(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3455,7 +3455,7 @@ class Effect1060(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3473,7 +3473,7 @@ class Effect1061(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3490,7 +3490,7 @@ class Effect1062(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3507,7 +3507,7 @@ class Effect1080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3540,7 +3540,7 @@ class Effect1087(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3559,7 +3559,7 @@ class Effect1099(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMF2'),
                                       skill='Minmatar Frigate', **kwargs)
 
@@ -3578,7 +3578,7 @@ class Effect1176(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'speedFactor', container.getModifiedItemAttr('speedFBonus') * level, **kwargs)
 
 
@@ -3594,7 +3594,7 @@ class Effect1179(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -3611,7 +3611,7 @@ class Effect1181(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -3628,7 +3628,7 @@ class Effect1182(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -3646,7 +3646,7 @@ class Effect1183(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -3664,7 +3664,7 @@ class Effect1184(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC2'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -3705,7 +3705,7 @@ class Effect1190(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'),
                                       'duration', container.getModifiedItemAttr('iceHarvestCycleBonus') * level, **kwargs)
 
 
@@ -3766,7 +3766,7 @@ class Effect1215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -3786,7 +3786,7 @@ class Effect1218(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3802,7 +3802,7 @@ class Effect1219(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAB'),
                                       skill='Amarr Battleship', **kwargs)
 
@@ -3821,7 +3821,7 @@ class Effect1220(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -3838,7 +3838,7 @@ class Effect1221(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMB'),
                                       skill='Minmatar Battleship', **kwargs)
 
@@ -3855,7 +3855,7 @@ class Effect1222(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMC2'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -3873,7 +3873,7 @@ class Effect1228(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -3893,7 +3893,7 @@ class Effect1230(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3910,7 +3910,7 @@ class Effect1232(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3927,7 +3927,7 @@ class Effect1233(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3944,7 +3944,7 @@ class Effect1234(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3960,7 +3960,7 @@ class Effect1239(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3976,7 +3976,7 @@ class Effect1240(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3993,7 +3993,7 @@ class Effect1255(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'durationBonus', implant.getModifiedItemAttr('implantSetBloodraider'), **kwargs)
 
 
@@ -4009,7 +4009,7 @@ class Effect1256(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capacitor Emission Systems'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -4026,7 +4026,7 @@ class Effect1261(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'velocityBonus', implant.getModifiedItemAttr('implantSetSerpentis'), **kwargs)
 
 
@@ -4042,7 +4042,7 @@ class Effect1264(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors', **kwargs)
 
@@ -4059,7 +4059,7 @@ class Effect1268(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors', **kwargs)
 
@@ -4079,7 +4079,7 @@ class Effect1281(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         penalized = 'implant' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', container.getModifiedItemAttr('repairBonus'),
                                       stackingPenalties=penalized, **kwargs)
 
@@ -4100,7 +4100,7 @@ class Effect1318(BaseEffect):
         groups = ('ECM', 'Burst Jammer')
         level = container.level if 'skill' in context else 1
         for scanType in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+            fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                           'scan{0}StrengthBonus'.format(scanType),
                                           container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level,
                                           stackingPenalties=False if 'skill' in context else True, **kwargs)
@@ -4120,7 +4120,7 @@ class Effect1360(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Sensor Linking'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4138,7 +4138,7 @@ class Effect1361(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4156,7 +4156,7 @@ class Effect1370(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Target Painting'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4175,7 +4175,7 @@ class Effect1372(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4191,7 +4191,7 @@ class Effect1395(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', container.getModifiedItemAttr('shieldBoostMultiplier'), **kwargs)
 
 
@@ -4208,7 +4208,7 @@ class Effect1397(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'shieldBoostMultiplier', implant.getModifiedItemAttr('implantSetGuristas'), **kwargs)
 
 
@@ -4231,7 +4231,7 @@ class Effect1409(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Astrometrics'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
 
 
@@ -4249,7 +4249,7 @@ class Effect1410(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Propulsion Jamming'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4265,7 +4265,7 @@ class Effect1412(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -4282,7 +4282,7 @@ class Effect1434(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for sensorType in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Electronic Warfare'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Electronic Warfare'),
                                           'scan{0}StrengthBonus'.format(sensorType),
                                           ship.getModifiedItemAttr('shipBonusCB'),
                                           skill='Caldari Battleship', **kwargs)
@@ -4300,7 +4300,7 @@ class Effect1441(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCB3'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -4317,7 +4317,7 @@ class Effect1442(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -4335,7 +4335,7 @@ class Effect1443(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCC'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -4355,7 +4355,7 @@ class Effect1445(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'booster' in context else True
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Sensor Linking'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties=penalize, **kwargs)
 
@@ -4375,7 +4375,7 @@ class Effect1446(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'booster' in context else True
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties=penalize, **kwargs)
 
@@ -4395,7 +4395,7 @@ class Effect1448(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'booster' in context else True
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(itemGroupIs('Weapon Disruptor'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties=penalize, **kwargs)
 
@@ -4414,7 +4414,7 @@ class Effect1449(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Sensor Linking'),
+            itemRequiresSkill('Sensor Linking'),
             'falloffEffectiveness', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
 
 
@@ -4431,7 +4431,7 @@ class Effect1450(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'falloffEffectiveness', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
 
 
@@ -4448,7 +4448,7 @@ class Effect1451(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(itemGroupIs('Weapon Disruptor'),
                                       'falloffEffectiveness', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
 
 
@@ -4468,7 +4468,7 @@ class Effect1452(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context and 'implant' not in context, **kwargs)
 
@@ -4486,7 +4486,7 @@ class Effect1453(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'falloffEffectiveness', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
 
 
@@ -4506,7 +4506,7 @@ class Effect1472(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'implant' in context or 'booster' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level,
                                         stackingPenalties=penalize, **kwargs)
 
@@ -4525,7 +4525,7 @@ class Effect1500(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'capacitorNeed', container.getModifiedItemAttr('shieldBoostCapacitorBonus') * level, **kwargs)
 
 
@@ -4542,7 +4542,7 @@ class Effect1550(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         level = skill.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus',
                                       skill.getModifiedItemAttr('scanSkillTargetPaintStrengthBonus') * level, **kwargs)
 
@@ -4560,7 +4560,7 @@ class Effect1551(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMF2'),
                                       skill='Minmatar Frigate', **kwargs)
 
@@ -4579,7 +4579,7 @@ class Effect1577(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.appliedImplants.filteredItemMultiply(
-            lambda implant: implant.item.requiresSkill('Cybernetics'),
+            itemRequiresSkill('Cybernetics'),
             'signatureRadiusBonus', implant.getModifiedItemAttr('implantSetHalo'), **kwargs)
 
 
@@ -4597,7 +4597,7 @@ class Effect1579(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'armorHpBonus', implant.getModifiedItemAttr('implantSetAmulet') or 1, **kwargs)
 
 
@@ -4628,7 +4628,7 @@ class Effect1585(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -4644,7 +4644,7 @@ class Effect1586(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -4660,7 +4660,7 @@ class Effect1587(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -4678,7 +4678,7 @@ class Effect1588(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -4699,7 +4699,7 @@ class Effect1590(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'implant' in context or 'booster' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeVelocity', container.getModifiedItemAttr('aoeVelocityBonus') * level,
                                         stackingPenalties=penalize, **kwargs)
 
@@ -4718,7 +4718,7 @@ class Effect1592(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'),
                                         'emDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -4736,7 +4736,7 @@ class Effect1593(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -4754,7 +4754,7 @@ class Effect1594(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -4774,7 +4774,7 @@ class Effect1595(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
 
 
@@ -4794,7 +4794,7 @@ class Effect1596(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
 
 
@@ -4814,7 +4814,7 @@ class Effect1597(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
 
 
@@ -4887,7 +4887,7 @@ class Effect1634(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'),
                                       'capacitorNeed', container.getModifiedItemAttr('shieldBoostCapacitorBonus') * level, **kwargs)
 
 
@@ -4907,7 +4907,7 @@ class Effect1635(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'duration',
+            itemRequiresSkill('Capital Repair Systems'), 'duration',
             container.getModifiedItemAttr('durationSkillBonus') * level, **kwargs)
 
 
@@ -4944,15 +4944,15 @@ class Effect1643(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -4968,15 +4968,15 @@ class Effect1644(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -4992,15 +4992,15 @@ class Effect1645(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -5016,15 +5016,15 @@ class Effect1646(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -5041,7 +5041,7 @@ class Effect1650(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(itemRequiresSkill(skill),
                                          'consumptionQuantity', amount * skill.level, **kwargs)
 
 
@@ -5061,7 +5061,7 @@ class Effect1657(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
 
 
@@ -5199,7 +5199,7 @@ class Effect1720(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
             'shieldBonus', module.getModifiedItemAttr('shieldBoostMultiplier'),
             stackingPenalties=True, **kwargs)
 
@@ -5232,7 +5232,7 @@ class Effect1730(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill(skill),
+        fit.drones.filteredItemBoost(itemRequiresSkill(skill),
                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -5264,7 +5264,7 @@ class Effect1763(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', container.getModifiedItemAttr('rofBonus') * level, **kwargs)
 
 
@@ -5284,7 +5284,7 @@ class Effect1764(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', container.getModifiedItemAttr('speedFactor') * level,
                                         stackingPenalties=penalized, **kwargs)
 
@@ -5302,7 +5302,7 @@ class Effect1773(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -5526,15 +5526,15 @@ class Effect1848(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -5552,7 +5552,7 @@ class Effect1851(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemBoost(itemRequiresSkill(skill),
                                       'speed', skill.getModifiedItemAttr('rofBonus') * skill.level, **kwargs)
 
 
@@ -5569,7 +5569,7 @@ class Effect1862(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -5587,7 +5587,7 @@ class Effect1863(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -5605,7 +5605,7 @@ class Effect1864(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -5623,7 +5623,7 @@ class Effect1882(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'miningAmount', module.getModifiedItemAttr('miningAmountBonus'), **kwargs)
 
 
@@ -5640,7 +5640,7 @@ class Effect1885(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -5658,7 +5658,7 @@ class Effect1886(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -5676,7 +5676,7 @@ class Effect1910(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5695,7 +5695,7 @@ class Effect1911(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanGravimetricStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5714,7 +5714,7 @@ class Effect1912(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanMagnetometricStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5733,7 +5733,7 @@ class Effect1913(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanRadarStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5752,7 +5752,7 @@ class Effect1914(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanLadarStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5772,7 +5772,7 @@ class Effect1921(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5791,7 +5791,7 @@ class Effect1922(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5823,7 +5823,7 @@ class Effect1964(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -5839,7 +5839,7 @@ class Effect1969(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -5856,7 +5856,7 @@ class Effect1996(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCF2'),
                                       skill='Caldari Frigate', **kwargs)
 
@@ -5890,7 +5890,7 @@ class Effect2008(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cynosural Field Theory'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cynosural Field Theory'),
                                       'duration', ship.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -5911,7 +5911,7 @@ class Effect2013(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalties = False if 'implant' in context or 'booster' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', container.getModifiedItemAttr('droneMaxVelocityBonus') * level,
                                      stackingPenalties=penalties, **kwargs)
 
@@ -5930,7 +5930,7 @@ class Effect2014(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxRange',
                                      container.getModifiedItemAttr('rangeSkillBonus') * level,
                                      stackingPenalties=penalized, **kwargs)
@@ -5948,7 +5948,7 @@ class Effect2015(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', module.getModifiedItemAttr('hullHpBonus'), **kwargs)
 
 
@@ -5964,7 +5964,7 @@ class Effect2016(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', module.getModifiedItemAttr('hullHpBonus'), **kwargs)
 
 
@@ -5981,7 +5981,7 @@ class Effect2017(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', container.getModifiedItemAttr('hullHpBonus') * level, **kwargs)
 
 
@@ -6001,7 +6001,7 @@ class Effect2019(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'shieldBonus', container.getModifiedItemAttr('damageHP') * level,
                                      stackingPenalties=penalized, **kwargs)
 
@@ -6022,7 +6022,7 @@ class Effect2020(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'armorDamageAmount', container.getModifiedItemAttr('damageHP') * level,
                                      stackingPenalties=penalized, **kwargs)
 
@@ -6092,7 +6092,7 @@ class Effect2053(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Shield Resistance Amplifier'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
 
@@ -6108,7 +6108,7 @@ class Effect2054(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Shield Resistance Amplifier'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6125,7 +6125,7 @@ class Effect2055(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Shield Resistance Amplifier'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6142,7 +6142,7 @@ class Effect2056(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Shield Resistance Amplifier'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6159,7 +6159,7 @@ class Effect2105(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Coating'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
 
@@ -6175,7 +6175,7 @@ class Effect2106(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Coating'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6192,7 +6192,7 @@ class Effect2107(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Coating'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6209,7 +6209,7 @@ class Effect2108(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Coating'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6226,7 +6226,7 @@ class Effect2109(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energized Armor Membrane',
+        fit.modules.filteredItemBoost(itemGroupIs('Energized Armor Membrane'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
 
@@ -6242,7 +6242,7 @@ class Effect2110(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energized Armor Membrane',
+        fit.modules.filteredItemBoost(itemGroupIs('Energized Armor Membrane'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6259,7 +6259,7 @@ class Effect2111(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energized Armor Membrane',
+        fit.modules.filteredItemBoost(itemGroupIs('Energized Armor Membrane'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6276,7 +6276,7 @@ class Effect2112(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energized Armor Membrane',
+        fit.modules.filteredItemBoost(itemGroupIs('Energized Armor Membrane'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6294,7 +6294,7 @@ class Effect2130(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6312,7 +6312,7 @@ class Effect2131(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6328,7 +6328,7 @@ class Effect2132(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6345,7 +6345,7 @@ class Effect2133(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus2'), **kwargs)
 
 
@@ -6364,9 +6364,9 @@ class Effect2134(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Shield Booster', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Shield Booster'), 'maxRange',
                                       ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Shield Booster', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Ancillary Remote Shield Booster'), 'maxRange',
                                       ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6386,9 +6386,9 @@ class Effect2135(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Armor Repairer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Armor Repairer'), 'maxRange',
                                       src.getModifiedItemAttr('maxRangeBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Armor Repairer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Ancillary Remote Armor Repairer'), 'maxRange',
                                       src.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6404,7 +6404,7 @@ class Effect2143(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMC2'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -6438,7 +6438,7 @@ class Effect2155(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships', **kwargs)
 
@@ -6455,7 +6455,7 @@ class Effect2156(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                       skill='Command Ships', **kwargs)
 
@@ -6472,7 +6472,7 @@ class Effect2157(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships', **kwargs)
 
@@ -6489,7 +6489,7 @@ class Effect2160(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                       skill='Command Ships', **kwargs)
 
@@ -6509,7 +6509,7 @@ class Effect2179(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusGC2'),
                                          skill='Gallente Cruiser', **kwargs)
 
@@ -6527,7 +6527,7 @@ class Effect2181(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusAC2'),
                                          skill='Amarr Cruiser', **kwargs)
 
@@ -6546,7 +6546,7 @@ class Effect2186(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusGB2'),
                                          skill='Gallente Battleship', **kwargs)
 
@@ -6564,7 +6564,7 @@ class Effect2187(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGB2'),
                                      skill='Gallente Battleship', **kwargs)
 
@@ -6583,7 +6583,7 @@ class Effect2188(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'),
                                      skill='Gallente Cruiser', **kwargs)
 
@@ -6600,7 +6600,7 @@ class Effect2189(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC2'),
                                      skill='Amarr Cruiser', **kwargs)
 
@@ -6617,7 +6617,7 @@ class Effect2201(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusInterdictors1'),
                                       skill='Interdictors', **kwargs)
 
@@ -6639,7 +6639,7 @@ class Effect2215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -6673,7 +6673,7 @@ class Effect2249(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'miningAmount', ship.getModifiedItemAttr('shipBonusAC2'),
                                      skill='Amarr Cruiser', **kwargs)
 
@@ -6690,7 +6690,7 @@ class Effect2250(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount', ship.getModifiedItemAttr('shipBonusGC2'),
                                      skill='Gallente Cruiser', **kwargs)
 
@@ -6709,9 +6709,9 @@ class Effect2251(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('maxGangModules'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('maxGangModules'), **kwargs)
 
 
@@ -6739,7 +6739,7 @@ class Effect2252(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredItemForce(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemForce(itemRequiresSkill('Cloaking'),
                                       'moduleReactivationDelay',
                                       container.getModifiedItemAttr('covertOpsAndReconOpsCloakModuleDelay'), **kwargs)
 
@@ -6763,7 +6763,7 @@ class Effect2253(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemForce(itemGroupIs('Cloaking Device'),
                                       'cloakingTargetingDelay',
                                       ship.getModifiedItemAttr('covertOpsStealthBomberTargettingDelay'), **kwargs)
 
@@ -6883,7 +6883,7 @@ class Effect2305(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -6902,7 +6902,7 @@ class Effect2354(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Remote Armor Repair Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -6919,7 +6919,7 @@ class Effect2355(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -6935,7 +6935,7 @@ class Effect2356(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Capacitor Emission Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -6954,7 +6954,7 @@ class Effect2402(BaseEffect):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for dmgType in damageTypes:
             fit.modules.filteredItemBoost(
-                lambda mod: mod.item.requiresSkill('Doomsday Operation'), f'{dmgType}Damage',
+                itemRequiresSkill('Doomsday Operation'), f'{dmgType}Damage',
                 skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -7013,7 +7013,7 @@ class Effect2444(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'cpu', module.getModifiedItemAttr('cpuPenaltyPercent'), **kwargs)
 
 
@@ -7029,7 +7029,7 @@ class Effect2445(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'),
                                       'cpu', module.getModifiedItemAttr('cpuPenaltyPercent'), **kwargs)
 
 
@@ -7047,7 +7047,7 @@ class Effect2456(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Upgrades'),
                                       'cpuPenaltyPercent',
                                       container.getModifiedItemAttr('miningUpgradeCPUReductionBonus') * level, **kwargs)
 
@@ -7083,7 +7083,7 @@ class Effect2479(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'),
                                       'duration', module.getModifiedItemAttr('iceHarvestCycleBonus'), **kwargs)
 
 
@@ -7135,7 +7135,7 @@ class Effect2489(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusMC'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -7152,7 +7152,7 @@ class Effect2490(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -7171,7 +7171,7 @@ class Effect2491(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'),
                                       'ecmBurstRange', container.getModifiedItemAttr('rangeSkillBonus') * level, **kwargs)
 
 
@@ -7190,7 +7190,7 @@ class Effect2492(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -7208,7 +7208,7 @@ class Effect2503(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB2'),
                                       skill='Gallente Battleship', **kwargs)
 
@@ -7229,7 +7229,7 @@ class Effect2504(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -7246,7 +7246,7 @@ class Effect2561(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                         skill='Assault Frigates', **kwargs)
 
@@ -7355,7 +7355,7 @@ class Effect2611(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -7423,7 +7423,7 @@ class Effect2647(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -7441,7 +7441,7 @@ class Effect2648(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -7459,7 +7459,7 @@ class Effect2649(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Light',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Light'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -7500,7 +7500,7 @@ class Effect2688(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'capacitorNeed', module.getModifiedItemAttr('capNeedBonus'), **kwargs)
 
 
@@ -7516,7 +7516,7 @@ class Effect2689(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'capacitorNeed', module.getModifiedItemAttr('capNeedBonus'), **kwargs)
 
 
@@ -7532,7 +7532,7 @@ class Effect2690(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'cpu', module.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
 
 
@@ -7548,7 +7548,7 @@ class Effect2691(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'cpu', module.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
 
 
@@ -7565,7 +7565,7 @@ class Effect2693(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalize = False if 'booster' in context else True
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=penalize, **kwargs)
 
@@ -7583,7 +7583,7 @@ class Effect2694(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalize = 'booster' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=penalize, **kwargs)
 
@@ -7601,7 +7601,7 @@ class Effect2695(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalize = 'booster' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=penalize, **kwargs)
 
@@ -7620,7 +7620,7 @@ class Effect2696(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalties = 'booster' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=penalties, **kwargs)
 
@@ -7638,7 +7638,7 @@ class Effect2697(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalties = 'booster' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=penalties, **kwargs)
 
@@ -7656,7 +7656,7 @@ class Effect2698(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalize = False if 'booster' in context else True
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=penalize, **kwargs)
 
@@ -7673,7 +7673,7 @@ class Effect2706(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -7689,7 +7689,7 @@ class Effect2707(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -7705,7 +7705,7 @@ class Effect2708(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -7751,7 +7751,7 @@ class Effect2714(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'cpu', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -7829,7 +7829,7 @@ class Effect2727(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Gas Cloud Scoops',
+        fit.modules.filteredItemIncrease(itemGroupIs('Gas Cloud Scoops'),
                                          'maxGroupActive', skill.level, **kwargs)
 
 
@@ -7847,7 +7847,7 @@ class Effect2734(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for type in ('Gravimetric', 'Ladar', 'Radar', 'Magnetometric'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('shipBonusCF'),
                                           skill='Caldari Frigate', **kwargs)
@@ -7889,7 +7889,7 @@ class Effect2736(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Armor Repair Unit', 'Ancillary Armor Repairer'),
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Repair Unit', 'Ancillary Armor Repairer'),
                                       'armorDamageAmount', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -7929,7 +7929,7 @@ class Effect2739(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'maxRange', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -7948,7 +7948,7 @@ class Effect2741(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'falloff', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -8003,7 +8003,7 @@ class Effect2747(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'trackingSpeed', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -8022,7 +8022,7 @@ class Effect2748(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -8040,7 +8040,7 @@ class Effect2749(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeVelocity', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -8057,7 +8057,7 @@ class Effect2756(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for type in ('Gravimetric', 'Magnetometric', 'Ladar', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                           'scan{0}StrengthBonus'.format(type), ship.getModifiedItemAttr('shipBonusCC'),
                                           skill='Caldari Cruiser', **kwargs)
 
@@ -8196,7 +8196,7 @@ class Effect2791(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeCloudSize', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -8231,7 +8231,7 @@ class Effect2794(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Salvaging'),
                                          'accessDifficultyBonus', container.getModifiedItemAttr('accessDifficultyBonus'),
                                          position='post', **kwargs)
 
@@ -8282,7 +8282,7 @@ class Effect2797(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Projectile Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8300,7 +8300,7 @@ class Effect2798(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalize = 'booster' not in context
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Projectile Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=penalize, **kwargs)
 
@@ -8317,7 +8317,7 @@ class Effect2799(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Missile Launcher Operation'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8334,7 +8334,7 @@ class Effect2801(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8352,7 +8352,7 @@ class Effect2802(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalize = 'booster' not in context
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Hybrid Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=penalize, **kwargs)
 
@@ -8373,7 +8373,7 @@ class Effect2803(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalties = 'booster' not in context
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=penalties, **kwargs)
 
@@ -8390,7 +8390,7 @@ class Effect2804(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Hybrid Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8409,7 +8409,7 @@ class Effect2805(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAB2'),
                                       skill='Amarr Battleship', **kwargs)
 
@@ -8427,7 +8427,7 @@ class Effect2809(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'),
                                         skill='Caldari Cruiser', **kwargs)
 
@@ -8444,7 +8444,7 @@ class Effect2812(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'),
                                       'ecmBurstRange', ship.getModifiedItemAttr('shipBonusCB3'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -8482,7 +8482,7 @@ class Effect2847(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'trackingSpeed', container.getModifiedItemAttr('trackingSpeedBonus') * level, **kwargs)
 
 
@@ -8501,7 +8501,7 @@ class Effect2848(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda module: module.item.requiresSkill('Archaeology'), 'accessDifficultyBonus',
+            itemRequiresSkill('Archaeology'), 'accessDifficultyBonus',
             container.getModifiedItemAttr('accessDifficultyBonusModifier'), **kwargs)
 
 
@@ -8522,7 +8522,7 @@ class Effect2849(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda c: c.item.requiresSkill('Hacking'), 'accessDifficultyBonus',
+            itemRequiresSkill('Hacking'), 'accessDifficultyBonus',
             container.getModifiedItemAttr('accessDifficultyBonusModifier'), **kwargs)
 
 
@@ -8538,7 +8538,7 @@ class Effect2850(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'duration', module.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -8556,7 +8556,7 @@ class Effect2851(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         penalize = False if 'booster' in context else True
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                                '%sDamage' % dmgType,
                                                container.getModifiedItemAttr('missileDamageMultiplierBonus'),
                                                stackingPenalties=penalize, **kwargs)
@@ -8574,7 +8574,7 @@ class Effect2853(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'),
                                       'cloakingTargetingDelay', module.getModifiedItemAttr('cloakingTargetingDelayBonus'), **kwargs)
 
 
@@ -8658,7 +8658,7 @@ class Effect2867(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'damageMultiplier', module.getModifiedItemAttr('damageMultiplierBonus'),
                                      stackingPenalties=True, **kwargs)
 
@@ -8675,7 +8675,7 @@ class Effect2868(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'armorDamageAmount', implant.getModifiedItemAttr('repairBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -8692,7 +8692,7 @@ class Effect2872(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Defender Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Defender Missiles'),
                                         'maxVelocity', container.getModifiedItemAttr('missileVelocityBonus'), **kwargs)
 
 
@@ -8710,7 +8710,7 @@ class Effect2881(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8728,7 +8728,7 @@ class Effect2882(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8746,7 +8746,7 @@ class Effect2883(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8764,7 +8764,7 @@ class Effect2884(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8783,7 +8783,7 @@ class Effect2885(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gas Cloud Harvesting'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -8801,7 +8801,7 @@ class Effect2887(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8819,7 +8819,7 @@ class Effect2888(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8837,7 +8837,7 @@ class Effect2889(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8855,7 +8855,7 @@ class Effect2890(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8872,7 +8872,7 @@ class Effect2891(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8889,7 +8889,7 @@ class Effect2892(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8906,7 +8906,7 @@ class Effect2893(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8923,7 +8923,7 @@ class Effect2894(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8941,7 +8941,7 @@ class Effect2899(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8959,7 +8959,7 @@ class Effect2900(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8977,7 +8977,7 @@ class Effect2901(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8995,7 +8995,7 @@ class Effect2902(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9013,7 +9013,7 @@ class Effect2903(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9031,7 +9031,7 @@ class Effect2904(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9049,7 +9049,7 @@ class Effect2905(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9067,7 +9067,7 @@ class Effect2906(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9085,7 +9085,7 @@ class Effect2907(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9103,7 +9103,7 @@ class Effect2908(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9121,7 +9121,7 @@ class Effect2909(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9139,7 +9139,7 @@ class Effect2910(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9155,7 +9155,7 @@ class Effect2911(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Data Miners',
+        fit.modules.filteredItemBoost(itemGroupIs('Data Miners'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -9172,7 +9172,7 @@ class Effect2967(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(itemRequiresSkill(skill),
                                          'consumptionQuantity', amount * skill.level, **kwargs)
 
 
@@ -9188,7 +9188,7 @@ class Effect2979(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Hull Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Hull Repair Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -9204,7 +9204,7 @@ class Effect2980(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Hull Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Remote Hull Repair Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -9304,7 +9304,7 @@ class Effect3024(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Bomb Deployment'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops', **kwargs)
 
@@ -9339,7 +9339,7 @@ class Effect3026(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Bomb Deployment'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops', **kwargs)
 
@@ -9357,7 +9357,7 @@ class Effect3027(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Bomb Deployment'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops', **kwargs)
 
@@ -9374,7 +9374,7 @@ class Effect3028(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Bomb Deployment'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops', **kwargs)
 
@@ -9477,7 +9477,7 @@ class Effect3036(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Bomb',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Bomb'),
                                       'moduleReactivationDelay', skill.getModifiedItemAttr('reactivationDelayBonus') * skill.level, **kwargs)
 
 
@@ -9523,7 +9523,7 @@ class Effect3061(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'heatDamage', module.getModifiedItemAttr('heatDamageBonus'), **kwargs)
 
 
@@ -9539,7 +9539,7 @@ class Effect3169(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'cpu',
                                       src.getModifiedItemAttr('shieldTransportCpuNeedBonus'), **kwargs)
 
 
@@ -9559,7 +9559,7 @@ class Effect3172(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         # This is actually level-less bonus, anyway you have to train cruisers 5
         # and will get 100% (20%/lvl as stated by description)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'armorDamageAmount', ship.getModifiedItemAttr('droneArmorDamageAmountBonus'), **kwargs)
 
 
@@ -9579,7 +9579,7 @@ class Effect3173(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         # This is actually level-less bonus, anyway you have to train cruisers 5
         # and will get 100% (20%/lvl as stated by description)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'shieldBonus', ship.getModifiedItemAttr('droneShieldBonusBonus'), **kwargs)
 
 
@@ -9703,7 +9703,7 @@ class Effect3212(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Auto-Targeting Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Auto-Targeting Missiles'),
                                         'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level, **kwargs)
 
 
@@ -9719,7 +9719,7 @@ class Effect3234(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusAF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -9736,7 +9736,7 @@ class Effect3235(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusAF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -9753,7 +9753,7 @@ class Effect3236(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusAF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -9770,7 +9770,7 @@ class Effect3237(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusAF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -9852,7 +9852,7 @@ class Effect3264(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(itemRequiresSkill(skill),
                                          'consumptionQuantity', amount * skill.level, **kwargs)
 
 
@@ -9868,7 +9868,7 @@ class Effect3267(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Industrial Reconfiguration'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Industrial Reconfiguration'),
                                       'consumptionQuantity', ship.getModifiedItemAttr('shipBonusORECapital1'),
                                       skill='Capital Industrial Ships', **kwargs)
 
@@ -9885,7 +9885,7 @@ class Effect3297(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAB'),
                                       skill='Amarr Battleship', **kwargs)
 
@@ -9903,7 +9903,7 @@ class Effect3298(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -9922,7 +9922,7 @@ class Effect3299(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -10032,7 +10032,7 @@ class Effect3343(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -10049,7 +10049,7 @@ class Effect3355(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                         skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -10066,7 +10066,7 @@ class Effect3356(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                         skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -10085,7 +10085,7 @@ class Effect3366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -10102,7 +10102,7 @@ class Effect3367(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -10119,7 +10119,7 @@ class Effect3369(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -10136,7 +10136,7 @@ class Effect3370(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -10154,7 +10154,7 @@ class Effect3371(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip2'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -10187,7 +10187,7 @@ class Effect3379(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'capacitorNeed', implant.getModifiedItemAttr('capNeedBonus'), **kwargs)
 
 
@@ -10213,7 +10213,7 @@ class Effect3380(BaseEffect):
                 fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
             if module.charge.ID == 45010:
                 fit.modules.filteredItemIncrease(
-                    lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+                    itemRequiresSkill('High Speed Maneuvering', 'Micro Jump Drive Operation'),
                     'activationBlocked', 1, **kwargs)
         else:
             fit.ship.forceItemAttr('disallowAssistance', 1, **kwargs)
@@ -10221,9 +10221,9 @@ class Effect3380(BaseEffect):
                 return
             fit.ship.boostItemAttr('mass', module.getModifiedItemAttr('massBonusPercentage'), **kwargs)
             fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonus'), **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+            fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                           'speedBoostFactor', module.getModifiedItemAttr('speedBoostFactorBonus'), **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+            fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'speedFactor', module.getModifiedItemAttr('speedFactorBonus'), **kwargs)
 
 
@@ -10239,7 +10239,7 @@ class Effect3392(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
 
 
@@ -10255,7 +10255,7 @@ class Effect3415(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -10271,7 +10271,7 @@ class Effect3416(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -10287,7 +10287,7 @@ class Effect3417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -10303,7 +10303,7 @@ class Effect3424(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders', **kwargs)
 
 
@@ -10319,7 +10319,7 @@ class Effect3425(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders', **kwargs)
 
 
@@ -10335,7 +10335,7 @@ class Effect3427(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusViolatorsRole2'), **kwargs)
 
 
@@ -10351,7 +10351,7 @@ class Effect3439(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusViolators1'),
                                       skill='Marauders', **kwargs)
 
@@ -10370,7 +10370,7 @@ class Effect3447(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -10418,7 +10418,7 @@ class Effect3468(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Disrupt Field Generator',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Disrupt Field Generator'),
                                       'warpScrambleRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors2'),
                                       skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -10435,7 +10435,7 @@ class Effect3473(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'maxTractorVelocity', ship.getModifiedItemAttr('eliteBonusViolatorsRole3'), **kwargs)
 
 
@@ -10452,7 +10452,7 @@ class Effect3478(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -10468,7 +10468,7 @@ class Effect3480(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -10487,7 +10487,7 @@ class Effect3483(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -10504,7 +10504,7 @@ class Effect3484(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -10526,7 +10526,7 @@ class Effect3487(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -10543,7 +10543,7 @@ class Effect3489(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -10559,7 +10559,7 @@ class Effect3493(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cargo Scanner',
+        fit.modules.filteredItemBoost(itemGroupIs('Cargo Scanner'),
                                       'cargoScanRange', ship.getModifiedItemAttr('cargoScannerRangeBonus'), **kwargs)
 
 
@@ -10575,7 +10575,7 @@ class Effect3494(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Survey Scanner',
+        fit.modules.filteredItemBoost(itemGroupIs('Survey Scanner'),
                                       'surveyScanRange', ship.getModifiedItemAttr('surveyScannerRangeBonus'), **kwargs)
 
 
@@ -10596,7 +10596,7 @@ class Effect3495(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         groups = ('Stasis Web', 'Warp Scrambler')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusInterceptorRole'), **kwargs)
 
 
@@ -10613,7 +10613,7 @@ class Effect3496(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'agilityBonus', implant.getModifiedItemAttr('implantSetThukker'), **kwargs)
 
 
@@ -10630,7 +10630,7 @@ class Effect3498(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'scanStrengthBonus', implant.getModifiedItemAttr('implantSetSisters'), **kwargs)
 
 
@@ -10647,7 +10647,7 @@ class Effect3499(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'boosterAttributeModifier',
                                                  implant.getModifiedItemAttr('implantSetSyndicate'), **kwargs)
 
@@ -10665,7 +10665,7 @@ class Effect3513(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'rangeSkillBonus', implant.getModifiedItemAttr('implantSetMordus'), **kwargs)
 
 
@@ -10681,7 +10681,7 @@ class Effect3514(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusInterceptor2'), skill='Interceptors', **kwargs)
 
 
@@ -10697,7 +10697,7 @@ class Effect3519(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Bomb Deployment'),
                                       'cpu', skill.getModifiedItemAttr('cpuNeedBonus') * skill.level, **kwargs)
 
 
@@ -10713,7 +10713,7 @@ class Effect3520(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Bomb Deployment'),
                                       'power', skill.getModifiedItemAttr('powerNeedBonus') * skill.level, **kwargs)
 
 
@@ -10732,7 +10732,7 @@ class Effect3526(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cynosural Field Generator',
+        fit.modules.filteredItemBoost(itemGroupIs('Cynosural Field Generator'),
                                       'consumptionQuantity',
                                       container.getModifiedItemAttr('consumptionQuantityBonusPercentage') * level, **kwargs)
 
@@ -10767,7 +10767,7 @@ class Effect3561(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(itemGroupIs('Weapon Disruptor'),
                                       'trackingSpeedBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
 
@@ -10784,7 +10784,7 @@ class Effect3568(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'maxRangeBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -10801,7 +10801,7 @@ class Effect3569(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'maxRangeBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -10818,7 +10818,7 @@ class Effect3570(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'trackingSpeedBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -10835,7 +10835,7 @@ class Effect3571(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'trackingSpeedBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -10855,7 +10855,7 @@ class Effect3586(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context else True
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'scanResolutionBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level,
                                       stackingPenalties=penalized, **kwargs)
@@ -10873,7 +10873,7 @@ class Effect3587(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -10892,7 +10892,7 @@ class Effect3588(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -10911,7 +10911,7 @@ class Effect3589(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -10928,7 +10928,7 @@ class Effect3590(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -10947,7 +10947,7 @@ class Effect3591(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxTargetRangeBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
 
@@ -11122,7 +11122,7 @@ class Effect3649(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolators1'),
                                       skill='Marauders', **kwargs)
 
@@ -11140,7 +11140,7 @@ class Effect3650(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -11157,7 +11157,7 @@ class Effect3651(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -11174,7 +11174,7 @@ class Effect3652(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(itemGroupIs('Weapon Disruptor'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -11191,7 +11191,7 @@ class Effect3653(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Projectors',
+        fit.modules.filteredItemBoost(itemGroupIs('Burst Projectors'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -11207,7 +11207,7 @@ class Effect3655(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -11224,7 +11224,7 @@ class Effect3656(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -11294,7 +11294,7 @@ class Effect3668(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mining Laser',
+        fit.modules.filteredItemBoost(itemGroupIs('Mining Laser'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -11313,7 +11313,7 @@ class Effect3669(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Frequency Mining Laser',
+        fit.modules.filteredItemBoost(itemGroupIs('Frequency Mining Laser'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -11332,7 +11332,7 @@ class Effect3670(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Strip Miner',
+        fit.modules.filteredItemBoost(itemGroupIs('Strip Miner'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -11349,7 +11349,7 @@ class Effect3671(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Gas Cloud Scoops',
+        fit.modules.filteredItemBoost(itemGroupIs('Gas Cloud Scoops'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -11367,7 +11367,7 @@ class Effect3672(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'maxRangeBonus', implant.getModifiedItemAttr('implantSetORE'), **kwargs)
 
 
@@ -11400,7 +11400,7 @@ class Effect3677(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -11526,7 +11526,7 @@ class Effect3703(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         groups = ('Missile Launcher Rapid Light', 'Missile Launcher Heavy', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -11542,7 +11542,7 @@ class Effect3705(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -11558,7 +11558,7 @@ class Effect3706(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -11605,7 +11605,7 @@ class Effect3739(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonusTractorBeamRange'), **kwargs)
 
 
@@ -11621,7 +11621,7 @@ class Effect3740(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam', 'maxTractorVelocity',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'), 'maxTractorVelocity',
                                       ship.getModifiedItemAttr('roleBonusTractorBeamVelocity'), **kwargs)
 
 
@@ -11637,15 +11637,15 @@ class Effect3744(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
 
 
@@ -11661,7 +11661,7 @@ class Effect3745(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Survey Scanner', 'surveyScanRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Survey Scanner'), 'surveyScanRange',
                                       src.getModifiedItemAttr('roleBonusSurveyScannerRange'), **kwargs)
 
 
@@ -11677,7 +11677,7 @@ class Effect3765(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemMultiply(itemGroupIs('Missile Launcher Torpedo'),
                                          'power', ship.getModifiedItemAttr('stealthBomberLauncherPower'), **kwargs)
 
 
@@ -11693,7 +11693,7 @@ class Effect3766(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusInterceptor'),
                                       skill='Interceptors', **kwargs)
 
@@ -11943,7 +11943,7 @@ class Effect3861(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusMinmatarPropulsion'),
                                       skill='Minmatar Propulsion Systems', **kwargs)
 
@@ -11960,7 +11960,7 @@ class Effect3863(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusCaldariPropulsion'),
                                       skill='Caldari Propulsion Systems', **kwargs)
 
@@ -11977,7 +11977,7 @@ class Effect3864(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusAmarrPropulsion'),
                                       skill='Amarr Propulsion Systems', **kwargs)
 
@@ -12058,7 +12058,7 @@ class Effect3869(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', src.getModifiedItemAttr('subsystemBonusMinmatarPropulsion2'),
                                       skill='Minmatar Propulsion Systems', **kwargs)
 
@@ -12075,7 +12075,7 @@ class Effect3872(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', src.getModifiedItemAttr('subsystemBonusAmarrPropulsion2'),
                                       skill='Amarr Propulsion Systems', **kwargs)
 
@@ -12092,7 +12092,7 @@ class Effect3875(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'capacitorNeed', module.getModifiedItemAttr('subsystemBonusGallentePropulsion'),
                                       skill='Gallente Propulsion Systems', **kwargs)
 
@@ -12173,7 +12173,7 @@ class Effect3959(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', module.getModifiedItemAttr('subsystemBonusAmarrDefensive'),
                                       skill='Amarr Defensive Systems', **kwargs)
 
@@ -12191,7 +12191,7 @@ class Effect3961(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', module.getModifiedItemAttr('subsystemBonusGallenteDefensive'),
                                       skill='Gallente Defensive Systems', **kwargs)
 
@@ -12209,10 +12209,10 @@ class Effect3962(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
                                       skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
                                       skill='Minmatar Defensive Systems', **kwargs)
 
@@ -12230,7 +12230,7 @@ class Effect3964(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', module.getModifiedItemAttr('subsystemBonusCaldariDefensive'),
                                       skill='Caldari Defensive Systems', **kwargs)
 
@@ -12445,7 +12445,7 @@ class Effect4002(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'maxVelocity', beacon.getModifiedItemAttr('missileVelocityMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12480,7 +12480,7 @@ class Effect4016(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Gunnery'),
                                          'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -12498,7 +12498,7 @@ class Effect4017(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'thermalDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12516,7 +12516,7 @@ class Effect4018(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'emDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12534,7 +12534,7 @@ class Effect4019(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12552,7 +12552,7 @@ class Effect4020(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'kineticDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12570,7 +12570,7 @@ class Effect4021(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemMultiply(itemRequiresSkill('Drones'),
                                         'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12588,7 +12588,7 @@ class Effect4022(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Gunnery'),
                                          'trackingSpeed', module.getModifiedItemAttr('trackingSpeedMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12607,7 +12607,7 @@ class Effect4023(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.modules.filteredChargeMultiply(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'aoeVelocity', beacon.getModifiedItemAttr('aoeVelocityMultiplier'),
             stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12829,7 +12829,7 @@ class Effect4045(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'empFieldRange', module.getModifiedItemAttr('empFieldRangeMultiplier'), **kwargs)
 
 
@@ -12846,7 +12846,7 @@ class Effect4046(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'emDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
 
 
@@ -12863,7 +12863,7 @@ class Effect4047(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'thermalDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
 
 
@@ -12880,7 +12880,7 @@ class Effect4048(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'kineticDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
 
 
@@ -12897,7 +12897,7 @@ class Effect4049(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'explosiveDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
 
 
@@ -12914,7 +12914,7 @@ class Effect4054(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Small Energy Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -12932,7 +12932,7 @@ class Effect4055(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Small Projectile Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -12950,7 +12950,7 @@ class Effect4056(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Small Hybrid Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -12968,7 +12968,7 @@ class Effect4057(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets'),
                                            'emDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12986,7 +12986,7 @@ class Effect4058(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13004,7 +13004,7 @@ class Effect4059(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13022,7 +13022,7 @@ class Effect4060(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13040,7 +13040,7 @@ class Effect4061(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Light Missiles'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13058,7 +13058,7 @@ class Effect4062(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Light Missiles'),
                                            'emDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13076,7 +13076,7 @@ class Effect4063(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Light Missiles'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13094,8 +13094,7 @@ class Effect4086(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Repair Systems') or
-                                                     mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Repair Systems', 'Capital Repair Systems'),
                                          'armorDamageAmount', module.getModifiedItemAttr('armorDamageAmountMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13115,8 +13114,7 @@ class Effect4088(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or
-                        mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            itemRequiresSkill('Remote Armor Repair Systems', 'Capital Remote Armor Repair Systems'),
             'armorDamageAmount', module.getModifiedItemAttr('armorDamageAmountMultiplierRemote'),
             stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13136,8 +13134,7 @@ class Effect4089(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Shield Emission Systems') or
-                        mod.item.requiresSkill('Capital Shield Emission Systems'),
+            itemRequiresSkill('Shield Emission Systems', 'Capital Shield Emission Systems'),
             'shieldBonus', module.getModifiedItemAttr('shieldBonusMultiplierRemote'),
             stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13187,7 +13184,7 @@ class Effect4093(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusAmarrOffensive'),
                                       skill='Amarr Offensive Systems', **kwargs)
 
@@ -13204,7 +13201,7 @@ class Effect4104(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusCaldariOffensive'),
                                       skill='Caldari Offensive Systems', **kwargs)
 
@@ -13221,7 +13218,7 @@ class Effect4106(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', module.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                       skill='Gallente Offensive Systems', **kwargs)
 
@@ -13238,7 +13235,7 @@ class Effect4114(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -13255,7 +13252,7 @@ class Effect4115(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -13273,7 +13270,7 @@ class Effect4122(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems', **kwargs)
 
 
@@ -13468,7 +13465,7 @@ class Effect4161(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseMaxScanDeviation',
+            chargeRequiresSkill('Astrometrics'), 'baseMaxScanDeviation',
             container.getModifiedItemAttr('maxScanDeviationModifier') * level, **kwargs)
 
 
@@ -13496,7 +13493,7 @@ class Effect4162(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', container.getModifiedItemAttr('scanStrengthBonus') * level,
                                         stackingPenalties=penalized, **kwargs)
 
@@ -13513,7 +13510,7 @@ class Effect4165(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -13530,7 +13527,7 @@ class Effect4166(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusMF2'),
                                         skill='Minmatar Frigate', **kwargs)
 
@@ -13547,7 +13544,7 @@ class Effect4167(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusGF2'),
                                         skill='Gallente Frigate', **kwargs)
 
@@ -13564,7 +13561,7 @@ class Effect4168(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops', **kwargs)
 
@@ -13649,7 +13646,7 @@ class Effect4215(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'capacitorNeed', module.getModifiedItemAttr('subsystemBonusAmarrOffensive2'),
                                       skill='Amarr Offensive Systems', **kwargs)
 
@@ -13666,7 +13663,7 @@ class Effect4216(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'powerTransferAmount',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'powerTransferAmount',
                                       src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems', **kwargs)
 
 
@@ -13682,7 +13679,7 @@ class Effect4217(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'energyNeutralizerAmount',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'energyNeutralizerAmount',
                                       src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems', **kwargs)
 
 
@@ -13698,13 +13695,13 @@ class Effect4248(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems', **kwargs)
 
@@ -13721,16 +13718,16 @@ class Effect4250(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems', **kwargs)
 
@@ -13747,7 +13744,7 @@ class Effect4251(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -13765,7 +13762,7 @@ class Effect4256(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -13877,7 +13874,7 @@ class Effect4273(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'), 'maxRange',
                                       src.getModifiedItemAttr('subsystemBonusGallenteCore2'), skill='Gallente Core Systems', **kwargs)
 
 
@@ -13893,7 +13890,7 @@ class Effect4274(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('subsystemBonusMinmatarCore2'), skill='Minmatar Core Systems', **kwargs)
 
 
@@ -13973,7 +13970,7 @@ class Effect4282(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                       skill='Gallente Offensive Systems', **kwargs)
 
@@ -13990,7 +13987,7 @@ class Effect4283(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                       skill='Caldari Offensive Systems', **kwargs)
 
@@ -14007,7 +14004,7 @@ class Effect4286(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -14023,7 +14020,7 @@ class Effect4288(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'), skill='Gallente Offensive Systems', **kwargs)
 
 
@@ -14039,7 +14036,7 @@ class Effect4290(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems', 'Remote Armor Repair Systems'),
                                       'capacitorNeed', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -14056,7 +14053,7 @@ class Effect4292(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                       skill='Caldari Offensive Systems', **kwargs)
 
@@ -14073,15 +14070,15 @@ class Effect4321(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanLadarStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scanLadarStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanRadarStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scanRadarStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'maxRange',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanGravimetricStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scanGravimetricStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanMagnetometricStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scanMagnetometricStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
 
 
@@ -14097,13 +14094,13 @@ class Effect4327(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -14119,7 +14116,7 @@ class Effect4330(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusAmarrOffensive3'),
                                       skill='Amarr Offensive Systems', **kwargs)
 
@@ -14136,7 +14133,7 @@ class Effect4331(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles', 'Heavy Assault Missiles'),
                                         'maxVelocity', src.getModifiedItemAttr('subsystemBonusCaldariOffensive3'),
                                         skill='Caldari Offensive Systems', **kwargs)
 
@@ -14186,7 +14183,7 @@ class Effect4347(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', module.getModifiedItemAttr('subsystemBonusGallenteOffensive3'),
                                       skill='Gallente Offensive Systems', **kwargs)
 
@@ -14203,7 +14200,7 @@ class Effect4351(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'trackingSpeed', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -14220,7 +14217,7 @@ class Effect4358(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', module.getModifiedItemAttr('ecmRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -14238,7 +14235,7 @@ class Effect4360(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -14254,13 +14251,13 @@ class Effect4362(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -14276,7 +14273,7 @@ class Effect4366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -14292,7 +14289,7 @@ class Effect4370(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusCC2'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -14309,7 +14306,7 @@ class Effect4372(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusCB3'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -14347,7 +14344,7 @@ class Effect4377(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -14363,7 +14360,7 @@ class Effect4378(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -14379,7 +14376,7 @@ class Effect4379(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -14395,7 +14392,7 @@ class Effect4380(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -14411,7 +14408,7 @@ class Effect4384(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                         skill='Recon Ships', **kwargs)
 
@@ -14428,7 +14425,7 @@ class Effect4385(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                         skill='Recon Ships', **kwargs)
 
@@ -14446,7 +14443,7 @@ class Effect4393(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops', **kwargs)
 
@@ -14463,7 +14460,7 @@ class Effect4394(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'), skill='Covert Ops', **kwargs)
 
 
@@ -14480,7 +14477,7 @@ class Effect4395(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops', **kwargs)
 
@@ -14497,7 +14494,7 @@ class Effect4396(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops', **kwargs)
 
@@ -14514,7 +14511,7 @@ class Effect4398(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -14530,7 +14527,7 @@ class Effect4413(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -14547,7 +14544,7 @@ class Effect4415(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -14563,7 +14560,7 @@ class Effect4416(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -14579,7 +14576,7 @@ class Effect4417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -14657,7 +14654,7 @@ class Effect4456(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanMagnetometricStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetFederationNavy'), **kwargs)
 
@@ -14675,7 +14672,7 @@ class Effect4457(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanRadarStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetImperialNavy'), **kwargs)
 
@@ -14693,7 +14690,7 @@ class Effect4458(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanLadarStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetRepublicFleet'), **kwargs)
 
@@ -14711,7 +14708,7 @@ class Effect4459(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanGravimetricStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetCaldariNavy'), **kwargs)
 
@@ -14729,7 +14726,7 @@ class Effect4460(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanRadarStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGImperialNavy'), **kwargs)
 
@@ -14747,7 +14744,7 @@ class Effect4461(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanMagnetometricStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGFederationNavy'), **kwargs)
 
@@ -14765,7 +14762,7 @@ class Effect4462(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanGravimetricStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGCaldariNavy'), **kwargs)
 
@@ -14783,7 +14780,7 @@ class Effect4463(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanLadarStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGRepublicFleet'), **kwargs)
 
@@ -14800,7 +14797,7 @@ class Effect4464(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusMF'), stackingPenalties=True, skill='Minmatar Frigate', **kwargs)
 
 
@@ -14818,7 +14815,7 @@ class Effect4471(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -14834,7 +14831,7 @@ class Effect4472(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -14867,7 +14864,7 @@ class Effect4474(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -14883,7 +14880,7 @@ class Effect4475(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -14899,7 +14896,7 @@ class Effect4476(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -14915,7 +14912,7 @@ class Effect4477(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -14931,7 +14928,7 @@ class Effect4478(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusATF1'), **kwargs)
 
 
@@ -14947,7 +14944,7 @@ class Effect4479(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Survey Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Survey Probe'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusCovertOps3'),
                                         skill='Covert Ops', **kwargs)
 
@@ -14966,7 +14963,7 @@ class Effect4482(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -14982,7 +14979,7 @@ class Effect4484(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -14998,7 +14995,7 @@ class Effect4485(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -15083,7 +15080,7 @@ class Effect4510(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -15100,7 +15097,7 @@ class Effect4512(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -15117,7 +15114,7 @@ class Effect4513(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -15134,7 +15131,7 @@ class Effect4515(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -15151,7 +15148,7 @@ class Effect4516(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -15167,7 +15164,7 @@ class Effect4527(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -15184,7 +15181,7 @@ class Effect4555(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'),
                                         'emDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -15200,7 +15197,7 @@ class Effect4556(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'),
                                         'explosiveDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -15216,7 +15213,7 @@ class Effect4557(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'),
                                         'kineticDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -15232,7 +15229,7 @@ class Effect4558(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'),
                                         'thermalDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -15249,7 +15246,7 @@ class Effect4559(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         for attr in ('maxRange', 'falloff', 'trackingSpeed'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           attr, module.getModifiedItemAttr('%sBonus' % attr),
                                           stackingPenalties=True, **kwargs)
 
@@ -15274,55 +15271,55 @@ class Effect4575(BaseEffect):
                                   stackingPenalties=True, **kwargs)
 
         #  Remote Shield Repper Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'duration', src.getModifiedItemAttr('industrialCoreRemoteLogisticsDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'maxRange', src.getModifiedItemAttr('industrialCoreRemoteLogisticsRangeBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'capacitorNeed', src.getModifiedItemAttr('industrialCoreRemoteLogisticsDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('industrialCoreRemoteLogisticsRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
         #  Local Shield Repper Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'),
                                       'duration', src.getModifiedItemAttr('industrialCoreLocalLogisticsDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('industrialCoreLocalLogisticsAmountBonus'),
                                       stackingPenalties=True, **kwargs)
 
         # Mining Burst Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
 
         #  Command Burst Range Bonus
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'),
                                       'maxRange', src.getModifiedItemAttr('industrialCoreBonusCommandBurstRange'),
                                       stackingPenalties=True, **kwargs)
 
         # Drone Bonuses
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Operation'),
                                      'duration', src.getModifiedItemAttr('industrialCoreBonusDroneIceHarvesting'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount', src.getModifiedItemAttr('industrialCoreBonusDroneMining'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', src.getModifiedItemAttr('industrialCoreBonusDroneVelocity'),
                                      stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
                                      stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
 
         # Remote impedance (no reps, etc)
@@ -15346,7 +15343,7 @@ class Effect4576(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'falloffBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -15363,7 +15360,7 @@ class Effect4577(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'falloffBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -15380,7 +15377,7 @@ class Effect4579(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Stasis Webifying Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Stasis Webifying Drone'),
                                      'speedFactor', module.getModifiedItemAttr('webSpeedFactorBonus'), **kwargs)
 
 
@@ -15396,7 +15393,7 @@ class Effect4619(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -15414,7 +15411,7 @@ class Effect4620(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -15449,7 +15446,7 @@ class Effect4622(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -15465,7 +15462,7 @@ class Effect4623(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -15481,7 +15478,7 @@ class Effect4624(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -15497,7 +15494,7 @@ class Effect4625(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -15515,7 +15512,7 @@ class Effect4626(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -15534,7 +15531,7 @@ class Effect4635(BaseEffect):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+                chargeRequiresSkill('Cruise Missiles', 'Torpedoes'),
                 '{0}Damage'.format(damageType), ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -15551,7 +15548,7 @@ class Effect4636(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+            chargeRequiresSkill('Cruise Missiles', 'Torpedoes'),
             'aoeVelocity', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -15569,7 +15566,7 @@ class Effect4637(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+            chargeRequiresSkill('Cruise Missiles', 'Torpedoes'),
             'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'), skill='Caldari Battleship', **kwargs)
 
 
@@ -15607,7 +15604,7 @@ class Effect4643(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusAC'),
                                             skill='Amarr Cruiser', **kwargs)
 
@@ -15626,7 +15623,7 @@ class Effect4645(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         groups = ('Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault', 'Missile Launcher Heavy')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -15645,7 +15642,7 @@ class Effect4648(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         sensorTypes = ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar')
         for type in sensorTypes:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scan{0}StrengthBonus'.format(type),
+            fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
 
 
@@ -15662,7 +15659,7 @@ class Effect4649(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         affectedGroups = ('Missile Launcher Cruise', 'Missile Launcher Torpedo')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in affectedGroups,
+        fit.modules.filteredItemBoost(itemGroupIs(*affectedGroups),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -15678,7 +15675,7 @@ class Effect4667(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusOreIndustrial1'),
                                       skill='ORE Hauler', **kwargs)
 
@@ -15695,7 +15692,7 @@ class Effect4668(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'duration', ship.getModifiedItemAttr('shipBonusOreIndustrial1'),
                                       skill='ORE Hauler', **kwargs)
 
@@ -15712,7 +15709,7 @@ class Effect4669(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'maxTractorVelocity', ship.getModifiedItemAttr('shipBonusOreIndustrial2'),
                                       skill='ORE Hauler', **kwargs)
 
@@ -15729,7 +15726,7 @@ class Effect4670(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusOreIndustrial2'),
                                       skill='ORE Hauler', **kwargs)
 
@@ -15751,11 +15748,11 @@ class Effect4728(BaseEffect):
         damages = ('em', 'thermal', 'kinetic', 'explosive')
         for damage in damages:
             # Nerf missile damage
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                             '{0}Damage'.format(damage),
                                             beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
             # Nerf smartbomb damage
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Smart Bomb',
+            fit.modules.filteredItemBoost(itemGroupIs('Smart Bomb'),
                                           '{0}Damage'.format(damage),
                                           beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
             # Nerf armor resistances
@@ -15768,7 +15765,7 @@ class Effect4728(BaseEffect):
         fit.drones.filteredItemBoost(lambda drone: True,
                                      'damageMultiplier', beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
         # Nerf turret damage output
-        fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'damageMultiplier', beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
 
 
@@ -15800,7 +15797,7 @@ class Effect4775(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonus2AF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -15817,7 +15814,7 @@ class Effect4782(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -15833,7 +15830,7 @@ class Effect4789(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusATF1'), **kwargs)
 
 
@@ -15849,7 +15846,7 @@ class Effect4793(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
 
 
@@ -15865,7 +15862,7 @@ class Effect4794(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Light',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Light'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
 
 
@@ -15881,7 +15878,7 @@ class Effect4795(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
 
 
@@ -15899,7 +15896,7 @@ class Effect4799(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         sensorTypes = ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar')
         for type in sensorTypes:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+            fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
 
@@ -15918,7 +15915,7 @@ class Effect4804(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill(skill), 'accessDifficultyBonus',
+        fit.modules.filteredItemMultiply(itemRequiresSkill(skill), 'accessDifficultyBonus',
                                          skill.getModifiedItemAttr('accessDifficultyBonusAbsolutePercent') * skill.level, **kwargs)
 
 
@@ -15934,7 +15931,7 @@ class Effect4809(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanGravimetricStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True, **kwargs)
 
@@ -15951,7 +15948,7 @@ class Effect4810(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanLadarStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True, **kwargs)
 
@@ -15968,7 +15965,7 @@ class Effect4811(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanMagnetometricStrengthBonus',
                                       module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True, **kwargs)
@@ -15986,7 +15983,7 @@ class Effect4812(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanRadarStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True, **kwargs)
 
@@ -16003,7 +16000,7 @@ class Effect4814(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'consumptionQuantity',
+        fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'consumptionQuantity',
                                       skill.getModifiedItemAttr('consumptionQuantityBonusPercent') * skill.level, **kwargs)
 
 
@@ -16019,7 +16016,7 @@ class Effect4817(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Salvager',
+        fit.modules.filteredItemBoost(itemGroupIs('Salvager'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -16035,7 +16032,7 @@ class Effect4820(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Energy Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
 
 
@@ -16052,7 +16049,7 @@ class Effect4821(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Hybrid Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
 
 
@@ -16068,7 +16065,7 @@ class Effect4822(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Projectile Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
 
 
@@ -16084,7 +16081,7 @@ class Effect4823(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Energy Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
 
 
@@ -16101,7 +16098,7 @@ class Effect4824(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Hybrid Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
 
 
@@ -16117,7 +16114,7 @@ class Effect4825(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Projectile Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
 
 
@@ -16133,7 +16130,7 @@ class Effect4826(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Energy Turret'),
                                          'capacitorNeed', ship.getModifiedItemAttr('bcLargeTurretCap'), **kwargs)
 
 
@@ -16150,7 +16147,7 @@ class Effect4827(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Hybrid Turret'),
                                          'capacitorNeed', ship.getModifiedItemAttr('bcLargeTurretCap'), **kwargs)
 
 
@@ -16167,7 +16164,7 @@ class Effect4867(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'powerEngineeringOutputBonus',
                                                  implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
@@ -16185,7 +16182,7 @@ class Effect4868(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'capacitorCapacityBonus',
                                                  implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
@@ -16203,7 +16200,7 @@ class Effect4869(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'cpuOutputBonus2', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -16220,7 +16217,7 @@ class Effect4871(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'capRechargeBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -16236,7 +16233,7 @@ class Effect4896(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -16252,7 +16249,7 @@ class Effect4897(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -16268,7 +16265,7 @@ class Effect4898(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -16284,7 +16281,7 @@ class Effect4901(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -16302,7 +16299,7 @@ class Effect4902(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('MWDSignatureRadiusBonus'), **kwargs)
 
 
@@ -16319,7 +16316,7 @@ class Effect4906(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'),
                                           'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -16366,7 +16363,7 @@ class Effect4923(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Micro Jump Drive Operation'),
                                       'duration', skill.getModifiedItemAttr('durationBonus') * skill.level, **kwargs)
 
 
@@ -16510,7 +16507,7 @@ class Effect4934(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -16546,7 +16543,7 @@ class Effect4941(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -16562,7 +16559,7 @@ class Effect4945(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Signature Suppressor',
+        fit.modules.filteredItemBoost(itemGroupIs('Signature Suppressor'),
                                       'durationHighisGood', skill.getModifiedItemAttr('durationBonus') * skill.level, **kwargs)
 
 
@@ -16578,7 +16575,7 @@ class Effect4950(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -16599,7 +16596,7 @@ class Effect4951(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
             'shieldBonus', container.getModifiedItemAttr('shieldBoostMultiplier'), **kwargs)
 
 
@@ -16616,8 +16613,7 @@ class Effect4961(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Shield Operation') or
-                                                     mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
                                          'shieldBonus', module.getModifiedItemAttr('shieldBonusMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -16636,7 +16632,7 @@ class Effect4967(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
             'duration', module.getModifiedItemAttr('durationSkillBonus'), **kwargs)
 
 
@@ -16656,7 +16652,7 @@ class Effect4970(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('boosterShieldBoostAmountPenalty'), **kwargs)
 
 
@@ -16672,7 +16668,7 @@ class Effect4972(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Light',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Light'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -16688,7 +16684,7 @@ class Effect4973(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rocket',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rocket'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -16705,7 +16701,7 @@ class Effect4974(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('eliteBonusViolators2'), skill='Marauders', **kwargs)
 
 
@@ -16721,7 +16717,7 @@ class Effect4975(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -16738,9 +16734,9 @@ class Effect4976(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Resistance Shift Hardener', 'duration',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Resistance Shift Hardener'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Resistance Phasing'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Resistance Phasing'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -16756,7 +16752,7 @@ class Effect4989(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeCloudSize', implant.getModifiedItemAttr('aoeCloudSizeBonus'), **kwargs)
 
 
@@ -16773,7 +16769,7 @@ class Effect4990(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('rookieSETCapBonus'), **kwargs)
 
 
@@ -16791,7 +16787,7 @@ class Effect4991(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSETDamageBonus'), **kwargs)
 
 
@@ -16883,7 +16879,7 @@ class Effect4999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSHTOptimalBonus'), **kwargs)
 
 
@@ -16899,7 +16895,7 @@ class Effect5000(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('rookieMissileKinDamageBonus'), **kwargs)
 
 
@@ -16985,7 +16981,7 @@ class Effect5013(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSHTDamageBonus'), **kwargs)
 
 
@@ -17005,7 +17001,7 @@ class Effect5014(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
 
 
@@ -17021,7 +17017,7 @@ class Effect5015(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('rookieDampStrengthBonus'), **kwargs)
 
 
@@ -17037,7 +17033,7 @@ class Effect5016(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('rookieDampStrengthBonus'), **kwargs)
 
 
@@ -17053,7 +17049,7 @@ class Effect5017(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('rookieArmorRepBonus'), **kwargs)
 
 
@@ -17084,7 +17080,7 @@ class Effect5019(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('rookieTargetPainterStrengthBonus'), **kwargs)
 
 
@@ -17101,7 +17097,7 @@ class Effect5020(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSPTDamageBonus'), **kwargs)
 
 
@@ -17118,7 +17114,7 @@ class Effect5021(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('rookieShieldBoostBonus'), **kwargs)
 
 
@@ -17135,7 +17131,7 @@ class Effect5028(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for type in ('Gravimetric', 'Ladar', 'Radar', 'Magnetometric'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('rookieECMStrengthBonus'), **kwargs)
 
@@ -17155,7 +17151,7 @@ class Effect5030(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount', container.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
 
 
@@ -17176,7 +17172,7 @@ class Effect5035(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          type, ship.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
 
 
@@ -17192,7 +17188,7 @@ class Effect5036(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -17208,7 +17204,7 @@ class Effect5045(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17224,7 +17220,7 @@ class Effect5048(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusGF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -17240,7 +17236,7 @@ class Effect5051(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17256,7 +17252,7 @@ class Effect5058(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Mining'),
                                          'miningAmount', module.getModifiedItemAttr('miningAmountMultiplier'), **kwargs)
 
 
@@ -17273,7 +17269,7 @@ class Effect5066(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Target Painting'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17323,7 +17319,7 @@ class Effect5069(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Mercoxit Ore Processing'),
+            chargeRequiresSkill('Mercoxit Ore Processing'),
             'specializationAsteroidYieldMultiplier',
             module.getModifiedItemAttr('miningAmountBonus'), **kwargs)
 
@@ -17341,7 +17337,7 @@ class Effect5079(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17359,7 +17355,7 @@ class Effect5080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17395,7 +17391,7 @@ class Effect5087(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -17413,7 +17409,7 @@ class Effect5090(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17429,7 +17425,7 @@ class Effect5103(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17445,7 +17441,7 @@ class Effect5104(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17461,7 +17457,7 @@ class Effect5105(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17477,7 +17473,7 @@ class Effect5106(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17493,7 +17489,7 @@ class Effect5107(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -17509,7 +17505,7 @@ class Effect5108(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -17527,7 +17523,7 @@ class Effect5109(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -17544,7 +17540,7 @@ class Effect5110(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -17562,7 +17558,7 @@ class Effect5111(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -17579,7 +17575,7 @@ class Effect5119(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonus2AF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -17597,7 +17593,7 @@ class Effect5121(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('energyTransferAmountBonus'), **kwargs)
 
 
@@ -17613,7 +17609,7 @@ class Effect5122(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -17629,7 +17625,7 @@ class Effect5123(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -17645,7 +17641,7 @@ class Effect5124(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -17661,7 +17657,7 @@ class Effect5125(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -17678,7 +17674,7 @@ class Effect5126(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -17694,7 +17690,7 @@ class Effect5127(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -17710,7 +17706,7 @@ class Effect5128(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -17727,7 +17723,7 @@ class Effect5129(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMC'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -17747,7 +17743,7 @@ class Effect5131(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -17765,7 +17761,7 @@ class Effect5132(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -17781,7 +17777,7 @@ class Effect5133(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -17801,7 +17797,7 @@ class Effect5136(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -17817,7 +17813,7 @@ class Effect5139(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'miningAmount', module.getModifiedItemAttr('miningFrigatesBonusOreMiningYield'),
                                       skill='Mining Frigate', **kwargs)
 
@@ -17835,7 +17831,7 @@ class Effect5153(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -17852,9 +17848,9 @@ class Effect5162(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Resistance Shift Hardener', 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Resistance Shift Hardener'), 'capacitorNeed',
                                       src.getModifiedItemAttr('capNeedBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Resistance Phasing'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Resistance Phasing'), 'capacitorNeed',
                                       src.getModifiedItemAttr('capNeedBonus') * lvl, **kwargs)
 
 
@@ -17871,7 +17867,7 @@ class Effect5165(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -17888,7 +17884,7 @@ class Effect5168(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.drones.filteredItemIncrease(
-            lambda drone: drone.item.requiresSkill('Salvage Drone Operation'), 'accessDifficultyBonus',
+            itemRequiresSkill('Salvage Drone Operation'), 'accessDifficultyBonus',
             container.getModifiedItemAttr('accessDifficultyBonus') * container.level, **kwargs)
 
 
@@ -17966,7 +17962,7 @@ class Effect5185(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonus2AF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -17983,7 +17979,7 @@ class Effect5187(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusGC'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -18001,7 +17997,7 @@ class Effect5188(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalize = 'booster' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=penalize, **kwargs)
 
@@ -18021,7 +18017,7 @@ class Effect5189(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalties = 'booster' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=penalties, **kwargs)
 
@@ -18039,7 +18035,7 @@ class Effect5190(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         penalize = 'booster' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=penalize, **kwargs)
 
@@ -18057,7 +18053,7 @@ class Effect5201(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plate',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Plate'),
                                       'massAddition', container.getModifiedItemAttr('massPenaltyReduction') * level, **kwargs)
 
 
@@ -18073,7 +18069,7 @@ class Effect5205(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSETTracking'), **kwargs)
 
 
@@ -18089,7 +18085,7 @@ class Effect5206(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSETOptimal'), **kwargs)
 
 
@@ -18105,7 +18101,7 @@ class Effect5207(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('rookieNosDrain'), **kwargs)
 
 
@@ -18121,7 +18117,7 @@ class Effect5208(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('rookieNeutDrain'), **kwargs)
 
 
@@ -18138,7 +18134,7 @@ class Effect5209(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('rookieWebAmount'), **kwargs)
 
 
@@ -18170,7 +18166,7 @@ class Effect5213(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'maxVelocity', ship.getModifiedItemAttr('rookieRocketVelocity'), **kwargs)
 
 
@@ -18186,7 +18182,7 @@ class Effect5214(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('rookieLightMissileVelocity'), **kwargs)
 
 
@@ -18202,7 +18198,7 @@ class Effect5215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSHTTracking'), **kwargs)
 
 
@@ -18218,7 +18214,7 @@ class Effect5216(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('rookieSHTFalloff'), **kwargs)
 
 
@@ -18234,7 +18230,7 @@ class Effect5217(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSPTTracking'), **kwargs)
 
 
@@ -18250,7 +18246,7 @@ class Effect5218(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('rookieSPTFalloff'), **kwargs)
 
 
@@ -18266,7 +18262,7 @@ class Effect5219(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSPTOptimal'), **kwargs)
 
 
@@ -18282,7 +18278,7 @@ class Effect5220(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18298,7 +18294,7 @@ class Effect5221(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18314,7 +18310,7 @@ class Effect5222(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18330,7 +18326,7 @@ class Effect5223(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18346,7 +18342,7 @@ class Effect5224(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18362,7 +18358,7 @@ class Effect5225(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18378,7 +18374,7 @@ class Effect5226(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18394,7 +18390,7 @@ class Effect5227(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18410,7 +18406,7 @@ class Effect5228(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18430,7 +18426,7 @@ class Effect5229(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', container.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -18486,7 +18482,7 @@ class Effect5234(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'explosiveDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -18503,7 +18499,7 @@ class Effect5237(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'kineticDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -18521,7 +18517,7 @@ class Effect5240(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'thermalDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -18539,7 +18535,7 @@ class Effect5243(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'emDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -18556,7 +18552,7 @@ class Effect5259(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemBoost(itemGroupIs('Cloaking Device'),
                                       'cpu', ship.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -18573,7 +18569,7 @@ class Effect5260(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'),
                                       'cpu', ship.getModifiedItemAttr('eliteBonusCovertOps1'), skill='Covert Ops', **kwargs)
 
 
@@ -18605,7 +18601,7 @@ class Effect5262(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Cloaking'),
                                          'covertCloakCPUAdd', module.getModifiedItemAttr('covertCloakCPUPenalty'), **kwargs)
 
 
@@ -18621,7 +18617,7 @@ class Effect5263(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Cynosural Field Theory'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Cynosural Field Theory'),
                                          'covertCloakCPUAdd', module.getModifiedItemAttr('covertCloakCPUPenalty'), **kwargs)
 
 
@@ -18653,7 +18649,7 @@ class Effect5265(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'),
                                          'warfareLinkCPUAdd', module.getModifiedItemAttr('warfareLinkCPUPenalty'), **kwargs)
 
 
@@ -18670,7 +18666,7 @@ class Effect5266(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemBoost(itemGroupIs('Cloaking Device'),
                                       'cpu', ship.getModifiedItemAttr('eliteIndustrialCovertCloakBonus'),
                                       skill='Transport Ships', **kwargs)
 
@@ -18688,7 +18684,7 @@ class Effect5267(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -18705,7 +18701,7 @@ class Effect5268(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -18747,7 +18743,7 @@ class Effect5293(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -18763,7 +18759,7 @@ class Effect5294(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -18779,7 +18775,7 @@ class Effect5295(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -18795,11 +18791,11 @@ class Effect5300(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -18815,7 +18811,7 @@ class Effect5303(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -18831,7 +18827,7 @@ class Effect5304(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -18847,7 +18843,7 @@ class Effect5305(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer', **kwargs)
 
@@ -18864,7 +18860,7 @@ class Effect5306(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer', **kwargs)
 
@@ -18881,7 +18877,7 @@ class Effect5307(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -18897,7 +18893,7 @@ class Effect5308(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -18913,7 +18909,7 @@ class Effect5309(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -18931,7 +18927,7 @@ class Effect5310(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGD2'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -18947,7 +18943,7 @@ class Effect5311(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -18963,11 +18959,11 @@ class Effect5316(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -18984,7 +18980,7 @@ class Effect5317(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMD1'),
                                       skill='Minmatar Destroyer', **kwargs)
 
@@ -19002,7 +18998,7 @@ class Effect5318(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMD2'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -19018,7 +19014,7 @@ class Effect5319(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer', **kwargs)
 
@@ -19035,7 +19031,7 @@ class Effect5320(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer', **kwargs)
 
@@ -19052,7 +19048,7 @@ class Effect5321(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMD2'),
                                       skill='Minmatar Destroyer', **kwargs)
 
@@ -19141,7 +19137,7 @@ class Effect5326(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                      skill='Amarr Battlecruiser', **kwargs)
 
@@ -19159,7 +19155,7 @@ class Effect5331(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusABC2'), skill='Amarr Battlecruiser', **kwargs)
 
 
@@ -19175,7 +19171,7 @@ class Effect5332(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19192,7 +19188,7 @@ class Effect5333(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19210,7 +19206,7 @@ class Effect5334(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -19299,7 +19295,7 @@ class Effect5339(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser', **kwargs)
 
@@ -19317,7 +19313,7 @@ class Effect5340(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser', **kwargs)
 
@@ -19335,7 +19331,7 @@ class Effect5341(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19354,7 +19350,7 @@ class Effect5342(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19371,7 +19367,7 @@ class Effect5343(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
                                      skill='Gallente Battlecruiser', **kwargs)
 
@@ -19389,7 +19385,7 @@ class Effect5348(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
 
 
@@ -19405,7 +19401,7 @@ class Effect5349(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19421,7 +19417,7 @@ class Effect5350(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19438,7 +19434,7 @@ class Effect5351(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMBC1'),
                                       skill='Minmatar Battlecruiser', **kwargs)
 
@@ -19456,7 +19452,7 @@ class Effect5352(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMBC1'),
                                       skill='Minmatar Battlecruiser', **kwargs)
 
@@ -19473,7 +19469,7 @@ class Effect5353(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19489,7 +19485,7 @@ class Effect5354(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19506,7 +19502,7 @@ class Effect5355(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19523,7 +19519,7 @@ class Effect5356(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -19539,7 +19535,7 @@ class Effect5357(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCBC2'),
                                       skill='Caldari Battlecruiser', **kwargs)
 
@@ -19556,7 +19552,7 @@ class Effect5358(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGBC1'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19573,7 +19569,7 @@ class Effect5359(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19590,7 +19586,7 @@ class Effect5360(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC1'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19606,7 +19602,7 @@ class Effect5361(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19628,7 +19624,7 @@ class Effect5364(BaseEffect):
     @staticmethod
     def handler(fit, booster, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Capital Repair Systems'),
+            itemRequiresSkill('Repair Systems', 'Capital Repair Systems'),
             'armorDamageAmount', booster.getModifiedItemAttr('armorDamageAmountBonus') or 0, **kwargs)
 
 
@@ -19645,7 +19641,7 @@ class Effect5365(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('eliteBonusViolators2'),
                                       skill='Marauders', **kwargs)
 
@@ -19662,7 +19658,7 @@ class Effect5366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -19678,7 +19674,7 @@ class Effect5367(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGB2'),
                                       skill='Gallente Battleship', **kwargs)
 
@@ -19695,7 +19691,7 @@ class Effect5378(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser', **kwargs)
 
@@ -19712,7 +19708,7 @@ class Effect5379(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser', **kwargs)
 
@@ -19729,7 +19725,7 @@ class Effect5380(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19746,7 +19742,7 @@ class Effect5381(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19765,7 +19761,7 @@ class Effect5382(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -19783,7 +19779,7 @@ class Effect5383(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19801,7 +19797,7 @@ class Effect5384(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19819,7 +19815,7 @@ class Effect5385(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19835,7 +19831,7 @@ class Effect5386(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19851,7 +19847,7 @@ class Effect5387(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19867,7 +19863,7 @@ class Effect5388(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19883,7 +19879,7 @@ class Effect5397(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseMaxScanDeviation',
                                         module.getModifiedItemAttr('maxScanDeviationModifierModule'),
                                         stackingPenalties=True, **kwargs)
@@ -19901,7 +19897,7 @@ class Effect5398(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Astrometrics'),
                                       'duration', module.getModifiedItemAttr('scanDurationBonus'), **kwargs)
 
 
@@ -19917,7 +19913,7 @@ class Effect5399(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', module.getModifiedItemAttr('scanStrengthBonusModule'),
                                         stackingPenalties=True, **kwargs)
 
@@ -19934,7 +19930,7 @@ class Effect5402(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusABC2'),
                                         skill='Amarr Battlecruiser', **kwargs)
 
@@ -19951,7 +19947,7 @@ class Effect5403(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusABC2'),
                                         skill='Amarr Battlecruiser', **kwargs)
 
@@ -19968,7 +19964,7 @@ class Effect5410(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19985,7 +19981,7 @@ class Effect5411(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -20001,7 +19997,7 @@ class Effect5417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20017,7 +20013,7 @@ class Effect5418(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20033,7 +20029,7 @@ class Effect5419(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20049,7 +20045,7 @@ class Effect5420(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20066,7 +20062,7 @@ class Effect5424(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -20082,7 +20078,7 @@ class Effect5427(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -20098,7 +20094,7 @@ class Effect5428(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxRange', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -20114,7 +20110,7 @@ class Effect5429(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMB2'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -20131,7 +20127,7 @@ class Effect5430(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMB2'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -20149,7 +20145,7 @@ class Effect5431(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20172,7 +20168,7 @@ class Effect5433(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Hacking'),
                                          'virusCoherence', container.getModifiedItemAttr('virusCoherenceBonus') * level, **kwargs)
 
 
@@ -20193,7 +20189,7 @@ class Effect5437(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Archaeology'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Archaeology'),
                                          'virusCoherence', container.getModifiedItemAttr('virusCoherenceBonus') * level, **kwargs)
 
 
@@ -20210,7 +20206,7 @@ class Effect5440(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Light Missiles'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -20227,7 +20223,7 @@ class Effect5444(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -20243,7 +20239,7 @@ class Effect5445(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -20259,7 +20255,7 @@ class Effect5456(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -20275,7 +20271,7 @@ class Effect5457(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -20292,7 +20288,7 @@ class Effect5459(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'), 'virusStrength', src.getModifiedItemAttr('virusStrengthBonus'), **kwargs)
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Hacking'), 'virusStrength', src.getModifiedItemAttr('virusStrengthBonus'), **kwargs)
 
 
 class Effect5460(BaseEffect):
@@ -20458,7 +20454,7 @@ class Effect5480(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'implantBonusVelocity', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -20475,7 +20471,7 @@ class Effect5482(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'agilityBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -20492,7 +20488,7 @@ class Effect5483(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'shieldCapacityBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -20509,7 +20505,7 @@ class Effect5484(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'armorHpBonus2', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -20525,7 +20521,7 @@ class Effect5485(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -20541,7 +20537,7 @@ class Effect5486(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMBC2'),
                                       skill='Minmatar Battlecruiser', **kwargs)
 
@@ -20559,7 +20555,7 @@ class Effect5496(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
 
 
@@ -20576,7 +20572,7 @@ class Effect5497(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
 
 
@@ -20592,7 +20588,7 @@ class Effect5499(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships', **kwargs)
 
@@ -20609,7 +20605,7 @@ class Effect5500(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships', **kwargs)
 
@@ -20626,7 +20622,7 @@ class Effect5501(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                       skill='Command Ships', **kwargs)
 
@@ -20643,7 +20639,7 @@ class Effect5503(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                      skill='Command Ships', **kwargs)
 
@@ -20660,7 +20656,7 @@ class Effect5505(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
 
 
@@ -20678,7 +20674,7 @@ class Effect5514(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType),
                                             ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships', **kwargs)
 
@@ -20697,7 +20693,7 @@ class Effect5521(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                             '{0}Damage'.format(damageType),
                                             ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships', **kwargs)
 
@@ -20714,7 +20710,7 @@ class Effect5539(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -20730,7 +20726,7 @@ class Effect5540(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -20746,7 +20742,7 @@ class Effect5541(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -20762,7 +20758,7 @@ class Effect5542(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -20778,7 +20774,7 @@ class Effect5552(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers', **kwargs)
 
@@ -20795,7 +20791,7 @@ class Effect5553(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers', **kwargs)
 
@@ -20812,7 +20808,7 @@ class Effect5554(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -20829,7 +20825,7 @@ class Effect5555(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'maxVelocity', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -20845,7 +20841,7 @@ class Effect5556(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -20861,7 +20857,7 @@ class Effect5557(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                      skill='Heavy Assault Cruisers', **kwargs)
 
@@ -20878,7 +20874,7 @@ class Effect5558(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                      skill='Heavy Assault Cruisers', **kwargs)
 
@@ -20895,7 +20891,7 @@ class Effect5559(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -20911,7 +20907,7 @@ class Effect5560(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Micro Jump Drive',
+        fit.modules.filteredItemBoost(itemGroupIs('Micro Jump Drive'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('roleBonusMarauder'), **kwargs)
 
 
@@ -20988,7 +20984,7 @@ class Effect5572(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
                                           skill='Command Ships', **kwargs)
 
@@ -21006,7 +21002,7 @@ class Effect5573(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
                                           skill='Command Ships', **kwargs)
 
@@ -21024,7 +21020,7 @@ class Effect5574(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
                                           skill='Command Ships', **kwargs)
 
@@ -21042,7 +21038,7 @@ class Effect5575(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
                                           skill='Command Ships', **kwargs)
 
@@ -21062,7 +21058,7 @@ class Effect5607(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capacitor Emission Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -21080,7 +21076,7 @@ class Effect5610(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -21096,7 +21092,7 @@ class Effect5611(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGB2'), skill='Gallente Battleship', **kwargs)
 
 
@@ -21113,7 +21109,7 @@ class Effect5618(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -21129,7 +21125,7 @@ class Effect5619(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -21145,7 +21141,7 @@ class Effect5620(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21161,7 +21157,7 @@ class Effect5621(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21177,7 +21173,7 @@ class Effect5622(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21193,7 +21189,7 @@ class Effect5628(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21209,7 +21205,7 @@ class Effect5629(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21226,7 +21222,7 @@ class Effect5630(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21243,7 +21239,7 @@ class Effect5631(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21260,7 +21256,7 @@ class Effect5632(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21277,7 +21273,7 @@ class Effect5633(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21293,7 +21289,7 @@ class Effect5634(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21310,7 +21306,7 @@ class Effect5635(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21327,7 +21323,7 @@ class Effect5636(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21343,7 +21339,7 @@ class Effect5637(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21360,7 +21356,7 @@ class Effect5638(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21377,7 +21373,7 @@ class Effect5639(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21395,7 +21391,7 @@ class Effect5644(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'maxVelocity',
+            chargeRequiresSkill('Heavy Assault Missiles'), 'maxVelocity',
             ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -21422,7 +21418,7 @@ class Effect5647(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'),
                                       'cpu', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21474,7 +21470,7 @@ class Effect5673(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors', **kwargs)
 
@@ -21509,7 +21505,7 @@ class Effect5717(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'WarpSBonus', implant.getModifiedItemAttr('implantSetWarpSpeed'), **kwargs)
 
 
@@ -21525,7 +21521,7 @@ class Effect5721(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21541,7 +21537,7 @@ class Effect5723(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusInterdictors2'),
                                       skill='Interdictors', **kwargs)
 
@@ -21558,7 +21554,7 @@ class Effect5724(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -21574,7 +21570,7 @@ class Effect5725(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21590,7 +21586,7 @@ class Effect5726(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21606,7 +21602,7 @@ class Effect5733(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -21622,7 +21618,7 @@ class Effect5734(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -21638,7 +21634,7 @@ class Effect5735(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -21654,7 +21650,7 @@ class Effect5736(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -21670,7 +21666,7 @@ class Effect5737(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21686,9 +21682,9 @@ class Effect5738(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -21765,7 +21761,7 @@ class Effect5769(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'structureDamageAmount', container.getModifiedItemAttr('damageHP') * level, **kwargs)
 
 
@@ -21782,7 +21778,7 @@ class Effect5778(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -21800,7 +21796,7 @@ class Effect5779(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -21819,7 +21815,7 @@ class Effect5793(BaseEffect):
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
         for attr in ('maxRangeBonus', 'falloffBonus'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'),
                                           attr, container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
 
 
@@ -21835,7 +21831,7 @@ class Effect5802(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -21851,7 +21847,7 @@ class Effect5803(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21867,7 +21863,7 @@ class Effect5804(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21883,7 +21879,7 @@ class Effect5805(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21899,7 +21895,7 @@ class Effect5806(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21915,7 +21911,7 @@ class Effect5807(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21931,7 +21927,7 @@ class Effect5808(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21947,7 +21943,7 @@ class Effect5809(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21963,7 +21959,7 @@ class Effect5810(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21979,7 +21975,7 @@ class Effect5811(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGB2'),
                                         skill='Gallente Battleship', **kwargs)
 
@@ -21996,7 +21992,7 @@ class Effect5812(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGB2'),
                                         skill='Gallente Battleship', **kwargs)
 
@@ -22014,7 +22010,7 @@ class Effect5813(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -22031,7 +22027,7 @@ class Effect5814(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -22048,7 +22044,7 @@ class Effect5815(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -22066,7 +22062,7 @@ class Effect5816(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22084,7 +22080,7 @@ class Effect5817(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22102,7 +22098,7 @@ class Effect5818(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22120,7 +22116,7 @@ class Effect5819(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22137,7 +22133,7 @@ class Effect5820(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -22155,7 +22151,7 @@ class Effect5821(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22171,7 +22167,7 @@ class Effect5822(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22187,7 +22183,7 @@ class Effect5823(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22203,7 +22199,7 @@ class Effect5824(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22220,7 +22216,7 @@ class Effect5825(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -22237,7 +22233,7 @@ class Effect5826(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -22253,7 +22249,7 @@ class Effect5827(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -22270,7 +22266,7 @@ class Effect5852(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            itemRequiresSkill('Mining'), 'miningAmount',
             ship.getModifiedItemAttr('expeditionFrigateBonusOreMiningYield'),
             skill='Expedition Frigates', **kwargs)
 
@@ -22310,7 +22306,7 @@ class Effect5854(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemForce(itemGroupIs('Energy Nosferatu'),
                                       'nosOverride', ship.getModifiedItemAttr('nosOverride'), **kwargs)
 
 
@@ -22326,7 +22322,7 @@ class Effect5862(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -22342,7 +22338,7 @@ class Effect5863(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -22359,7 +22355,7 @@ class Effect5864(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -22376,7 +22372,7 @@ class Effect5865(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -22393,7 +22389,7 @@ class Effect5866(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -22413,7 +22409,7 @@ class Effect5867(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -22460,7 +22456,7 @@ class Effect5870(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCI2'), skill='Caldari Hauler', **kwargs)
 
 
@@ -22476,7 +22472,7 @@ class Effect5871(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMI2'), skill='Minmatar Hauler', **kwargs)
 
 
@@ -22492,7 +22488,7 @@ class Effect5872(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusAI2'),
                                       skill='Amarr Hauler', **kwargs)
 
@@ -22509,7 +22505,7 @@ class Effect5873(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGI2'),
                                       skill='Gallente Hauler', **kwargs)
 
@@ -22578,7 +22574,7 @@ class Effect5889(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'overloadSpeedFactorBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22595,7 +22591,7 @@ class Effect5890(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22611,7 +22607,7 @@ class Effect5891(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'),
                                       'overloadHardeningBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22627,7 +22623,7 @@ class Effect5892(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22643,7 +22639,7 @@ class Effect5893(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Tactical Shield Manipulation'),
                                       'overloadHardeningBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22659,9 +22655,9 @@ class Effect5896(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadShieldBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22677,9 +22673,9 @@ class Effect5899(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadArmorDamageAmount', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22711,7 +22707,7 @@ class Effect5901(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Reinforced Bulkhead',
+        fit.modules.filteredItemBoost(itemGroupIs('Reinforced Bulkhead'),
                                       'cpu', ship.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
 
 
@@ -22745,7 +22741,7 @@ class Effect5912(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemMultiply(itemGroupIs('Remote Capacitor Transmitter'),
                                          'powerTransferAmount', beacon.getModifiedItemAttr('energyTransferAmountBonus'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -22782,7 +22778,7 @@ class Effect5914(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Neutralizer'),
                                          'energyNeutralizerAmount',
                                          beacon.getModifiedItemAttr('energyWarfareStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -22802,7 +22798,7 @@ class Effect5915(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Nosferatu'),
                                          'powerTransferAmount',
                                          beacon.getModifiedItemAttr('energyWarfareStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -22821,7 +22817,7 @@ class Effect5916(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -22839,7 +22835,7 @@ class Effect5917(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -22857,7 +22853,7 @@ class Effect5918(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -22875,7 +22871,7 @@ class Effect5919(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'emDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -22893,7 +22889,7 @@ class Effect5920(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'aoeCloudSize', beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -22911,7 +22907,7 @@ class Effect5921(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Target Painting'),
                                          'signatureRadiusBonus',
                                          beacon.getModifiedItemAttr('targetPainterStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -22931,7 +22927,7 @@ class Effect5922(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemMultiply(itemGroupIs('Stasis Web'),
                                          'speedFactor', beacon.getModifiedItemAttr('stasisWebStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -22949,7 +22945,7 @@ class Effect5923(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'energyNeutralizerAmount',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -22968,7 +22964,7 @@ class Effect5924(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'scanGravimetricStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -22987,7 +22983,7 @@ class Effect5925(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'scanLadarStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23006,7 +23002,7 @@ class Effect5926(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'scanMagnetometricStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23025,7 +23021,7 @@ class Effect5927(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'scanRadarStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23070,7 +23066,7 @@ class Effect5934(BaseEffect):
             return
         fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'))
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+            itemRequiresSkill('High Speed Maneuvering', 'Micro Jump Drive Operation'),
             'activationBlocked', module.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
 
 
@@ -23086,7 +23082,7 @@ class Effect5939(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rocket',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rocket'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -23102,7 +23098,7 @@ class Effect5944(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -23154,7 +23150,7 @@ class Effect5956(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -23170,7 +23166,7 @@ class Effect5957(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -23189,7 +23185,7 @@ class Effect5958(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23205,7 +23201,7 @@ class Effect5959(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -23290,7 +23286,7 @@ class Effect6006(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr1'),
                                       skill='Amarr Tactical Destroyer', **kwargs)
 
@@ -23307,7 +23303,7 @@ class Effect6007(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr2'),
                                       skill='Amarr Tactical Destroyer', **kwargs)
 
@@ -23343,7 +23339,7 @@ class Effect6009(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Astrometrics'), 'cpu',
+            itemRequiresSkill('Astrometrics'), 'cpu',
             src.getModifiedItemAttr('roleBonusT3ProbeCPU'), **kwargs)
 
 
@@ -23380,7 +23376,7 @@ class Effect6011(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+            itemRequiresSkill('Small Energy Turret'),
             'maxRange',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -23504,7 +23500,7 @@ class Effect6020(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -23520,7 +23516,7 @@ class Effect6021(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -23536,7 +23532,7 @@ class Effect6025(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -23552,7 +23548,7 @@ class Effect6027(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                       skill='Recon Ships', **kwargs)
 
@@ -23569,7 +23565,7 @@ class Effect6032(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'power', ship.getModifiedItemAttr('powerTransferPowerNeedBonus'), **kwargs)
 
 
@@ -23602,7 +23598,7 @@ class Effect6037(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar1'),
                                       skill='Minmatar Tactical Destroyer', **kwargs)
 
@@ -23619,7 +23615,7 @@ class Effect6038(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar2'),
                                       skill='Minmatar Tactical Destroyer', **kwargs)
 
@@ -23637,7 +23633,7 @@ class Effect6039(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+            itemRequiresSkill('Small Projectile Turret'),
             'trackingSpeed',
             1 / module.getModifiedItemAttr('modeTrackingPostDiv'),
             stackingPenalties=True,
@@ -23658,7 +23654,7 @@ class Effect6040(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            itemRequiresSkill('High Speed Maneuvering'),
             'signatureRadiusBonus',
             1 / module.getModifiedItemAttr('modeMWDSigPenaltyPostDiv'),
             stackingPenalties=True,
@@ -23705,7 +23701,7 @@ class Effect6045(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23721,7 +23717,7 @@ class Effect6046(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23737,7 +23733,7 @@ class Effect6047(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23753,7 +23749,7 @@ class Effect6048(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23769,7 +23765,7 @@ class Effect6051(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23785,7 +23781,7 @@ class Effect6052(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23801,7 +23797,7 @@ class Effect6053(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23817,7 +23813,7 @@ class Effect6054(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23833,7 +23829,7 @@ class Effect6055(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23849,7 +23845,7 @@ class Effect6056(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23865,7 +23861,7 @@ class Effect6057(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23881,7 +23877,7 @@ class Effect6058(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23897,7 +23893,7 @@ class Effect6059(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23913,7 +23909,7 @@ class Effect6060(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23929,7 +23925,7 @@ class Effect6061(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23945,7 +23941,7 @@ class Effect6062(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23982,7 +23978,7 @@ class Effect6076(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredChargeMultiply(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'maxVelocity',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -24023,7 +24019,7 @@ class Effect6083(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+                chargeRequiresSkill('Rockets', 'Light Missiles'),
                 '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -24039,7 +24035,7 @@ class Effect6085(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari1'),
                                       skill='Caldari Tactical Destroyer', **kwargs)
 
@@ -24058,7 +24054,7 @@ class Effect6088(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser', **kwargs)
 
@@ -24077,7 +24073,7 @@ class Effect6093(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser', **kwargs)
 
@@ -24096,7 +24092,7 @@ class Effect6096(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser', **kwargs)
 
@@ -24113,7 +24109,7 @@ class Effect6098(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'reloadTime', ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari2'),
                                       skill='Caldari Tactical Destroyer', **kwargs)
 
@@ -24136,7 +24132,7 @@ class Effect6104(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Infomorph Psychology'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Infomorph Psychology'),
                                          'duration', ship.getModifiedItemAttr('entosisDurationMultiplier') or 1, **kwargs)
 
 
@@ -24152,7 +24148,7 @@ class Effect6110(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', module.getModifiedItemAttr('missileVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -24169,7 +24165,7 @@ class Effect6111(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosionDelay', module.getModifiedItemAttr('explosionDelayBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -24186,7 +24182,7 @@ class Effect6112(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeCloudSize', module.getModifiedItemAttr('aoeCloudSizeBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -24204,7 +24200,7 @@ class Effect6113(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeVelocity', module.getModifiedItemAttr('aoeVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -24289,7 +24285,7 @@ class Effect6135(BaseEffect):
                 ('missileVelocityBonus', 'maxVelocity'),
                 ('explosionDelayBonus', 'explosionDelay'),
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                             tgtAttr, container.getModifiedItemAttr(srcAttr),
                                             stackingPenalties=True, **kwargs)
 
@@ -24345,7 +24341,7 @@ class Effect6149(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente1'),
                                       skill='Gallente Tactical Destroyer', **kwargs)
 
@@ -24362,7 +24358,7 @@ class Effect6150(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente2'),
                                       skill='Gallente Tactical Destroyer', **kwargs)
 
@@ -24403,7 +24399,7 @@ class Effect6152(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+            itemRequiresSkill('Small Hybrid Turret'),
             'maxRange',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -24424,7 +24420,7 @@ class Effect6153(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            itemRequiresSkill('High Speed Maneuvering'),
             'capacitorNeed',
             1 / module.getModifiedItemAttr('modeMWDCapPostDiv'),
             **kwargs)
@@ -24443,7 +24439,7 @@ class Effect6154(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            itemRequiresSkill('High Speed Maneuvering'),
             'speedFactor',
             1 / module.getModifiedItemAttr('modeMWDVelocityPostDiv'),
             stackingPenalties=True,
@@ -24464,7 +24460,7 @@ class Effect6155(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Repair Systems'),
+            itemRequiresSkill('Repair Systems'),
             'duration',
             1 / module.getModifiedItemAttr('modeArmorRepDurationPostDiv'),
             **kwargs)
@@ -24515,11 +24511,11 @@ class Effect6166(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Propulsion Jamming'),
                                       'speedFactorBonus', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Propulsion Jamming'),
                                       'speedBoostFactorBonus', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Propulsion Jamming'),
                                       'massBonusPercentage', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
 
 
@@ -24535,7 +24531,7 @@ class Effect6170(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Infomorph Psychology'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Infomorph Psychology'),
                                          'entosisCPUAdd', ship.getModifiedItemAttr('entosisCPUPenalty'), **kwargs)
 
 
@@ -24566,9 +24562,9 @@ class Effect6172(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24585,9 +24581,9 @@ class Effect6173(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24605,9 +24601,9 @@ class Effect6174(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24625,7 +24621,7 @@ class Effect6175(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', skill.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24643,7 +24639,7 @@ class Effect6176(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24659,7 +24655,7 @@ class Effect6177(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCBC2'),
                                       skill='Caldari Battlecruiser', **kwargs)
 
@@ -24676,7 +24672,7 @@ class Effect6178(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMBC2'),
                                       skill='Minmatar Battlecruiser', **kwargs)
 
@@ -24906,7 +24902,7 @@ class Effect6214(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'power',
                                       src.getModifiedItemAttr('roleBonusCD'), **kwargs)
 
 
@@ -24960,7 +24956,7 @@ class Effect6222(BaseEffect):
             return
         fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+            itemRequiresSkill('High Speed Maneuvering', 'Micro Jump Drive Operation'),
             'activationBlocked', module.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
 
 
@@ -24976,7 +24972,7 @@ class Effect6230(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -24992,7 +24988,7 @@ class Effect6232(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
 
 
@@ -25008,7 +25004,7 @@ class Effect6233(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -25024,7 +25020,7 @@ class Effect6234(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -25040,7 +25036,7 @@ class Effect6237(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
 
 
@@ -25056,7 +25052,7 @@ class Effect6238(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -25072,7 +25068,7 @@ class Effect6241(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -25088,7 +25084,7 @@ class Effect6242(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -25104,7 +25100,7 @@ class Effect6245(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -25120,7 +25116,7 @@ class Effect6246(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -25137,7 +25133,7 @@ class Effect6253(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -25153,7 +25149,7 @@ class Effect6256(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -25170,7 +25166,7 @@ class Effect6257(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -25186,7 +25182,7 @@ class Effect6260(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -25202,7 +25198,7 @@ class Effect6267(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -25219,7 +25215,7 @@ class Effect6272(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip3'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -25236,7 +25232,7 @@ class Effect6273(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -25253,7 +25249,7 @@ class Effect6278(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip3'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -25270,7 +25266,7 @@ class Effect6281(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -25286,7 +25282,7 @@ class Effect6285(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonus3AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -25302,7 +25298,7 @@ class Effect6287(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -25318,7 +25314,7 @@ class Effect6291(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonus3AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -25334,7 +25330,7 @@ class Effect6294(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25350,7 +25346,7 @@ class Effect6299(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC3'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25366,7 +25362,7 @@ class Effect6300(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25382,9 +25378,9 @@ class Effect6301(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25400,7 +25396,7 @@ class Effect6305(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC3'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25416,7 +25412,7 @@ class Effect6307(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -25432,7 +25428,7 @@ class Effect6308(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -25448,7 +25444,7 @@ class Effect6309(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -25464,7 +25460,7 @@ class Effect6310(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer', **kwargs)
 
@@ -25482,7 +25478,7 @@ class Effect6315(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
                                           skill='Command Destroyers', **kwargs)
 
@@ -25501,7 +25497,7 @@ class Effect6316(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
                                           skill='Command Destroyers', **kwargs)
 
@@ -25518,7 +25514,7 @@ class Effect6317(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Micro Jump Drive Operation'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer2'), skill='Command Destroyers', **kwargs)
 
 
@@ -25662,7 +25658,7 @@ class Effect6326(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -25678,7 +25674,7 @@ class Effect6327(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -25694,7 +25690,7 @@ class Effect6328(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -25710,7 +25706,7 @@ class Effect6329(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer', **kwargs)
 
@@ -25792,7 +25788,7 @@ class Effect6334(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
                                           skill='Command Destroyers', **kwargs)
 
@@ -25874,7 +25870,7 @@ class Effect6339(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
                                           skill='Command Destroyers', **kwargs)
 
@@ -25956,7 +25952,7 @@ class Effect6350(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Light Missiles') or mod.charge.requiresSkill('Rockets'), 'kineticDamage',
+            chargeRequiresSkill('Light Missiles', 'Rockets'), 'kineticDamage',
             src.getModifiedItemAttr('shipBonus3CF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -25972,7 +25968,7 @@ class Effect6351(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCC3'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -25988,9 +25984,9 @@ class Effect6352(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26006,9 +26002,9 @@ class Effect6353(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'cpu',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'capacitorNeed',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26028,7 +26024,7 @@ class Effect6354(BaseEffect):
             'trackingSpeedBonus', 'explosionDelayBonus', 'maxRangeBonus', 'falloffBonus',
             'missileVelocityBonus', 'aoeVelocityBonus', 'aoeCloudSizeBonus'
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), attrName,
+            fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), attrName,
                                           src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -26044,7 +26040,7 @@ class Effect6357(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Navigation'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Navigation'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -26060,7 +26056,7 @@ class Effect6358(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Navigation'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Navigation'),
                                          'warpScrambleStrength', ship.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26076,7 +26072,7 @@ class Effect6359(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'aoeVelocity',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'aoeVelocity',
                                         src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -26092,11 +26088,11 @@ class Effect6360(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -26112,7 +26108,7 @@ class Effect6361(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonus3MF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -26128,7 +26124,7 @@ class Effect6362(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26147,9 +26143,9 @@ class Effect6368(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Shield Booster', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Shield Booster'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('falloffBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Shield Booster',
+        fit.modules.filteredItemBoost(itemGroupIs('Ancillary Remote Shield Booster'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('falloffBonus'), **kwargs)
 
 
@@ -26165,7 +26161,7 @@ class Effect6369(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -26182,7 +26178,7 @@ class Effect6370(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -26198,7 +26194,7 @@ class Effect6371(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusGC'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -26215,7 +26211,7 @@ class Effect6372(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusAC2'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -26236,9 +26232,9 @@ class Effect6373(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Armor Repairer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Armor Repairer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('falloffBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Armor Repairer',
+        fit.modules.filteredItemBoost(itemGroupIs('Ancillary Remote Armor Repairer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('falloffBonus'), **kwargs)
 
 
@@ -26256,7 +26252,7 @@ class Effect6374(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone', 'structureDamageAmount',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('droneArmorDamageAmountBonus'), **kwargs)
 
 
@@ -26273,9 +26269,9 @@ class Effect6377(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
 
 
@@ -26292,9 +26288,9 @@ class Effect6378(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
 
 
@@ -26379,7 +26375,7 @@ class Effect6385(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemForce(itemGroupIs('Cloaking Device'),
                                       'maxVelocityModifier', src.getModifiedItemAttr('ignoreCloakVelocityPenalty'), **kwargs)
 
 
@@ -26403,7 +26399,7 @@ class Effect6386(BaseEffect):
                 'aoeCloudSizeBonus',
                 'missileVelocityBonus'
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'),
                                           attr, src.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
 
 
@@ -26423,7 +26419,7 @@ class Effect6395(BaseEffect):
             'missileVelocityBonus', 'aoeVelocityBonus', 'maxRangeBonus', 'explosionDelayBonus',
             'aoeCloudSizeBonus', 'trackingSpeedBonus', 'falloffBonus'
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), attrName,
+            fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), attrName,
                                           src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -26441,7 +26437,7 @@ class Effect6396(BaseEffect):
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Structure Anti-Capital Missile', 'Structure Anti-Subcapital Missile', 'Guided Bomb')
         for damageType in ('em', 'thermal', 'explosive', 'kinetic'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+            fit.modules.filteredChargeBoost(chargeGroupIs(*groups),
                                             '%sDamage' % damageType, src.getModifiedItemAttr('damageMultiplierBonus'),
                                             skill='Structure Missile Systems', **kwargs)
 
@@ -26459,7 +26455,7 @@ class Effect6400(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Structure Warp Scrambler', 'Structure ECM Battery', 'Structure Stasis Webifier')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('capNeedBonus'),
                                       skill='Structure Electronic Systems', **kwargs)
 
@@ -26477,7 +26473,7 @@ class Effect6401(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Structure Energy Neutralizer', 'Structure Area Denial Module')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('capNeedBonus'),
                                       skill='Structure Engineering Systems', **kwargs)
 
@@ -26496,7 +26492,7 @@ class Effect6402(BaseEffect):
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
 
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+        fit.modules.filteredChargeBoost(chargeGroupIs(*groups),
                                       'aoeVelocity', src.getModifiedItemAttr('structureRigMissileExploVeloBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26514,7 +26510,7 @@ class Effect6403(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+        fit.modules.filteredChargeBoost(chargeGroupIs(*groups),
                                       'maxVelocity', src.getModifiedItemAttr('structureRigMissileVelocityBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26532,11 +26528,11 @@ class Effect6404(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Energy Neutralizer'),
                                       'maxRange', src.getModifiedItemAttr('structureRigEwarOptimalBonus'),
                                       stackingPenalties=True, **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Energy Neutralizer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26554,7 +26550,7 @@ class Effect6405(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Energy Neutralizer'),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigEwarCapUseBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26573,13 +26569,13 @@ class Effect6406(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Structure ECM Battery', 'Structure Disruption Battery')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'falloff', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'maxRange', src.getModifiedItemAttr('structureRigEwarOptimalBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'falloffEffectiveness', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26598,7 +26594,7 @@ class Effect6407(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Structure ECM Battery', 'Structure Disruption Battery')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigEwarCapUseBonus'), **kwargs)
 
 
@@ -26649,7 +26645,7 @@ class Effect6410(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Guided Bomb',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Guided Bomb'),
                                         'aoeCloudSize', src.getModifiedItemAttr('structureRigMissileExplosionRadiusBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -26667,7 +26663,7 @@ class Effect6411(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Guided Bomb',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Guided Bomb'),
                                         'maxVelocity', src.getModifiedItemAttr('structureRigMissileVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -26685,7 +26681,7 @@ class Effect6412(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Area Denial Module'),
                                       'empFieldRange', src.getModifiedItemAttr('structureRigPDRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26703,7 +26699,7 @@ class Effect6413(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Area Denial Module'),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigPDCapUseBonus'), **kwargs)
 
 
@@ -26719,7 +26715,7 @@ class Effect6417(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemIncrease(itemGroupIs('Structure Doomsday Weapon'),
                                          'lightningWeaponDamageLossTarget',
                                          src.getModifiedItemAttr('structureRigDoomsdayDamageLossTargetBonus'), **kwargs)
 
@@ -26777,7 +26773,7 @@ class Effect6423(BaseEffect):
             ('missileVelocityBonus', 'maxVelocity'),
             ('explosionDelayBonus', 'explosionDelay')
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                             tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
                                             stackingPenalties=True, **kwargs)
 
@@ -26807,7 +26803,7 @@ class Effect6424(BaseEffect):
             ('maxRangeBonus', 'maxRange'),
             ('falloffBonus', 'falloff')
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
                                           stackingPenalties=True, **kwargs)
 
@@ -26917,7 +26913,7 @@ class Effect6428(BaseEffect):
             ('maxRangeBonus', 'maxRange'),
             ('falloffBonus', 'falloff')
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
                                           stackingPenalties=True, **kwargs)
 
@@ -27171,7 +27167,7 @@ class Effect6448(BaseEffect):
                 ('missileVelocityBonus', 'maxVelocity'),
                 ('explosionDelayBonus', 'explosionDelay'),
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in missileGroups,
+            fit.modules.filteredChargeBoost(chargeGroupIs(*missileGroups),
                                             tgtAttr, container.getModifiedItemAttr(srcAttr),
                                             stackingPenalties=True, **kwargs)
 
@@ -27191,13 +27187,13 @@ class Effect6449(BaseEffect):
         missileGroups = ('Structure Anti-Capital Missile', 'Structure Anti-Subcapital Missile')
 
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.group.name in missileGroups,
+            fit.modules.filteredChargeMultiply(chargeGroupIs(*missileGroups),
                                                '%sDamage' % dmgType,
                                                module.getModifiedItemAttr('missileDamageMultiplierBonus'),
                                                stackingPenalties=True, **kwargs)
 
         launcherGroups = ('Structure XL Missile Launcher', 'Structure Multirole Missile Launcher')
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name in launcherGroups,
+        fit.modules.filteredItemMultiply(itemGroupIs(*launcherGroups),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -27309,7 +27305,7 @@ class Effect6475(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemIncrease(itemGroupIs('Structure Doomsday Weapon'),
                                          'lightningWeaponTargetAmount',
                                          src.getModifiedItemAttr('structureRigDoomsdayTargetAmountBonus'), **kwargs)
 
@@ -27404,7 +27400,7 @@ class Effect6479(BaseEffect):
             ('missileVelocityBonus', 'maxVelocity'),
             ('explosionDelayBonus', 'explosionDelay')
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                             tgtAttr, module.getModifiedItemAttr(srcAttr),
                                             stackingPenalties=True, **kwargs)
         for srcAttr, tgtAttr in (
@@ -27412,7 +27408,7 @@ class Effect6479(BaseEffect):
             ('maxRangeBonus', 'maxRange'),
             ('falloffBonus', 'falloff')
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           tgtAttr, module.getModifiedItemAttr(srcAttr),
                                           stackingPenalties=True, **kwargs)
 
@@ -27537,7 +27533,7 @@ class Effect6501(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
 
 
@@ -27572,7 +27568,7 @@ class Effect6503(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtA3'), skill='Amarr Dreadnought', **kwargs)
 
 
@@ -27630,7 +27626,7 @@ class Effect6506(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -27646,7 +27642,7 @@ class Effect6507(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG2'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -27662,7 +27658,7 @@ class Effect6508(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG3'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -27678,7 +27674,7 @@ class Effect6509(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -27694,7 +27690,7 @@ class Effect6510(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -27710,7 +27706,7 @@ class Effect6511(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'), 'duration',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -27750,10 +27746,10 @@ class Effect6526(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Capacitor Emission Systems'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'),
                                       skill='Amarr Carrier', **kwargs)
 
@@ -27792,24 +27788,19 @@ class Effect6533(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command', 'Information Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command', 'Information Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command', 'Information Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command', 'Information Command'),
                                       'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command', 'Information Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
 
@@ -27827,19 +27818,19 @@ class Effect6534(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -27856,19 +27847,19 @@ class Effect6535(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
 
 
@@ -27885,19 +27876,19 @@ class Effect6536(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
 
 
@@ -27913,7 +27904,7 @@ class Effect6537(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -27932,10 +27923,10 @@ class Effect6545(BaseEffect):
         if src.getModifiedItemAttr('shipBonusForceAuxiliaryC1') is None:
             return  # See GH Issue 1321
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Capacitor Emission Systems'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryC1'),
                                       skill='Caldari Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'shieldBonus', src.getModifiedItemAttr('shipBonusForceAuxiliaryC1'),
                                       skill='Caldari Carrier', **kwargs)
 
@@ -27975,7 +27966,7 @@ class Effect6548(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems') or mod.item.requiresSkill('Capital Shield Emission Systems'),
+            itemRequiresSkill('Capital Remote Armor Repair Systems', 'Capital Shield Emission Systems'),
             'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryG1'), skill='Gallente Carrier', **kwargs)
 
 
@@ -27991,9 +27982,9 @@ class Effect6549(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG2'), skill='Gallente Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG2'), skill='Gallente Carrier', **kwargs)
 
 
@@ -28010,7 +28001,7 @@ class Effect6551(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems') or mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            itemRequiresSkill('Capital Shield Emission Systems', 'Capital Remote Armor Repair Systems'),
             'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM1'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -28026,9 +28017,9 @@ class Effect6552(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'shieldBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -28044,9 +28035,9 @@ class Effect6555(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
 
 
@@ -28064,16 +28055,16 @@ class Effect6556(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
 
 
@@ -28089,39 +28080,39 @@ class Effect6557(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'trackingSpeed',
                                      src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretTrackingSpeed',
                                        src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'falloff',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'falloff',
                                      src.getModifiedItemAttr('falloffBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True, **kwargs)
 
@@ -28158,40 +28149,40 @@ class Effect6559(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'falloff',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'falloff',
                                      src.getModifiedItemAttr('falloffBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretTrackingSpeed',
                                        src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'trackingSpeed',
                                      src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
 
 
@@ -28208,13 +28199,13 @@ class Effect6560(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
@@ -28232,7 +28223,7 @@ class Effect6561(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Light Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Light Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -28249,7 +28240,7 @@ class Effect6562(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shieldBonus') * lvl, **kwargs)
 
 
@@ -28266,13 +28257,13 @@ class Effect6563(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Heavy Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Heavy Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Heavy Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
@@ -28303,7 +28294,7 @@ class Effect6565(BaseEffect):
             'structureRigEwarCapUseBonus',
             'structureRigMissileExplosionRadiusBonus'
         ]:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Jury Rigging'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Jury Rigging'),
                                       attr, src.getModifiedItemAttr('structureRoleBonus'), **kwargs)
 
 
@@ -28319,18 +28310,18 @@ class Effect6566(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('fighterBonusShieldCapacityPercent'), **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('fighterBonusVelocityPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretDuration',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'fighterAbilityAttackTurretDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesDuration',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldRechargeRate',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'shieldRechargeRate',
                                        src.getModifiedItemAttr('fighterBonusShieldRechargePercent'), **kwargs)
 
 
@@ -28352,7 +28343,7 @@ class Effect6567(BaseEffect):
             attr = 'scan{}Strength'.format(scanType)
             bonus = src.getModifiedItemAttr('scan{}StrengthPercent'.format(scanType))
             fit.ship.boostItemAttr(attr, bonus, stackingPenalties=True, **kwargs)
-            fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), attr, bonus,
+            fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), attr, bonus,
                                            stackingPenalties=True, **kwargs)
 
         # EW cap need increase
@@ -28368,7 +28359,7 @@ class Effect6567(BaseEffect):
                                                   mod.item.requiresSkill('Propulsion Jamming'),
                                       'capacitorNeed', src.getModifiedItemAttr('ewCapacitorNeedBonus'), **kwargs)
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.requiresSkill('Capital Micro Jump Drive Operation'), 'activationBlocked',
+            itemRequiresSkill('Capital Micro Jump Drive Operation'), 'activationBlocked',
             src.getModifiedItemAttr('networkedSensorArrayDisallowCapitalMicroJump'), **kwargs)
 
 
@@ -28401,7 +28392,7 @@ class Effect6571(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Autocannon Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Autocannon Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28418,7 +28409,7 @@ class Effect6572(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Artillery Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Artillery Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28435,7 +28426,7 @@ class Effect6573(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Blaster Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Blaster Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28452,7 +28443,7 @@ class Effect6574(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Railgun Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Railgun Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28469,7 +28460,7 @@ class Effect6575(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Pulse Laser Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28486,7 +28477,7 @@ class Effect6576(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Beam Laser Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28503,7 +28494,7 @@ class Effect6577(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missile Specialization'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('XL Cruise Missile Specialization'), 'speed',
                                       src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
 
 
@@ -28520,7 +28511,7 @@ class Effect6578(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Torpedo Specialization'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('XL Torpedo Specialization'), 'speed',
                                       src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
 
 
@@ -28536,11 +28527,11 @@ class Effect6580(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'structureDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'armorDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'), 'armorDamageAmount',
                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'shieldBonus',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'), 'shieldBonus',
                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -28563,23 +28554,23 @@ class Effect6581(BaseEffect):
                 ('Capital Shield Emission Systems', 'shieldBonus', True),
                 ('Capital Capacitor Emission Systems', 'powerTransferAmount', False),
                 ('Capital Remote Hull Repair Systems', 'structureDamageAmount', False)):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'duration',
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'duration',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsDurationBonus'), **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), amtAttr,
                                           src.getModifiedItemAttr('siegeRemoteLogisticsAmountBonus'),
                                           stackingPenalties=stack, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'maxRange',
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'maxRange',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsRangeBonus'), stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'falloffEffectiveness',
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'falloffEffectiveness',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsRangeBonus'), stackingPenalties=True, **kwargs)
 
         # Local armor/shield rep effects (duration / amount)
         for skill, amtAttr in (
                 ('Capital Shield Operation', 'shieldBonus'),
                 ('Capital Repair Systems', 'armorDamageAmount')):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'duration',
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'duration',
                                           src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'), **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), amtAttr,
                                           src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
                                           stackingPenalties=True, **kwargs)
 
@@ -28615,7 +28606,7 @@ class Effect6581(BaseEffect):
         fit.ship.forceItemAttr('disallowAssistance', src.getModifiedItemAttr('disallowAssistance'), **kwargs)
 
         # new in April 2016 release
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
 
         fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
@@ -28641,41 +28632,34 @@ class Effect6582(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         # Turrets
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret') or
-                                                  mod.item.requiresSkill('Capital Hybrid Turret') or
-                                                  mod.item.requiresSkill('Capital Projectile Turret') or
-                                                  mod.item.requiresSkill('Capital Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret', 'Capital Hybrid Turret', 'Capital Projectile Turret', 'Capital Precursor Weapon'),
                                       'damageMultiplier', src.getModifiedItemAttr('siegeTurretDamageBonus'), **kwargs)
 
         # Missiles
         for type in ('kinetic', 'thermal', 'explosive', 'em'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes') or
-                                                        mod.charge.requiresSkill('XL Cruise Missiles') or
-                                                        mod.charge.requiresSkill('Torpedoes'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes', 'XL Cruise Missiles', 'Torpedoes'),
                                             '%sDamage' % type, src.getModifiedItemAttr('siegeMissileDamageBonus'), **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes') or
-                                                  mod.item.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('XL Torpedoes', 'XL Cruise Missiles'),
                                       'speed', src.getModifiedItemAttr('siegeLauncherROFBonus'), **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Torpedo',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Torpedo'),
                                       'speed', src.getModifiedItemAttr('siegeHAWMissileROFBonus'),
                                       stackingPenalties=True, penaltyGroup='postPercent', **kwargs)
 
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', src.getModifiedItemAttr('siegeTorpedoVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
 
         # Tank
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation') or
-                                                  mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation', 'Capital Repair Systems'),
                                       'duration', src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'), **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
                                       stackingPenalties=True, **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -28774,19 +28758,19 @@ class Effect6595(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
 
 
@@ -28803,19 +28787,19 @@ class Effect6596(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
 
 
@@ -28832,19 +28816,19 @@ class Effect6597(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
 
 
@@ -28861,19 +28845,19 @@ class Effect6598(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -28933,13 +28917,13 @@ class Effect6601(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
 
@@ -28956,13 +28940,13 @@ class Effect6602(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
 
@@ -28980,13 +28964,13 @@ class Effect6603(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
 
@@ -29004,13 +28988,13 @@ class Effect6604(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
 
@@ -29027,13 +29011,13 @@ class Effect6605(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
 
@@ -29050,13 +29034,13 @@ class Effect6606(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
 
@@ -29074,19 +29058,19 @@ class Effect6607(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
 
 
@@ -29103,19 +29087,19 @@ class Effect6608(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
 
 
@@ -29132,19 +29116,19 @@ class Effect6609(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
 
 
@@ -29161,19 +29145,19 @@ class Effect6610(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -29189,7 +29173,7 @@ class Effect6611(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusSupercarrierC2'), skill='Caldari Carrier', **kwargs)
 
 
@@ -29205,10 +29189,10 @@ class Effect6612(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA2'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA2'), skill='Amarr Carrier', **kwargs)
 
@@ -29225,9 +29209,9 @@ class Effect6613(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -29243,9 +29227,9 @@ class Effect6614(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'), 'capacityBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Upgrades'), 'capacityBonus',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -29261,7 +29245,7 @@ class Effect6615(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'),
                                       'durationWeaponDisruptionBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
 
@@ -29278,7 +29262,7 @@ class Effect6616(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'),
                                       'durationECMJammerBurstProjector', src.getModifiedItemAttr('shipBonusSupercarrierC4'),
                                       skill='Caldari Carrier', **kwargs)
 
@@ -29295,7 +29279,7 @@ class Effect6617(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'),
                                       'durationSensorDampeningBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierG4'), skill='Gallente Carrier', **kwargs)
 
@@ -29312,7 +29296,7 @@ class Effect6618(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'),
                                       'durationTargetIlluminationBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierM4'), skill='Minmatar Carrier', **kwargs)
 
@@ -29329,9 +29313,9 @@ class Effect6619(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -29347,7 +29331,7 @@ class Effect6620(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'), 'reloadTime',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'), 'reloadTime',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtC3'), skill='Caldari Dreadnought', **kwargs)
 
 
@@ -29407,7 +29391,7 @@ class Effect6623(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG2'), skill='Gallente Carrier', **kwargs)
 
 
@@ -29424,7 +29408,7 @@ class Effect6624(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM2'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -29440,9 +29424,9 @@ class Effect6625(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierA2'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'),
                                        'fighterAbilityEnergyNeutralizerOptimalRange',
                                        src.getModifiedItemAttr('shipBonusCarrierA2'), skill='Amarr Carrier', **kwargs)
 
@@ -29459,9 +29443,9 @@ class Effect6626(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierC2'), skill='Caldari Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'),
                                        'fighterAbilityECMRangeOptimal', src.getModifiedItemAttr('shipBonusCarrierC2'),
                                        skill='Caldari Carrier', **kwargs)
 
@@ -29478,9 +29462,9 @@ class Effect6627(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierG2'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'),
                                        'fighterAbilityWarpDisruptionRange', src.getModifiedItemAttr('shipBonusCarrierG2'),
                                        skill='Gallente Carrier', **kwargs)
 
@@ -29497,9 +29481,9 @@ class Effect6628(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierM2'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'),
                                        'fighterAbilityStasisWebifierOptimalRange',
                                        src.getModifiedItemAttr('shipBonusCarrierM2'), skill='Minmatar Carrier', **kwargs)
 
@@ -29535,7 +29519,7 @@ class Effect6634(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
 
 
@@ -29551,11 +29535,11 @@ class Effect6635(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
 
 
@@ -29571,7 +29555,7 @@ class Effect6636(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
 
 
@@ -29588,7 +29572,7 @@ class Effect6637(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
 
 
@@ -29604,11 +29588,11 @@ class Effect6638(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher XL Cruise', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher XL Cruise'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Torpedo', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher XL Torpedo', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher XL Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan', **kwargs)
 
 
@@ -29624,10 +29608,10 @@ class Effect6639(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
 
@@ -29644,9 +29628,9 @@ class Effect6640(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -29662,9 +29646,9 @@ class Effect6641(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'), 'capacityBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Upgrades'), 'capacityBonus',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -29681,7 +29665,7 @@ class Effect6642(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Doomsday Operation'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Doomsday Operation'), 'duration',
                                       src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
 
 
@@ -29815,7 +29799,7 @@ class Effect6653(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusTitanA2'), skill='Amarr Titan', **kwargs)
 
 
@@ -29831,7 +29815,7 @@ class Effect6654(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
 
 
@@ -29848,7 +29832,7 @@ class Effect6655(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanM2'), skill='Minmatar Titan', **kwargs)
 
 
@@ -29864,7 +29848,7 @@ class Effect6656(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'maxVelocity',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'maxVelocity',
                                         src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
@@ -29880,23 +29864,23 @@ class Effect6657(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
 
 
@@ -29924,40 +29908,29 @@ class Effect6658(BaseEffect):
                                           stackingPenalties=penalize, penaltyGroup='preMul', **kwargs)
 
         # Turrets
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret') or
-                                                  mod.item.requiresSkill('Large Hybrid Turret') or
-                                                  mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret', 'Large Hybrid Turret', 'Large Projectile Turret'),
                                       'maxRange', src.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret') or
-                                                  mod.item.requiresSkill('Large Hybrid Turret') or
-                                                  mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret', 'Large Hybrid Turret', 'Large Projectile Turret'),
                                       'falloff', src.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret') or
-                                                  mod.item.requiresSkill('Large Hybrid Turret') or
-                                                  mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret', 'Large Hybrid Turret', 'Large Projectile Turret'),
                                       'speed', src.getModifiedItemAttr('bastionTurretROFBonus'),
                                       stackingPenalties=True, penaltyGroup='postPerc', **kwargs)
 
         # Missiles
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes') or
-                                                    mod.charge.requiresSkill('Cruise Missiles') or
-                                                    mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes', 'Cruise Missiles', 'Heavy Missiles'),
                                         'maxVelocity', src.getModifiedItemAttr('missileVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cruise Missiles') or
-                                                  mod.item.requiresSkill('Torpedoes') or
-                                                  mod.item.requiresSkill('Torpedo Specialization') or
-                                                  mod.item.requiresSkill('Cruise Missile Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cruise Missiles', 'Torpedoes', 'Torpedo Specialization', 'Cruise Missile Specialization'),
                                       'speed', src.getModifiedItemAttr('bastionMissileROFBonus'),
                                       stackingPenalties=True, penaltyGroup='postPerc', **kwargs)
 
         # Tanking
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('armorDamageAmountBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('shieldBoostMultiplier'),
                                       stackingPenalties=True, **kwargs)
 
@@ -29974,7 +29947,7 @@ class Effect6658(BaseEffect):
         fit.ship.boostItemAttr('remoteAssistanceImpedance', src.getModifiedItemAttr('remoteAssistanceImpedanceBonus'), **kwargs)
         fit.ship.boostItemAttr('sensorDampenerResistance', src.getModifiedItemAttr('sensorDampenerResistanceBonus'), **kwargs)
         # This one was removed from expressions, but somehow MJD is still blocked, so leaving it here
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Micro Jump Drive Operation'),
                                          'activationBlocked', src.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
         fit.ship.boostItemAttr('targetPainterResistance', src.getModifiedItemAttr('targetPainterResistanceBonus'), **kwargs)
         fit.ship.boostItemAttr('weaponDisruptionResistance', src.getModifiedItemAttr('weaponDisruptionResistanceBonus'), **kwargs)
@@ -29996,7 +29969,7 @@ class Effect6661(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('shipBonusCarrierM3'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -30012,7 +29985,7 @@ class Effect6662(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusCarrierG3'), skill='Gallente Carrier', **kwargs)
 
 
@@ -30029,18 +30002,18 @@ class Effect6663(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'), 'miningDroneAmountPercent',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'), 'miningDroneAmountPercent',
                                      src.getModifiedItemAttr('miningAmountBonus') * lvl, **kwargs)
 
 
@@ -30075,16 +30048,16 @@ class Effect6664(BaseEffect):
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level if 'skill' in context else 1
         fit.drones.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+            itemRequiresSkill('Drones'), 'maxRange',
             src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
         fit.fighters.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+            itemRequiresSkill('Fighters'), 'fighterAbilityMissilesRange',
             src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
         fit.fighters.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretRangeOptimal',
+            itemRequiresSkill('Fighters'), 'fighterAbilityAttackTurretRangeOptimal',
             src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
         fit.fighters.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackMissileRangeOptimal',
+            itemRequiresSkill('Fighters'), 'fighterAbilityAttackMissileRangeOptimal',
             src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
 
 
@@ -30103,13 +30076,13 @@ class Effect6665(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('armorHpBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shieldCapacityBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shieldCapacityBonus') * lvl, **kwargs)
 
 
@@ -30127,9 +30100,9 @@ class Effect6667(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -30145,13 +30118,13 @@ class Effect6669(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('hullHpBonus'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('hullHpBonus'), **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('hullHpBonus'), **kwargs)
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
 
@@ -30168,14 +30141,14 @@ class Effect6670(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('rangeSkillBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal',
                                        src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
@@ -30193,9 +30166,9 @@ class Effect6671(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('droneMaxVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('droneMaxVelocityBonus'), stackingPenalties=True, **kwargs)
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
 
@@ -30246,7 +30219,7 @@ class Effect6679(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Doomsday Weapon'),
                                       'duration', src.getModifiedItemAttr('durationBonus'),
                                       skill='Structure Doomsday Operation', **kwargs)
 
@@ -30263,9 +30236,9 @@ class Effect6681(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
@@ -30396,7 +30369,7 @@ class Effect6686(BaseEffect):
             ('missileVelocityBonus', 'maxVelocity'),
             ('explosionDelayBonus', 'explosionDelay')
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                             tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
                                             stackingPenalties=True, **kwargs)
         for srcAttr, tgtAttr in (
@@ -30404,7 +30377,7 @@ class Effect6686(BaseEffect):
             ('maxRangeBonus', 'maxRange'),
             ('falloffBonus', 'falloff')
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           tgtAttr, module.getModifiedItemAttr(srcAttr) * rangeFactor,
                                           stackingPenalties=True, **kwargs)
 
@@ -30598,7 +30571,7 @@ class Effect6694(BaseEffect):
             ('maxRangeBonus', 'maxRange'),
             ('falloffBonus', 'falloff')
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           tgtAttr, container.getModifiedItemAttr(srcAttr),
                                           stackingPenalties=True, **kwargs)
 
@@ -30641,9 +30614,9 @@ class Effect6697(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Armor', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Armor'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Resource Processing', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Resource Processing'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30660,9 +30633,9 @@ class Effect6698(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Navigation', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Navigation'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Anchor', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Anchor'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30679,7 +30652,7 @@ class Effect6699(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Drones', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Drones'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30696,11 +30669,11 @@ class Effect6700(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Electronic Systems', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Electronic Systems'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Scanning', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Scanning'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Targeting', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Targeting'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30717,7 +30690,7 @@ class Effect6701(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Projectile Weapon', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Projectile Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30734,7 +30707,7 @@ class Effect6702(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Energy Weapon', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Energy Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30751,7 +30724,7 @@ class Effect6703(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Hybrid Weapon', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Hybrid Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30768,7 +30741,7 @@ class Effect6704(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Launcher', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Launcher'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30785,7 +30758,7 @@ class Effect6705(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Shield', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Shield'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30802,7 +30775,7 @@ class Effect6706(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'armorRepairBonus', src.getModifiedItemAttr('implantSetSerpentis2'), **kwargs)
 
 
@@ -30818,7 +30791,7 @@ class Effect6708(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('armorRepairBonus'), **kwargs)
 
 
@@ -30834,7 +30807,7 @@ class Effect6709(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -30850,7 +30823,7 @@ class Effect6710(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'speedFactor',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -30866,7 +30839,7 @@ class Effect6711(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
@@ -30882,7 +30855,7 @@ class Effect6712(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'speedFactor',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
 
 
@@ -30898,7 +30871,7 @@ class Effect6713(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'), 'speedFactor',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -30940,11 +30913,11 @@ class Effect6720(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldBonus',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldBonus',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'structureDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorDamageAmount',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -30960,11 +30933,11 @@ class Effect6721(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'maxRange',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
@@ -30982,10 +30955,10 @@ class Effect6722(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness',
                                       src.getModifiedItemAttr('roleBonusRepairRange'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'maxRange',
                                       src.getModifiedItemAttr('roleBonusRepairRange'), **kwargs)
 
@@ -31002,7 +30975,7 @@ class Effect6723(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -31018,7 +30991,7 @@ class Effect6724(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogistics3'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -31034,7 +31007,7 @@ class Effect6725(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'falloff',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'), 'falloff',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -31050,7 +31023,7 @@ class Effect6726(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -31066,7 +31039,7 @@ class Effect6727(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu', 'Energy Neutralizer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('eliteBonusCovertOps1'),
                                       stackingPenalties=True, skill='Covert Ops', **kwargs)
 
@@ -31273,9 +31246,9 @@ class Effect6762(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Drone Specialization'), 'miningAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Specialization'), 'miningAmount',
                                      src.getModifiedItemAttr('miningAmountBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Drone Specialization'), 'maxVelocity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Specialization'), 'maxVelocity',
                                      src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -31293,7 +31266,7 @@ class Effect6763(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration', src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Operation'), 'duration', src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
 
 
 class Effect6764(BaseEffect):
@@ -31309,9 +31282,9 @@ class Effect6764(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Specialization'), 'duration',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Specialization'), 'duration',
                                      src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Specialization'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Specialization'),
                                      'maxVelocity', src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -31328,7 +31301,7 @@ class Effect6765(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Spatial Phenomena Generation'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Spatial Phenomena Generation'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31344,9 +31317,9 @@ class Effect6766(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('maxGangModules'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('maxGangModules'), **kwargs)
 
 
@@ -31364,7 +31337,7 @@ class Effect6769(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'maxRange',
                                       src.getModifiedItemAttr('areaOfEffectBonus') * src.level, **kwargs)
 
 
@@ -31381,7 +31354,7 @@ class Effect6770(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31398,7 +31371,7 @@ class Effect6771(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31415,7 +31388,7 @@ class Effect6772(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31432,7 +31405,7 @@ class Effect6773(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31449,7 +31422,7 @@ class Effect6774(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31466,13 +31439,13 @@ class Effect6776(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
@@ -31489,13 +31462,13 @@ class Effect6777(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
@@ -31512,13 +31485,13 @@ class Effect6778(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
@@ -31535,13 +31508,13 @@ class Effect6779(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
@@ -31558,10 +31531,10 @@ class Effect6780(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff4Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff3Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff2Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff1Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
 class Effect6782(BaseEffect):
@@ -31577,7 +31550,7 @@ class Effect6782(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'),
                                       'reloadTime',
                                       src.getModifiedItemAttr('reloadTimeBonus') * lvl, **kwargs)
 
@@ -31602,7 +31575,7 @@ class Effect6783(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonusCommandBurstAoERange'), **kwargs)
 
 
@@ -31618,15 +31591,15 @@ class Effect6786(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
 
 
@@ -31647,7 +31620,7 @@ class Effect6789(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier',
                                      src.getModifiedItemAttr('industrialBonusDroneDamage'), **kwargs)
 
@@ -31664,15 +31637,15 @@ class Effect6793(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
 
 
@@ -31688,15 +31661,15 @@ class Effect6794(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
 
 
@@ -31713,7 +31686,7 @@ class Effect6796(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+            itemRequiresSkill('Small Hybrid Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -31733,7 +31706,7 @@ class Effect6797(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+            itemRequiresSkill('Small Projectile Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -31753,7 +31726,7 @@ class Effect6798(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+            itemRequiresSkill('Small Energy Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -31774,7 +31747,7 @@ class Effect6799(BaseEffect):
     def handler(fit, module, context, projectionRange, **kwargs):
         types = ('thermal', 'em', 'explosive', 'kinetic')
         for type in types:
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets', 'Light Missiles'),
                                                '{}Damage'.format(type),
                                                1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
                                                stackingPenalties=True,
@@ -31811,7 +31784,7 @@ class Effect6801(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Afterburner'),
+            itemRequiresSkill('High Speed Maneuvering', 'Afterburner'),
             'speedFactor',
             1 / module.getModifiedItemAttr('modeVelocityPostDiv'),
             stackingPenalties=True,
@@ -31831,9 +31804,9 @@ class Effect6807(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Invulnerability Core Operation'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Invulnerability Core Operation'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Invulnerability Core Operation'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Invulnerability Core Operation'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31849,7 +31822,7 @@ class Effect6844(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Defender Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Defender Missiles'),
                                         'maxVelocity', skill.getModifiedItemAttr('missileVelocityBonus') * skill.level, **kwargs)
 
 
@@ -31865,7 +31838,7 @@ class Effect6845(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Defender Missiles'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Defender Missiles'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -31882,7 +31855,7 @@ class Effect6851(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
 class Effect6852(BaseEffect):
@@ -31897,7 +31870,7 @@ class Effect6852(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
 
 
@@ -31913,9 +31886,9 @@ class Effect6853(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
 
 
@@ -31931,9 +31904,9 @@ class Effect6855(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
 
 
@@ -31949,7 +31922,7 @@ class Effect6856(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -31965,9 +31938,9 @@ class Effect6857(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
 
 
@@ -31983,7 +31956,7 @@ class Effect6858(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
 
 
@@ -32000,7 +31973,7 @@ class Effect6859(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'cpu', src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'cpu', src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
 
 
 class Effect6860(BaseEffect):
@@ -32015,7 +31988,7 @@ class Effect6860(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'power',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'power',
                                       src.getModifiedItemAttr('shipBonusRole5'), **kwargs)
 
 
@@ -32031,7 +32004,7 @@ class Effect6861(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'), 'power', src.getModifiedItemAttr('shipBonusRole5'), **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Remote Armor Repair Systems'), 'power', src.getModifiedItemAttr('shipBonusRole5'), **kwargs)
 
 
 class Effect6862(BaseEffect):
@@ -32046,7 +32019,7 @@ class Effect6862(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Remote Armor Repair Systems'),
                                       'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM1'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -32079,9 +32052,9 @@ class Effect6866(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -32097,7 +32070,7 @@ class Effect6867(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'speed', src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -32127,10 +32100,10 @@ class Effect6871(BaseEffect):
 
         bonus = sec_status * 10
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'),
+            itemRequiresSkill('Repair Systems'),
             'armorDamageAmount', bonus, **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation'),
+            itemRequiresSkill('Shield Operation'),
             'shieldBonus', bonus, **kwargs)
 
 
@@ -32146,7 +32119,7 @@ class Effect6872(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange', src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange', src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
 class Effect6873(BaseEffect):
@@ -32178,9 +32151,9 @@ class Effect6874(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -32213,7 +32186,7 @@ class Effect6878(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusBlackOps4'), skill='Black Ops', **kwargs)
 
 
@@ -32230,7 +32203,7 @@ class Effect6879(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusBlackOps3'), skill='Black Ops', **kwargs)
 
 
@@ -32247,11 +32220,11 @@ class Effect6880(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Cruise'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Heavy'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -32268,9 +32241,9 @@ class Effect6881(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosionDelay',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'explosionDelay',
                                         src.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'explosionDelay',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'explosionDelay',
                                         src.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -32286,9 +32259,9 @@ class Effect6883(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -32304,9 +32277,9 @@ class Effect6894(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu', 'Energy Neutralizer'),
         'cpu', src.getModifiedItemAttr('subsystemEnergyNeutFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu', 'Energy Neutralizer'),
                                       'power', src.getModifiedItemAttr('subsystemEnergyNeutFittingReduction'), **kwargs)
 
 
@@ -32322,9 +32295,9 @@ class Effect6895(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMETFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMETFittingReduction'), **kwargs)
 
 
@@ -32342,9 +32315,9 @@ class Effect6896(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMHTFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMHTFittingReduction'), **kwargs)
 
 
@@ -32360,9 +32333,9 @@ class Effect6897(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMPTFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMPTFittingReduction'), **kwargs)
 
 
@@ -32380,7 +32353,7 @@ class Effect6898(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+            itemRequiresSkill('Remote Armor Repair Systems'),
             'mediumRemoteRepFittingMultiplier', src.getModifiedItemAttr('subsystemMRARFittingReduction'), **kwargs)
 
 
@@ -32398,7 +32371,7 @@ class Effect6899(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+            itemRequiresSkill('Shield Emission Systems'),
             'mediumRemoteRepFittingMultiplier', src.getModifiedItemAttr('subsystemMRSBFittingReduction'), **kwargs)
 
 
@@ -32417,9 +32390,9 @@ class Effect6900(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'cpu', src.getModifiedItemAttr('subsystemMMissileFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'power', src.getModifiedItemAttr('subsystemMMissileFittingReduction'), **kwargs)
 
 
@@ -32519,7 +32492,7 @@ class Effect6921(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'),
                                         skill='Amarr Defensive Systems', **kwargs)
 
@@ -32536,7 +32509,7 @@ class Effect6923(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles', 'Heavy Assault Missiles'),
                                       'maxVelocity', container.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -32553,7 +32526,7 @@ class Effect6924(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                       'aoeVelocity', container.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -32570,10 +32543,10 @@ class Effect6925(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                      skill='Gallente Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                      skill='Gallente Offensive Systems', **kwargs)
 
@@ -32621,7 +32594,7 @@ class Effect6928(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner') or mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner', 'High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', src.getModifiedItemAttr('subsystemBonusCaldariPropulsion2'),
                                       skill='Caldari Propulsion Systems', **kwargs)
 
@@ -32639,7 +32612,7 @@ class Effect6929(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner') or mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner', 'High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', src.getModifiedItemAttr('subsystemBonusGallentePropulsion2'),
                                       skill='Gallente Propulsion Systems', **kwargs)
 
@@ -32736,7 +32709,7 @@ class Effect6935(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu', 'Energy Neutralizer'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrCore3'), skill='Amarr Core Systems', **kwargs)
 
 
@@ -32752,7 +32725,7 @@ class Effect6936(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'overloadRangeBonus', src.getModifiedItemAttr('subsystemBonusMinmatarCore3'),
                                       skill='Minmatar Core Systems', **kwargs)
 
@@ -32769,7 +32742,7 @@ class Effect6937(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'overloadRangeBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'), 'overloadRangeBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteCore3'), skill='Gallente Core Systems', **kwargs)
 
 
@@ -32785,7 +32758,7 @@ class Effect6938(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'overloadECMStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'overloadECMStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore3'), skill='Caldari Core Systems', **kwargs)
 
 
@@ -32801,9 +32774,9 @@ class Effect6939(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'), skill='Amarr Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'), skill='Amarr Defensive Systems', **kwargs)
 
 
@@ -32819,9 +32792,9 @@ class Effect6940(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
 
 
@@ -32837,7 +32810,7 @@ class Effect6941(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Tactical Shield Manipulation'),
                                       'overloadHardeningBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive2'),
                                       skill='Caldari Defensive Systems', **kwargs)
 
@@ -32854,11 +32827,11 @@ class Effect6942(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Tactical Shield Manipulation'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
 
 
@@ -32875,10 +32848,10 @@ class Effect6943(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusAmarrDefensive3'),
                                       skill='Amarr Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusAmarrDefensive3'),
                                       skill='Amarr Defensive Systems', **kwargs)
 
@@ -32896,10 +32869,10 @@ class Effect6944(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusGallenteDefensive3'),
                                       skill='Gallente Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusGallenteDefensive3'),
                                       skill='Gallente Defensive Systems', **kwargs)
 
@@ -32917,10 +32890,10 @@ class Effect6945(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadShieldBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive3'),
                                       skill='Caldari Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive3'),
                                       skill='Caldari Defensive Systems', **kwargs)
 
@@ -32938,13 +32911,13 @@ class Effect6946(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
                                       skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadShieldBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
                                       skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems', 'Shield Operation'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
                                       skill='Minmatar Defensive Systems', **kwargs)
 
@@ -32961,7 +32934,7 @@ class Effect6947(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', src.getModifiedItemAttr('subsystemBonusCaldariDefensive2'),
                                         skill='Caldari Defensive Systems', **kwargs)
 
@@ -32978,7 +32951,7 @@ class Effect6949(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
 
 
@@ -32994,7 +32967,7 @@ class Effect6951(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
 
 
@@ -33029,9 +33002,9 @@ class Effect6954(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'power',
                                       src.getModifiedItemAttr('subsystemCommandBurstFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'cpu',
                                       src.getModifiedItemAttr('subsystemCommandBurstFittingReduction'), **kwargs)
 
 
@@ -33048,7 +33021,7 @@ class Effect6955(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Shield Booster', 'Ancillary Remote Shield Booster'),
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Shield Booster', 'Ancillary Remote Shield Booster'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('remoteShieldBoosterFalloffBonus'), **kwargs)
 
 
@@ -33064,7 +33037,7 @@ class Effect6956(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
                                       'maxRange', src.getModifiedItemAttr('remoteArmorRepairerOptimalBonus'), **kwargs)
 
 
@@ -33080,7 +33053,7 @@ class Effect6957(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('remoteArmorRepairerFalloffBonus'), **kwargs)
 
 
@@ -33096,7 +33069,7 @@ class Effect6958(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -33112,7 +33085,7 @@ class Effect6959(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteOffensive3'), skill='Gallente Offensive Systems', **kwargs)
 
 
@@ -33128,7 +33101,7 @@ class Effect6960(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusCaldariOffensive3'),
                                       skill='Caldari Offensive Systems', **kwargs)
 
@@ -33145,7 +33118,7 @@ class Effect6961(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems', 'Remote Armor Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -33211,7 +33184,7 @@ class Effect6965(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Survey'), 'explosionDelay',
+            chargeRequiresSkill('Survey'), 'explosionDelay',
             container.getModifiedItemAttr('surveyProbeDurationBonus'), **kwargs)
 
 
@@ -33227,17 +33200,17 @@ class Effect6981(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
 
 
@@ -33253,17 +33226,17 @@ class Effect6982(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
 
 
@@ -33298,13 +33271,13 @@ class Effect6984(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretDamageMultiplier',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackMissileDamageMultiplier',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesDamageMultiplier',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
 
 
@@ -33320,17 +33293,17 @@ class Effect6985(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -33346,7 +33319,7 @@ class Effect6986(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'), 'shieldBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG1'), skill='Gallente Carrier', **kwargs)
 
 
@@ -33362,17 +33335,17 @@ class Effect6987(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'structureDamageAmount', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'shieldBonus', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'armorDamageAmount', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'armorHP', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'shieldCapacity', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'hp', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -33388,7 +33361,7 @@ class Effect6992(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
 class Effect6993(BaseEffect):
@@ -33404,18 +33377,18 @@ class Effect6993(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMissileAOECloudPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterCapacitorCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterAOEVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterArmorRepairAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMissileVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretTrackingPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterShieldCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretOptimalRangePenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterShieldBoostAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretFalloffPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterArmorHPPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMaxVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterMissileAOECloudPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterCapacitorCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterAOEVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterArmorRepairAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterMissileVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterTurretTrackingPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterShieldCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterTurretOptimalRangePenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterShieldBoostAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterTurretFalloffPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterArmorHPPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterMaxVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
 class Effect6994(BaseEffect):
@@ -33430,7 +33403,7 @@ class Effect6994(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -33463,7 +33436,7 @@ class Effect6996(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -33479,7 +33452,7 @@ class Effect6997(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('eliteBonusCovertOps4'), skill='Covert Ops', **kwargs)
 
 
@@ -33495,7 +33468,7 @@ class Effect6999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemMultiply(itemGroupIs('Missile Launcher Torpedo'),
                                          'cpu', ship.getModifiedItemAttr('stealthBomberLauncherCPU'), **kwargs)
 
 
@@ -33511,7 +33484,7 @@ class Effect7000(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'falloff',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'), 'falloff',
                                       src.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -33527,7 +33500,7 @@ class Effect7001(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'), 'speed', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
 class Effect7002(BaseEffect):
@@ -33542,8 +33515,8 @@ class Effect7002(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'), 'power', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'), 'cpu', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Bomb Deployment'), 'power', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Bomb Deployment'), 'cpu', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
 class Effect7003(BaseEffect):
@@ -33558,7 +33531,7 @@ class Effect7003(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('eliteBonusCovertOps3'), skill='Covert Ops', **kwargs)
 
 
@@ -33631,7 +33604,7 @@ class Effect7013(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -33647,7 +33620,7 @@ class Effect7014(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -33663,7 +33636,7 @@ class Effect7015(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -33679,7 +33652,7 @@ class Effect7016(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'explosiveDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -33696,7 +33669,7 @@ class Effect7017(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'aoeVelocity',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'aoeVelocity',
                                         src.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
 
 
@@ -33712,7 +33685,7 @@ class Effect7018(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusAF'), stackingPenalties=False, skill='Amarr Frigate', **kwargs)
 
 
@@ -33729,7 +33702,7 @@ class Effect7020(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('stasisWebRangeBonus'), stackingPenalties=False, **kwargs)
 
 
@@ -33826,11 +33799,11 @@ class Effect7030(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Guided Bomb Launcher',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Guided Bomb Launcher'),
                                       'speed', ship.getModifiedItemAttr('structureAoERoFRoleBonus'), **kwargs)
         for attr in ['duration', 'durationTargetIlluminationBurstProjector', 'durationWeaponDisruptionBurstProjector',
                      'durationECMJammerBurstProjector', 'durationSensorDampeningBurstProjector', 'capacitorNeed']:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Burst Projector',
+            fit.modules.filteredItemBoost(itemGroupIs('Structure Burst Projector'),
                                           attr, ship.getModifiedItemAttr('structureAoERoFRoleBonus'), **kwargs)
 
 
@@ -33846,7 +33819,7 @@ class Effect7031(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -33862,7 +33835,7 @@ class Effect7032(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -33878,7 +33851,7 @@ class Effect7033(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -33894,7 +33867,7 @@ class Effect7034(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -33910,7 +33883,7 @@ class Effect7035(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -33926,7 +33899,7 @@ class Effect7036(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -33942,7 +33915,7 @@ class Effect7037(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'thermalDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -33958,7 +33931,7 @@ class Effect7038(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -33976,7 +33949,7 @@ class Effect7039(BaseEffect):
     def handler(fit, src, context, projectionRange, **kwargs):
         groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.item.group.name in groups,
+            fit.modules.filteredChargeMultiply(itemGroupIs(*groups),
                                                '%sDamage' % dmgType,
                                                src.getModifiedItemAttr('hiddenMissileDamageMultiplier'), **kwargs)
 
@@ -34094,14 +34067,14 @@ class Effect7047(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Propulsion Module', 'Micro Jump Drive'),
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module', 'Micro Jump Drive'),
                                       'power', src.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Propulsion Module', 'Micro Jump Drive'),
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module', 'Micro Jump Drive'),
                                       'cpu', src.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Target Painter', 'Scan Probe Launcher'),
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter', 'Scan Probe Launcher'),
                                       'cpu', src.getModifiedItemAttr('flagCruiserFittingBonusPainterProbes'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Target Painter', 'Scan Probe Launcher'),
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter', 'Scan Probe Launcher'),
                                       'power', src.getModifiedItemAttr('flagCruiserFittingBonusPainterProbes'), **kwargs)
 
 
@@ -34159,9 +34132,9 @@ class Effect7052(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter', 'signatureRadiusBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'), 'signatureRadiusBonus',
                                       src.getModifiedItemAttr('targetPainterStrengthModifierFlagCruisers'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'), 'maxRange',
                                       src.getModifiedItemAttr('targetPainterRangeModifierFlagCruisers'), **kwargs)
 
 
@@ -34177,35 +34150,35 @@ class Effect7055(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -34374,7 +34347,7 @@ class Effect7071(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34391,7 +34364,7 @@ class Effect7072(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34408,7 +34381,7 @@ class Effect7073(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34425,7 +34398,7 @@ class Effect7074(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34442,7 +34415,7 @@ class Effect7075(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34459,7 +34432,7 @@ class Effect7076(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34475,7 +34448,7 @@ class Effect7077(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Precursor Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -34492,7 +34465,7 @@ class Effect7078(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Precursor Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -34509,7 +34482,7 @@ class Effect7079(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Precursor Weapon'),
                                       'speed', ship.getModifiedItemAttr('shipBonusPBS1'), skill='Precursor Battleship', **kwargs)
 
 
@@ -34525,7 +34498,7 @@ class Effect7080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPBS2'), skill='Precursor Battleship', **kwargs)
 
 
@@ -34542,7 +34515,7 @@ class Effect7085(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
 
 
@@ -34559,7 +34532,7 @@ class Effect7086(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
 
 
@@ -34575,7 +34548,7 @@ class Effect7087(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusPF2'), skill='Precursor Frigate', **kwargs)
 
 
@@ -34592,7 +34565,7 @@ class Effect7088(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPF1'), skill='Precursor Frigate', **kwargs)
 
 
@@ -34608,7 +34581,7 @@ class Effect7091(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'), 'capacitorNeed', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capacitor Emission Systems'), 'capacitorNeed', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
 class Effect7092(BaseEffect):
@@ -34631,7 +34604,7 @@ class Effect7092(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            itemRequiresSkill('Remote Armor Repair Systems', 'Capital Remote Armor Repair Systems'),
             'capacitorNeed', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -34655,7 +34628,7 @@ class Effect7093(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Energy Pulse Weapons'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -34679,7 +34652,7 @@ class Effect7094(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            itemRequiresSkill('Remote Armor Repair Systems', 'Capital Remote Armor Repair Systems'),
             'maxRange', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -34695,7 +34668,7 @@ class Effect7097(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Precursor Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -34718,17 +34691,17 @@ class Effect7098(BaseEffect):
         fit.ship.boostItemAttr('scanResolution', src.getModifiedItemAttr('structureRigScanResBonus'),
                                stackingPenalties=True, **kwargs)
         fit.ship.increaseItemAttr('maxLockedTargets', src.getModifiedItemAttr('structureRigMaxTargetBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Area Denial Module'),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigPDCapUseBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Area Denial Module'),
                                       'empFieldRange', src.getModifiedItemAttr('structureRigPDRangeBonus'), **kwargs)
         for attr in ('structureRigMaxTargetBonus', 'structureRigMaxTargetRangeBonus', 'structureRigScanResBonus'):
             fit.modules.filteredItemForce(
-                lambda mod: mod.item.group.name == 'Structure Combat Rig L - Max Targets and Sensor Boosting',
+                itemGroupIs('Structure Combat Rig L - Max Targets and Sensor Boosting'),
                 attr, src.getModifiedItemAttr('constantZero'), **kwargs)
         for attr in ('structureRigPDCapUseBonus', 'structureRigPDRangeBonus'):
             fit.modules.filteredItemForce(
-                lambda mod: mod.item.group.name == 'Structure Combat Rig L - Point Defense Battery Application and Projection',
+                itemGroupIs('Structure Combat Rig L - Point Defense Battery Application and Projection'),
                 attr, src.getModifiedItemAttr('constantZero'), **kwargs)
 
 
@@ -34745,7 +34718,7 @@ class Effect7111(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Small Precursor Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -34769,7 +34742,7 @@ class Effect7112(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -34785,7 +34758,7 @@ class Effect7116(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
 
 
@@ -34823,7 +34796,7 @@ class Effect7118(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'), 'damageMultiplierBonusPerCycle',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Small Precursor Weapon'), 'damageMultiplierBonusPerCycle',
                                          src.getModifiedItemAttr('eliteBonusCovertOps3'), skill='Covert Ops', **kwargs)
 
 
@@ -34839,7 +34812,7 @@ class Effect7119(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'), 'damageMultiplierBonusPerCycle',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Medium Precursor Weapon'), 'damageMultiplierBonusPerCycle',
                                          src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -34857,11 +34830,11 @@ class Effect7142(BaseEffect):
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
         fit.ship.boostItemAttr('mass', src.getModifiedItemAttr('massBonusPercentage'), stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'), 'speedFactor',
                                       src.getModifiedItemAttr('speedFactorBonus'), stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedBoostFactor',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'), 'speedBoostFactor',
                                       src.getModifiedItemAttr('speedBoostFactorBonus'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'), 'activationBlocked',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('High Speed Maneuvering'), 'activationBlocked',
                                          src.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
         fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('maxVelocityBonus'), stackingPenalties=True, **kwargs)
 
@@ -34878,7 +34851,7 @@ class Effect7154(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPD1'),
                                       skill='Precursor Destroyer', **kwargs)
 
@@ -34895,7 +34868,7 @@ class Effect7155(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPBC1'),
                                       skill='Precursor Battlecruiser', **kwargs)
 
@@ -34912,7 +34885,7 @@ class Effect7156(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -34928,7 +34901,7 @@ class Effect7157(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusPD2'),
                                       skill='Precursor Destroyer', **kwargs)
 
@@ -35009,7 +34982,7 @@ class Effect7162(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -35060,7 +35033,7 @@ class Effect7167(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter', 'maxRange', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'), 'maxRange', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
 class Effect7168(BaseEffect):
@@ -35075,7 +35048,7 @@ class Effect7168(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'maxRange', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'), 'maxRange', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
 class Effect7169(BaseEffect):
@@ -35090,7 +35063,7 @@ class Effect7169(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'armorDamageAmount', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'), 'armorDamageAmount', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
 
 
 class Effect7170(BaseEffect):
@@ -35105,7 +35078,7 @@ class Effect7170(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'capacitorNeed', src.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'), 'capacitorNeed', src.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
 
 
 class Effect7171(BaseEffect):
@@ -35120,7 +35093,7 @@ class Effect7171(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'maxRange', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'), 'maxRange', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
 
 
 class Effect7172(BaseEffect):
@@ -35135,7 +35108,7 @@ class Effect7172(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'capacitorNeed', src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'), 'capacitorNeed', src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
 
 
 class Effect7173(BaseEffect):
@@ -35150,7 +35123,7 @@ class Effect7173(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'armorDamageAmount', src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'), 'armorDamageAmount', src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
 
 
 class Effect7176(BaseEffect):
@@ -35167,7 +35140,7 @@ class Effect7176(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -35183,11 +35156,11 @@ class Effect7177(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('armorHpBonus'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shieldCapacityBonus'), **kwargs)
 
 
@@ -35204,7 +35177,7 @@ class Effect7183(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Warp Scrambler',
+            itemGroupIs('Warp Scrambler'),
             'maxRange', src.getModifiedItemAttr('warpScrambleRangeBonus'), **kwargs)
 
 
@@ -35221,7 +35194,7 @@ class Effect7184(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -35238,7 +35211,7 @@ class Effect7185(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -35255,7 +35228,7 @@ class Effect7186(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -35273,7 +35246,7 @@ class Effect7193(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'), 'duration',
                                       beacon.getModifiedItemAttr('miningDurationMultiplier'), **kwargs)
 
 
@@ -35290,7 +35263,7 @@ class Effect7202(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', beacon.getModifiedItemAttr('droneMaxVelocityBonus'),
                                      stackingPenalties=True, **kwargs)
 
@@ -35308,7 +35281,7 @@ class Effect7203(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', beacon.getModifiedItemAttr('droneDamageBonus'),
                                      stackingPenalties=True, **kwargs)
 
@@ -35385,7 +35358,7 @@ class Effect7209(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -35402,7 +35375,7 @@ class Effect7210(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Defender Missiles'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Defender Missiles'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -35418,7 +35391,7 @@ class Effect7211(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'damageMultiplierBonusMax', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -35435,7 +35408,7 @@ class Effect7216(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'damageMultiplierBonusMax', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -35484,7 +35457,7 @@ class Effect7228(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -35501,7 +35474,7 @@ class Effect7230(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC2'),
                                      skill='Gallente Cruiser', **kwargs)
 
@@ -35518,7 +35491,7 @@ class Effect7231(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGC3'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -35536,7 +35509,7 @@ class Effect7232(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Precursor Weapon', 'damageMultiplierBonusMax',
+            itemGroupIs('Precursor Weapon'), 'damageMultiplierBonusMax',
             implant.getModifiedItemAttr('damageMultiplierBonusMaxModifier'), **kwargs)
 
 
@@ -35553,7 +35526,7 @@ class Effect7233(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Precursor Weapon', 'damageMultiplierBonusPerCycle',
+            itemGroupIs('Precursor Weapon'), 'damageMultiplierBonusPerCycle',
             implant.getModifiedItemAttr('damageMultiplierBonusPerCycleModifier'), **kwargs)
 
 
@@ -35571,10 +35544,10 @@ class Effect7234(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.appliedImplants.filteredItemMultiply(
-            lambda imp: imp.item.group.name == 'Cyberimplant', 'damageMultiplierBonusMaxModifier',
+            itemGroupIs('Cyberimplant'), 'damageMultiplierBonusMaxModifier',
             implant.getModifiedItemAttr('setBonusMimesis'), **kwargs)
         fit.appliedImplants.filteredItemMultiply(
-            lambda imp: imp.item.group.name == 'Cyberimplant', 'damageMultiplierBonusPerCycleModifier',
+            itemGroupIs('Cyberimplant'), 'damageMultiplierBonusPerCycleModifier',
             implant.getModifiedItemAttr('setBonusMimesis'), **kwargs)
 
 
@@ -35608,7 +35581,7 @@ class Effect7238(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Precursor Weapon'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Precursor Weapon'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtPC1'), skill='Precursor Dreadnought', **kwargs)
 
 
@@ -35641,7 +35614,7 @@ class Effect7240(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Precursor Weapon'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Precursor Weapon'), 'speed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtPC3'), skill='Precursor Dreadnought', **kwargs)
 
 
@@ -35658,7 +35631,7 @@ class Effect7242(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -35692,7 +35665,7 @@ class Effect7248(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -35724,7 +35697,7 @@ class Effect8013(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'shieldHpBonus', implant.getModifiedItemAttr('ImplantSetNirvana') or 1, **kwargs)
 
 
@@ -35742,7 +35715,7 @@ class Effect8017(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.appliedImplants.filteredItemMultiply(
-            lambda implant: implant.item.requiresSkill('Cybernetics'),
+            itemRequiresSkill('Cybernetics'),
             'remoteRepDurationBonus', implant.getModifiedItemAttr('implantSetSavior'), **kwargs)
 
 
@@ -35759,8 +35732,7 @@ class Effect8018(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Emission Systems')
-                        or mod.item.requiresSkill('Remote Armor Repair Systems'),
+            itemRequiresSkill('Shield Emission Systems', 'Remote Armor Repair Systems'),
             'duration', implant.getModifiedItemAttr('remoteRepDurationBonus'), **kwargs)
 
 
@@ -35795,7 +35767,7 @@ class Effect8021(BaseEffect):
     def handler(fit, implant, context, projectionRange, **kwargs):
         for attr in ('hydraDroneTrackingBonus', 'hydraDroneRangeBonus', 'hydraMissileFlightTimeBonus', 'hydraMissileExplosionVelocityBonus'):
             fit.appliedImplants.filteredItemMultiply(
-                lambda implant: implant.item.requiresSkill('Cybernetics'),
+                itemRequiresSkill('Cybernetics'),
                 attr, implant.getModifiedItemAttr('implantSetHydra'), **kwargs)
 
 
@@ -35812,7 +35784,7 @@ class Effect8023(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'),
+            itemRequiresSkill('Drones'),
             'trackingSpeed', implant.getModifiedItemAttr('hydraDroneTrackingBonus'), **kwargs)
 
 
@@ -35830,7 +35802,7 @@ class Effect8024(BaseEffect):
     def handler(fit, implant, context, projectionRange, **kwargs):
         for attr in ('maxRange', 'falloff'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Drones'),
+                itemRequiresSkill('Drones'),
                 attr, implant.getModifiedItemAttr('hydraDroneRangeBonus'), **kwargs)
 
 
@@ -35847,7 +35819,7 @@ class Effect8025(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'explosionDelay', implant.getModifiedItemAttr('hydraMissileFlightTimeBonus'), **kwargs)
 
 
@@ -35864,7 +35836,7 @@ class Effect8026(BaseEffect):
     @staticmethod
     def handler(fit, implant, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'aoeVelocity', implant.getModifiedItemAttr('hydraMissileExplosionVelocityBonus'), **kwargs)
 
 
@@ -35882,7 +35854,7 @@ class Effect8029(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for attr in ('maxGroupOnline', 'maxGroupFitted'):
             fit.modules.filteredItemForce(
-                lambda mod: mod.item.group.name == 'Capacitor Booster',
+                itemGroupIs('Capacitor Booster'),
                 attr, ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -35916,7 +35888,7 @@ class Effect8032(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.group.name == 'Warp Scrambler',
+            itemGroupIs('Warp Scrambler'),
             'warpScrambleStrength', beacon.getModifiedItemAttr('warpScrambleStrengthBonus'), **kwargs)
 
 
@@ -35934,7 +35906,7 @@ class Effect8033(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.group.name == 'ECM', 'maxRange',
+            itemGroupIs('ECM'), 'maxRange',
             beacon.getModifiedItemAttr('ecmRangeBonus'), stackingPenalties=True, **kwargs)
 
 
@@ -35950,7 +35922,7 @@ class Effect8034(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Vorton Projector'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Vorton Projector'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -35966,7 +35938,7 @@ class Effect8035(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Vorton Projector'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Vorton Projector'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -35982,7 +35954,7 @@ class Effect8036(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Vorton Projector'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Vorton Projector'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -36011,9 +35983,9 @@ class Effect8039(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Vorton Projector Operation'),
                                       'aoeVelocity', container.getModifiedItemAttr('aoeVelocityBonus') * level, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Vorton Projector Operation'),
                                       'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level, **kwargs)
 
 
@@ -36029,7 +36001,7 @@ class Effect8041(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Vorton Projector',
+        fit.modules.filteredItemBoost(itemGroupIs('Vorton Projector'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -36045,7 +36017,7 @@ class Effect8042(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Vorton Projector Operation'),
                                       'speed', skill.getModifiedItemAttr('turretSpeeBonus') * skill.level, **kwargs)
 
 
@@ -36061,7 +36033,7 @@ class Effect8044(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Vorton Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Vorton Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -36077,7 +36049,7 @@ class Effect8045(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Vorton Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Vorton Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -36093,7 +36065,7 @@ class Effect8046(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Vorton Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Vorton Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -36128,7 +36100,7 @@ class Effect8048(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Vorton Projector'), 'damageMultiplier',
+            itemRequiresSkill('Small Vorton Projector'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipBonusUF2'), skill='EDENCOM Frigate', **kwargs)
 
 
@@ -36163,7 +36135,7 @@ class Effect8053(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Vorton Projector'), 'maxRange',
+            itemRequiresSkill('Medium Vorton Projector'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusUC1'), skill='EDENCOM Cruiser', **kwargs)
 
 
@@ -36180,7 +36152,7 @@ class Effect8054(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Large Vorton Projector'), 'damageMultiplier',
+            itemRequiresSkill('Large Vorton Projector'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipBonusUB1'), skill='EDENCOM Battleship', **kwargs)
 
 
@@ -36197,7 +36169,7 @@ class Effect8056(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Large Vorton Projector'), 'speed',
+            itemRequiresSkill('Large Vorton Projector'), 'speed',
             ship.getModifiedItemAttr('shipBonusUB2'), skill='EDENCOM Battleship', **kwargs)
 
 
@@ -36213,10 +36185,10 @@ class Effect8057(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Vorton Projector',
+        fit.modules.filteredItemMultiply(itemGroupIs('Vorton Projector'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Vorton Projector',
+        fit.modules.filteredItemMultiply(itemGroupIs('Vorton Projector'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -36248,7 +36220,7 @@ class Effect8065(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Vorton Projector Operation'),
                                       'maxRange', skill.getModifiedItemAttr('rangeSkillBonus') * skill.level, **kwargs)
 
 
@@ -36265,7 +36237,7 @@ class Effect8064(BaseEffect):
     @staticmethod
     def handler(fit, booster, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'), 'maxRange',
+            itemRequiresSkill('Vorton Projector Operation'), 'maxRange',
             booster.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -36284,7 +36256,7 @@ class Effect8066(BaseEffect):
     @staticmethod
     def handler(fit, booster, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'), 'damageMultiplier',
+            itemRequiresSkill('Vorton Projector Operation'), 'damageMultiplier',
             booster.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -36318,8 +36290,7 @@ class Effect8070(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or
-                                                    mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles', 'Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships', **kwargs)
 
@@ -36336,7 +36307,7 @@ class Effect8071(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxRange', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                      skill='Command Ships', **kwargs)
 
@@ -36387,7 +36358,7 @@ class Effect8074(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
 
 
@@ -36438,7 +36409,7 @@ class Effect8091(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.group.name == 'Capacitor Booster Charge',
+            chargeGroupIs('Capacitor Booster Charge'),
             'capacitorBonus', ship.getModifiedItemAttr('shipBonusForceAuxiliaryG2'),
             skill='Gallente Carrier', **kwargs)
 
@@ -36456,7 +36427,7 @@ class Effect8092(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.group.name == 'Capacitor Booster Charge',
+            chargeGroupIs('Capacitor Booster Charge'),
             'capacitorBonus', ship.getModifiedItemAttr('shipBonusForceAuxiliaryM2'),
             skill='Minmatar Carrier', **kwargs)
 
@@ -36473,7 +36444,7 @@ class Effect8094(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusGD1'),
                                       skill='Gallente Destroyer', **kwargs)
 
@@ -36490,7 +36461,7 @@ class Effect8095(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plate',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Plate'),
                                       'massAddition', ship.getModifiedItemAttr('eliteBonusInterdictors1'),
                                       skill='Interdictors', **kwargs)
 
@@ -36507,7 +36478,7 @@ class Effect8096(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCD2'),
                                         skill='Caldari Destroyer', **kwargs)
 
@@ -36557,7 +36528,7 @@ class Effect8100(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'),
+            itemRequiresSkill('Drones'),
             'ecmJamDuration', ship.getModifiedItemAttr('shipBonusCF'),
             skill='Caldari Frigate', **kwargs)
 
@@ -36576,7 +36547,7 @@ class Effect8101(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Drones'),
+                itemRequiresSkill('Drones'),
                 f'{dmgType}Damage', ship.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -36596,7 +36567,7 @@ class Effect8102(BaseEffect):
             'droneControlRange', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
         for attr in ('shieldCapacity', 'armorHP', 'hp'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Drones'),
+                itemRequiresSkill('Drones'),
                 attr, ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -36633,7 +36604,7 @@ class Effect8103(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.appliedImplants.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Cybernetics'),
+            itemRequiresSkill('Cybernetics'),
             'capRechargeBonus', src.getModifiedItemAttr('ImplantSetRapture'), **kwargs)
 
 
@@ -36651,10 +36622,10 @@ class Effect8104(BaseEffect):
     def handler(fit, src, context, projectionRange, **kwargs):
         lvl = src.level
         fit.drones.filteredItemIncrease(
-            lambda mod: mod.item.requiresSkill('Salvage Drone Specialization'),
+            itemRequiresSkill('Salvage Drone Specialization'),
             'accessDifficultyBonus', src.getModifiedItemAttr('specAccessDifficultyBonus') * lvl, **kwargs)
         fit.drones.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Salvage Drone Specialization'),
+            itemRequiresSkill('Salvage Drone Specialization'),
             'maxVelocity', src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -36670,7 +36641,7 @@ class Effect8106(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMB2'),
                                       skill='Minmatar Battleship', **kwargs)
 
@@ -36687,7 +36658,7 @@ class Effect8107(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAB2'),
                                       skill='Amarr Battleship', **kwargs)
 
@@ -36739,12 +36710,12 @@ class Effect8111(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.ship.increaseItemAttr('disallowCloaking', beacon.getModifiedItemAttr('disallowCloaking'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', beacon.getModifiedItemAttr('scanProbeStrengthBonus'),
                                         stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Archaeology'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Archaeology'),
                                          'virusCoherence', beacon.getModifiedItemAttr('virusCoherenceBonus'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Hacking'),
                                          'virusCoherence', beacon.getModifiedItemAttr('virusCoherenceBonus'), **kwargs)
         fit.ship.boostItemAttr('shieldEmDamageResonance', beacon.getModifiedItemAttr('shieldEmDamageResistanceBonus'),
                                stackingPenalties=True, **kwargs)
@@ -36769,13 +36740,11 @@ class Effect8112(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems') or
-                                                  mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems', 'Capital Repair Systems'),
                                       'duration', beacon.getModifiedItemAttr('armorRepairDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation') or
-                                                  mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
                                       'duration', beacon.getModifiedItemAttr('shieldBoosterDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'), 'duration',
                                       beacon.getModifiedItemAttr('miningDurationMultiplier'), **kwargs)
         fit.ship.boostItemAttr('warpSpeedMultiplier', beacon.getModifiedItemAttr('warpSpeedBonus'),
                                stackingPenalties=True, **kwargs)
@@ -36806,13 +36775,11 @@ class Effect8113(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Shield Emission Systems') or
-                        mod.item.requiresSkill('Capital Shield Emission Systems'),
+            itemRequiresSkill('Shield Emission Systems', 'Capital Shield Emission Systems'),
             'shieldBonus', beacon.getModifiedItemAttr('shieldBonusMultiplierRemote'),
             stackingPenalties=True, penaltyGroup='postMul', **kwargs)
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or
-                        mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+            itemRequiresSkill('Remote Armor Repair Systems', 'Capital Remote Armor Repair Systems'),
             'armorDamageAmount', beacon.getModifiedItemAttr('armorDamageAmountMultiplierRemote'),
             stackingPenalties=True, penaltyGroup='postMul', **kwargs)
         fit.ship.multiplyItemAttr('shieldCapacity', beacon.getModifiedItemAttr('shieldCapacityMultiplier'), **kwargs)
@@ -36843,20 +36810,20 @@ class Effect8114(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Gunnery'),
                                          'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                          stackingPenalties=True, **kwargs)
         for attr in ('emDamage', 'explosiveDamage', 'kineticDamage', 'thermalDamage'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                                attr, beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                                stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemMultiply(itemRequiresSkill('Drones'),
                                         'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'),
                                           'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                           stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Gunnery'),
                                          'trackingSpeed', beacon.getModifiedItemAttr('trackingSpeedMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
         fit.drones.filteredItemMultiply(lambda drone: True,
@@ -36864,11 +36831,11 @@ class Effect8114(BaseEffect):
                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
         for attr in ('fighterAbilityAttackMissileExplosionRadius', 'fighterAbilityMissilesExplosionRadius'):
             fit.fighters.filteredItemMultiply(
-                lambda mod: mod.item.requiresSkill('Fighters'),
+                itemRequiresSkill('Fighters'),
                 attr, beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'),
                 stackingPenalties=True, penaltyGroup='postMul', **kwargs)
         fit.ship.multiplyItemAttr('armorHP', beacon.getModifiedItemAttr('armorHPMultiplier'), **kwargs)
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'aoeCloudSize', beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
         fit.ship.boostItemAttr('shieldThermalDamageResonance',
@@ -36913,43 +36880,43 @@ class Effect8119(BaseEffect):
         fit.ship.multiplyItemAttr('mass', src.getModifiedItemAttr('siegeMassMultiplier'), **kwargs)
 
         #  Local Shield Repper Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'duration', src.getModifiedItemAttr('industrialCoreLocalLogisticsDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('industrialCoreLocalLogisticsAmountBonus'),
                                       stackingPenalties=True, **kwargs)
 
         # Mining Burst Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
 
         #  Command Burst Range Bonus
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'),
                                       'maxRange', src.getModifiedItemAttr('industrialCoreBonusCommandBurstRange'),
                                       stackingPenalties=True, **kwargs)
 
         # Drone Bonuses
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Operation'),
                                      'duration', src.getModifiedItemAttr('industrialCoreBonusDroneIceHarvesting'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount', src.getModifiedItemAttr('industrialCoreBonusDroneMining'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', src.getModifiedItemAttr('industrialCoreBonusDroneVelocity'),
                                      stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
                                      stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
 
         # Remote impedance (no reps, etc)
@@ -36977,13 +36944,13 @@ class Effect8120(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Interdiction Nullifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Interdiction Nullifier'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Interdiction Nullifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Interdiction Nullifier'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Interdiction Nullifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Interdiction Nullifier'),
                                       'durationHighisGood', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Interdiction Nullifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Interdiction Nullifier'),
                                       'scanResolutionMultiplier', ship.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
@@ -37030,7 +36997,7 @@ class Effect8128(BaseEffect):
 
     @staticmethod
     def handler(fit, source, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'), 'maxRange',
                                       source.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -37097,7 +37064,7 @@ class Effect8132(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseMaxScanDeviation',
+            chargeRequiresSkill('Astrometrics'), 'baseMaxScanDeviation',
             container.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -37147,7 +37114,7 @@ class Effect8135(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseMaxScanDeviation',
+            chargeRequiresSkill('Astrometrics'), 'baseMaxScanDeviation',
             container.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -37181,7 +37148,7 @@ class Effect8151(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Cloaking'), 'maxVelocityModifier',
+            itemRequiresSkill('Cloaking'), 'maxVelocityModifier',
             ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -37198,10 +37165,10 @@ class Effect8152(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Energy Neutralizer', 'energyNeutralizerAmount',
+            itemGroupIs('Energy Neutralizer'), 'energyNeutralizerAmount',
             ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Energy Nosferatu', 'powerTransferAmount',
+            itemGroupIs('Energy Nosferatu'), 'powerTransferAmount',
             ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
 
 
@@ -37217,9 +37184,9 @@ class Effect8153(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorDamageAmount',
                                      src.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldBonus',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldBonus',
                                      src.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
 
 
@@ -37236,10 +37203,10 @@ class Effect8154(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'maxRange',
+            itemRequiresSkill('Drones'), 'maxRange',
             ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'trackingSpeed',
+            itemRequiresSkill('Drones'), 'trackingSpeed',
             ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
 
 
@@ -37256,7 +37223,7 @@ class Effect8155(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+            itemRequiresSkill('Large Projectile Turret'),
             'trackingSpeed', ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
 
 
@@ -37273,7 +37240,7 @@ class Effect8156(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+            itemRequiresSkill('Large Projectile Turret'),
             'falloff', ship.getModifiedItemAttr('eliteBonusBlackOps2'), skill='Black Ops', **kwargs)
 
 
@@ -37309,7 +37276,7 @@ class Effect8158(BaseEffect):
     @staticmethod
     def handler(fit, booster, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Cloaking'), 'stabilizeCloakDuration',
+            itemRequiresSkill('Cloaking'), 'stabilizeCloakDuration',
             booster.getModifiedItemAttr('stabilizeCloakDurationBonus'), **kwargs)
 
 
@@ -37359,7 +37326,7 @@ class Effect8210(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            itemRequiresSkill('Ice Harvesting'), 'duration',
             ship.getModifiedItemAttr('expeditionFrigateBonusIceHarvestingDuration'),
             skill='Expedition Frigates', **kwargs)
 
@@ -37378,7 +37345,7 @@ class Effect8223(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            itemRequiresSkill('Mining'), 'miningAmount',
             ship.getModifiedItemAttr('shipRoleBonusOreMiningYield'), **kwargs)
 
 
@@ -37397,7 +37364,7 @@ class Effect8224(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            itemRequiresSkill('Ice Harvesting'), 'duration',
             ship.getModifiedItemAttr('shipRoleBonusIceHarvestingDuration'), **kwargs)
 
 
@@ -37414,7 +37381,7 @@ class Effect8225(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'damageMultiplier',
+            itemRequiresSkill('Drones'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipRoleBonusDroneDamage'), **kwargs)
 
 
@@ -37433,7 +37400,7 @@ class Effect8226(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Drones'), layer,
+                itemRequiresSkill('Drones'), layer,
                 ship.getModifiedItemAttr('shipRoleBonusDroneHitPoints'), **kwargs)
 
 
@@ -37451,7 +37418,7 @@ class Effect8227(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            itemRequiresSkill('Mining'), 'miningAmount',
             ship.getModifiedItemAttr('miningBargeBonusOreMiningYield'),
             skill='Mining Barge', **kwargs)
 
@@ -37470,7 +37437,7 @@ class Effect8228(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            itemRequiresSkill('Ice Harvesting'), 'duration',
             ship.getModifiedItemAttr('miningBargeBonusIceHarvestingDuration'),
             skill='Mining Barge', **kwargs)
 
@@ -37490,7 +37457,7 @@ class Effect8229(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            itemRequiresSkill('Gas Cloud Harvesting'), 'duration',
             ship.getModifiedItemAttr('miningBargeBonusGasHarvestingDuration'),
             skill='Mining Barge', **kwargs)
 
@@ -37508,7 +37475,7 @@ class Effect8230(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining'), 'maxRange',
+            itemRequiresSkill('Mining'), 'maxRange',
             ship.getModifiedItemAttr('miningBargeBonusOreMiningRange'),
             skill='Mining Barge', **kwargs)
 
@@ -37526,7 +37493,7 @@ class Effect8231(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'maxRange',
+            itemRequiresSkill('Ice Harvesting'), 'maxRange',
             ship.getModifiedItemAttr('miningBargeBonusIceHarvestingRange'),
             skill='Mining Barge', **kwargs)
 
@@ -37544,7 +37511,7 @@ class Effect8243(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+            itemRequiresSkill('Mining'), 'duration',
             ship.getModifiedItemAttr('exhumersBonusOreMiningDuration'),
             skill='Exhumers', **kwargs)
 
@@ -37562,7 +37529,7 @@ class Effect8244(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            itemRequiresSkill('Ice Harvesting'), 'duration',
             ship.getModifiedItemAttr('exhumersBonusIceHarvestingDuration'),
             skill='Exhumers', **kwargs)
 
@@ -37580,7 +37547,7 @@ class Effect8249(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining'), 'miningAmount',
+            itemRequiresSkill('Mining'), 'miningAmount',
             ship.getModifiedItemAttr('exhumersBonusOreMiningYield'),
             skill='Exhumers', **kwargs)
 
@@ -37635,7 +37602,7 @@ class Effect8261(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'damageMultiplier',
+            itemRequiresSkill('Drones'), 'damageMultiplier',
             ship.getModifiedItemAttr('industrialCommandBonusDroneDamage'),
             skill='Industrial Command Ships', **kwargs)
 
@@ -37653,7 +37620,7 @@ class Effect8263(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Industrial Reconfiguration'), 'consumptionQuantity',
+            itemRequiresSkill('Industrial Reconfiguration'), 'consumptionQuantity',
             ship.getModifiedItemAttr('industrialCommandBonusFuelConsuptionCompactIndustrialCore'),
             skill='Industrial Command Ships', **kwargs)
 
@@ -37672,7 +37639,7 @@ class Effect8264(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining Foreman'), 'maxRange',
+            itemRequiresSkill('Mining Foreman'), 'maxRange',
             ship.getModifiedItemAttr('industrialCommandBonusMiningForemanBurstRange'),
             skill='Industrial Command Ships', **kwargs)
 
@@ -37707,7 +37674,7 @@ class Effect8268(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Energy Nosferatu', 'duration',
+            itemGroupIs('Energy Nosferatu'), 'duration',
             module.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -37724,7 +37691,7 @@ class Effect8269(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+            itemGroupIs('Stasis Web'), 'maxRange',
             module.getModifiedItemAttr('stasisWebRangeAdd'), **kwargs)
 
 
@@ -37810,7 +37777,7 @@ class Effect8291(BaseEffect):
     @staticmethod
     def handler(fit, booster, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+            itemRequiresSkill('Afterburner'), 'speedFactor',
             booster.getModifiedItemAttr('speedFBonus'), **kwargs)
 
 
@@ -37827,7 +37794,7 @@ class Effect8294(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Mining Drone Operation'), 'miningAmount',
+            itemRequiresSkill('Mining Drone Operation'), 'miningAmount',
             ship.getModifiedItemAttr('industrialCommandBonusDroneOreMiningYield'),
             skill='Industrial Command Ships', **kwargs)
 
@@ -37845,7 +37812,7 @@ class Effect8295(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration',
+            itemRequiresSkill('Ice Harvesting Drone Operation'), 'duration',
             ship.getModifiedItemAttr('industrialCommandBonusDroneIceHarvestingCycleTime'),
             skill='Industrial Command Ships', **kwargs)
 
@@ -37863,7 +37830,7 @@ class Effect8296(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Mining Drone Operation'), 'miningAmount',
+            itemRequiresSkill('Mining Drone Operation'), 'miningAmount',
             ship.getModifiedItemAttr('capitalIndustrialShipBonusDroneOreMiningYield'),
             skill='Capital Industrial Ships', **kwargs)
 
@@ -37881,7 +37848,7 @@ class Effect8297(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration',
+            itemRequiresSkill('Ice Harvesting Drone Operation'), 'duration',
             ship.getModifiedItemAttr('capitalIndustrialShipBonusDroneIceCycleTime'),
             skill='Capital Industrial Ships', **kwargs)
 
@@ -37900,7 +37867,7 @@ class Effect8300(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            itemRequiresSkill('Gas Cloud Harvesting'), 'duration',
             ship.getModifiedItemAttr('shipRoleBonusGasHarvesterDuration'), **kwargs)
 
 
@@ -37917,7 +37884,7 @@ class Effect8301(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            itemRequiresSkill('Gas Cloud Harvesting'), 'duration',
             ship.getModifiedItemAttr('exhumersBonusGasHarvestingDuration'),
             skill='Exhumers', **kwargs)
 
@@ -37935,7 +37902,7 @@ class Effect8303(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining'), 'capacitorNeed',
+            itemRequiresSkill('Mining'), 'capacitorNeed',
             ship.getModifiedItemAttr('shipRoleBonusStripMinerActivationCost'), **kwargs)
 
 
@@ -37952,7 +37919,7 @@ class Effect8304(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'capacitorNeed',
+            itemRequiresSkill('Ice Harvesting'), 'capacitorNeed',
             ship.getModifiedItemAttr('shipRoleBonusIceHarvesterActivationCost'), **kwargs)
 
 
@@ -37970,7 +37937,7 @@ class Effect8305(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+            itemRequiresSkill('Mining'), 'duration',
             ship.getModifiedItemAttr('shipRoleBonusOreMiningDuration'), **kwargs)
 
 
@@ -37987,7 +37954,7 @@ class Effect8306(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(itemRequiresSkill(skill),
                                          'consumptionQuantity', amount * skill.level, **kwargs)
 
 
@@ -38005,7 +37972,7 @@ class Effect8309(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Drones'), layer,
+                itemRequiresSkill('Drones'), layer,
                 ship.getModifiedItemAttr('capitalIndustrialShipBonusDroneHitPoints'),
                 skill='Capital Industrial Ships', **kwargs)
 
@@ -38024,7 +37991,7 @@ class Effect8311(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Drones'), layer,
+                itemRequiresSkill('Drones'), layer,
                 ship.getModifiedItemAttr('industrialCommandBonusDroneHitPoints'),
                 skill='Industrial Command Ships', **kwargs)
 
@@ -38043,7 +38010,7 @@ class Effect8313(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'duration',
+            itemRequiresSkill('Gas Cloud Harvesting'), 'duration',
             ship.getModifiedItemAttr('miningFrigateBonusGasCloudHarvestingDuration'),
             skill='Mining Frigate', **kwargs)
 
@@ -38062,7 +38029,7 @@ class Effect8315(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'), 'miningAmount',
+            itemRequiresSkill('Gas Cloud Harvesting'), 'miningAmount',
             ship.getModifiedItemAttr('shipRoleBonusGasHarvestingYield'), **kwargs)
 
 
@@ -38079,7 +38046,7 @@ class Effect8317(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+            itemRequiresSkill('Ice Harvesting'), 'duration',
             ship.getModifiedItemAttr('miningFrigateBonusIceHarvestingDuration'),
             skill='Mining Frigate', **kwargs)
 
@@ -38115,7 +38082,7 @@ class Effect8360(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+            itemRequiresSkill('Missile Launcher Operation'),
             'reloadTime', ship.getModifiedItemAttr('shipBonusGC2'),
             skill='Gallente Cruiser', **kwargs)
 
@@ -38134,7 +38101,7 @@ class Effect8362(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Warp Disrupt Field Generator',
+            itemGroupIs('Warp Disrupt Field Generator'),
             'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors3'), **kwargs)
 
 
@@ -38162,8 +38129,7 @@ class Effect8372(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shipboard Compression Technology')
-                        or mod.item.requiresSkill('Capital Shipboard Compression Technology'),
+            itemRequiresSkill('Shipboard Compression Technology', 'Capital Shipboard Compression Technology'),
             'maxRange', skill.getModifiedItemAttr('fleetCompressionLogisticsRangeBonus') * skill.level, **kwargs)
 
 
@@ -38182,13 +38148,13 @@ class Effect8377(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Shield Extender',
+            itemGroupIs('Shield Extender'),
             'capacityBonus', ship.getModifiedItemAttr('battleshipExtenderHPBonus'), **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Armor Plate',
+            itemGroupIs('Armor Plate'),
             'armorHPBonusAdd', ship.getModifiedItemAttr('battleshipPlateHPBonus'), **kwargs)
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.group.name == 'Reinforced Bulkhead',
+            itemGroupIs('Reinforced Bulkhead'),
             'structureHPMultiplier', ship.getModifiedItemAttr('battleshipBulkheadHPModifierBonus'), **kwargs)
 
 
@@ -38241,7 +38207,7 @@ class Effect8470(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'damageMultiplier',
+            itemRequiresSkill('Drones'), 'damageMultiplier',
             container.getModifiedItemAttr('capitalIndustrialCommandBonusDroneDamage'),
             skill='Capital Industrial Ships', **kwargs)
 
@@ -38260,7 +38226,7 @@ class Effect8474(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            itemGroupIs('Armor Plate'), 'massAddition',
             ship.getModifiedItemAttr('subsystemBonusMassAddition'), **kwargs)
 
 
@@ -38277,7 +38243,7 @@ class Effect8477(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'trackingSpeed',
+            itemRequiresSkill('Drones'), 'trackingSpeed',
             container.getModifiedItemAttr('droneTrackingBonus'), **kwargs)
 
 
@@ -38295,7 +38261,7 @@ class Effect8478(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Ice Harvesting') or mod.item.requiresSkill('Mining'),
+            itemRequiresSkill('Ice Harvesting', 'Mining'),
             'duration', skill.getModifiedItemAttr('iceHarvestCycleBonus'), **kwargs)
 
 
@@ -38312,10 +38278,10 @@ class Effect8479(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'maxRange',
+            itemRequiresSkill('Drones'), 'maxRange',
             container.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'falloff',
+            itemRequiresSkill('Drones'), 'falloff',
             container.getModifiedItemAttr('falloffBonus'), **kwargs)
 
 
@@ -38332,7 +38298,7 @@ class Effect11055(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'aoeVelocity',
+            chargeRequiresSkill('Heavy Missiles'), 'aoeVelocity',
             ship.getModifiedItemAttr('shipBonusMBC1'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -38349,7 +38315,7 @@ class Effect11056(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'aoeVelocity',
+            chargeRequiresSkill('Heavy Assault Missiles'), 'aoeVelocity',
             ship.getModifiedItemAttr('shipBonusMBC1'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -38366,7 +38332,7 @@ class Effect11057(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation'), 'capacitorNeed',
+            itemRequiresSkill('Shield Operation'), 'capacitorNeed',
             ship.getModifiedItemAttr('shipBonusCBC3'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -38383,7 +38349,7 @@ class Effect11059(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
+            itemRequiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
             src.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -38400,7 +38366,7 @@ class Effect11060(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'speedFactor',
+            itemRequiresSkill('Drones'), 'speedFactor',
             ship.getModifiedItemAttr('shipBonusGBC3'), skill='Gallente Battlecruiser', **kwargs)
 
 
@@ -38418,7 +38384,7 @@ class Effect11061(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for attr in ('maxRange', 'falloff'):
             fit.modules.filteredItemBoost(
-                lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), attr,
+                itemRequiresSkill('Medium Hybrid Turret'), attr,
                 ship.getModifiedItemAttr('roleBonusCBC2'), **kwargs)
 
 
@@ -38435,7 +38401,7 @@ class Effect11063(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Energy Turret'), 'damageMultiplier',
+            itemRequiresSkill('Medium Energy Turret'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipBonusABC3'), skill='Amarr Battlecruiser', **kwargs)
 
 
@@ -38452,7 +38418,7 @@ class Effect11064(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Energy Turret'), 'maxRange',
+            itemRequiresSkill('Medium Energy Turret'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusABC1'), skill='Amarr Battlecruiser', **kwargs)
 
 
@@ -38487,7 +38453,7 @@ class Effect11067(BaseEffect):
     def handler(fit, src, context, projectionRange, **kwargs):
         for attr in ('maxRange', 'falloff'):
             fit.modules.filteredItemBoost(
-                lambda mod: mod.item.requiresSkill('Medium Energy Turret'), attr,
+                itemRequiresSkill('Medium Energy Turret'), attr,
                 src.getModifiedItemAttr('roleBonusCBC2'), **kwargs)
 
 
@@ -38504,7 +38470,7 @@ class Effect11068(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Missile Launcher Operation'), 'speed',
+            itemRequiresSkill('Missile Launcher Operation'), 'speed',
             ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -38524,7 +38490,7 @@ class Effect11069(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Astrometrics'), 'cpu',
+            itemRequiresSkill('Astrometrics'), 'cpu',
             src.getModifiedItemAttr('shipRoleBonusScanProbeLauncherCPU'), **kwargs)
 
 
@@ -38542,7 +38508,7 @@ class Effect11070(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
+                chargeRequiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
                 ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -38558,7 +38524,7 @@ class Effect11072(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -38594,7 +38560,7 @@ class Effect11359(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for attr in ('cpu', 'power'):
             fit.modules.filteredItemBoost(
-                lambda mod: mod.item.requiresSkill('Shield Operation'), attr,
+                itemRequiresSkill('Shield Operation'), attr,
                 ship.getModifiedItemAttr('shipBonusCBC3'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -38612,10 +38578,10 @@ class Effect11373(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'shieldBonus',
+            itemRequiresSkill('Capital Shield Operation'), 'shieldBonus',
             src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Capital Repair Systems'), 'armorDamageAmount',
             src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -38633,7 +38599,7 @@ class Effect11374(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for attr in ('powerTransferAmount', 'maxRange'):
             fit.modules.filteredItemBoost(
-                lambda mod: mod.item.group.name == 'Energy Nosferatu', attr,
+                itemGroupIs('Energy Nosferatu'), attr,
                 ship.getModifiedItemAttr('shipBonusDreadnoughtA4'), skill='Amarr Dreadnought', **kwargs)
 
 
@@ -38650,7 +38616,7 @@ class Effect11376(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'maxRange',
+            itemRequiresSkill('Capital Hybrid Turret'), 'maxRange',
             src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -38667,7 +38633,7 @@ class Effect11380(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Capital Repair Systems'), 'armorDamageAmount',
             src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -38684,7 +38650,7 @@ class Effect11381(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+            itemGroupIs('Warp Scrambler'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusDreadnoughtG5'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -38701,7 +38667,7 @@ class Effect11382(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Target Painter', 'signatureRadiusBonus',
+            itemGroupIs('Target Painter'), 'signatureRadiusBonus',
             src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought', **kwargs)
 
 
@@ -38718,7 +38684,7 @@ class Effect11387(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'damageMultiplier',
+            itemRequiresSkill('Small Hybrid Turret'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -38735,7 +38701,7 @@ class Effect11388(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente2'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -38752,7 +38718,7 @@ class Effect11390(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            itemGroupIs('Armor Plate'), 'massAddition',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente3'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -38769,7 +38735,7 @@ class Effect11391(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'damageMultiplier',
+            itemRequiresSkill('Small Hybrid Turret'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerCaldari1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -38786,7 +38752,7 @@ class Effect11392(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'maxRange',
+            itemRequiresSkill('Small Hybrid Turret'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerCaldari2'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -38803,7 +38769,7 @@ class Effect11393(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'maxRange',
+            itemRequiresSkill('Small Hybrid Turret'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente4'), **kwargs)
 
 
@@ -38820,7 +38786,7 @@ class Effect11394(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'falloff',
+            itemRequiresSkill('Small Hybrid Turret'), 'falloff',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerGallente5'), **kwargs)
 
 
@@ -38837,7 +38803,7 @@ class Effect11395(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            itemRequiresSkill('Shield Operation'), 'shieldBonus',
             src.getModifiedItemAttr('shipBonusNavyDestroyerCaldari3'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -38854,7 +38820,7 @@ class Effect11396(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'maxRange',
+            itemRequiresSkill('Small Hybrid Turret'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerCaldari4'), **kwargs)
 
 
@@ -38871,7 +38837,7 @@ class Effect11397(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'falloff',
+            itemRequiresSkill('Small Hybrid Turret'), 'falloff',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerCaldari5'), **kwargs)
 
 
@@ -38888,7 +38854,7 @@ class Effect11398(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'damageMultiplier',
+            itemRequiresSkill('Small Projectile Turret'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar1'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -38905,7 +38871,7 @@ class Effect11399(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'speed',
+            itemRequiresSkill('Small Projectile Turret'), 'speed',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar2'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -38922,7 +38888,7 @@ class Effect11400(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'), 'signatureRadiusBonus',
+            itemRequiresSkill('High Speed Maneuvering'), 'signatureRadiusBonus',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar3'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -38939,7 +38905,7 @@ class Effect11401(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'maxRange',
+            itemRequiresSkill('Small Projectile Turret'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar4'), **kwargs)
 
 
@@ -38956,7 +38922,7 @@ class Effect11402(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'falloff',
+            itemRequiresSkill('Small Projectile Turret'), 'falloff',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerMinmatar5'), **kwargs)
 
 
@@ -38990,7 +38956,7 @@ class Effect11405(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'damageMultiplier',
+            itemRequiresSkill('Small Energy Turret'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr2'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -39007,7 +38973,7 @@ class Effect11406(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'capacitorNeed',
+            itemRequiresSkill('Small Energy Turret'), 'capacitorNeed',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr3'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -39024,7 +38990,7 @@ class Effect11407(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Energy Neutralizer', 'capacitorNeed',
+            itemGroupIs('Energy Neutralizer'), 'capacitorNeed',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr4'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -39041,7 +39007,7 @@ class Effect11408(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Energy Neutralizer', 'energyNeutralizerAmount',
+            itemGroupIs('Energy Neutralizer'), 'energyNeutralizerAmount',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr5'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -39058,7 +39024,7 @@ class Effect11410(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'falloff',
+            itemRequiresSkill('Small Energy Turret'), 'falloff',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr7'), **kwargs)
 
 
@@ -39077,7 +39043,7 @@ class Effect11411(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
+                chargeRequiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
                 ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -39138,7 +39104,7 @@ class Effect11414(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            itemRequiresSkill('Shield Operation'), 'shieldBonus',
             src.getModifiedItemAttr('eliteBonusHeavyGunship1'), skill='Heavy Assault Cruisers', **kwargs)
 
 
@@ -39155,7 +39121,7 @@ class Effect11415(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
+            itemRequiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
             src.getModifiedItemAttr('eliteBonusHeavyGunship1'), skill='Heavy Assault Cruisers', **kwargs)
 
 
@@ -39172,7 +39138,7 @@ class Effect11416(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'falloff',
+            itemRequiresSkill('Medium Hybrid Turret'), 'falloff',
             src.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -39189,7 +39155,7 @@ class Effect11417(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            itemGroupIs('Armor Plate'), 'massAddition',
             ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -39206,7 +39172,7 @@ class Effect11419(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'trackingSpeed',
+            itemRequiresSkill('Drones'), 'trackingSpeed',
             container.getModifiedItemAttr('shipBonusGB2'), skill='Gallente Battleship', **kwargs)
 
 
@@ -39223,7 +39189,7 @@ class Effect11420(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
             ship.getModifiedItemAttr('shipBonusGB3'), skill='Gallente Battleship', **kwargs)
 
 
@@ -39241,7 +39207,7 @@ class Effect11421(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Torpedoes'), f'{dmgType}Damage',
+                chargeRequiresSkill('Torpedoes'), f'{dmgType}Damage',
                 ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -39259,7 +39225,7 @@ class Effect11422(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Cruise Missiles'), f'{dmgType}Damage',
+                chargeRequiresSkill('Cruise Missiles'), f'{dmgType}Damage',
                 ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -39277,7 +39243,7 @@ class Effect11423(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Heavy Missiles'), f'{dmgType}Damage',
+                chargeRequiresSkill('Heavy Missiles'), f'{dmgType}Damage',
                 ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -39294,7 +39260,7 @@ class Effect11424(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Large Energy Turret'), 'damageMultiplier',
+            itemRequiresSkill('Large Energy Turret'), 'damageMultiplier',
             ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -39312,7 +39278,7 @@ class Effect11425(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Drones'), layer,
+                itemRequiresSkill('Drones'), layer,
                 ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -39329,7 +39295,7 @@ class Effect11426(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'), 'damageMultiplier',
+            itemRequiresSkill('Drones'), 'damageMultiplier',
             container.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -39346,7 +39312,7 @@ class Effect11428(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'aoeVelocity',
+            chargeRequiresSkill('Cruise Missiles'), 'aoeVelocity',
             ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -39363,7 +39329,7 @@ class Effect11429(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Torpedoes'), 'aoeVelocity',
+            chargeRequiresSkill('Torpedoes'), 'aoeVelocity',
             ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -39380,7 +39346,7 @@ class Effect11430(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Large Projectile Turret'), 'trackingSpeed',
+            itemRequiresSkill('Large Projectile Turret'), 'trackingSpeed',
             ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -39413,7 +39379,7 @@ class Effect11432(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
             ship.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
 
 
@@ -39448,7 +39414,7 @@ class Effect11446(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+            itemRequiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
             src.getModifiedItemAttr('shipBonusDreadnoughtG4'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -39465,7 +39431,7 @@ class Effect11450(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'maxRange',
+            itemRequiresSkill('Small Energy Turret'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusNavyDestroyerAmarr6'), **kwargs)
 
 
@@ -39482,7 +39448,7 @@ class Effect11452(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Warp Scrambler', 'warpScrambleStrength',
+            itemGroupIs('Warp Scrambler'), 'warpScrambleStrength',
             ship.getModifiedItemAttr('shipBonusDreadnoughtG5'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -39499,7 +39465,7 @@ class Effect11454(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Stasis Grappler', 'falloffEffectiveness',
+            itemGroupIs('Stasis Grappler'), 'falloffEffectiveness',
             ship.getModifiedItemAttr('shipBonusDreadnoughtM4'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -39516,7 +39482,7 @@ class Effect11512(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name in ('Missile Launcher Light', 'Missile Launcher Rocket'),
+            itemGroupIs('Missile Launcher Light', 'Missile Launcher Rocket'),
             'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -39534,7 +39500,7 @@ class Effect11513(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
+                chargeRequiresSkill('Missile Launcher Operation'), f'{dmgType}Damage',
                 ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -39551,7 +39517,7 @@ class Effect11514(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
             ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -39568,7 +39534,7 @@ class Effect11515(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
             ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -39585,7 +39551,7 @@ class Effect11516(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            itemRequiresSkill('Shield Operation'), 'shieldBonus',
             ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -39604,7 +39570,7 @@ class Effect11517(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Propulsion Jamming'),
+                itemRequiresSkill('Propulsion Jamming'),
                 layer, ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
 
 
@@ -39622,7 +39588,7 @@ class Effect11518(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Propulsion Jamming'),
+            itemRequiresSkill('Propulsion Jamming'),
             'maxVelocity', ship.getModifiedItemAttr('shipBonusAT2'), **kwargs)
 
 
@@ -39640,7 +39606,7 @@ class Effect11519(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.drones.filteredItemBoost(
-            lambda drone: drone.item.requiresSkill('Drones'),
+            itemRequiresSkill('Drones'),
             'speedFactor', ship.getModifiedItemAttr('shipBonusAT3'), **kwargs)
 
 
@@ -39657,7 +39623,7 @@ class Effect11528(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Cloaking'),
+            itemRequiresSkill('Cloaking'),
             'cpu', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -39674,7 +39640,7 @@ class Effect11529(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Science'),
+            chargeRequiresSkill('Science'),
             'baseSensorStrength', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -39691,7 +39657,7 @@ class Effect11530(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Science'),
+            chargeRequiresSkill('Science'),
             'baseMaxScanDeviation', ship.getModifiedItemAttr('shipBonusRole6'), **kwargs)
 
 
@@ -39708,7 +39674,7 @@ class Effect11531(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Scan Probe Launcher', 'cpu',
+            itemGroupIs('Scan Probe Launcher'), 'cpu',
             ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -39725,7 +39691,7 @@ class Effect11532(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Data Miners', 'cpu',
+            itemGroupIs('Data Miners'), 'cpu',
             ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -39759,7 +39725,7 @@ class Effect11696(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'trackingSpeed',
+            itemRequiresSkill('Capital Hybrid Turret'), 'trackingSpeed',
             src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought', **kwargs)
 
 
@@ -39776,7 +39742,7 @@ class Effect11697(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'maxRange',
+            itemRequiresSkill('Capital Hybrid Turret'), 'maxRange',
             src.getModifiedItemAttr('shipBonusDreadnoughtC2'), skill='Caldari Dreadnought', **kwargs)
 
 
@@ -39794,7 +39760,7 @@ class Effect11698(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.modules.filteredItemBoost(
-                lambda module: module.item.requiresSkill('Disruptive Lance Operation'), f'{dmgType}Damage',
+                itemRequiresSkill('Disruptive Lance Operation'), f'{dmgType}Damage',
                 ship.getModifiedItemAttr('shipBonusAdvancedDreadnought1'), skill='Lancer Dreadnoughts', **kwargs)
 
 
@@ -39811,7 +39777,7 @@ class Effect11700(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda module: module.item.requiresSkill('Disruptive Lance Operation'), 'capacitorNeed',
+            itemRequiresSkill('Disruptive Lance Operation'), 'capacitorNeed',
             skill.getModifiedItemAttr('disruptionLanceSkillBoostCapacitorCost') * skill.level, **kwargs)
 
 
@@ -39828,7 +39794,7 @@ class Effect11701(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda module: module.item.requiresSkill('Disruptive Lance Operation'), 'maxRange',
+            itemRequiresSkill('Disruptive Lance Operation'), 'maxRange',
             ship.getModifiedItemAttr('shipBonusAdvancedDreadnought2'), skill='Lancer Dreadnoughts', **kwargs)
 
 
@@ -39845,7 +39811,7 @@ class Effect11702(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
             src.getModifiedItemAttr('eliteBonusViolators2'), skill='Marauders', **kwargs)
 
 
@@ -39862,7 +39828,7 @@ class Effect11704(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'falloff',
+            itemRequiresSkill('Capital Projectile Turret'), 'falloff',
             src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -39942,7 +39908,7 @@ class Effect11714(BaseEffect):
     @staticmethod
     def handler(fit, module, context, projectionRange, **kwargs):
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.requiresSkill('Cloaking'), 'activationBlocked',
+            itemRequiresSkill('Cloaking'), 'activationBlocked',
             module.getModifiedItemAttr('disruptionLanceDisallowCloaking'), **kwargs)
 
 
@@ -39959,7 +39925,7 @@ class Effect11743(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'trackingSpeed',
+            itemRequiresSkill('Small Projectile Turret'), 'trackingSpeed',
             ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -40040,7 +40006,7 @@ class Effect11750(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'kineticDamage',
+            chargeRequiresSkill('Heavy Assault Missiles'), 'kineticDamage',
             ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
 
 
@@ -40057,7 +40023,7 @@ class Effect11751(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'thermalDamage',
+            chargeRequiresSkill('Heavy Assault Missiles'), 'thermalDamage',
             ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
 
 
@@ -40074,7 +40040,7 @@ class Effect11752(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+            chargeRequiresSkill('Heavy Missiles'), 'kineticDamage',
             ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
 
 
@@ -40091,7 +40057,7 @@ class Effect11753(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+            chargeRequiresSkill('Heavy Missiles'), 'thermalDamage',
             ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
 
 
@@ -40108,7 +40074,7 @@ class Effect11763(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Projectile Turret'), 'falloff',
+            itemRequiresSkill('Medium Projectile Turret'), 'falloff',
             ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
 
 
@@ -40125,7 +40091,7 @@ class Effect11764(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+            itemRequiresSkill('Medium Projectile Turret'),
             'speed', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -40142,7 +40108,7 @@ class Effect11767(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
+            itemRequiresSkill('Medium Hybrid Turret'), 'trackingSpeed',
             src.getModifiedItemAttr('eliteBonusHeavyGunship1'), skill='Heavy Assault Cruisers', **kwargs)
 
 
@@ -40159,7 +40125,7 @@ class Effect11919(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'falloff',
+            itemRequiresSkill('Small Projectile Turret'), 'falloff',
             ship.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -40244,7 +40210,7 @@ class Effect11942(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+            chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
             ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -40261,7 +40227,7 @@ class Effect11943(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+            chargeRequiresSkill('Missile Launcher Operation'), 'thermalDamage',
             ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -40278,7 +40244,7 @@ class Effect11944(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'falloff',
+            itemRequiresSkill('Capital Projectile Turret'), 'falloff',
             src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -40295,7 +40261,7 @@ class Effect11945(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'trackingSpeed',
+            itemRequiresSkill('Capital Projectile Turret'), 'trackingSpeed',
             src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -40312,7 +40278,7 @@ class Effect11946(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Vorton Projector'),
+            itemRequiresSkill('Small Vorton Projector'),
             'damageMultiplier', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
             stackingPenalties=True, **kwargs)
 
@@ -40330,7 +40296,7 @@ class Effect11947(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+            itemRequiresSkill('Vorton Projector Operation'),
             'aoeCloudSize', beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'),
             stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -40348,7 +40314,7 @@ class Effect11948(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+            itemRequiresSkill('Vorton Projector Operation'),
             'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
             stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -40366,7 +40332,7 @@ class Effect11953(BaseEffect):
     @staticmethod
     def handler(fit, beacon, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'),
+            itemRequiresSkill('Vorton Projector Operation'),
             'aoeVelocity', beacon.getModifiedItemAttr('aoeVelocityMultiplier'),
             stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -40385,7 +40351,7 @@ class Effect11992(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Armor Plate', 'massAddition',
+            itemGroupIs('Armor Plate'), 'massAddition',
             ship.getModifiedItemAttr('shipBonusATF3'), **kwargs)
 
 
@@ -40402,7 +40368,7 @@ class Effect11993(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
             src.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -40419,7 +40385,7 @@ class Effect11994(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'falloff',
+            itemRequiresSkill('Medium Hybrid Turret'), 'falloff',
             src.getModifiedItemAttr('eliteBonusHeavyGunship2'), skill='Heavy Assault Cruisers', **kwargs)
 
 
@@ -40436,7 +40402,7 @@ class Effect11995(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Afterburner'), 'overloadSpeedFactorBonus',
+            itemRequiresSkill('Afterburner'), 'overloadSpeedFactorBonus',
             src.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -40453,7 +40419,7 @@ class Effect11996(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'), 'overloadSpeedFactorBonus',
+            itemRequiresSkill('High Speed Maneuvering'), 'overloadSpeedFactorBonus',
             src.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -40470,7 +40436,7 @@ class Effect11997(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+            itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
             src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -40487,7 +40453,7 @@ class Effect11998(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'maxRange',
+            itemRequiresSkill('Small Hybrid Turret'), 'maxRange',
             src.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
 
 
@@ -40504,7 +40470,7 @@ class Effect11999(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'trackingSpeed',
+            itemRequiresSkill('Small Hybrid Turret'), 'trackingSpeed',
             src.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
 
 
@@ -40521,7 +40487,7 @@ class Effect12003(BaseEffect):
     @staticmethod
     def handler(fit, booster, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Vorton Projector Operation'), 'speed',
+            itemRequiresSkill('Vorton Projector Operation'), 'speed',
             booster.getModifiedItemAttr('turretSpeeBonus'), **kwargs)
 
 
@@ -40538,7 +40504,7 @@ class Effect12038(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'falloff',
+            itemRequiresSkill('Small Projectile Turret'), 'falloff',
             ship.getModifiedItemAttr('shipBonus3MF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -40572,7 +40538,7 @@ class Effect12051(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'emDamage', container.getModifiedItemAttr('shipBonusUH2'),
             skill='Upwell Hauler', **kwargs)
 
@@ -40590,7 +40556,7 @@ class Effect12052(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'thermalDamage', container.getModifiedItemAttr('shipBonusUH2'),
             skill='Upwell Hauler', **kwargs)
 
@@ -40608,7 +40574,7 @@ class Effect12053(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'explosiveDamage', container.getModifiedItemAttr('shipBonusUH2'),
             skill='Upwell Hauler', **kwargs)
 
@@ -40626,7 +40592,7 @@ class Effect12054(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'kineticDamage', container.getModifiedItemAttr('shipBonusUH2'),
             skill='Upwell Hauler', **kwargs)
 
@@ -40661,7 +40627,7 @@ class Effect12058(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'emDamage', container.getModifiedItemAttr('shipBonusUFreighter2'),
             skill='Upwell Freighter', **kwargs)
 
@@ -40679,7 +40645,7 @@ class Effect12060(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'thermalDamage', container.getModifiedItemAttr('shipBonusUFreighter2'),
             skill='Upwell Freighter', **kwargs)
 
@@ -40697,7 +40663,7 @@ class Effect12061(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'explosiveDamage', container.getModifiedItemAttr('shipBonusUFreighter2'),
             skill='Upwell Freighter', **kwargs)
 
@@ -40715,7 +40681,7 @@ class Effect12062(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'kineticDamage', container.getModifiedItemAttr('shipBonusUFreighter2'),
             skill='Upwell Freighter', **kwargs)
 
@@ -40733,7 +40699,7 @@ class Effect12063(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.group.name == 'Cloaking Device',
+            itemGroupIs('Cloaking Device'),
             'cpu', ship.getModifiedItemAttr('upwellFreightercloakCPUPenalty'), **kwargs)
 
 
@@ -40752,7 +40718,7 @@ class Effect12069(BaseEffect):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for dmgType in damageTypes:
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Auto-Targeting Missiles'),
+                chargeRequiresSkill('Auto-Targeting Missiles'),
                 f'{dmgType}Damage', container.getModifiedItemAttr('shipBonusUFreighter3'),
                 skill='Upwell Freighter', **kwargs)
 
@@ -40770,10 +40736,10 @@ class Effect12071(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.group.name == 'Flex Shield Hardener',
+            itemGroupIs('Flex Shield Hardener'),
             'power', ship.getModifiedItemAttr('upwellFreighterCapitalFlexHardenerFittingCapBonus'), **kwargs)
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.group.name == 'Flex Shield Hardener',
+            itemGroupIs('Flex Shield Hardener'),
             'capacitorNeed', ship.getModifiedItemAttr('upwellFreighterCapitalFlexHardenerFittingCapBonus'), **kwargs)
 
 
@@ -40790,7 +40756,7 @@ class Effect12072(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name in ('Energy Neutralizer', 'Energy Nosferatu'),
+            itemGroupIs('Energy Neutralizer', 'Energy Nosferatu'),
             'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -40824,7 +40790,7 @@ class Effect12102(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Capital Micro Jump Drive Operation'), 'capacitorNeed',
+            itemRequiresSkill('Capital Micro Jump Drive Operation'), 'capacitorNeed',
             skill.getModifiedItemAttr('capitalMJDCapReductionBonus') * skill.level, **kwargs)
 
 
@@ -40892,7 +40858,7 @@ class Effect12165(BaseEffect):
             'damageMultiplier', bonus, **kwargs)
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+                chargeRequiresSkill('Rockets', 'Light Missiles'),
                 f'{dmgType}Damage', bonus, **kwargs)
 
 
@@ -40947,10 +40913,10 @@ class Effect12180(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Micro Jump Drive',
+            itemGroupIs('Micro Jump Drive'),
             'cpu', ship.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name == 'Micro Jump Drive',
+            itemGroupIs('Micro Jump Drive'),
             'power', ship.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
 
 
@@ -40974,7 +40940,7 @@ class Effect12181(BaseEffect):
         except:
             return
         bonus = ship.getModifiedItemAttr('ATcruiserStasisWebifierBonus') * sec_status
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange', bonus, **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange', bonus, **kwargs)
 
 
 class Effect12183(BaseEffect):
@@ -40990,7 +40956,7 @@ class Effect12183(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.group.name in ('Propulsion Module', 'Microwarpdrive'),
+            itemGroupIs('Propulsion Module', 'Microwarpdrive'),
             'duration', ship.getModifiedItemAttr('shipBonusATprobDuration'), **kwargs)
 
 
@@ -41034,7 +41000,7 @@ class Effect12185(BaseEffect):
             return
         bonus = ship.getModifiedItemAttr('ATBurstJammerStrengthBonus') * sec_status
         for attr in ('ecmBurstRange', 'scanRadarStrengthBonus', 'scanGravimetricStrengthBonus', 'scanLadarStrengthBonus', 'scanMagnetometricStrengthBonus'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer', attr, bonus, **kwargs)
+            fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'), attr, bonus, **kwargs)
 
 
 class Effect12188(BaseEffect):
@@ -41050,7 +41016,7 @@ class Effect12188(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'damageMultiplier',
+            itemRequiresSkill('Small Projectile Turret'), 'damageMultiplier',
             container.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -41067,7 +41033,7 @@ class Effect12189(BaseEffect):
     @staticmethod
     def handler(fit, container, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Projectile Turret'), 'damageMultiplier',
+            itemRequiresSkill('Medium Projectile Turret'), 'damageMultiplier',
             container.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -41085,7 +41051,7 @@ class Effect12190(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Rockets'), f'{damageType}Damage',
+                chargeRequiresSkill('Rockets'), f'{damageType}Damage',
                 ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -41103,7 +41069,7 @@ class Effect12191(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), f'{damageType}Damage',
+                chargeRequiresSkill('Heavy Assault Missiles'), f'{damageType}Damage',
                 ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -41154,7 +41120,7 @@ class Effect12194(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            itemRequiresSkill('Shield Operation'), 'shieldBonus',
             src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -41171,7 +41137,7 @@ class Effect12195(BaseEffect):
     @staticmethod
     def handler(fit, src, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+            itemRequiresSkill('Shield Operation'), 'shieldBonus',
             src.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -41195,7 +41161,7 @@ class Effect12202(BaseEffect):
         except:
             return
         bonus = ship.getModifiedItemAttr('ATcruiserScramblerDisruptorBonus') * sec_status
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange', bonus, **kwargs)
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'), 'maxRange', bonus, **kwargs)
 
 
 class Effect12203(BaseEffect):
@@ -41212,7 +41178,7 @@ class Effect12203(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for attr in ('shieldCapacity', 'armorHP', 'hp', 'damageMultiplier'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+                itemRequiresSkill('Light Drone Operation'),
                 attr, ship.getModifiedItemAttr('ATfrigDroneBonus'), **kwargs)
 
 
@@ -41229,7 +41195,7 @@ class Effect12213(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Medium Projectile Turret'), 'falloff',
+            itemRequiresSkill('Medium Projectile Turret'), 'falloff',
             ship.getModifiedItemAttr('ShipBonusMC3'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -41247,7 +41213,7 @@ class Effect12214(BaseEffect):
     def handler(fit, ship, context, projectionRange, **kwargs):
         for attr in ('shieldCapacity', 'armorHP', 'hp', 'damageMultiplier'):
             fit.drones.filteredItemBoost(
-                lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+                itemRequiresSkill('Medium Drone Operation'),
                 attr, ship.getModifiedItemAttr('ATcruiserDroneBonus'), **kwargs)
 
 
@@ -41264,7 +41230,7 @@ class Effect12217(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Breacher Pod Launcher Operation'), 'dotMaxHPPercentagePerTick',
+            chargeRequiresSkill('Breacher Pod Launcher Operation'), 'dotMaxHPPercentagePerTick',
             skill.getModifiedItemAttr('dotMaxHPPercentagePerTickBonus') * skill.level, **kwargs)
 
 
@@ -41281,7 +41247,7 @@ class Effect12218(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Breacher Pod Launcher Operation'), 'dotMaxDamagePerTick',
+            chargeRequiresSkill('Breacher Pod Launcher Operation'), 'dotMaxDamagePerTick',
             skill.getModifiedItemAttr('dotMaxDamagePerTickBonus') * skill.level, **kwargs)
 
 
@@ -41298,7 +41264,7 @@ class Effect12219(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Breacher Pod Launcher Operation'), 'maxVelocity',
+            chargeRequiresSkill('Breacher Pod Launcher Operation'), 'maxVelocity',
             skill.getModifiedItemAttr('speedFactor') * skill.level, **kwargs)
 
 
@@ -41315,7 +41281,7 @@ class Effect12220(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Breacher Pod Launcher Operation'),
+            itemRequiresSkill('Breacher Pod Launcher Operation'),
             'speed', skill.getModifiedItemAttr('rofBonus') * skill.level, **kwargs)
 
 
@@ -41332,5 +41298,5 @@ class Effect12221(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, projectionRange, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Breacher Pod Launcher Operation'), 'dotDuration',
+            chargeRequiresSkill('Breacher Pod Launcher Operation'), 'dotDuration',
             skill.getModifiedItemAttr('durationBonus') * skill.level, **kwargs)
@@ -0,0 +1,176 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from collections import namedtuple
+from time import time
+
+from logbook import Logger
+from sqlalchemy.orm.attributes import set_committed_value
+
+import eos.db
+
+
+pyfalog = Logger(__name__)
+
+
+FitStats = namedtuple('FitStats', (
+    'fit', 'character', 'damagePattern',
+    'dps', 'volley', 'ehp', 'capStable', 'capState', 'maxSpeed', 'alignTime'))
+
+
+def evaluateFits(fits, characters=None, damagePatterns=None, factorReload=False, cache=None):
+    """
+    Calculate stats of every fit with every character and damage pattern,
+    without going through fitting service (and thus without GUI session or
+    global character). Fits and characters can be passed as objects or IDs.
+
+    Returns list of FitStats rows, ordered by fit, then character, then damage
+    pattern. When character or damage pattern list is not passed, fit's own
+    ones are used. Every fit is calculated once per distinct character, damage
+    patterns only affect EHP and are applied to already calculated fit. Fits
+    which are already calculated are not calculated again for their own
+    character.
+
+    When eos.fitStatsCache.FitStatsCache is passed, fits whose stats are in
+    it are not calculated at all, and stats of calculated fits are stored there.
+    """
+    fits = [_getFit(f) for f in fits]
+    characters = [_getCharacter(c) for c in characters] if characters else [None]
+    damagePatterns = list(damagePatterns) if damagePatterns else [None]
+    start = time()
+    rows = []
+    for fit in fits:
+        if fit is None or fit.isInvalid:
+            continue
+        statsMaps = _getFitStats(fit, characters, damagePatterns, factorReload, cache)
+        for character in characters:
+            statsMap = statsMaps[id(character)]
+            for damagePattern in damagePatterns:
+                rows.append(FitStats(
+                    fit=fit, character=character if character is not None else fit.character,
+                    damagePattern=damagePattern if damagePattern is not None else fit.damagePattern,
+                    **statsMap[id(damagePattern)]))
+    pyfalog.debug("Evaluated {} fits with {} characters and {} damage patterns in {:.3f}s",
+                  len(fits), len(characters), len(damagePatterns), time() - start)
+    return rows
+
+
+def _getFit(fit):
+    if isinstance(fit, int):
+        return eos.db.getFit(fit)
+    return fit
+
+
+def _getCharacter(character):
+    if isinstance(character, int):
+        return eos.db.getCharacter(character)
+    return character
+
+
+def _getFitStats(fit, characters, damagePatterns, factorReload, cache):
+    """
+    Return stats of fit per character and damage pattern, from cache if
+    possible. Same character can be requested multiple times, it is calculated
+    only once.
+    Format: {id(character): {id(damage pattern): stats}}
+    """
+    statsMaps = {}
+    # Format: {id(character): {id(damage pattern): cache key}}
+    keys = {}
+    toCalculate = []
+    for character in characters:
+        if id(character) in statsMaps or any(c is character for c in toCalculate):
+            continue
+        if cache is not None:
+            from eos.fitStatsCache import getFitStatsKey
+            charKeys = keys[id(character)] = {
+                id(p): getFitStatsKey(fit, character, p, factorReload) for p in damagePatterns}
+            cached = cache.getMany(charKeys.values())
+            if all(k in cached for k in charKeys.values()):
+                statsMaps[id(character)] = {patternID: cached[k] for patternID, k in charKeys.items()}
+                continue
+        toCalculate.append(character)
+    for character, (stats, ehpMap) in zip(toCalculate, _calculateFit(fit, toCalculate, damagePatterns, factorReload)):
+        statsMap = statsMaps[id(character)] = {patternID: dict(stats, ehp=ehp) for patternID, ehp in ehpMap.items()}
+        if cache is not None:
+            cache.setMany({keys[id(character)][patternID]: s for patternID, s in statsMap.items()})
+    return statsMaps
+
+
+def _calculateFit(fit, characters, damagePatterns, factorReload):
+    """
+    Calculate fit with every given character, return list of stats and EHP per
+    damage pattern. Fit is restored once, after all characters are done; when
+    fit is already calculated with settings requested, its current state is
+    used without calculating it again.
+    """
+    # Raw character, property returns All 0 character when fit has none
+    origCharacter = fit._Fit__character
+    origFactorReload = fit.factorReload
+    wasCalculated = fit.calculated
+    # State of the fit differs from original one
+    changed = False
+    results = [None] * len(characters)
+
+    def isOwn(character):
+        return character is None or character is origCharacter
+
+    # Stats of already calculated fit can be taken before anything is touched
+    order = sorted(range(len(characters)), key=lambda i: not isOwn(characters[i]))
+    try:
+        for i in order:
+            character = characters[i]
+            if not changed and wasCalculated and isOwn(character) and factorReload == origFactorReload:
+                results[i] = _getStats(fit, damagePatterns)
+                continue
+            changed = True
+            # Assigning character the usual way would change character's fits
+            # via backref, and mark both as modified in the database session
+            set_committed_value(fit, '_Fit__character', origCharacter if isOwn(character) else character)
+            fit.factorReload = factorReload
+            fit.clear()
+            fit.calculateModifiedAttributes()
+            results[i] = _getStats(fit, damagePatterns)
+    finally:
+        # Leave the fit as we found it; fits which were calculated (e.g. open
+        # in the GUI) have to stay calculated with their own settings
+        if changed:
+            set_committed_value(fit, '_Fit__character', origCharacter)
+            fit.factorReload = origFactorReload
+            fit.clear()
+            if wasCalculated:
+                fit.calculateModifiedAttributes()
+    return results
+
+
+def _getStats(fit, damagePatterns):
+    """Return stats of calculated fit, and its EHP per damage pattern"""
+    stats = {
+        'dps': fit.getTotalDps().total,
+        'volley': fit.getTotalVolley().total,
+        'capStable': fit.capStable,
+        'capState': fit.capState,
+        'maxSpeed': fit.maxSpeed,
+        'alignTime': fit.alignTime}
+    ehpMap = {}
+    for damagePattern in damagePatterns:
+        pattern = damagePattern if damagePattern is not None else fit.damagePattern
+        ehpMap[id(damagePattern)] = sum(pattern.calculateEhp(fit.ship).values())
+    return stats, ehpMap
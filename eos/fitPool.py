@@ -0,0 +1,402 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import multiprocessing
+import os
+from time import time
+
+from logbook import Logger
+
+# Nothing which touches database can be imported at module level: worker
+# processes import this module before their database config is set up
+import eos.config
+
+
+pyfalog = Logger(__name__)
+
+
+# Serialized form of fits and related data. It contains only IDs of gamedata
+# items and plain values, so it is cheap to pickle and can be turned back into
+# objects by any process which has access to the same gamedata.
+
+def serializeFit(fit):
+    """
+    Convert fit into plain data. Projected and command fits are not included,
+    fits are restored as standalone ones.
+    """
+    return {
+        'ID': fit.ID,
+        'name': fit.name,
+        'shipID': fit.ship.item.ID,
+        'modeID': fit.mode.item.ID if fit.mode is not None else None,
+        'implantLocation': fit.implantLocation,
+        'systemSecurity': fit.systemSecurity,
+        'pilotSecurity': fit.pilotSecurity,
+        'modules': [{
+            'itemID': m.itemID,
+            'baseItemID': m.baseItemID,
+            'mutaplasmidID': m.mutaplasmidID,
+            'mutations': {x.attrID: x.value for x in m.mutators.values()},
+            'chargeID': m.chargeID,
+            'state': m.state,
+            'spoolType': m.spoolType,
+            'spoolAmount': m.spoolAmount,
+            'rahPattern': serializeDamagePattern(m.rahPatternOverride) if m.rahPatternOverride is not None else None,
+            'position': m.position}
+            for m in fit.modules if not m.isEmpty],
+        'drones': [{
+            'itemID': d.itemID,
+            'baseItemID': d.baseItemID,
+            'mutaplasmidID': d.mutaplasmidID,
+            'mutations': {x.attrID: x.value for x in d.mutators.values()},
+            'amount': d.amount,
+            'amountActive': d.amountActive}
+            for d in fit.drones],
+        'fighters': [{
+            'itemID': f.itemID,
+            'amount': f.amount,
+            'active': f.active,
+            'abilities': {a.effectID: a.active for a in f.abilities}}
+            for f in fit.fighters],
+        'implants': [_serializeImplant(i) for i in fit.implants],
+        'boosters': [{
+            'itemID': b.itemID,
+            'active': b.active,
+            'sideEffects': {se.effectID: se.active for se in b.sideEffects}}
+            for b in fit.boosters]}
+
+
+def serializeCharacter(character):
+    return {
+        'name': character.name,
+        'secStatus': character.secStatus,
+        'skills': {s.itemID: s.level for s in character.skills},
+        'implants': [_serializeImplant(i) for i in character.implants]}
+
+
+def serializeDamagePattern(pattern):
+    return {
+        'name': pattern.name,
+        'amounts': (pattern.emAmount, pattern.thermalAmount, pattern.kineticAmount, pattern.explosiveAmount)}
+
+
+def _serializeImplant(implant):
+    return {'itemID': implant.itemID, 'active': implant.active}
+
+
+def deserializeFit(data):
+    import eos.db
+    from eos.saveddata.booster import Booster
+    from eos.saveddata.citadel import Citadel
+    from eos.saveddata.drone import Drone
+    from eos.saveddata.fighter import Fighter
+    from eos.saveddata.fit import Fit
+    from eos.saveddata.mode import Mode
+    from eos.saveddata.module import Module
+    from eos.saveddata.ship import Ship
+
+    shipItem = eos.db.getItem(data['shipID'])
+    try:
+        ship = Ship(shipItem)
+    except ValueError:
+        ship = Citadel(shipItem)
+    fit = Fit(ship, data['name'])
+    fit.ID = data['ID']
+    if data['modeID'] is not None:
+        fit.mode = Mode(eos.db.getItem(data['modeID']))
+    fit.implantLocation = data['implantLocation']
+    fit.systemSecurity = data['systemSecurity']
+    fit.pilotSecurity = data['pilotSecurity']
+
+    for modData in sorted(data['modules'], key=lambda m: m['position'] or 0):
+        baseItem, mutaplasmid = _getMutation(modData)
+        mod = Module(eos.db.getItem(modData['itemID']), baseItem=baseItem, mutaplasmid=mutaplasmid)
+        _applyMutations(mod, modData)
+        if modData['chargeID'] is not None:
+            mod.charge = eos.db.getItem(modData['chargeID'])
+        mod.spoolType = modData['spoolType']
+        mod.spoolAmount = modData['spoolAmount']
+        if modData['rahPattern'] is not None:
+            mod.rahPatternOverride = deserializeDamagePattern(modData['rahPattern'])
+        fit.modules.append(mod)
+        # State is validated against fit, so set it only after module is on it
+        if mod.isValidState(modData['state']):
+            mod.state = modData['state']
+
+    for droneData in data['drones']:
+        baseItem, mutaplasmid = _getMutation(droneData)
+        drone = Drone(eos.db.getItem(droneData['itemID']), baseItem=baseItem, mutaplasmid=mutaplasmid)
+        _applyMutations(drone, droneData)
+        drone.amount = droneData['amount']
+        drone.amountActive = droneData['amountActive']
+        fit.drones.append(drone)
+
+    for fighterData in data['fighters']:
+        fighter = Fighter(eos.db.getItem(fighterData['itemID']))
+        fighter.amount = fighterData['amount']
+        fighter.active = fighterData['active']
+        for ability in fighter.abilities:
+            ability.active = fighterData['abilities'].get(ability.effectID, ability.active)
+        fit.fighters.append(fighter)
+
+    for implantData in data['implants']:
+        fit.implants.append(_deserializeImplant(implantData))
+
+    for boosterData in data['boosters']:
+        booster = Booster(eos.db.getItem(boosterData['itemID']))
+        booster.active = boosterData['active']
+        for sideEffect in booster.sideEffects:
+            sideEffect.active = boosterData['sideEffects'].get(sideEffect.effectID, sideEffect.active)
+        fit.boosters.append(booster)
+    return fit
+
+
+def deserializeCharacter(data):
+    from eos.saveddata.character import Character
+
+    character = Character(data['name'])
+    for skill in character.skills:
+        level = data['skills'].get(skill.itemID)
+        if level is not None:
+            skill.setLevel(level, ignoreRestrict=True)
+    character.secStatus = data['secStatus']
+    for implantData in data['implants']:
+        character.implants.append(_deserializeImplant(implantData))
+    return character
+
+
+def deserializeDamagePattern(data):
+    from eos.saveddata.damagePattern import DamagePattern
+
+    pattern = DamagePattern(*data['amounts'])
+    pattern.rawName = data['name']
+    return pattern
+
+
+def _deserializeImplant(data):
+    import eos.db
+    from eos.saveddata.implant import Implant
+
+    implant = Implant(eos.db.getItem(data['itemID']))
+    implant.active = data['active']
+    return implant
+
+
+def _getMutation(data):
+    import eos.db
+
+    if data['baseItemID'] and data['mutaplasmidID']:
+        return eos.db.getItem(data['baseItemID']), eos.db.getDynamicItem(data['mutaplasmidID'])
+    return None, None
+
+
+def _applyMutations(item, data):
+    for attrID, mutator in item.mutators.items():
+        if attrID in data['mutations']:
+            mutator.value = data['mutations'][attrID]
+
+
+# Worker process state
+
+_workerCharacters = None
+_workerDamagePatterns = None
+
+
+def _initWorker(gamedataConnection, settings, lang, characters, damagePatterns):
+    """
+    Set up engine of worker process: gamedata is opened read-only, saveddata
+    lives in memory, as workers never store anything
+    """
+    global _workerCharacters, _workerDamagePatterns
+    eos.config.gamedata_connectionstring = gamedataConnection
+    eos.config.saveddata_connectionstring = 'sqlite:///:memory:'
+    eos.config.settings = settings
+    eos.config.lang = lang
+    # Import database only once config is set up
+    import eos.db  # noqa: F401
+    _workerCharacters = [deserializeCharacter(c) for c in characters]
+    _workerDamagePatterns = [deserializeDamagePattern(p) for p in damagePatterns]
+
+
+def _evaluateChunk(args):
+    """
+    Calculate serialized fits. Every fit comes with its own character and damage
+    pattern, which are used when pool was not given any. Returns amount of
+    processed fits, stats rows and (fit index, error message) of fits which
+    could not be calculated.
+    """
+    from eos.fitBatch import evaluateFits
+
+    entries, factorReload = args
+    results = []
+    failures = []
+    for fitIndex, fitData, charData, patternData in entries:
+        try:
+            fit = deserializeFit(fitData)
+            characters = [deserializeCharacter(charData)] if charData is not None else _workerCharacters
+            damagePatterns = [deserializeDamagePattern(patternData)] if patternData is not None else _workerDamagePatterns
+            rows = evaluateFits([fit], characters=characters, damagePatterns=damagePatterns, factorReload=factorReload)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.error("Cannot calculate fit {} in worker process: {}", fitData['ID'], e)
+            failures.append((fitIndex, '{}: {}'.format(type(e).__name__, e)))
+            continue
+        for rowIndex, row in enumerate(rows):
+            charIndex, patternIndex = divmod(rowIndex, len(damagePatterns))
+            stats = row._asdict()
+            for field in ('fit', 'character', 'damagePattern'):
+                del stats[field]
+            results.append((fitIndex, charIndex, patternIndex, stats))
+    return len(entries), results, failures
+
+
+def _getReadOnlyConnection(connection):
+    """Convert SQLite connection string into one which opens database read-only"""
+    if not isinstance(connection, str) or not connection.startswith('sqlite:///'):
+        raise ValueError('Process pool requires gamedata in SQLite file, got {}'.format(connection))
+    path = connection[len('sqlite:///'):].split('?', 1)[0]
+    return 'sqlite:///file:{}?mode=ro&uri=true'.format(path)
+
+
+class FitCalcPool:
+    """
+    Pool of processes calculating fits in parallel. Each worker has its own
+    read-only gamedata engine; fits, characters and damage patterns are passed
+    to workers in serialized form. Fits are restored without projected and
+    command fits.
+
+    Usage:
+        with FitCalcPool(characters=[char]) as pool:
+            rows = pool.evaluate(fits)
+    """
+
+    def __init__(self, characters=None, damagePatterns=None, processes=None, chunkSize=20):
+        self.__characters = list(characters) if characters else [None]
+        self.__damagePatterns = list(damagePatterns) if damagePatterns else [None]
+        self.__chunkSize = chunkSize
+        self.__cancelled = False
+        # Format: [(fit, error message)]
+        self.failures = []
+        # Spawn is the only start method available everywhere we run, and it
+        # guarantees workers do not inherit database connections of parent
+        context = multiprocessing.get_context('spawn')
+        self.__pool = context.Pool(
+            processes=processes or os.cpu_count(),
+            initializer=_initWorker,
+            initargs=(
+                _getReadOnlyConnection(eos.config.gamedata_connectionstring),
+                dict(eos.config.settings), eos.config.lang,
+                [serializeCharacter(c) for c in self.__characters if c is not None],
+                [serializeDamagePattern(p) for p in self.__damagePatterns if p is not None]))
+
+    def evaluate(self, fits, factorReload=False, progress=None, cache=None):
+        """
+        Calculate stats of fits with every character and damage pattern of the
+        pool. Returns the same rows as eos.fitBatch.evaluateFits; when pool has
+        no characters or damage patterns, character and damage pattern of rows
+        are the ones of the fits. Fits which have all their stats in passed
+        FitStatsCache are not sent to workers. Fits which could not be
+        calculated have no rows, they are listed in failures attribute.
+        """
+        from eos.fitBatch import FitStats
+        from eos.fitStatsCache import getFitStatsKey
+
+        fits = [f for f in fits if f is not None and not f.isInvalid]
+        start = time()
+        self.failures = []
+        ownCharacter = self.__characters == [None]
+        ownDamagePattern = self.__damagePatterns == [None]
+        rows = []
+        # {(fit index, character index, pattern index): cache key}
+        cacheKeys = {}
+        pending = list(range(len(fits)))
+        if cache is not None:
+            pending = []
+            for fitIndex, fit in enumerate(fits):
+                fitKeys = {
+                    (fitIndex, charIndex, patternIndex): getFitStatsKey(fit, character, damagePattern, factorReload)
+                    for charIndex, character in enumerate(self.__characters)
+                    for patternIndex, damagePattern in enumerate(self.__damagePatterns)}
+                cacheKeys.update(fitKeys)
+                cached = cache.getMany(fitKeys.values())
+                if all(k in cached for k in fitKeys.values()):
+                    rows.extend((*rowKey, cached[k]) for rowKey, k in fitKeys.items())
+                else:
+                    pending.append(fitIndex)
+            pyfalog.debug("Stats of {} fits out of {} found in cache", len(fits) - len(pending), len(fits))
+        chunks = []
+        for i in range(0, len(pending), self.__chunkSize):
+            entries = []
+            for j in pending[i:i + self.__chunkSize]:
+                fit = fits[j]
+                entries.append((
+                    j, serializeFit(fit),
+                    serializeCharacter(fit.character) if ownCharacter else None,
+                    serializeDamagePattern(fit.damagePattern) if ownDamagePattern else None))
+            chunks.append((entries, factorReload))
+        if progress is not None:
+            progress.maximum = len(fits)
+            progress.current += len(fits) - len(pending)
+        failures = []
+        for fitCount, results, chunkFailures in self.__pool.imap_unordered(_evaluateChunk, chunks):
+            rows.extend(results)
+            failures.extend(chunkFailures)
+            if cache is not None:
+                cache.setMany({cacheKeys[r[:3]]: r[3] for r in results})
+            if progress is not None:
+                progress.current += fitCount
+                if progress.userCancelled:
+                    # Chunks which are queued or running are not needed anymore
+                    self.__cancelled = True
+                    break
+        self.failures = [(fits[fitIndex], message) for fitIndex, message in sorted(failures)]
+        # Keep order the same as in single-process batch evaluation
+        rows.sort(key=lambda r: r[:3])
+        table = []
+        for fitIndex, charIndex, patternIndex, stats in rows:
+            fit = fits[fitIndex]
+            character = self.__characters[charIndex]
+            damagePattern = self.__damagePatterns[patternIndex]
+            table.append(FitStats(
+                fit=fit, character=character if character is not None else fit.character,
+                damagePattern=damagePattern if damagePattern is not None else fit.damagePattern,
+                **stats))
+        pyfalog.debug("Evaluated {} fits in process pool in {:.3f}s", len(fits), time() - start)
+        return table
+
+    def close(self):
+        """Wait for all submitted work to finish and stop workers"""
+        self.__pool.close()
+        self.__pool.join()
+
+    def terminate(self):
+        """Stop workers right away, dropping work which is not finished"""
+        self.__pool.terminate()
+        self.__pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType is not None or self.__cancelled:
+            self.terminate()
+        else:
+            self.close()
@@ -0,0 +1,193 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from copy import deepcopy
+
+from logbook import Logger
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+pyfalog = Logger(__name__)
+
+
+# How much recalculation pending changes need
+_UP_TO_DATE = 0
+_INCREMENTAL = 1
+_FULL = 2
+
+
+def forkFit(fit):
+    """
+    Return detached copy of the fit, which is not added to the database session
+    and does not affect any other object. Unlike deepcopy of fit, projected and
+    command fits are not copied, as they are linked to the fit via database.
+    """
+    from eos.saveddata.fit import Fit
+    fork = Fit()
+    # Assigning character the usual way would add fork to character's fits via
+    # backref, and thus to the database session
+    set_committed_value(fork, '_Fit__character', fit.character)
+    fork.ship = deepcopy(fit.ship)
+    fork.mode = deepcopy(fit.mode)
+    fork.name = fit.name
+    fork.damagePattern = fit.damagePattern
+    fork.targetProfile = fit.targetProfile
+    fork.implantLocation = fit.implantLocation
+    fork.systemSecurity = fit.systemSecurity
+    fork.pilotSecurity = fit.pilotSecurity
+    fork.factorReload = fit.factorReload
+    # Items get their owner from database otherwise, and some of their stats rely on it
+    for mod in fit.modules:
+        modCopy = deepcopy(mod)
+        modCopy.owner = fork
+        fork.modules.appendIgnoreEmpty(modCopy)
+    for name in ('drones', 'fighters', 'boosters', 'projectedModules', 'projectedDrones', 'projectedFighters'):
+        forkList = getattr(fork, name)
+        for item in getattr(fit, name):
+            itemCopy = deepcopy(item)
+            itemCopy.owner = fork
+            forkList.append(itemCopy)
+    for implant in fit.implants:
+        fork.implants.append(deepcopy(implant))
+    return fork
+
+
+class FitScenario:
+    """
+    What-if calculations for a fit: apply changes like module state or charge
+    switch, look at the result and revert them, without touching the fit.
+
+    Changes are applied to a detached copy of the fit, which is calculated once
+    with dependency graph recorded, so that state and charge changes are then
+    evaluated incrementally. Adding modules needs full calculation of the copy.
+
+    Fits affected by other fits can't be detached; for them, scenario changes
+    the fit itself, and restores and recalculates it on revert and discard.
+
+    Usage:
+        with FitScenario(fit) as scenario:
+            scenario.setModuleState(mod, FittingModuleState.ONLINE)
+            speed = scenario.evaluate().maxSpeed
+            scenario.revert()
+    """
+
+    def __init__(self, fit):
+        self.__source = fit
+        self.__detached = self.canDetach(fit)
+        self.__fit = None
+        self.__undo = []
+        self.__pending = _UP_TO_DATE
+
+    @staticmethod
+    def canDetach(fit):
+        return not fit.projectedFits and not fit.commandFits
+
+    @property
+    def fit(self):
+        """Fit changes are applied to; it is not necessarily calculated, use evaluate() for that"""
+        if self.__fit is None:
+            if self.__detached:
+                pyfalog.debug("Forking {} for what-if calculations", repr(self.__source))
+                self.__fit = forkFit(self.__source)
+                self.__fit.recordCalcGraph = True
+                self.__pending = _FULL
+            else:
+                self.__fit = self.__source
+        return self.__fit
+
+    def getModule(self, mod):
+        """Return counterpart of module of the original fit, modules of scenario fit are returned as is"""
+        modules = self.fit.modules
+        if any(m is mod for m in modules):
+            return mod
+        return modules[self.__source.modules.index(mod)]
+
+    def setModuleState(self, mod, state):
+        mod = self.getModule(mod)
+        oldState = mod.state
+        mod.state = state
+        self.__change(_INCREMENTAL, lambda: setattr(mod, 'state', oldState))
+
+    def setCharge(self, mod, charge):
+        mod = self.getModule(mod)
+        oldCharge = mod.charge
+        mod.charge = charge
+        self.__change(_INCREMENTAL, lambda: setattr(mod, 'charge', oldCharge))
+
+    def addModule(self, mod):
+        """Add module to the fit, returns False if it can't be added"""
+        fit = self.fit
+        modules = fit.modules
+        oldLength = len(modules)
+        mod.owner = fit
+        modules.append(mod)
+        if mod not in modules:
+            return False
+        if len(modules) > oldLength:
+            undo = lambda: modules.remove(mod)
+        else:
+            undo = lambda: modules.free(mod.position)
+        self.__change(_FULL, undo)
+        return True
+
+    def markDirty(self):
+        """Tell scenario its fit has been modified outside of it, and needs full calculation"""
+        self.__pending = _FULL
+
+    def evaluate(self):
+        """Bring the fit up to date with applied changes and return it"""
+        fit = self.fit
+        if self.__pending == _INCREMENTAL:
+            fit.calculateModifiedAttributesIncremental()
+        elif self.__pending == _FULL:
+            fit.clear()
+            fit.calculateModifiedAttributes()
+        self.__pending = _UP_TO_DATE
+        return fit
+
+    def revert(self):
+        """Undo all applied changes"""
+        while self.__undo:
+            undo, cost = self.__undo.pop()
+            undo()
+            self.__pending = max(self.__pending, cost)
+        # Original fit is used by others, it has to be up to date all the time
+        if not self.__detached:
+            self.evaluate()
+
+    def discard(self):
+        if self.__fit is None:
+            return
+        if self.__detached:
+            self.__undo = []
+        else:
+            self.revert()
+        self.__fit = None
+        self.__pending = _UP_TO_DATE
+
+    def __change(self, cost, undo):
+        self.__undo.append((undo, cost))
+        self.__pending = max(self.__pending, cost)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.discard()
@@ -0,0 +1,149 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import hashlib
+import json
+import sqlite3
+import threading
+
+from logbook import Logger
+
+import eos.config
+from eos.fitPool import serializeCharacter, serializeDamagePattern, serializeFit
+
+
+pyfalog = Logger(__name__)
+
+
+# Fields of eos.fitBatch.FitStats which are stored in cache
+STATS_FIELDS = ('dps', 'volley', 'ehp', 'capStable', 'capState', 'maxSpeed', 'alignTime')
+
+
+def getFitStatsKey(fit, character=None, damagePattern=None, factorReload=False):
+    """
+    Return hash of everything stats of fit depend on: fit contents, character
+    skills and implants, damage and target profiles, engine settings and
+    gamedata version. Fits which are affected by other fits or projected items
+    are not cached, None is returned for them.
+    """
+    if (
+        fit.projectedFits or fit.commandFits or
+        fit.projectedModules or fit.projectedDrones or fit.projectedFighters
+    ):
+        return None
+    if character is None:
+        character = fit.character
+    if damagePattern is None:
+        damagePattern = fit.damagePattern
+    fitData = serializeFit(fit)
+    # Names and IDs do not affect stats, so identical fits share entries
+    del fitData['ID'], fitData['name']
+    for modData in fitData['modules']:
+        if modData['rahPattern'] is not None:
+            modData['rahPattern'] = modData['rahPattern']['amounts']
+    charData = serializeCharacter(character)
+    del charData['name']
+    targetProfile = fit.targetProfile
+    data = {
+        'gamedataVersion': eos.config.gamedata_version,
+        'settings': eos.config.settings,
+        'fit': fitData,
+        'character': charData,
+        'damagePattern': serializeDamagePattern(damagePattern)['amounts'],
+        'targetProfile': None if targetProfile is None else (
+            targetProfile.emAmount, targetProfile.thermalAmount, targetProfile.kineticAmount,
+            targetProfile.explosiveAmount, targetProfile.maxVelocity, targetProfile.signatureRadius,
+            targetProfile.radius, targetProfile.hp),
+        'factorReload': factorReload}
+    # Enums and such end up as their values, and key order is fixed
+    text = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class FitStatsCache:
+    """
+    Persistent cache of calculated fit stats, stored in separate SQLite file.
+    Entries are stored under getFitStatsKey() hashes, so they never become
+    stale: any change of things stats depend on gives different key. Entries
+    of other gamedata versions are dropped when cache is opened. When gamedata
+    version is unknown, nothing is stored or returned.
+    """
+
+    def __init__(self, path):
+        self.__lock = threading.Lock()
+        self.__conn = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__conn:
+            self.__conn.execute(
+                'CREATE TABLE IF NOT EXISTS fitStats ('
+                'key TEXT PRIMARY KEY, gamedataVersion TEXT NOT NULL, stats TEXT NOT NULL)')
+            removed = 0
+            if eos.config.gamedata_version is not None:
+                removed = self.__conn.execute(
+                    'DELETE FROM fitStats WHERE gamedataVersion != ?', (eos.config.gamedata_version,)).rowcount
+        if removed:
+            pyfalog.debug("Dropped {} fit stats cache entries of old gamedata", removed)
+
+    def get(self, key):
+        """Return stats dictionary stored under key, or None"""
+        return self.getMany((key,)).get(key)
+
+    def getMany(self, keys):
+        """Return {key: stats} for all keys which have entries"""
+        result = {}
+        if eos.config.gamedata_version is None:
+            return result
+        keys = list(set(k for k in keys if k is not None))
+        with self.__lock:
+            # Stay well below SQLite limit of query parameters
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self.__conn.execute(
+                    'SELECT key, stats FROM fitStats WHERE key IN ({})'.format(', '.join('?' * len(chunk))), chunk)
+                for key, stats in rows:
+                    result[key] = json.loads(stats)
+        return result
+
+    def set(self, key, stats):
+        self.setMany({key: stats})
+
+    def setMany(self, entries):
+        """Store {key: stats} entries in one transaction"""
+        if eos.config.gamedata_version is None:
+            return
+        rows = [
+            (key, eos.config.gamedata_version, json.dumps({f: stats[f] for f in STATS_FIELDS}))
+            for key, stats in entries.items() if key is not None]
+        if not rows:
+            return
+        with self.__lock, self.__conn:
+            self.__conn.executemany(
+                'INSERT OR REPLACE INTO fitStats (key, gamedataVersion, stats) VALUES (?, ?, ?)', rows)
+
+    def clear(self):
+        with self.__lock, self.__conn:
+            self.__conn.execute('DELETE FROM fitStats')
+
+    def close(self):
+        with self.__lock:
+            self.__conn.close()
+
+    def __len__(self):
+        with self.__lock:
+            return self.__conn.execute('SELECT COUNT(*) FROM fitStats').fetchone()[0]
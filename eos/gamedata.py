@@ -20,6 +20,7 @@
 
 import json
 import re
+import weakref
 
 from logbook import Logger
 from sqlalchemy.orm import reconstructor
@@ -27,6 +28,7 @@ from sqlalchemy.orm import reconstructor
 import eos.effects
 import eos.db
 from eos.saveddata.price import Price as types_Price
+from eos.skillTemplate import invalidateTemplates
 from .eqBase import EqBase
 
 
@@ -56,6 +58,8 @@ class Effect(EqBase):
         """
         self.__generated = False
         self.__effectDef = None
+        # Items which keep this effect in their effect tables
+        self.__tableOwners = weakref.WeakSet()
 
     @property
     def handler(self):
@@ -117,9 +121,18 @@ class Effect(EqBase):
     def activeByDefault(self, value):
         """
         Just assign the input values to the activeByDefault attribute.
-        You *could* do something more interesting here if you wanted.
+        Effect tables of items are dropped, so that they are composed again
+        with the new value.
         """
         self.__activeByDefault = value
+        for item in list(self.__tableOwners):
+            item.clearEffectTables()
+        # Skills could have run the effect when templates were recorded
+        invalidateTemplates()
+
+    def addTableOwner(self, item):
+        """Register item whose effect tables depend on activeByDefault of the effect"""
+        self.__tableOwners.add(item)
 
     @property
     def type(self):
@@ -229,11 +242,47 @@ class Item(EqBase):
     def init(self):
         self.__race = None
         self.__requiredSkills = None
+        self.__requiredSkillLevels = None
         self.__requiredFor = None
         self.__offensive = None
         self.__assistive = None
         self.__overrides = None
         self.__priceObj = None
+        self.__effectTables = {}
+
+    def getEffects(self, runTime, anyTypes=None, allTypes=(), activeOnly=True):
+        """
+        Return effects of the item which run at passed runTime, in order they
+        are defined on the item. When anyTypes is passed, only effects of at
+        least one of those types are returned; effects have to be of all types
+        from allTypes. With activeOnly, effects not active by default are
+        skipped. Effects of an item never change, so every selection is
+        composed only once and is reused on all subsequent calculations, until
+        activeByDefault of any of its effects is changed.
+        """
+        key = (runTime, anyTypes, allTypes, activeOnly)
+        try:
+            return self.__effectTables[key]
+        except KeyError:
+            pass
+        effects = []
+        for effect in self.effects.values():
+            if effect.runTime != runTime:
+                continue
+            if activeOnly:
+                effect.addTableOwner(self)
+                if not effect.activeByDefault:
+                    continue
+            if anyTypes is not None and not any(effect.isType(t) for t in anyTypes):
+                continue
+            if not all(effect.isType(t) for t in allTypes):
+                continue
+            effects.append(effect)
+        effects = self.__effectTables[key] = tuple(effects)
+        return effects
+
+    def clearEffectTables(self):
+        self.__effectTables = {}
 
     def getShortName(self, charLimit=12):
         if len(self.name) <= charLimit:
@@ -428,30 +477,61 @@ class Item(EqBase):
         return self.__offensive
 
     def requiresSkill(self, skill, level=None):
-        for s, l in self.requiredSkills.items():
-            if isinstance(skill, str):
-                if s.typeName == skill and (level is None or l == level):
-                    return True
-
-            elif isinstance(skill, int) and (level is None or l == level):
-                if s.ID == skill:
-                    return True
-
-            elif skill == s and (level is None or l == level):
-                return True
-
-            elif hasattr(skill, "item") and skill.item == s and (level is None or l == level):
-                return True
-
-        return False
+        # Map of required skill names and IDs to levels, so that we do not have
+        # to walk over all required skills on every check
+        if self.__requiredSkillLevels is None:
+            self.__requiredSkillLevels = {}
+            for s, l in self.requiredSkills.items():
+                self.__requiredSkillLevels[s.typeName] = l
+                self.__requiredSkillLevels[s.ID] = l
+        if not isinstance(skill, (str, int)):
+            # Skill or item
+            skill = getattr(skill, "item", skill)
+            skill = getattr(skill, "ID", None)
+        try:
+            l = self.__requiredSkillLevels[skill]
+        except KeyError:
+            return False
+        return level is None or l == level
 
-    @property
-    def price(self):
+    def __checkPriceDeleted(self):
         # todo: use `from sqlalchemy import inspect` instead (mac-deprecated doesn't have inspect(), was imp[lemented in 0.8)
         if self.__priceObj is not None and getattr(self.__priceObj, '_sa_instance_state', None) and self.__priceObj._sa_instance_state.deleted:
             pyfalog.debug("Price data for {} was deleted (probably from a cache reset), resetting object".format(self.ID))
             self.__priceObj = None
 
+    @staticmethod
+    def loadPrices(items):
+        """
+        Attach price objects to all passed items with one query, instead of
+        querying them one by one when price of every item is accessed. Prices
+        which are not in the database yet are created and flushed at once.
+        """
+        # Format: {type ID: [items]}
+        toLoad = {}
+        for item in items:
+            item.__checkPriceDeleted()
+            if item.__priceObj is None:
+                toLoad.setdefault(item.ID, []).append(item)
+        if not toLoad:
+            return
+        prices = eos.db.getPrices(toLoad)
+        created = False
+        for typeID, typeItems in toLoad.items():
+            price = prices.get(typeID)
+            if price is None:
+                price = types_Price(typeID)
+                eos.db.add(price)
+                created = True
+            for item in typeItems:
+                item.__priceObj = price
+        if created:
+            eos.db.flush()
+
+    @property
+    def price(self):
+        self.__checkPriceDeleted()
+
         if self.__priceObj is None:
             db_price = eos.db.getPrice(self.ID)
             # do not yet have a price in the database for this item, create one
@@ -18,10 +18,12 @@
 # ===============================================================================
 
 
+import sys
 from collections.abc import MutableMapping
-from copy import copy
-from math import exp
+from functools import wraps
 
+from eos import calcGraph
+from eos.calc import applyPenalizedChain, splitPenalizedChain
 from eos.const import Operator
 # TODO: This needs to be moved out, we shouldn't have *ANY* dependencies back to other modules/methods inside eos.
 # This also breaks writing any tests. :(
@@ -32,6 +34,20 @@ defaultValuesCache = {}
 cappingAttrKeyCache = {}
 resistanceCache = {}
 
+# Max amount of results of extended getter remembered per attribute dictionary;
+# graphs request values for arbitrary web/paint strengths, so set of possible
+# keys is unbounded
+EXTENDED_CACHE_SIZE = 1000
+
+
+def internAttrKey(key):
+    """
+    Attribute names are used as keys by every item of every fit; interning them
+    makes all those dictionaries share single string object per attribute, and
+    lets lookups compare keys by identity.
+    """
+    return sys.intern(key) if type(key) is str else key
+
 
 def getAttrDefault(key, fallback=None):
     try:
@@ -97,9 +113,61 @@ class ChargeAttrShortcut:
         return return_value if return_value is not None else default
 
 
+class AttrModifications:
+    """All modifications applied to single attribute of single item"""
+
+    __slots__ = (
+        'preAssign', 'forced', 'preIncrease', 'multiplier', 'penalizedMultipliers', 'penalizedChains',
+        'postIncrease')
+
+    def __init__(self):
+        self.preAssign = None
+        self.forced = None
+        self.preIncrease = 0
+        self.multiplier = 1
+        # {penalty group: [multipliers]}, created only when needed
+        self.penalizedMultipliers = None
+        # {penalty group: (bonuses, penalties)}, sorted for application, built
+        # from penalized multipliers on demand
+        self.penalizedChains = None
+        self.postIncrease = 0
+
+    def getPenalizedChains(self):
+        if self.penalizedChains is None:
+            self.penalizedChains = {
+                group: splitPenalizedChain(multipliers)
+                for group, multipliers in (self.penalizedMultipliers or {}).items()}
+        return self.penalizedChains
+
+
+# Shared record for attributes which have no modifications, never written to
+noModifications = AttrModifications()
+
+
+def recordedOperation(method):
+    """
+    Modification methods are reported as a whole to calculation recorders which
+    need to replay them later (see eos.skillTemplate)
+    """
+    @wraps(method)
+    def operation(self, *args, **kwargs):
+        graph = calcGraph.state.active
+        if graph is not None and graph.recordsOperations:
+            return graph.recordOperation(self, method, args, kwargs)
+        return method(self, *args, **kwargs)
+    return operation
+
+
 class ModifiedAttributeDict(MutableMapping):
     overrides_enabled = False
 
+    # There are tens of thousands of these when many fits are loaded, so keep
+    # them compact: no instance dictionary, and all modification types of an
+    # attribute are stored in a single record instead of a dict per type
+    __slots__ = (
+        '__fit', 'parent', '__original', '__intermediary', '__modified', '__affectedBy',
+        '__overrides', '__mutators', '__mutatorsByName', '__attrMods', '__tmpModifier', '__extendedCache')
+
     class CalculationPlaceholder:
         def __init__(self):
             pass
@@ -121,29 +189,38 @@ class ModifiedAttributeDict(MutableMapping):
         self.__affectedBy = {}
         # Overrides (per item)
         self.__overrides = {}
-        # Mutators (per module)
+        # Mutators (per module), keyed by attribute ID, and the same keyed by
+        # attribute name along with mutators it was built from, built on demand
         self.__mutators = {}
-        # Dictionaries for various value modification types
-        self.__forced = {}
-        self.__preAssigns = {}
-        self.__preIncreases = {}
-        self.__multipliers = {}
-        self.__penalizedMultipliers = {}
-        self.__postIncreases = {}
+        self.__mutatorsByName = None
+        # Modifications of various types, {attr name: AttrModifications}
+        self.__attrMods = {}
         # We sometimes override the modifier (for things like skill handling). Store it here instead of registering it
         # with the fit (which could cause bug for items that have both item bonuses and skill bonus, ie Subsystems)
         self.__tmpModifier = None
+        # Results of extended getter, created only when needed
+        # {(attr name, extra multipliers, ignored afflictor IDs, overrides flag): value}
+        self.__extendedCache = None
 
     def clear(self):
         self.__intermediary.clear()
         self.__modified.clear()
         self.__affectedBy.clear()
-        self.__forced.clear()
-        self.__preAssigns.clear()
-        self.__preIncreases.clear()
-        self.__multipliers.clear()
-        self.__penalizedMultipliers.clear()
-        self.__postIncreases.clear()
+        self.__attrMods.clear()
+        self.__extendedCache = None
+
+    def clearAttributes(self, keys):
+        """Drop modifications of passed attributes, keeping modifications of other attributes intact"""
+        for key in keys:
+            self.__intermediary.pop(key, None)
+            self.__modified.pop(key, None)
+            self.__affectedBy.pop(key, None)
+            self.__attrMods.pop(key, None)
+        self.__extendedCache = None
+        # Attributes we keep can be capped by dropped ones, so their
+        # values have to be calculated again
+        for key in self.__modified:
+            self.__modified[key] = self.CalculationPlaceholder
 
     @property
     def fit(self):
@@ -169,6 +246,7 @@ class ModifiedAttributeDict(MutableMapping):
     def original(self, val):
         self.__original = val
         self.__modified.clear()
+        self.__extendedCache = None
 
     @property
     def overrides(self):
@@ -177,16 +255,39 @@ class ModifiedAttributeDict(MutableMapping):
     @overrides.setter
     def overrides(self, val):
         self.__overrides = val
+        self.__extendedCache = None
 
     @property
     def mutators(self):
-        return {x.attribute.name: x for x in self.__mutators.values()}
+        # Mutators are added to and replaced in the item's collection in place,
+        # so rebuild the name map whenever any of them changes
+        mutators = tuple(self.__mutators.values())
+        cached = self.__mutatorsByName
+        if (
+            cached is None or len(cached[0]) != len(mutators) or
+            any(old is not new for old, new in zip(cached[0], mutators))
+        ):
+            cached = self.__mutatorsByName = (mutators, {x.attribute.name: x for x in mutators})
+        return cached[1]
 
     @mutators.setter
     def mutators(self, val):
         self.__mutators = val
+        self.__mutatorsByName = None
+        self.__extendedCache = None
+
+    def __getAttrMods(self, key):
+        """Return modification record for attribute, creating it if necessary"""
+        try:
+            return self.__attrMods[key]
+        except KeyError:
+            mods = self.__attrMods[internAttrKey(key)] = AttrModifications()
+            return mods
 
     def __getitem__(self, key):
+        graph = calcGraph.state.active
+        if graph is not None:
+            graph.recordRead(self, key)
         # Check if we have final calculated value
         val = self.__modified.get(key)
         if val is self.CalculationPlaceholder:
@@ -209,10 +310,76 @@ class ModifiedAttributeDict(MutableMapping):
         """
         Here we consider couple of parameters. If they affect final result, we do
         not store result, and if they are - we do.
+
+        Results are remembered until any attribute of the dictionary is changed,
+        as graphs request the same values for the same fit over and over.
         """
+        graph = calcGraph.state.active
+        if graph is not None:
+            graph.recordRead(self, key)
+            # Values are in flux during calculation, do not remember them
+            return self.__getExtended(key, extraMultipliers, ignoreAfflictors, default)
+        cacheKey = self.__getExtendedCacheKey(key, extraMultipliers, ignoreAfflictors)
+        if cacheKey is None:
+            return self.__getExtended(key, extraMultipliers, ignoreAfflictors, default)
+        cache = self.__extendedCache
+        if cache is None:
+            cache = self.__extendedCache = {}
+        try:
+            val = cache[cacheKey]
+        except KeyError:
+            val = self.__getExtended(key, extraMultipliers, ignoreAfflictors, None)
+            if len(cache) >= EXTENDED_CACHE_SIZE:
+                cache.clear()
+            cache[cacheKey] = val
+        return val if val is not None else default
+
+    def __getExtendedCacheKey(self, key, extraMultipliers, ignoreAfflictors):
+        """Return hashable key of extended getter arguments, or None if they cannot be frozen"""
+        if extraMultipliers:
+            try:
+                frozenMultipliers = tuple(sorted(
+                    (stackGroup, tuple(operationsData)) for stackGroup, operationsData in extraMultipliers.items()
+                    if operationsData))
+            except TypeError:
+                return None
+            # Extra multipliers are resisted by the ship, and changes of its
+            # attributes do not go through this dictionary
+            resistances = self.__getExtraResistances(frozenMultipliers)
+        else:
+            frozenMultipliers = ()
+            resistances = ()
+        # Afflictors themselves, not their IDs: key keeps them alive, so that
+        # IDs of removed afflictors cannot be reused by new ones
+        ignored = frozenset(ignoreAfflictors) if ignoreAfflictors else frozenset()
+        cacheKey = (key, frozenMultipliers, resistances, ignored, self.overrides_enabled)
+        try:
+            hash(cacheKey)
+        except TypeError:
+            return None
+        return cacheKey
+
+    def __getExtraResistances(self, frozenMultipliers):
+        """Return values of ship resistance attributes extra multipliers depend on"""
+        resAttrIDs = sorted({
+            resAttrID for _, operationsData in frozenMultipliers
+            for _, resAttrID in operationsData if resAttrID})
+        if not resAttrIDs:
+            return ()
+        ship = getattr(self.fit, 'ship', None)
+        resistances = []
+        for resAttrID in resAttrIDs:
+            resAttrInfo = getAttributeInfo(resAttrID)
+            if resAttrInfo and ship is not None:
+                resistances.append((resAttrID, ship.itemModifiedAttributes[resAttrInfo.attributeName]))
+        return tuple(resistances)
+
+    def __getExtended(self, key, extraMultipliers, ignoreAfflictors, default):
         # Here we do not have support for preAssigns/forceds, as doing them would
         # mean that we have to store all of them in a list which increases memory use,
         # and we do not actually need those operators atm
+        if not ignoreAfflictors:
+            ignoreAfflictors = ()
         preIncreaseAdjustment = 0
         multiplierAdjustment = 1
         ignorePenalizedMultipliers = {}
@@ -258,6 +425,7 @@ class ModifiedAttributeDict(MutableMapping):
         return default
 
     def __delitem__(self, key):
+        self.__extendedCache = None
         if key in self.__modified:
             del self.__modified[key]
         if key in self.__intermediary:
@@ -269,7 +437,8 @@ class ModifiedAttributeDict(MutableMapping):
             val = self.overrides.get(key, val)
 
         # mutators are overriden by overrides. x_x
-        val = self.mutators.get(key, val)
+        if self.__mutators:
+            val = self.mutators.get(key, val)
 
         if val is None:
             if self.original:
@@ -284,7 +453,10 @@ class ModifiedAttributeDict(MutableMapping):
         return val.value if hasattr(val, "value") else val
 
     def __setitem__(self, key, val):
-        self.__intermediary[key] = val
+        if not self.__recordWrite(key):
+            return
+        self.__extendedCache = None
+        self.__intermediary[internAttrKey(key)] = val
 
     def __iter__(self):
         all_dict = dict(self.original, **self.__modified)
@@ -296,7 +468,8 @@ class ModifiedAttributeDict(MutableMapping):
 
     def __placehold(self, key):
         """Create calculation placeholder in item's modified attribute dict"""
-        self.__modified[key] = self.CalculationPlaceholder
+        self.__extendedCache = None
+        self.__modified[internAttrKey(key)] = self.CalculationPlaceholder
 
     def __len__(self):
         keys = set()
@@ -329,9 +502,11 @@ class ModifiedAttributeDict(MutableMapping):
         else:
             cappingValue = None
 
+        mods = self.__attrMods.get(key, noModifications)
+
         # If value is forced, we don't have to calculate anything,
         # just return forced value instead
-        force = self.__forced[key] if key in self.__forced else None
+        force = mods.forced
         if force is not None:
             if cappingValue is not None:
                 force = min(force, cappingValue)
@@ -339,12 +514,12 @@ class ModifiedAttributeDict(MutableMapping):
                 force = round(force, 2)
             return force
         # Grab our values if they're there, otherwise we'll take default values
-        preIncrease = self.__preIncreases.get(key, 0)
-        multiplier = self.__multipliers.get(key, 1)
-        penalizedMultiplierGroups = self.__penalizedMultipliers.get(key, {})
-        # Add extra multipliers to the group, not modifying initial data source
+        preIncrease = mods.preIncrease
+        multiplier = mods.multiplier
+        penalizedChains = mods.getPenalizedChains()
+        # Add extra multipliers to the chains, not modifying initial data source
         if extraMultipliers is not None:
-            penalizedMultiplierGroups = copy(penalizedMultiplierGroups)
+            penalizedChains = dict(penalizedChains)
             for stackGroup, operationsData in extraMultipliers.items():
                 multipliers = []
                 for mult, resAttrID in operationsData:
@@ -361,13 +536,23 @@ class ModifiedAttributeDict(MutableMapping):
                         continue
                     mult = (mult - 1) * resMult + 1
                     multipliers.append(mult)
-                penalizedMultiplierGroups[stackGroup] = penalizedMultiplierGroups.get(stackGroup, []) + multipliers
-        postIncrease = self.__postIncreases.get(key, 0)
+                bonuses, penalties = penalizedChains.get(stackGroup, ((), ()))
+                extraBonuses, extraPenalties = splitPenalizedChain(multipliers)
+                # Chains are already sorted, so re-sorting them is cheap
+                penalizedChains[stackGroup] = (
+                    sorted([*bonuses, *extraBonuses], reverse=True),
+                    sorted([*penalties, *extraPenalties]))
+        postIncrease = mods.postIncrease
 
         # Grab initial value, priorities are:
         # Results of ongoing calculation > preAssign > original > 0
         default = getAttrDefault(key, fallback=0.0)
-        val = self.__intermediary.get(key, self.__preAssigns.get(key, self.getOriginal(key, default)))
+        if key in self.__intermediary:
+            val = self.__intermediary[key]
+        elif mods.preAssign is not None:
+            val = mods.preAssign
+        else:
+            val = self.getOriginal(key, default)
 
         # We'll do stuff in the following order:
         # preIncrease > multiplier > stacking penalized multipliers > postIncrease
@@ -379,31 +564,18 @@ class ModifiedAttributeDict(MutableMapping):
             val *= multAdj
         # Each group is penalized independently
         # Things in different groups will not be stack penalized between each other
-        for penaltyGroup, penalizedMultipliers in penalizedMultiplierGroups.items():
+        for penaltyGroup, (bonuses, penalties) in penalizedChains.items():
             if ignorePenMult is not None and penaltyGroup in ignorePenMult:
                 # Avoid modifying source and remove multipliers we were asked to remove for this calc
-                penalizedMultipliers = penalizedMultipliers[:]
+                bonuses = list(bonuses)
+                penalties = list(penalties)
                 for ignoreMult in ignorePenMult[penaltyGroup]:
                     try:
-                        penalizedMultipliers.remove(ignoreMult)
+                        (bonuses if ignoreMult > 1 else penalties).remove(ignoreMult)
                     except ValueError:
                         pass
-            # A quick explanation of how this works:
-            # 1: Bonuses and penalties are calculated seperately, so we'll have to filter each of them
-            l1 = [_val for _val in penalizedMultipliers if _val > 1]
-            l2 = [_val for _val in penalizedMultipliers if _val < 1]
-            # 2: The most significant bonuses take the smallest penalty,
-            # This means we'll have to sort
-            abssort = lambda _val: -abs(_val - 1)
-            l1.sort(key=abssort)
-            l2.sort(key=abssort)
-            # 3: The first module doesn't get penalized at all
-            # Any module after the first takes penalties according to:
-            # 1 + (multiplier - 1) * math.exp(- math.pow(i, 2) / 7.1289)
-            for l in (l1, l2):
-                for i in range(len(l)):
-                    bonus = l[i]
-                    val *= 1 + (bonus - 1) * exp(- i ** 2 / 7.1289)
+            val = applyPenalizedChain(val, bonuses)
+            val = applyPenalizedChain(val, penalties)
         val += postIncrease
         if postIncAdj is not None:
             val += postIncAdj
@@ -427,6 +599,13 @@ class ModifiedAttributeDict(MutableMapping):
         self.__tmpModifier = skill
         return skill.level
 
+    def __recordWrite(self, attributeName):
+        """Report modification to calculation graph, if any is recording. Returns False if modification is to be skipped"""
+        graph = calcGraph.state.active
+        if graph is None:
+            return True
+        return graph.recordWrite(self, attributeName)
+
     def getAfflictions(self, key):
         return self.__affectedBy.get(key, {})
 
@@ -441,7 +620,7 @@ class ModifiedAttributeDict(MutableMapping):
             return
         # Create dictionary for given attribute and give it alias
         if attributeName not in self.__affectedBy:
-            self.__affectedBy[attributeName] = {}
+            self.__affectedBy[internAttrKey(attributeName)] = {}
         affs = self.__affectedBy[attributeName]
         origin = fit.getOrigin()
         fit = origin if origin and origin != fit else fit
@@ -461,14 +640,20 @@ class ModifiedAttributeDict(MutableMapping):
         # Add current affliction to list
         affs.append((modifier, operator, stackingGroup, preResAmount, postResAmount, used))
 
+    @recordedOperation
     def preAssign(self, attributeName, value, **kwargs):
         """Overwrites original value of the entity with given one, allowing further modification"""
-        self.__preAssigns[attributeName] = value
+        if not self.__recordWrite(attributeName):
+            return
+        self.__getAttrMods(attributeName).preAssign = value
         self.__placehold(attributeName)
         self.__afflict(attributeName, Operator.PREASSIGN, None, value, value, value != self.getOriginal(attributeName))
 
+    @recordedOperation
     def increase(self, attributeName, increase, position="pre", skill=None, **kwargs):
         """Increase value of given attribute by given number"""
+        if not self.__recordWrite(attributeName):
+            return
         if skill:
             increase *= self.__handleSkill(skill)
 
@@ -476,26 +661,27 @@ class ModifiedAttributeDict(MutableMapping):
             increase *= ModifiedAttributeDict.getResistance(self.fit, kwargs['effect']) or 1
 
         # Increases applied before multiplications and after them are
-        # written in separate maps
+        # stored separately
         if position == "pre":
             operator = Operator.PREINCREASE
-            tbl = self.__preIncreases
+            self.__getAttrMods(attributeName).preIncrease += increase
         elif position == "post":
             operator = Operator.POSTINCREASE
-            tbl = self.__postIncreases
+            self.__getAttrMods(attributeName).postIncrease += increase
         else:
             raise ValueError("position should be either pre or post")
-        if attributeName not in tbl:
-            tbl[attributeName] = 0
-        tbl[attributeName] += increase
         self.__placehold(attributeName)
         self.__afflict(attributeName, operator, None, increase, increase, increase != 0)
 
+    @recordedOperation
     def multiply(self, attributeName, multiplier, stackingPenalties=False, penaltyGroup="default", skill=None, **kwargs):
         """Multiply value of given attribute by given factor"""
         if multiplier is None:  # See GH issue 397
             return
 
+        if not self.__recordWrite(attributeName):
+            return
+
         if skill:
             multiplier *= self.__handleSkill(skill)
 
@@ -510,18 +696,15 @@ class ModifiedAttributeDict(MutableMapping):
 
         # If we're asked to do stacking penalized multiplication, append values
         # to per penalty group lists
+        mods = self.__getAttrMods(attributeName)
         if stackingPenalties:
-            if attributeName not in self.__penalizedMultipliers:
-                self.__penalizedMultipliers[attributeName] = {}
-            if penaltyGroup not in self.__penalizedMultipliers[attributeName]:
-                self.__penalizedMultipliers[attributeName][penaltyGroup] = []
-            tbl = self.__penalizedMultipliers[attributeName][penaltyGroup]
-            tbl.append(multiplier)
-        # Non-penalized multiplication factors go to the single list
+            if mods.penalizedMultipliers is None:
+                mods.penalizedMultipliers = {}
+            mods.penalizedMultipliers.setdefault(penaltyGroup, []).append(multiplier)
+            mods.penalizedChains = None
+        # Non-penalized multiplication factors are merged into single value
         else:
-            if attributeName not in self.__multipliers:
-                self.__multipliers[attributeName] = 1
-            self.__multipliers[attributeName] *= multiplier
+            mods.multiplier *= multiplier
 
         self.__placehold(attributeName)
 
@@ -535,17 +718,23 @@ class ModifiedAttributeDict(MutableMapping):
             attributeName, Operator.MULTIPLY, penaltyGroup if stackingPenalties else None,
             preResMultiplier, multiplier, multiplier != 1)
 
+    @recordedOperation
     def boost(self, attributeName, boostFactor, skill=None, **kwargs):
         """Boost value by some percentage"""
+        if not self.__recordWrite(attributeName):
+            return
         if skill:
             boostFactor *= self.__handleSkill(skill)
 
         # We just transform percentage boost into multiplication factor
         self.multiply(attributeName, 1 + boostFactor / 100.0, **kwargs)
 
+    @recordedOperation
     def force(self, attributeName, value, **kwargs):
         """Force value to attribute and prohibit any changes to it"""
-        self.__forced[attributeName] = value
+        if not self.__recordWrite(attributeName):
+            return
+        self.__getAttrMods(attributeName).forced = value
         self.__placehold(attributeName)
         self.__afflict(attributeName, Operator.FORCE, None, value, value)
 
@@ -117,12 +117,11 @@ class Booster(HandledItem, ItemAttrShortcut):
         if not self.active:
             return
 
-        for effect in self.item.effects.values():
-            if effect.runTime == runTime and \
-                    (effect.isType("passive") or effect.isType("boosterSideEffect")):
-                if effect.isType("boosterSideEffect") and effect not in self.activeSideEffectEffects:
-                    continue
-                effect.handler(fit, self, ("booster",), None, effect=effect)
+        # Side effects are not active by default, booster decides which are on
+        for effect in self.item.getEffects(runTime, ("passive", "boosterSideEffect"), activeOnly=False):
+            if effect.isType("boosterSideEffect") and effect not in self.activeSideEffectEffects:
+                continue
+            effect.handler(fit, self, ("booster",), None, effect=effect)
 
     @validates("ID", "itemID", "ammoID", "active")
     def validator(self, key, val):
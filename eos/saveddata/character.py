@@ -27,7 +27,10 @@ from sqlalchemy.orm import validates, reconstructor
 import eos
 import eos.db
 import eos.config
+from eos import calcGraph
 from eos.effectHandlerHelpers import HandledItem, HandledImplantList
+from eos.skillTemplate import TEMPLATES_PER_CHARACTER, SkillTemplate, getTemplateKey
+from eos.utils.lruCache import LRUCache
 
 pyfalog = Logger(__name__)
 
@@ -46,6 +49,7 @@ class Character:
         self.dirtySkills = set()
         self.alphaClone = None
         self.__secStatus = 0.0
+        self.__skillTemplates = None
 
         if initSkills:
             for item in self.getSkillList():
@@ -67,6 +71,7 @@ class Character:
             self.addSkill(Skill(self, skillID, self.defaultLevel))
 
         self.dirtySkills = set()
+        self.__skillTemplates = None
 
         self.alphaClone = None
 
@@ -135,6 +140,7 @@ class Character:
         del self.__skills[:]
         self.__skillIdMap.clear()
         self.dirtySkills.clear()
+        self.invalidateSkillTemplates()
 
     @property
     def ro(self):
@@ -195,6 +201,7 @@ class Character:
     def alphaCloneID(self, cloneID):
         self.__alphaCloneID = cloneID
         self.alphaClone = eos.db.getAlphaClone(cloneID) if cloneID is not None else None
+        self.invalidateSkillTemplates()
 
     @property
     def skills(self):
@@ -210,10 +217,12 @@ class Character:
                 return
 
         self.__skillIdMap[skill.itemID] = skill
+        self.invalidateSkillTemplates()
 
     def removeSkill(self, skill):
         self.__skills.remove(skill)
         del self.__skillIdMap[skill.itemID]
+        self.invalidateSkillTemplates()
 
     def getSkill(self, item):
         if isinstance(item, str):
@@ -271,9 +280,34 @@ class Character:
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
         if forceProjected:
             return
-        for skill in self.skills:
-            fit.register(skill)
-            skill.calculateModifiedAttributes(fit, runTime)
+        # Calculation graph needs to see effects of every skill run for real
+        if not eos.config.settings['skillTemplates'] or calcGraph.state.active is not None:
+            for skill in self.skills:
+                fit.register(skill)
+                skill.calculateModifiedAttributes(fit, runTime)
+            return
+        templates = self.__skillTemplates
+        if templates is None:
+            templates = self.__skillTemplates = LRUCache(TEMPLATES_PER_CHARACTER)
+        key = getTemplateKey(fit, self.skills, runTime)
+        if key in templates:
+            template = templates.get(key)
+            if template is not None:
+                template.replay(fit)
+                return
+            # Not replayable, run skills as usual
+            for skill in self.skills:
+                fit.register(skill)
+                skill.calculateModifiedAttributes(fit, runTime)
+            return
+        template = SkillTemplate.record(fit, self.skills, runTime)
+        # Skills could have been changed by effects themselves
+        if self.__skillTemplates is templates:
+            templates.set(key, template)
+
+    def invalidateSkillTemplates(self):
+        """Forget recorded skill effects, has to be called whenever skill levels change"""
+        self.__skillTemplates = None
 
     def clear(self):
         c = chain(
@@ -338,6 +372,8 @@ class Skill(HandledItem):
 
     def revert(self):
         self.activeLevel = self.__level
+        if self.character is not None:
+            self.character.invalidateSkillTemplates()
 
     @property
     def isDirty(self):
@@ -371,6 +407,8 @@ class Skill(HandledItem):
             raise ReadOnlyException()
 
         self.activeLevel = level
+        if self.character is not None:
+            self.character.invalidateSkillTemplates()
 
         # todo: have a way to do bulk skill level editing. Currently, everytime a single skill is changed, this runs,
         # which affects performance. Should have a checkSkillLevels() or something that is more efficient for bulk.
@@ -416,15 +454,11 @@ class Skill(HandledItem):
         if item is None:
             return
 
-        for effect in item.effects.values():
-            if effect.runTime == runTime and \
-                    effect.isType("passive") and \
-                    (not fit.isStructure or effect.isType("structure")) and \
-                    effect.activeByDefault:
-                try:
-                    effect.handler(fit, self, ("skill",), None, effect=effect)
-                except AttributeError:
-                    continue
+        for effect in item.getEffects(runTime, ("passive",), ("structure",) if fit.isStructure else ()):
+            try:
+                effect.handler(fit, self, ("skill",), None, effect=effect)
+            except AttributeError:
+                continue
 
     def clear(self):
         self.__suppressed = False
@@ -332,13 +332,17 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, Mu
             return val
 
     def clear(self):
+        self.clearCalculatedStats()
+        self.itemModifiedAttributes.clear()
+        self.chargeModifiedAttributes.clear()
+
+    def clearCalculatedStats(self):
+        """Reset stats derived from modified attributes, without touching attributes themselves"""
         self.__baseVolley = None
         self.__baseRRAmount = None
         self.__miningYield = None
         self.__miningWaste = None
         self.__ehp = None
-        self.itemModifiedAttributes.clear()
-        self.chargeModifiedAttributes.clear()
 
     def canBeApplied(self, projectedOnto):
         """Check if drone can engage specific fitting"""
@@ -368,24 +372,19 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, Mu
 
         projectionRange = self.projectionRange if forcedProjRange is DEFAULT else forcedProjRange
 
-        for effect in self.item.effects.values():
-            if effect.runTime == runTime and \
-                    effect.activeByDefault and \
-                    ((projected is True and effect.isType("projected")) or
-                                 projected is False and effect.isType("passive")):
-                # See GH issue #765
-                if effect.getattr('grouped'):
+        for effect in self.item.getEffects(runTime, ("projected",) if projected else ("passive",)):
+            # See GH issue #765
+            if effect.getattr('grouped'):
+                effect.handler(fit, self, context, projectionRange, effect=effect)
+            else:
+                i = 0
+                while i != self.amountActive:
                     effect.handler(fit, self, context, projectionRange, effect=effect)
-                else:
-                    i = 0
-                    while i != self.amountActive:
-                        effect.handler(fit, self, context, projectionRange, effect=effect)
-                        i += 1
+                    i += 1
 
         if self.charge:
-            for effect in self.charge.effects.values():
-                if effect.runTime == runTime and effect.activeByDefault:
-                    effect.handler(fit, self, ("droneCharge",), projectionRange, effect=effect)
+            for effect in self.charge.getEffects(runTime):
+                effect.handler(fit, self, ("droneCharge",), projectionRange, effect=effect)
 
     def __deepcopy__(self, memo):
         copy = Drone(self.item, self.baseItem, self.mutaplasmid)
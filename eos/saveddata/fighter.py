@@ -370,13 +370,17 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
             return val
 
     def clear(self):
-        self.__baseVolley = None
-        self.__miningyield = None
-        self.__ehp = None
+        self.clearCalculatedStats()
         self.itemModifiedAttributes.clear()
         self.chargeModifiedAttributes.clear()
         [x.clear() for x in self.abilities]
 
+    def clearCalculatedStats(self):
+        """Reset stats derived from modified attributes, without touching attributes themselves"""
+        self.__baseVolley = None
+        self.__miningyield = None
+        self.__ehp = None
+
     def canBeApplied(self, projectedOnto):
         """Check if fighter can engage specific fitting"""
         item = self.item
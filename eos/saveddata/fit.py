@@ -26,13 +26,15 @@ from math import ceil, log, sqrt
 from logbook import Logger
 from sqlalchemy.orm import reconstructor, validates
 
+import eos.config
 import eos.db
-from eos import capSim
+from eos import calcGraph, capSim
 from eos.calc import calculateLockTime, calculateMultiplier
 from eos.const import CalcType, FitSystemSecurity, FittingHardpoint, FittingModuleState, FittingSlot, ImplantLocation
 from eos.effectHandlerHelpers import (
     HandledBoosterList, HandledDroneCargoList, HandledImplantList,
-    HandledModuleList, HandledProjectedDroneList, HandledProjectedModList)
+    HandledModuleList, HandledProjectedDroneList, HandledProjectedModList,
+    itemGroupIs, itemRequiresSkill)
 from eos.saveddata.character import Character
 from eos.saveddata.citadel import Citadel
 from eos.saveddata.damagePattern import DamagePattern
@@ -154,6 +156,9 @@ class Fit:
         self.__capRecharge = None
         self.__savedCapSimData = {}
         self.__calculatedTargets = []
+        self.__calcGraph = None
+        # Record dependency graph even when incremental calculation is disabled
+        self.recordCalcGraph = False
         self.factorReload = False
         self.boostsFits = set()
         self.gangBoosts = None
@@ -511,26 +516,17 @@ class Fit:
             return False
         return True
 
+    def clearFilterIndexes(self):
+        """Drop indices effects use to look up items, they are rebuilt on demand"""
+        for itemList in (self.modules, self.drones, self.fighters, self.boosters, self.implants):
+            itemList.clearFilterIndex()
+        if self.character is not None:
+            self.character.implants.clearFilterIndex()
+
     def clear(self, projected=False, command=False):
-        self.__effectiveTank = None
-        self.__weaponDpsMap = {}
-        self.__weaponVolleyMap = {}
-        self.__remoteRepMap = {}
-        self.__minerYield = None
-        self.__droneYield = None
-        self.__minerWaste = None
-        self.__droneWaste = None
-        self.__effectiveSustainableTank = None
-        self.__sustainableTank = None
-        self.__droneDps = None
-        self.__droneVolley = None
-        self.__ehp = None
+        self.__calcGraph = None
+        self.__clearStats()
         self.__calculated = False
-        self.__capStable = None
-        self.__capState = None
-        self.__capUsed = None
-        self.__capRecharge = None
-        self.__savedCapSimData.clear()
         self.__ecmProjectedList = []
         # self.commandBonuses = {}
 
@@ -556,6 +552,8 @@ class Fit:
             if stuff is not None and stuff != self:
                 stuff.clear()
 
+        self.clearFilterIndexes()
+
         self._hullRr.clear()
         self._armorRr.clear()
         self._armorRrPreSpool.clear()
@@ -575,11 +573,35 @@ class Fit:
         #         if stuff is not None and stuff != self:
         #             stuff.clear(command=True)
 
+    def __clearStats(self):
+        """Reset all stats which are derived from modified attributes"""
+        self.__effectiveTank = None
+        self.__weaponDpsMap = {}
+        self.__weaponVolleyMap = {}
+        self.__remoteRepMap = {}
+        self.__minerYield = None
+        self.__droneYield = None
+        self.__minerWaste = None
+        self.__droneWaste = None
+        self.__effectiveSustainableTank = None
+        self.__sustainableTank = None
+        self.__droneDps = None
+        self.__droneVolley = None
+        self.__ehp = None
+        self.__capStable = None
+        self.__capState = None
+        self.__capUsed = None
+        self.__capRecharge = None
+        self.__savedCapSimData.clear()
+
     # Methods to register and get the thing currently affecting the fit,
     # so we can correctly map "Affected By"
     def register(self, currModifier, origin=None):
         self.__modifier = currModifier
         self.__origin = origin
+        graph = calcGraph.state.active
+        if graph is not None:
+            graph.setSource(currModifier)
         if hasattr(currModifier, "itemModifiedAttributes"):
             if hasattr(currModifier.itemModifiedAttributes, "fit"):
                 currModifier.itemModifiedAttributes.fit = origin or self
@@ -597,12 +619,22 @@ class Fit:
         # oh fuck this is so janky
         # @todo should we pass in min/max to this function, or is abs okay?
         # (abs is old method, ccp now provides the aggregate function in their data)
+        graph = calcGraph.state.active
+        if graph is not None:
+            # Command bonuses are applied outside of effect handlers, graph can't replay them
+            graph.invalidate()
         if warfareBuffID not in self.commandBonuses or abs(self.commandBonuses[warfareBuffID][1]) < abs(value):
             self.commandBonuses[warfareBuffID] = (runTime, value, module, effect)
 
     def addProjectedEcm(self, strength):
         self.__ecmProjectedList.append(strength)
 
+    def hasUntrackedEffectData(self):
+        """Check if effects stored any data on fit directly, instead of modifying attributes"""
+        return bool(
+            self.__extraDrains or self.__ecmProjectedList or self._hullRr or self._armorRr or
+            self._armorRrPreSpool or self._armorRrFullSpool or self._shieldRr)
+
     def __runCommandBoosts(self, runTime="normal"):
         pyfalog.debug("Applying gang boosts for {0}", repr(self))
         for warfareBuffID in list(self.commandBonuses.keys()):
@@ -622,14 +654,10 @@ class Fit:
 
                 if warfareBuffID == 11:  # Shield Burst: Active Shielding: Repair Duration/Capacitor
                     self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Shield Operation") or
-                                        mod.item.requiresSkill("Shield Emission Systems") or
-                                        mod.item.requiresSkill("Capital Shield Emission Systems"),
+                            itemRequiresSkill("Shield Operation", "Shield Emission Systems", "Capital Shield Emission Systems"),
                             "capacitorNeed", value)
                     self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Shield Operation") or
-                                        mod.item.requiresSkill("Shield Emission Systems") or
-                                        mod.item.requiresSkill("Capital Shield Emission Systems"),
+                            itemRequiresSkill("Shield Operation", "Shield Emission Systems", "Capital Shield Emission Systems"),
                             "duration", value)
 
                 if warfareBuffID == 12:  # Shield Burst: Shield Extension: Shield HP
@@ -641,14 +669,10 @@ class Fit:
 
                 if warfareBuffID == 14:  # Armor Burst: Rapid Repair: Repair Duration/Capacitor
                     self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or
-                                        mod.item.requiresSkill("Repair Systems") or
-                                        mod.item.requiresSkill("Capital Remote Armor Repair Systems"),
+                            itemRequiresSkill("Remote Armor Repair Systems", "Repair Systems", "Capital Remote Armor Repair Systems"),
                             "capacitorNeed", value)
                     self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or
-                                        mod.item.requiresSkill("Repair Systems") or
-                                        mod.item.requiresSkill("Capital Remote Armor Repair Systems"),
+                            itemRequiresSkill("Remote Armor Repair Systems", "Repair Systems", "Capital Remote Armor Repair Systems"),
                             "duration", value)
 
                 if warfareBuffID == 15:  # Armor Burst: Armor Reinforcement: Armor HP
@@ -659,26 +683,26 @@ class Fit:
 
                 if warfareBuffID == 17:  # Information Burst: Electronic Superiority: EWAR Range and Strength
                     groups = ("ECM", "Sensor Dampener", "Weapon Disruptor", "Target Painter")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value,
+                    self.modules.filteredItemBoost(itemGroupIs(*groups), "maxRange", value,
                                                    stackingPenalties=True)
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                    self.modules.filteredItemBoost(itemGroupIs(*groups),
                                                    "falloffEffectiveness", value, stackingPenalties=True)
 
                     for scanType in ("Magnetometric", "Radar", "Ladar", "Gravimetric"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+                        self.modules.filteredItemBoost(itemGroupIs("ECM"),
                                                        "scan%sStrengthBonus" % scanType, value,
                                                        stackingPenalties=True)
 
                     for attr in ("missileVelocityBonus", "explosionDelayBonus", "aoeVelocityBonus", "falloffBonus",
                                  "maxRangeBonus", "aoeCloudSizeBonus", "trackingSpeedBonus"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Weapon Disruptor",
+                        self.modules.filteredItemBoost(itemGroupIs("Weapon Disruptor"),
                                                        attr, value)
 
                     for attr in ("maxTargetRangeBonus", "scanResolutionBonus"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
+                        self.modules.filteredItemBoost(itemGroupIs("Sensor Dampener"),
                                                        attr, value)
 
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
+                    self.modules.filteredItemBoost(itemGroupIs("Target Painter"),
                                                    "signatureRadiusBonus", value, stackingPenalties=True)
 
                 if warfareBuffID == 18:  # Information Burst: Electronic Hardening: Scan Strength
@@ -694,36 +718,29 @@ class Fit:
 
                 if warfareBuffID == 21:  # Skirmish Burst: Interdiction Maneuvers: Tackle Range
                     groups = ("Stasis Web", "Warp Scrambler")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value,
+                    self.modules.filteredItemBoost(itemGroupIs(*groups), "maxRange", value,
                                                    stackingPenalties=True)
 
                 if warfareBuffID == 22:  # Skirmish Burst: Rapid Deployment: AB/MWD Speed Increase
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner") or
-                                                               mod.item.requiresSkill("High Speed Maneuvering"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Afterburner", "High Speed Maneuvering"),
                                                    "speedFactor", value, stackingPenalties=True)
 
                 if warfareBuffID == 23:  # Mining Burst: Mining Laser Field Enhancement: Mining/Survey Range
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Mining", "Ice Harvesting", "Gas Cloud Harvesting"),
                                                    "maxRange", value, stackingPenalties=True)
 
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("CPU Management"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("CPU Management"),
                                                    "surveyScanRange", value, stackingPenalties=True)
 
                 if warfareBuffID == 24:  # Mining Burst: Mining Laser Optimization: Mining Capacitor/Duration
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Mining", "Ice Harvesting", "Gas Cloud Harvesting"),
                                                    "capacitorNeed", value, stackingPenalties=True)
 
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Mining", "Ice Harvesting", "Gas Cloud Harvesting"),
                                                    "duration", value, stackingPenalties=True)
 
                 if warfareBuffID == 25:  # Mining Burst: Mining Equipment Preservation: Crystal Volatility
-                    self.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill("Mining"),
+                    self.modules.filteredChargeBoost(itemRequiresSkill("Mining"),
                                                      "crystalVolatilityChance", value, stackingPenalties=True)
 
                 if warfareBuffID == 26:  # Information Burst: Sensor Optimization: Targeting Range
@@ -782,21 +799,21 @@ class Fit:
                     self.ship.boostItemAttr("maxVelocity", value, stackingPenalties=True)
 
                 if warfareBuffID == 52:  # Erebus Effect Generator : Shield RR penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "shieldBonus", value, stackingPenalties=True)
+                    self.modules.filteredItemBoost(itemRequiresSkill("Shield Emission Systems"), "shieldBonus", value, stackingPenalties=True)
 
                 if warfareBuffID == 53:  # Leviathan Effect Generator : Armor RR penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Remote Armor Repair Systems"),
                                                    "armorDamageAmount", value, stackingPenalties=True)
 
                 if warfareBuffID == 54:  # Ragnarok Effect Generator : Laser and Hybrid Optimal penalty
                     groups = ("Energy Weapon", "Hybrid Weapon")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value, stackingPenalties=True)
+                    self.modules.filteredItemBoost(itemGroupIs(*groups), "maxRange", value, stackingPenalties=True)
 
                 # Localized environment effects
 
                 if warfareBuffID == 79:  # AOE_Beacon_bioluminescence_cloud
                     self.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "signatureRadius", value, stackingPenalties=True)
 
                 if warfareBuffID == 80:  # AOE_Beacon_caustic_cloud_inertia
@@ -806,11 +823,11 @@ class Fit:
                     self.ship.boostItemAttr("maxVelocity", value, stackingPenalties=True)
 
                 if warfareBuffID == 88:  # AOE_Beacon_filament_cloud_shield_booster_shield_bonus
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Shield Operation"),
                                                    "shieldBonus", value, stackingPenalties=True)
 
                 if warfareBuffID == 89:  # AOE_Beacon_filament_cloud_shield_booster_duration
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Shield Operation"),
                                                    "duration", value, stackingPenalties=True)
 
                 # Abyssal Weather Effects
@@ -818,10 +835,10 @@ class Fit:
                 if warfareBuffID == 90:  # Weather_electric_storm_EM_resistance_penalty
                     for tankType in ("shield", "armor"):
                         self.ship.boostItemAttr("{}EmDamageResonance".format(tankType), value)
-                        self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                        self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                             "{}EmDamageResonance".format(tankType), value)
                     self.ship.boostItemAttr("emDamageResonance", value)  # for hull
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "emDamageResonance", value)  #for hull
 
                 if warfareBuffID == 92:  # Weather_electric_storm_capacitor_recharge_bonus
@@ -830,53 +847,53 @@ class Fit:
                 if warfareBuffID == 93:  # Weather_xenon_gas_explosive_resistance_penalty
                     for tankType in ("shield", "armor"):
                         self.ship.boostItemAttr("{}ExplosiveDamageResonance".format(tankType), value)
-                        self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                        self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                             "{}ExplosiveDamageResonance".format(tankType), value)
                     self.ship.boostItemAttr("explosiveDamageResonance", value)  # for hull
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "explosiveDamageResonance", value)  # for hull
 
                 if warfareBuffID == 94:  # Weather_xenon_gas_shield_hp_bonus
                     self.ship.boostItemAttr("shieldCapacity", value)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "shieldCapacity", value)
 
                 if warfareBuffID == 95:  # Weather_infernal_thermal_resistance_penalty
                     for tankType in ("shield", "armor"):
                         self.ship.boostItemAttr("{}ThermalDamageResonance".format(tankType), value)
-                        self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                        self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                             "{}ThermalDamageResonance".format(tankType), value)
                     self.ship.boostItemAttr("thermalDamageResonance", value)  # for hull
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "thermalDamageResonance", value)  # for hull
 
                 if warfareBuffID == 96:  # Weather_infernal_armor_hp_bonus
                     self.ship.boostItemAttr("armorHP", value)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "armorHP", value)
 
                 if warfareBuffID == 97:  # Weather_darkness_turret_range_penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Gunnery"),
                                                    "maxRange", value, stackingPenalties=True)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "maxRange", value, stackingPenalties=True)
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+                    self.modules.filteredItemBoost(itemRequiresSkill("Gunnery"),
                                                    "falloff", value, stackingPenalties=True)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "falloff", value, stackingPenalties=True)
 
                 if warfareBuffID == 98:  # Weather_darkness_velocity_bonus
                     self.ship.boostItemAttr("maxVelocity", value)
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "maxVelocity", value)
 
                 if warfareBuffID == 99:  # Weather_caustic_toxin_kinetic_resistance_penalty
                     for tankType in ("shield", "armor"):
                         self.ship.boostItemAttr("{}KineticDamageResonance".format(tankType), value)
-                        self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                        self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                             "{}KineticDamageResonance".format(tankType), value)
                     self.ship.boostItemAttr("kineticDamageResonance", value)  # for hull
-                    self.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"),
+                    self.drones.filteredItemBoost(itemRequiresSkill("Drones"),
                         "kineticDamageResonance", value)  # for hull
 
                 if warfareBuffID == 100:  # Weather_caustic_toxin_scan_resolution_bonus
@@ -884,10 +901,10 @@ class Fit:
 
                 if warfareBuffID == 2405:  # Insurgency Suppression Bonus: Interdiction Range
                     self.modules.filteredItemBoost(
-                        lambda mod: mod.item.requiresSkill("Navigation"),
+                        itemRequiresSkill("Navigation"),
                         "maxRange", value, stackingPenalties=True)
                     self.modules.filteredItemBoost(
-                        lambda mod: mod.item.group.name == "Stasis Web",
+                        itemGroupIs("Stasis Web"),
                         "maxRange", value, stackingPenalties=True)
 
             del self.commandBonuses[warfareBuffID]
@@ -972,57 +989,81 @@ class Fit:
             pyfalog.info("Fit is not yet calculated; will be running local calcs for {}".format(repr(self)))
             self.clear()
 
-        # Loop through our run times here. These determine which effects are run in which order.
-        for runTime in ("early", "normal", "late"):
-            # pyfalog.debug("Run time: {0}", runTime)
-            # Items that are unrestricted. These items are run on the local fit
-            # first and then projected onto the target fit it one is designated
-            u = [
-                (self.character, self.ship),
-                self.drones,
-                self.fighters,
-                self.boosters,
-                self.appliedImplants,
-                self.modules
-            ] if not self.isStructure else [
-                # Ensure a restricted set for citadels
-                (self.character, self.ship),
-                self.fighters,
-                self.modules
-            ]
-
-            # Items that are restricted. These items are only run on the local
-            # fit. They are NOT projected onto the target fit. # See issue 354
-            r = [(self.mode,), self.projectedDrones, self.projectedFighters, self.projectedModules]
-
-            # chain unrestricted and restricted into one iterable
-            c = chain.from_iterable(u + r)
-
-            for item in c:
-                # Registering the item about to affect the fit allows us to
-                # track "Affected By" relations correctly
-                if item is not None:
-                    # apply effects locally if this is first time running them on fit
-                    if not self.__calculated:
-                        self.register(item)
-                        item.calculateModifiedAttributes(self, runTime, False)
-
-                    # Run command effects against target fit. We only have to worry about modules
-                    if type == CalcType.COMMAND and item in self.modules:
-                        # Apply the gang boosts to target fit
-                        # targetFit.register(item, origin=self)
-                        item.calculateModifiedAttributes(targetFit, runTime, False, True)
-
-            # pyfalog.debug("Command Bonuses: {}".format(self.commandBonuses))
-
-            # If we are calculating our local or projected fit and have command bonuses, apply them
-            if type != CalcType.COMMAND and self.commandBonuses:
-                self.__runCommandBoosts(runTime)
-
-            # Run projection effects against target fit. Projection effects have been broken out of the main loop,
-            # see GH issue #1081
-            if type == CalcType.PROJECTED and projectionInfo:
-                self.__runProjectionEffects(runTime, targetFit, projectionInfo)
+        # Record dependencies between attributes, so that changes to the fit can be applied incrementally later.
+        # This is possible only for fits which do not interact with other fits
+        graph = None
+        if (
+            (eos.config.settings['incrementalCalc'] or self.recordCalcGraph) and
+            type == CalcType.LOCAL and targetFit is self and
+            calcGraph.state.active is None and not self.projectedFits and not self.commandFits
+        ):
+            graph = calcGraph.state.active = calcGraph.CalcGraph(self)
+
+        try:
+            # Loop through our run times here. These determine which effects are run in which order.
+            for runTime in ("early", "normal", "late"):
+                # pyfalog.debug("Run time: {0}", runTime)
+                if graph is not None:
+                    graph.setRunTime(runTime)
+                # Items that are unrestricted. These items are run on the local fit
+                # first and then projected onto the target fit it one is designated
+                u = [
+                    (self.character, self.ship),
+                    self.drones,
+                    self.fighters,
+                    self.boosters,
+                    self.appliedImplants,
+                    self.modules
+                ] if not self.isStructure else [
+                    # Ensure a restricted set for citadels
+                    (self.character, self.ship),
+                    self.fighters,
+                    self.modules
+                ]
+
+                # Items that are restricted. These items are only run on the local
+                # fit. They are NOT projected onto the target fit. # See issue 354
+                r = [(self.mode,), self.projectedDrones, self.projectedFighters, self.projectedModules]
+
+                # chain unrestricted and restricted into one iterable
+                c = chain.from_iterable(u + r)
+
+                for item in c:
+                    # Registering the item about to affect the fit allows us to
+                    # track "Affected By" relations correctly
+                    if item is not None:
+                        # apply effects locally if this is first time running them on fit
+                        if not self.__calculated:
+                            self.register(item)
+                            item.calculateModifiedAttributes(self, runTime, False)
+
+                        # Run command effects against target fit. We only have to worry about modules
+                        if type == CalcType.COMMAND and item in self.modules:
+                            # Apply the gang boosts to target fit
+                            # targetFit.register(item, origin=self)
+                            item.calculateModifiedAttributes(targetFit, runTime, False, True)
+
+                # pyfalog.debug("Command Bonuses: {}".format(self.commandBonuses))
+
+                # If we are calculating our local or projected fit and have command bonuses, apply them
+                if type != CalcType.COMMAND and self.commandBonuses:
+                    self.__runCommandBoosts(runTime)
+
+                # Run projection effects against target fit. Projection effects have been broken out of the main loop,
+                # see GH issue #1081
+                if type == CalcType.PROJECTED and projectionInfo:
+                    self.__runProjectionEffects(runTime, targetFit, projectionInfo)
+        finally:
+            if graph is not None:
+                calcGraph.state.active = None
+
+        if graph is not None:
+            # Some effects do not modify attributes but store data on fit directly, graph can't track those
+            if self.hasUntrackedEffectData():
+                graph.invalidate()
+            if graph.valid:
+                graph.finalize()
+                self.__calcGraph = graph
 
         # Recursive command ships (A <-> B) get marked as calculated, which means that they aren't recalced when changing
         # tabs. See GH issue 1193
@@ -1047,6 +1088,26 @@ class Fit:
 
         pyfalog.debug('Done with fit calculation')
 
+    def calculateModifiedAttributesIncremental(self):
+        """
+        Bring already calculated local fit up to date after state, charge or amount of some of its items has been
+        changed. Using dependency graph recorded during last full calculation, only effects which depend on the
+        change are re-run. When graph is not available or cannot handle the change, fit is calculated from scratch.
+
+        Returns:
+            True if the fit was updated incrementally, False if full calculation was needed
+        """
+        graph = self.__calcGraph
+        if graph is not None and self.__calculated:
+            self.__calcGraph = None
+            self.__clearStats()
+            if graph.update():
+                self.__calcGraph = graph
+                return True
+        self.clear()
+        self.calculateModifiedAttributes()
+        return False
+
     def __runProjectionEffects(self, runTime, targetFit, projectionInfo):
         """
         To support a simpler way of doing self projections (so that we don't have to make a copy of the fit and
@@ -93,9 +93,8 @@ class Implant(HandledItem, ItemAttrShortcut):
             return
         if not self.active:
             return
-        for effect in self.item.effects.values():
-            if effect.runTime == runTime and effect.isType("passive") and effect.activeByDefault:
-                effect.handler(fit, self, ("implant",), None, effect=effect)
+        for effect in self.item.getEffects(runTime, ("passive",)):
+            effect.handler(fit, self, ("implant",), None, effect=effect)
 
     @validates("fitID", "itemID", "active")
     def validator(self, key, val):
@@ -50,9 +50,8 @@ class Mode(ItemAttrShortcut, HandledItem):
 
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
         if self.item:
-            for effect in self.item.effects.values():
-                if effect.runTime == runTime and effect.activeByDefault:
-                    effect.handler(fit, self, ("module",), None, effect=effect)
+            for effect in self.item.getEffects(runTime):
+                effect.handler(fit, self, ("module",), None, effect=effect)
 
     def __deepcopy__(self, memo):
         copy = Mode(self.item)
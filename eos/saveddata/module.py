@@ -891,15 +891,23 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, M
             return val
 
     def clear(self):
+        self.clearCalculatedStats()
+        self.clearEffectData()
+        self.itemModifiedAttributes.clear()
+        self.chargeModifiedAttributes.clear()
+
+    def clearCalculatedStats(self):
+        """Reset stats derived from modified attributes, without touching attributes themselves"""
         self.__baseVolley = None
         self.__baseRRAmount = None
         self.__miningYield = None
         self.__miningWaste = None
+        self.__chargeCycles = None
+
+    def clearEffectData(self):
+        """Reset data effects of the module set on it directly, has to be done before they are re-run"""
         self.__reloadTime = None
         self.__reloadForce = None
-        self.__chargeCycles = None
-        self.itemModifiedAttributes.clear()
-        self.chargeModifiedAttributes.clear()
 
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False, gang=False, forcedProjRange=DEFAULT):
         # We will run the effect when two conditions are met:
@@ -920,41 +928,37 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, M
 
         projectionRange = self.projectionRange if forcedProjRange is DEFAULT else forcedProjRange
 
+        stateEffectTypes = self.__getStateEffectTypes(self.state)
+
         if self.charge is not None:
             # fix for #82 and it's regression #106
             if not projected or (self.projected and not forceProjected) or gang:
-                for effect in self.charge.effects.values():
-                    if (
-                        effect.runTime == runTime and
-                        effect.activeByDefault and (
-                            effect.isType("offline") or
-                            (effect.isType("passive") and self.state >= FittingModuleState.ONLINE) or
-                            (effect.isType("active") and self.state >= FittingModuleState.ACTIVE)) and
-                        (not gang or (gang and effect.isType("gang")))
-                    ):
-                        contexts = ("moduleCharge",)
-                        effect.handler(fit, self, contexts, projectionRange, effect=effect)
+                for effect in self.charge.getEffects(runTime, stateEffectTypes, ("gang",) if gang else ()):
+                    contexts = ("moduleCharge",)
+                    effect.handler(fit, self, contexts, projectionRange, effect=effect)
 
         if self.item:
-            if self.state >= FittingModuleState.OVERHEATED:
-                for effect in self.item.effects.values():
-                    if effect.runTime == runTime and \
-                            effect.isType("overheat") \
-                            and not forceProjected \
-                            and effect.activeByDefault \
-                            and ((gang and effect.isType("gang")) or not gang):
-                        effect.handler(fit, self, context, projectionRange, effect=effect)
-
-            for effect in self.item.effects.values():
-                if effect.runTime == runTime and \
-                        effect.activeByDefault and \
-                        (effect.isType("offline") or
-                         (effect.isType("passive") and self.state >= FittingModuleState.ONLINE) or
-                         (effect.isType("active") and self.state >= FittingModuleState.ACTIVE)) \
-                        and ((projected and effect.isType("projected")) or not projected) \
-                        and ((gang and effect.isType("gang")) or not gang):
+            if self.state >= FittingModuleState.OVERHEATED and not forceProjected:
+                for effect in self.item.getEffects(runTime, ("overheat",), ("gang",) if gang else ()):
                     effect.handler(fit, self, context, projectionRange, effect=effect)
 
+            requiredTypes = ()
+            if projected:
+                requiredTypes += ("projected",)
+            if gang:
+                requiredTypes += ("gang",)
+            for effect in self.item.getEffects(runTime, stateEffectTypes, requiredTypes):
+                effect.handler(fit, self, context, projectionRange, effect=effect)
+
+    @staticmethod
+    def __getStateEffectTypes(state):
+        """Return types of effects which are run for module in passed state"""
+        if state >= FittingModuleState.ACTIVE:
+            return "offline", "passive", "active"
+        if state >= FittingModuleState.ONLINE:
+            return "offline", "passive"
+        return "offline",
+
     def getCycleParametersForDps(self, reloadOverride=None):
         # Special hack for breachers, since those are DoT and work independently of gun cycle
         if self.isBreacher:
@@ -86,19 +86,16 @@ class Ship(ItemAttrShortcut, HandledItem):
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
         if forceProjected:
             return
-        for effect in self.item.effects.values():
-            if effect.runTime == runTime and \
-                    effect.isType("passive") and \
-                    effect.activeByDefault:
-                # Ships have effects that utilize the level of a skill as an
-                # additional operator to the modifier. These are defined in
-                # the effect itself, and these skillbooks are registered when
-                # they are provided. However, we must re-register the ship
-                # before each effect, otherwise effects that do not have
-                # skillbook modifiers will use the stale modifier value
-                # GH issue #351
-                fit.register(self)
-                effect.handler(fit, self, ("ship",), None, effect=effect)
+        for effect in self.item.getEffects(runTime, ("passive",)):
+            # Ships have effects that utilize the level of a skill as an
+            # additional operator to the modifier. These are defined in
+            # the effect itself, and these skillbooks are registered when
+            # they are provided. However, we must re-register the ship
+            # before each effect, otherwise effects that do not have
+            # skillbook modifiers will use the stale modifier value
+            # GH issue #351
+            fit.register(self)
+            effect.handler(fit, self, ("ship",), None, effect=effect)
 
     def validateModeItem(self, item, owner=None):
         """ Checks if provided item is a valid mode """
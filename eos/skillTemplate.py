@@ -0,0 +1,183 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from logbook import Logger
+
+from eos import calcGraph
+
+
+pyfalog = Logger(__name__)
+
+
+# Max amount of templates remembered per character
+TEMPLATES_PER_CHARACTER = 32
+
+# Fit item lists whose attribute dictionaries skill effects can modify
+ITEM_LISTS = ('modules', 'drones', 'fighters', 'appliedImplants', 'boosters')
+DICT_NAMES = ('itemModifiedAttributes', 'chargeModifiedAttributes')
+
+# Changes whenever effects are toggled on or off, templates recorded with
+# other revision are not used
+_revision = 0
+
+
+def invalidateTemplates():
+    """Make all recorded templates stale"""
+    global _revision
+    _revision += 1
+
+
+def getTemplateKey(fit, skills, runTime):
+    """
+    Return key of everything besides skill levels which affects what skill
+    effects do to the fit: which items fit has and where, and which skills
+    are suppressed.
+    """
+    ship = fit.ship
+    mode = fit.mode
+    return (
+        _revision, runTime, fit.isStructure,
+        getattr(getattr(ship, 'item', None), 'ID', None),
+        getattr(getattr(mode, 'item', None), 'ID', None),
+        tuple(tuple(
+            (getattr(i, 'itemID', None), getattr(i, 'chargeID', None))
+            for i in getattr(fit, listName)) for listName in ITEM_LISTS),
+        tuple(s for s in skills if s.isSuppressed()))
+
+
+def _iterDicts(fit):
+    """Yield (locator, attribute dictionary) for every dictionary skills can modify"""
+    if fit.ship is not None:
+        yield ('ship', None, 'itemModifiedAttributes'), fit.ship.itemModifiedAttributes
+    if fit.mode is not None:
+        yield ('mode', None, 'itemModifiedAttributes'), fit.mode.itemModifiedAttributes
+    for listName in ITEM_LISTS:
+        for i, item in enumerate(getattr(fit, listName)):
+            for dictName in DICT_NAMES:
+                attrDict = getattr(item, dictName, None)
+                if attrDict is not None:
+                    yield (listName, i, dictName), attrDict
+
+
+def _resolve(fit, locator):
+    listName, i, dictName = locator
+    if i is None:
+        return getattr(getattr(fit, listName), dictName)
+    return getattr(getattr(fit, listName)[i], dictName)
+
+
+class SkillTemplate:
+    """
+    Modifications skills of a character applied to a fit during one run time,
+    recorded as list of attribute dictionary operations. Replaying them onto
+    another fit with the same items gives the same result as running effect
+    handlers of every skill, without going through all the skills, their
+    effects and item filters again.
+
+    Dictionaries are remembered by their position in the fit, not as objects,
+    so template can be replayed onto any fit with the same key.
+    """
+
+    def __init__(self, operations):
+        # List of (skill, locator, operation name, args, kwargs)
+        self.operations = operations
+
+    @classmethod
+    def record(cls, fit, skills, runTime):
+        """
+        Run skill effects on the fit and record what they did. Returns
+        template, or None if effects did something template can't replay.
+        """
+        recorder = _Recorder(fit)
+        previous = calcGraph.state.active
+        calcGraph.state.active = recorder
+        try:
+            for skill in skills:
+                fit.register(skill)
+                skill.calculateModifiedAttributes(fit, runTime)
+        finally:
+            calcGraph.state.active = previous
+        if not recorder.valid:
+            pyfalog.debug("Skill effects of {} are not replayable", repr(fit))
+            return None
+        return cls(recorder.operations)
+
+    def replay(self, fit):
+        dicts = {}
+        currSkill = None
+        for skill, locator, name, args, kwargs in self.operations:
+            if skill is not currSkill:
+                fit.register(skill)
+                currSkill = skill
+            try:
+                attrDict = dicts[locator]
+            except KeyError:
+                attrDict = dicts[locator] = _resolve(fit, locator)
+            getattr(attrDict, name)(*args, **kwargs)
+
+
+class _Recorder:
+    """
+    Stands in for calculation graph while skill effects are recorded. Effects
+    which read modified attributes or do anything else besides modifying
+    attributes of fit items make the recording invalid, as result of those
+    depends on more than template key.
+    """
+
+    recordsOperations = True
+
+    def __init__(self, fit):
+        self.valid = True
+        self.operations = []
+        self.__locators = {id(d): locator for locator, d in _iterDicts(fit)}
+        self.__source = None
+        # Operations can call other operations, only outer ones are recorded
+        self.__depth = 0
+
+    def setRunTime(self, runTime):
+        pass
+
+    def setSource(self, source):
+        self.__source = source
+
+    def recordOperation(self, attrDict, method, args, kwargs):
+        if self.__depth == 0:
+            locator = self.__locators.get(id(attrDict))
+            if locator is None:
+                self.valid = False
+            else:
+                self.operations.append((self.__source, locator, method.__name__, args, kwargs))
+        self.__depth += 1
+        try:
+            return method(attrDict, *args, **kwargs)
+        finally:
+            self.__depth -= 1
+
+    def recordWrite(self, attrDict, key):
+        return True
+
+    def recordRead(self, attrDict, key):
+        self.valid = False
+
+    def recordChargeScan(self, handledList):
+        pass
+
+    def invalidate(self):
+        self.valid = False
@@ -9,6 +9,8 @@ this module.
 import math
 import sys
 
+import numpy
+
 
 # As we will be rounding numbers after operations (which introduce higher error
 # than base float representation error), we need to keep less significant
@@ -24,3 +26,17 @@ def floatUnerr(value):
     # predefined amount of significant digits
     roundFactor = int(keepDigits - math.ceil(math.log10(abs(value))))
     return round(value, roundFactor)
+
+
+def floatUnerrArray(values):
+    """Same as floatUnerr, but for numpy array of values."""
+    values = numpy.asarray(values, dtype=float)
+    result = values.copy()
+    # Values too small for scale to be representable are left intact, as
+    # rounding error is way below anything noticeable for them anyway
+    mask = (numpy.abs(values) > 1e-290) & numpy.isfinite(values)
+    if mask.any():
+        roundFactors = keepDigits - numpy.ceil(numpy.log10(numpy.abs(values[mask])))
+        scales = 10.0 ** roundFactors
+        result[mask] = numpy.round(values[mask] * scales) / scales
+    return result
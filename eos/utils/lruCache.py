@@ -0,0 +1,104 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+
+CacheStats = namedtuple('CacheStats', ('hits', 'misses', 'evictions', 'size', 'maxSize'))
+
+_missing = object()
+
+
+class LRUCache:
+    """
+    Dictionary-like cache which keeps at most maxSize entries, dropping least
+    recently used ones when it is full. maxSize of None means no limit. Keeps
+    counters of hits, misses and evictions. Safe to use from multiple threads.
+
+    onEvict, if set, is called with key and value of every dropped entry; it
+    is called with cache locked, so it must not use the cache.
+    """
+
+    def __init__(self, maxSize=None, onEvict=None):
+        self.__maxSize = maxSize
+        self.__onEvict = onEvict
+        self.__data = OrderedDict()
+        self.__lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxSize(self):
+        return self.__maxSize
+
+    @maxSize.setter
+    def maxSize(self, maxSize):
+        with self.__lock:
+            self.__maxSize = maxSize
+            self.__evict()
+
+    def get(self, key, default=None):
+        with self.__lock:
+            value = self.__data.get(key, _missing)
+            if value is _missing:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.__data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.__lock:
+            self.__data[key] = value
+            self.__data.move_to_end(key)
+            self.__evict()
+
+    def pop(self, key, default=None):
+        with self.__lock:
+            return self.__data.pop(key, default)
+
+    def clear(self):
+        with self.__lock:
+            self.__data.clear()
+
+    def resetStats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def getStats(self):
+        return CacheStats(
+            hits=self.hits, misses=self.misses, evictions=self.evictions,
+            size=len(self.__data), maxSize=self.__maxSize)
+
+    def __evict(self):
+        if self.__maxSize is None:
+            return
+        while len(self.__data) > self.__maxSize:
+            key, value = self.__data.popitem(last=False)
+            self.evictions += 1
+            if self.__onEvict is not None:
+                self.__onEvict(key, value)
+
+    def __contains__(self, key):
+        return key in self.__data
+
+    def __len__(self):
+        return len(self.__data)
@@ -0,0 +1,235 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import re
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+
+SearchEntry = namedtuple('SearchEntry', ('ID', 'name', 'typeName', 'groupName', 'categoryName', 'published'))
+
+# Symbols which make preceding one optional
+_optionalQuantifiers = frozenset('*?{')
+# Symbols which have special meaning in regular expressions and cannot be
+# part of literal substring
+_specialChars = frozenset('.^$+*?{}()|[]')
+
+
+@lru_cache(maxsize=500)
+def _compileToken(token):
+    try:
+        return re.compile(token, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def _isFoldable(char):
+    # Lowercase form of some characters differs from what case-insensitive
+    # regex search matches against, do not rely on those
+    lowered = char.lower()
+    return len(lowered) == 1 and lowered == char.casefold()
+
+
+def _splitAlternatives(token):
+    """
+    Split token into alternatives if it's jargon-style (alt1|alt2) group,
+    return None if it has any other kind of grouping we do not parse.
+    """
+    body = token
+    if token.startswith('(') and token.endswith(')'):
+        body = token[1:-1]
+    alternatives = []
+    current = ''
+    escaped = False
+    for char in body:
+        if escaped:
+            current += char
+            escaped = False
+        elif char == '\\':
+            current += char
+            escaped = True
+        elif char in '()':
+            return None
+        elif char == '|':
+            alternatives.append(current)
+            current = ''
+        else:
+            current += char
+    alternatives.append(current)
+    if len(alternatives) > 1 and body is token:
+        return None
+    return alternatives
+
+
+def _getLiteralRuns(pattern):
+    """
+    Return list of substrings any string matching regex pattern has to
+    contain, or None if pattern uses constructs we do not parse.
+    """
+    runs = []
+    current = []
+    i = 0
+    length = len(pattern)
+    while i < length:
+        char = pattern[i]
+        if char == '\\':
+            if i + 1 >= length:
+                return None
+            nextChar = pattern[i + 1]
+            i += 2
+            # Character classes like \w, \d, \b
+            if nextChar.isalnum():
+                runs.append(''.join(current))
+                current = []
+                continue
+            literal = nextChar
+        elif char == '[':
+            return None
+        elif char in _specialChars:
+            i += 1
+            # Skip repetition counts
+            if char == '{':
+                closing = pattern.find('}', i)
+                if closing == -1:
+                    return None
+                i = closing + 1
+            if char in _optionalQuantifiers and current:
+                current.pop()
+            runs.append(''.join(current))
+            current = []
+            continue
+        else:
+            literal = char
+            i += 1
+        # Literal followed by quantifier which makes it optional
+        if i < length and pattern[i] in _optionalQuantifiers:
+            runs.append(''.join(current))
+            current = []
+            continue
+        if not _isFoldable(literal):
+            runs.append(''.join(current))
+            current = []
+            continue
+        current.append(literal.lower())
+    runs.append(''.join(current))
+    return [r for r in runs if r]
+
+
+def _getTrigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    In-memory index over item names, answering regex token searches the way
+    SQLite regexp search did: item matches if every token matches somewhere
+    in its name, case-insensitively. Literal parts of tokens (including every
+    alternative of jargon-expanded tokens) are looked up in trigram index to
+    get candidates, so that regexes are run only against few names.
+    """
+
+    def __init__(self, entries):
+        self.__entries = []
+        # {trigram: array of entry positions}
+        self.__trigrams = {}
+        for entry in sorted(entries, key=lambda e: e.ID):
+            if not entry.name:
+                continue
+            position = len(self.__entries)
+            self.__entries.append(entry)
+            for trigram in _getTrigrams(entry.name.lower()):
+                try:
+                    self.__trigrams[trigram].append(position)
+                except KeyError:
+                    self.__trigrams[trigram] = array('I', (position,))
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def search(self, tokens, filters=None, forcePublished=None, limit=None):
+        """
+        Return sorted IDs of items matching all regex tokens.
+
+        filters: list of (category names, group names) pairs; if passed, only
+        items whose category or group is in any of the pairs are returned.
+        forcePublished: {typeName: published} overrides of items' publicity;
+        if passed, only published items are returned.
+        """
+        patterns = []
+        for token in tokens:
+            pattern = _compileToken(token)
+            # Broken regex never matched anything in database either
+            if pattern is None:
+                return []
+            patterns.append(pattern)
+        candidates = None
+        for token in tokens:
+            tokenCandidates = self.__getCandidates(token)
+            if tokenCandidates is None:
+                continue
+            if candidates is None:
+                candidates = tokenCandidates
+            else:
+                candidates = candidates.intersection(tokenCandidates)
+            if not candidates:
+                return []
+        positions = range(len(self.__entries)) if candidates is None else sorted(candidates)
+        entries = self.__entries
+        results = []
+        for position in positions:
+            entry = entries[position]
+            if filters is not None and not any(
+                entry.categoryName in categories or entry.groupName in groups
+                for categories, groups in filters
+            ):
+                continue
+            if forcePublished is not None and not forcePublished.get(entry.typeName, entry.published):
+                continue
+            if not all(p.search(entry.name) for p in patterns):
+                continue
+            results.append(entry.ID)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def __getCandidates(self, token):
+        """Return set of positions of entries which may match token, or None if any may"""
+        alternatives = _splitAlternatives(token)
+        if alternatives is None:
+            return None
+        candidates = set()
+        for alternative in alternatives:
+            runs = _getLiteralRuns(alternative)
+            if runs is None:
+                return None
+            trigrams = set()
+            for run in runs:
+                trigrams.update(_getTrigrams(run))
+            if not trigrams:
+                return None
+            postings = sorted((self.__trigrams.get(t, ()) for t in trigrams), key=len)
+            altCandidates = set(postings[0])
+            for posting in postings[1:]:
+                if not altCandidates:
+                    break
+                altCandidates.intersection_update(posting)
+            candidates.update(altCandidates)
+        return candidates
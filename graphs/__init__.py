@@ -18,5 +18,13 @@
 # =============================================================================
 
 
-from .gui.canvasPanel import graphFrame_enabled
-from .gui.frame import GraphFrame
+def __getattr__(name):
+    # GUI is imported on first use: main frame imports graph frame while being
+    # imported itself, and graph calculations have to be usable without GUI
+    if name == 'GraphFrame':
+        from .gui.frame import GraphFrame
+        return GraphFrame
+    if name == 'graphFrame_enabled':
+        from .gui.canvasPanel import graphFrame_enabled
+        return graphFrame_enabled
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
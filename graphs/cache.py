@@ -0,0 +1,144 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+import heapq
+from bisect import bisect_right
+from itertools import repeat
+
+from eos.utils.float import floatUnerr
+from eos.utils.lruCache import LRUCache
+
+
+class PlotCache:
+    """
+    Calculated graph data, keyed by everything it was calculated from. Every
+    entry is tagged with things it depends on, like fits, target profiles and
+    graph settings, so that a change of something removes only data which
+    depends on it. Keeps at most maxSize entries, dropping least recently
+    used ones.
+    """
+
+    def __init__(self, maxSize):
+        # Format: {key: (value, tags)}
+        self.__data = LRUCache(maxSize, onEvict=self.__untag)
+        # Format: {tag: {key, ...}}
+        self.__taggedKeys = {}
+
+    def get(self, key, default=None):
+        entry = self.__data.get(key)
+        if entry is None:
+            return default
+        return entry[0]
+
+    def set(self, key, value, tags):
+        self.pop(key)
+        for tag in tags:
+            self.__taggedKeys.setdefault(tag, set()).add(key)
+        self.__data.set(key, (value, tuple(tags)))
+
+    def pop(self, key):
+        entry = self.__data.pop(key)
+        if entry is not None:
+            self.__untag(key, entry)
+
+    def invalidate(self, tag):
+        """Remove all entries tagged with tag"""
+        for key in self.__taggedKeys.pop(tag, ()):
+            self.pop(key)
+
+    def clear(self):
+        self.__data.clear()
+        self.__taggedKeys.clear()
+
+    def __untag(self, key, entry):
+        for tag in entry[1]:
+            keys = self.__taggedKeys.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self.__taggedKeys[tag]
+
+    def __contains__(self, key):
+        return key in self.__data
+
+    def __len__(self):
+        return len(self.__data)
+
+
+class TimeSeries:
+    """
+    Values of multiple keys changing over time. Stored as columns: per key,
+    sorted list of times when its value changes and list of values it changes
+    to. Value of a key stays the same until its next change.
+    """
+
+    def __init__(self):
+        self.__times = {}
+        # Rounded times, used for lookups
+        self.__unerrTimes = {}
+        self.__values = {}
+
+    def add(self, key, time, value):
+        """Set value of key since specified time; changes of each key have to be added in time order."""
+        times = self.__times.setdefault(key, [])
+        values = self.__values.setdefault(key, [])
+        if times and times[-1] == time:
+            values[-1] = value
+            return
+        times.append(time)
+        self.__unerrTimes.setdefault(key, []).append(floatUnerr(time))
+        values.append(value)
+
+    def getLast(self, key, default=None):
+        """Return latest value of key."""
+        values = self.__values.get(key)
+        if not values:
+            return default
+        return values[-1]
+
+    def getPoint(self, time):
+        """Return values all keys have at specified time in {key: value} format."""
+        time = floatUnerr(time)
+        data = {}
+        for key, unerrTimes in self.__unerrTimes.items():
+            index = bisect_right(unerrTimes, time)
+            if index:
+                data[key] = self.__values[key][index - 1]
+        return data
+
+    def iterPoints(self):
+        """
+        Iterate over (time, {key: value}) pairs for every time when value of
+        any key changes, in time order. Single dictionary is updated and
+        yielded on each step, so references to it should not be kept.
+        """
+        keys = list(self.__times)
+        # Key index is there to never compare keys or values on equal times
+        columns = [zip(self.__times[k], repeat(i), self.__values[k]) for i, k in enumerate(keys)]
+        data = {}
+        prevTime = None
+        for time, keyIndex, value in heapq.merge(*columns):
+            if prevTime is not None and time != prevTime:
+                yield prevTime, data
+            data[keys[keyIndex]] = value
+            prevTime = time
+        if prevTime is not None:
+            yield prevTime, data
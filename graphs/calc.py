@@ -18,6 +18,8 @@
 # =============================================================================
 
 
+import numpy
+
 from service.settings import GraphSettings
 
 
@@ -35,3 +37,17 @@ def checkDroneControlRange(src, distance):
     if GraphSettings.getInstance().get('ignoreDCR'):
         return True
     return distance <= src.item.extraAttributes['droneControlRange']
+
+
+def checkLockRangeArray(src, distances, size):
+    """Same as checkLockRange, but for numpy array of distances"""
+    if distances is None or GraphSettings.getInstance().get('ignoreLockRange'):
+        return numpy.ones(size, dtype=bool)
+    return distances <= src.item.maxTargetRange
+
+
+def checkDroneControlRangeArray(src, distances, size):
+    """Same as checkDroneControlRange, but for numpy array of distances"""
+    if distances is None or GraphSettings.getInstance().get('ignoreDCR'):
+        return numpy.ones(size, dtype=bool)
+    return distances <= src.item.extraAttributes['droneControlRange']
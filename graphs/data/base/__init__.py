@@ -17,6 +17,7 @@
 # along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
 # =============================================================================
 
+from graphs.cache import PlotCache, TimeSeries
 from .cache import FitDataCache
 from .defs import XDef, YDef, VectorDef, Input, InputCheckbox
 from .getter import PointGetter, SmoothPointGetter
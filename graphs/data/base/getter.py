@@ -21,6 +21,8 @@
 import math
 from abc import ABCMeta, abstractmethod
 
+from graphs.worker import checkCancelled
+
 
 class PointGetter(metaclass=ABCMeta):
 
@@ -42,33 +44,40 @@ class SmoothPointGetter(PointGetter, metaclass=ABCMeta):
     _extraDepth = 0
 
     def getRange(self, xRange, miscParams, src, tgt):
-        xs = []
-        ys = []
         commonData = self._getCommonData(miscParams=miscParams, src=src, tgt=tgt)
-
-        def addExtraPoints(x1, y1, x2, y2, depth):
-            if depth <= 0 or y1 == y2:
-                return
-            newX = (x1 + x2) / 2
-            newY = self._calculatePoint(x=newX, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
-            addExtraPoints(x1=prevX, y1=prevY, x2=newX, y2=newY, depth=depth - 1)
-            xs.append(newX)
-            ys.append(newY)
-            addExtraPoints(x1=newX, y1=newY, x2=x2, y2=y2, depth=depth - 1)
-
-        prevX = None
-        prevY = None
         # Go through X points defined by our resolution setting
-        for x in self._xIterLinear(xRange):
-            y = self._calculatePoint(x=x, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
-            if prevX is not None and prevY is not None:
-                # And if Y values of adjacent data points are not equal, add extra points
-                # depending on extra depth setting
-                addExtraPoints(x1=prevX, y1=prevY, x2=x, y2=y, depth=self._extraDepth)
-            prevX = x
-            prevY = y
-            xs.append(x)
-            ys.append(y)
+        xs = list(self._xIterLinear(xRange))
+        ys = list(self._calculateRange(xs=xs, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData))
+        # And if Y values of adjacent data points are not equal, add extra points
+        # depending on extra depth setting. Points of every depth level are
+        # calculated in one go, to make use of getters which process arrays
+        # Flags show if segment to the right of the point can be split further
+        splittable = [True] * len(xs)
+        for depth in range(self._extraDepth):
+            checkCancelled()
+            splitIndices = [
+                i for i in range(len(xs) - 1)
+                if splittable[i] and ys[i] != ys[i + 1]]
+            if not splitIndices:
+                break
+            newXs = [(xs[i] + xs[i + 1]) / 2 for i in splitIndices]
+            newYs = self._calculateRange(xs=newXs, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+            newPoints = dict(zip(splitIndices, zip(newXs, newYs)))
+            mergedXs = []
+            mergedYs = []
+            mergedSplittable = []
+            for i in range(len(xs)):
+                mergedXs.append(xs[i])
+                mergedYs.append(ys[i])
+                if i in newPoints:
+                    newX, newY = newPoints[i]
+                    mergedSplittable.append(True)
+                    mergedXs.append(newX)
+                    mergedYs.append(newY)
+                    mergedSplittable.append(True)
+                else:
+                    mergedSplittable.append(False)
+            xs, ys, splittable = mergedXs, mergedYs, mergedSplittable
         return xs, ys
 
     def getPoint(self, x, miscParams, src, tgt):
@@ -90,6 +99,17 @@ class SmoothPointGetter(PointGetter, metaclass=ABCMeta):
     def _getCommonData(self, miscParams, src, tgt):
         return {}
 
+    def _calculateRange(self, xs, miscParams, src, tgt, commonData):
+        """
+        Calculate Y values for list of X values. Getters which can process
+        all the values at once with numpy override this.
+        """
+        ys = []
+        for x in xs:
+            checkCancelled()
+            ys.append(self._calculatePoint(x=x, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData))
+        return ys
+
     @abstractmethod
     def _calculatePoint(self, x, miscParams, src, tgt, commonData):
         raise NotImplementedError
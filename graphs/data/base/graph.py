@@ -23,9 +23,15 @@ from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 
 from eos.utils.float import floatUnerr
+from graphs.cache import PlotCache
 from service.const import GraphCacheCleanupReason
 
 
+# Max amount of plot lines and of X mark values graph keeps in its cache
+PLOT_CACHE_SIZE = 500
+POINT_CACHE_SIZE = 2000
+
+
 class FitGraph(metaclass=ABCMeta):
 
     # UI stuff
@@ -39,10 +45,10 @@ class FitGraph(metaclass=ABCMeta):
         FitGraph.viewMap[cls.internalName] = cls
 
     def __init__(self):
-        # Format: {(fit ID, target type, target ID): {(xSpec, ySpec): (xs, ys)}}
-        self._plotCache = {}
-        # Format: {(fit ID, target type, target ID): {(xSpec, ySpec): {x: y}}}
-        self._pointCache = {}
+        # Format: {(fit ID, target type, target ID, target resist mode, xSpec, ySpec, main input, misc inputs): (xs, ys)}
+        self._plotCache = PlotCache(PLOT_CACHE_SIZE)
+        # Format: {(fit ID, target type, target ID, target resist mode, xSpec, ySpec, x, misc inputs): y}
+        self._pointCache = PlotCache(POINT_CACHE_SIZE)
 
     @property
     @abstractmethod
@@ -92,65 +98,72 @@ class FitGraph(metaclass=ABCMeta):
     srcExtraCols = ()
     tgtExtraCols = ()
     usesHpEffectivity = False
+    # Graphs whose calculation only reads fits can be calculated in worker
+    # threads, in parallel for different source fits
+    threadSafe = True
+    # Graph settings calculation results depend on
+    usedSettings = ()
 
     def getPlotPoints(self, mainInput, miscInputs, xSpec, ySpec, src, tgt=None):
-        cacheKey = self._makeCacheKey(src=src, tgt=tgt)
-        try:
-            plotData = self._plotCache[cacheKey][(ySpec, xSpec)]
-        except KeyError:
-            plotData = self._calcPlotPoints(
+        plotData = self.getCachedPlotPoints(mainInput=mainInput, miscInputs=miscInputs, xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
+        if plotData is None:
+            plotData = self.calcPlotPoints(
                 mainInput=mainInput, miscInputs=miscInputs,
                 xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
-            self._plotCache.setdefault(cacheKey, {})[(ySpec, xSpec)] = plotData
+            self.cachePlotPoints(plotData=plotData, mainInput=mainInput, miscInputs=miscInputs, xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
         return plotData
 
     def getPoint(self, x, miscInputs, xSpec, ySpec, src, tgt=None):
-        cacheKey = self._makeCacheKey(src=src, tgt=tgt)
-        try:
-            y = self._pointCache[cacheKey][(ySpec, xSpec)][x]
-        except KeyError:
-            y = self._calcPoint(x=x, miscInputs=miscInputs, xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
-            self._pointCache.setdefault(cacheKey, {}).setdefault((ySpec, xSpec), {})[x] = y
+        y = self.getCachedPoint(x=x, miscInputs=miscInputs, xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
+        if y is None:
+            y = self.calcPoint(x=x, miscInputs=miscInputs, xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
+            self.cachePoint(y=y, x=x, miscInputs=miscInputs, xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
         return y
 
+    # Calculation and caching separately, for calculations done in worker
+    # threads: workers only calculate, caches are touched only by GUI thread
+    def calcPlotPoints(self, mainInput, miscInputs, xSpec, ySpec, src, tgt=None):
+        return self._calcPlotPoints(
+            mainInput=mainInput, miscInputs=miscInputs,
+            xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
+
+    def calcPoint(self, x, miscInputs, xSpec, ySpec, src, tgt=None):
+        return self._calcPoint(x=x, miscInputs=miscInputs, xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
+
+    def getCachedPlotPoints(self, mainInput, miscInputs, xSpec, ySpec, src, tgt=None):
+        cacheKey = self._makeCacheKey(src=src, tgt=tgt) + (xSpec, ySpec, self._makeInputKey(mainInput), self._makeInputsKey(miscInputs))
+        return self._plotCache.get(cacheKey)
+
+    def cachePlotPoints(self, plotData, mainInput, miscInputs, xSpec, ySpec, src, tgt=None):
+        cacheKey = self._makeCacheKey(src=src, tgt=tgt) + (xSpec, ySpec, self._makeInputKey(mainInput), self._makeInputsKey(miscInputs))
+        self._plotCache.set(cacheKey, plotData, self._makeCacheTags(src=src, tgt=tgt))
+
+    def getCachedPoint(self, x, miscInputs, xSpec, ySpec, src, tgt=None):
+        cacheKey = self._makeCacheKey(src=src, tgt=tgt) + (xSpec, ySpec, x, self._makeInputsKey(miscInputs))
+        return self._pointCache.get(cacheKey)
+
+    def cachePoint(self, y, x, miscInputs, xSpec, ySpec, src, tgt=None):
+        cacheKey = self._makeCacheKey(src=src, tgt=tgt) + (xSpec, ySpec, x, self._makeInputsKey(miscInputs))
+        self._pointCache.set(cacheKey, y, self._makeCacheTags(src=src, tgt=tgt))
+
     def clearCache(self, reason, extraData=None):
-        caches = (self._plotCache, self._pointCache)
-        plotKeysToClear = set()
-        # If fit changed - clear plots which concern this fit
+        # Inputs, axes and target resist mode are parts of cache keys, so
+        # changes of those do not make any cached data invalid
+        tags = ()
         if reason in (GraphCacheCleanupReason.fitChanged, GraphCacheCleanupReason.fitRemoved):
-            for cache in caches:
-                for cacheKey in cache:
-                    cacheFitID, cacheTgtType, cacheTgtID = cacheKey
-                    if extraData == cacheFitID:
-                        plotKeysToClear.add(cacheKey)
-                    elif cacheTgtType == 'fit' and extraData == cacheTgtID:
-                        plotKeysToClear.add(cacheKey)
-        # Same for profile
+            tags = (('fit', extraData),)
         elif reason in (GraphCacheCleanupReason.profileChanged, GraphCacheCleanupReason.profileRemoved):
-            for cache in caches:
-                for cacheKey in cache:
-                    cacheFitID, cacheTgtType, cacheTgtID = cacheKey
-                    if cacheTgtType == 'profile' and extraData == cacheTgtID:
-                        plotKeysToClear.add(cacheKey)
-        # Target fit resist mode changed
-        elif reason == GraphCacheCleanupReason.resistModeChanged:
-            for cache in caches:
-                for cacheKey in cache:
-                    cacheFitID, cacheTgtType, cacheTgtID = cacheKey
-                    if cacheTgtType == 'fit' and extraData == cacheTgtID:
-                        plotKeysToClear.add(cacheKey)
-        # Wipe out whole plot cache otherwise
-        else:
-            for cache in caches:
-                for cacheKey in cache:
-                    plotKeysToClear.add(cacheKey)
-        # Do actual cleanup
-        for cache in caches:
-            for cacheKey in plotKeysToClear:
-                try:
-                    del cache[cacheKey]
-                except KeyError:
-                    pass
+            tags = (('profile', extraData),)
+        # Clear data which depends on changed setting, or on any setting
+        # if we do not know which one changed
+        elif reason == GraphCacheCleanupReason.optionChanged:
+            if extraData is None:
+                tags = tuple(('setting', s) for s in self.usedSettings)
+            elif extraData in self.usedSettings:
+                tags = (('setting', extraData),)
+        for cache in (self._plotCache, self._pointCache):
+            for tag in tags:
+                cache.invalidate(tag)
         # Process any internal caches graphs might have
         self._clearInternalCache(reason, extraData)
 
@@ -158,15 +171,46 @@ class FitGraph(metaclass=ABCMeta):
         if tgt is not None and tgt.isFit:
             tgtType = 'fit'
             tgtItemID = tgt.item.ID
+            tgtResistMode = tgt.resistMode
         elif tgt is not None and tgt.isProfile:
             tgtType = 'profile'
             tgtItemID = tgt.item.ID
+            tgtResistMode = None
         else:
             tgtType = None
             tgtItemID = None
-        cacheKey = (src.item.ID, tgtType, tgtItemID)
+            tgtResistMode = None
+        cacheKey = (src.item.ID, tgtType, tgtItemID, tgtResistMode)
         return cacheKey
 
+    def _makeCacheTags(self, src, tgt):
+        tags = [('fit', src.item.ID)]
+        if tgt is not None and tgt.isFit:
+            tags.append(('fit', tgt.item.ID))
+        elif tgt is not None and tgt.isProfile:
+            tags.append(('profile', tgt.item.ID))
+        tags.extend(('setting', s) for s in self.usedSettings)
+        return tags
+
+    @staticmethod
+    def _makeInputKey(inputData):
+        # Round float errors away, so that the same value entered differently
+        # does not make a new cache entry
+        def normalize(value):
+            if isinstance(value, float) and math.isfinite(value):
+                return floatUnerr(value)
+            return value
+
+        value = inputData.value
+        if isinstance(value, (tuple, list)):
+            value = tuple(normalize(v) for v in value)
+        else:
+            value = normalize(value)
+        return inputData.handle, inputData.unit, value
+
+    def _makeInputsKey(self, inputs):
+        return tuple(sorted((self._makeInputKey(i) for i in inputs), key=lambda k: (k[0], k[1] or '')))
+
     def _clearInternalCache(self, reason, extraData):
         return
 
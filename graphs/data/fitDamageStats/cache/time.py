@@ -18,162 +18,138 @@
 # =============================================================================
 
 
-from copy import copy
-
 from eos.utils.float import floatUnerr
 from eos.utils.spoolSupport import SpoolOptions, SpoolType
 from eos.utils.stats import DmgTypes
-from graphs.data.base import FitDataCache
+from graphs.data.base import FitDataCache, TimeSeries
 
 
 class TimeCache(FitDataCache):
 
     # Whole data getters
     def getDpsData(self, src):
-        """Return DPS data in {time: {key: dps}} format."""
-        return self._data[src.item.ID]['finalDps']
+        """Return DPS data as TimeSeries of {key: dps}."""
+        return self._data[src.item.ID]['dps']
 
     def getVolleyData(self, src):
-        """Return volley data in {time: {key: volley}} format."""
-        return self._data[src.item.ID]['finalVolley']
+        """Return volley data as TimeSeries of {key: volley}."""
+        return self._data[src.item.ID]['volley']
 
     def getDmgData(self, src):
-        """Return inflicted damage data in {time: {key: damage}} format."""
-        return self._data[src.item.ID]['finalDmg']
+        """Return inflicted damage data as TimeSeries of {key: damage}."""
+        return self._data[src.item.ID]['dmg']
 
     # Specific data point getters
     def getDpsDataPoint(self, src, time):
         """Get DPS data by specified time in {key: dps} format."""
-        return self._getDataPoint(src=src, time=time, dataFunc=self.getDpsData)
+        return self.getDpsData(src).getPoint(time)
 
     def getVolleyDataPoint(self, src, time):
         """Get volley data by specified time in {key: volley} format."""
-        return self._getDataPoint(src=src, time=time, dataFunc=self.getVolleyData)
+        return self.getVolleyData(src).getPoint(time)
 
     def getDmgDataPoint(self, src, time):
         """Get inflicted damage data by specified time in {key: dmg} format."""
-        return self._getDataPoint(src=src, time=time, dataFunc=self.getDmgData)
+        return self.getDmgData(src).getPoint(time)
 
     # Preparation functions
     def prepareDpsData(self, src, maxTime):
-        self._prepareDpsVolleyData(src=src, maxTime=maxTime)
+        self._prepareData(src=src, maxTime=maxTime)
 
     def prepareVolleyData(self, src, maxTime):
-        self._prepareDpsVolleyData(src=src, maxTime=maxTime)
+        self._prepareData(src=src, maxTime=maxTime)
 
     def prepareDmgData(self, src, maxTime):
-        # Time is none means that time parameter has to be ignored,
-        # we do not need cache for that
-        if maxTime is None:
-            return
-        self._generateInternalForm(src=src, maxTime=maxTime)
-        fitCache = self._data[src.item.ID]
-        # Final cache has been generated already, don't do anything
-        if 'finalDmg' in fitCache:
-            return
-        intCache = fitCache['internalDmg']
-        changesByTime = {}
-        for key, dmgMap in intCache.items():
-            for time in dmgMap:
-                changesByTime.setdefault(time, []).append(key)
-        # Here we convert cache to following format:
-        # {time: {key: damage done by key at this time}}
-        finalCache = fitCache['finalDmg'] = {}
-        timeDmgData = {}
-        for time in sorted(changesByTime):
-            timeDmgData = copy(timeDmgData)
-            for key in changesByTime[time]:
-                keyDmg = intCache[key][time]
-                if key in timeDmgData:
-                    timeDmgData[key] = timeDmgData[key] + keyDmg
-                else:
-                    timeDmgData[key] = keyDmg
-            finalCache[time] = timeDmgData
-        # We do not need internal cache once we have final
-        del fitCache['internalDmg']
+        self._prepareData(src=src, maxTime=maxTime)
 
     # Private stuff
-    def _prepareDpsVolleyData(self, src, maxTime):
+    def _prepareData(self, src, maxTime):
         # Time is none means that time parameter has to be ignored,
         # we do not need cache for that
         if maxTime is None:
-            return True
-        self._generateInternalForm(src=src, maxTime=maxTime)
-        fitCache = self._data[src.item.ID]
-        # Final cache has been generated already, don't do anything
-        if 'finalDps' in fitCache and 'finalVolley' in fitCache:
             return
-        # Convert cache from segments with assigned values into points
-        # which are located at times when dps/volley values change
-        pointCache = {}
-        for key, dmgList in fitCache['internalDpsVolley'].items():
-            pointData = pointCache[key] = {}
-            prevDps = None
-            prevVolley = None
-            prevTimeEnd = None
-            for timeStart, timeEnd, dps, volley in dmgList:
-                # First item
-                if not pointData:
-                    pointData[timeStart] = (dps, volley)
-                # Gap between items
-                elif floatUnerr(prevTimeEnd) < floatUnerr(timeStart):
-                    pointData[prevTimeEnd] = (DmgTypes.default(), DmgTypes.default())
-                    pointData[timeStart] = (dps, volley)
-                # Changed value
-                elif dps != prevDps or volley != prevVolley:
-                    pointData[timeStart] = (dps, volley)
-                prevDps = dps
-                prevVolley = volley
-                prevTimeEnd = timeEnd
-        # We have data in another form, do not need old one any longer
-        del fitCache['internalDpsVolley']
-        changesByTime = {}
-        for key, dmgMap in pointCache.items():
-            for time in dmgMap:
-                changesByTime.setdefault(time, []).append(key)
-        # Here we convert cache to following format:
-        # {time: {key: (dps, volley}}
-        finalDpsCache = fitCache['finalDps'] = {}
-        finalVolleyCache = fitCache['finalVolley'] = {}
-        timeDpsData = {}
-        timeVolleyData = {}
-        for time in sorted(changesByTime):
-            timeDpsData = copy(timeDpsData)
-            timeVolleyData = copy(timeVolleyData)
-            for key in changesByTime[time]:
-                dps, volley = pointCache[key][time]
-                timeDpsData[key] = dps
-                timeVolleyData[key] = volley
-            finalDpsCache[time] = timeDpsData
-            finalVolleyCache[time] = timeVolleyData
-
-    def _generateInternalForm(self, src, maxTime):
-        if self._isTimeCacheValid(src=src, maxTime=maxTime):
+        try:
+            fitCache = self._data[src.item.ID]
+        except KeyError:
+            fitCache = self._data[src.item.ID] = {
+                'maxTime': None,
+                # [key, cycle iterator, start time of last generated cycle]
+                'sources': [[k, c, None] for k, c in self._iterSourceCycles(src=src)],
+                # {key: (dps, volley, end time) of last generated cycle}
+                'lastCycles': {},
+                'dps': TimeSeries(),
+                'volley': TimeSeries(),
+                'dmg': TimeSeries()}
+        # Cache is generated up to requested time already
+        if fitCache['maxTime'] is not None and maxTime <= fitCache['maxTime']:
             return
-        fitCache = self._data[src.item.ID] = {'maxTime': maxTime}
-        intCacheDpsVolley = fitCache['internalDpsVolley'] = {}
-        intCacheDmg = fitCache['internalDmg'] = {}
-
-        def addDpsVolley(ddKey, addedTimeStart, addedTimeFinish, addedVolleys):
-            if not addedVolleys:
-                return
-            volleySum = sum(addedVolleys, DmgTypes.default())
-            if volleySum.total > 0:
-                addedDps = volleySum / (addedTimeFinish - addedTimeStart)
-                # We can take "just best" volley, no matter target resistances, because all
-                # known items have the same damage type ratio throughout their cycle - and
-                # applying resistances doesn't change final outcome
-                bestVolley = max(addedVolleys, key=lambda v: v.total)
-                ddCacheDps = intCacheDpsVolley.setdefault(ddKey, [])
-                ddCacheDps.append((addedTimeStart, addedTimeFinish, addedDps, bestVolley))
-
-        def addDmg(ddKey, addedTime, addedDmg):
-            if addedDmg.total == 0:
-                return
-            addedDmg._breachers = {addedTime + k: v for k, v in addedDmg._breachers.items()}
-            addedDmg._clear_cached()
-            intCacheDmg.setdefault(ddKey, {})[addedTime] = addedDmg
-
+        fitCache['maxTime'] = maxTime
+        # Data is generated lazily - only as far as it was requested. Cycles
+        # which start after requested time are kept unconsumed in iterators
+        # until longer time is requested
+        for source in fitCache['sources']:
+            key, cycles, lastCycleStart = source
+            while lastCycleStart is None or lastCycleStart <= maxTime:
+                try:
+                    cycleStart, timeStart, timeFinish, volleys = next(cycles)
+                except StopIteration:
+                    break
+                for time, volley in volleys:
+                    self._addDmg(fitCache=fitCache, key=key, time=time, dmg=volley)
+                self._addDpsVolley(
+                    fitCache=fitCache, key=key, timeStart=timeStart, timeFinish=timeFinish,
+                    volleys=[v for t, v in volleys])
+                lastCycleStart = cycleStart
+            source[2] = lastCycleStart
+
+    @staticmethod
+    def _addDpsVolley(fitCache, key, timeStart, timeFinish, volleys):
+        if not volleys:
+            return
+        volleySum = sum(volleys, DmgTypes.default())
+        if volleySum.total <= 0:
+            return
+        dps = volleySum / (timeFinish - timeStart)
+        # We can take "just best" volley, no matter target resistances, because all
+        # known items have the same damage type ratio throughout their cycle - and
+        # applying resistances doesn't change final outcome
+        volley = max(volleys, key=lambda v: v.total)
+        dpsData = fitCache['dps']
+        volleyData = fitCache['volley']
+        # Store only points where dps/volley values change
+        try:
+            prevDps, prevVolley, prevTimeEnd = fitCache['lastCycles'][key]
+        # First item
+        except KeyError:
+            dpsData.add(key, timeStart, dps)
+            volleyData.add(key, timeStart, volley)
+        else:
+            # Gap between items
+            if floatUnerr(prevTimeEnd) < floatUnerr(timeStart):
+                dpsData.add(key, prevTimeEnd, DmgTypes.default())
+                volleyData.add(key, prevTimeEnd, DmgTypes.default())
+                dpsData.add(key, timeStart, dps)
+                volleyData.add(key, timeStart, volley)
+            # Changed value
+            elif dps != prevDps or volley != prevVolley:
+                dpsData.add(key, timeStart, dps)
+                volleyData.add(key, timeStart, volley)
+        fitCache['lastCycles'][key] = (dps, volley, timeFinish)
+
+    @staticmethod
+    def _addDmg(fitCache, key, time, dmg):
+        if dmg.total == 0:
+            return
+        dmg._breachers = {time + k: v for k, v in dmg._breachers.items()}
+        dmg._clear_cached()
+        # Damage is stored as total damage done by key by specified time
+        dmgData = fitCache['dmg']
+        prevDmg = dmgData.getLast(key)
+        dmgData.add(key, time, dmg if prevDmg is None else prevDmg + dmg)
+
+    def _iterSourceCycles(self, src):
+        """Return (key, iterator over damage cycles) pairs for all damage dealers of fit."""
+        pairs = []
         # Modules
         for mod in src.item.activeModulesIter():
             if not mod.isDealingDamage():
@@ -181,34 +157,7 @@ class TimeCache(FitDataCache):
             cycleParams = mod.getCycleParametersForDps(reloadOverride=True)
             if cycleParams is None:
                 continue
-            currentTime = 0
-            nonstopCycles = 0
-            isBreacher = mod.isBreacher
-            for cycleTimeMs, inactiveTimeMs, isInactivityReload in cycleParams.iterCycles():
-                cycleVolleys = []
-                volleyParams = mod.getVolleyParameters(spoolOptions=SpoolOptions(SpoolType.CYCLES, nonstopCycles, True))
-
-                for volleyTimeMs, volley in volleyParams.items():
-                    cycleVolleys.append(volley)
-                    time = currentTime + volleyTimeMs / 1000
-                    if isBreacher:
-                        time += 1
-                    addDmg(mod, time, volley)
-                    if isBreacher:
-                        break
-                timeStart = currentTime
-                timeFinish = currentTime + cycleTimeMs / 1000
-                if isBreacher:
-                    timeStart += 1
-                    timeFinish += 1
-                addDpsVolley(mod, timeStart, timeFinish, cycleVolleys)
-                if inactiveTimeMs > 0:
-                    nonstopCycles = 0
-                else:
-                    nonstopCycles += 1
-                if currentTime > maxTime:
-                    break
-                currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
+            pairs.append((mod, self._iterModuleCycles(mod=mod, cycleParams=cycleParams)))
         # Drones
         for drone in src.item.activeDronesIter():
             if not drone.isDealingDamage():
@@ -216,17 +165,7 @@ class TimeCache(FitDataCache):
             cycleParams = drone.getCycleParameters(reloadOverride=True)
             if cycleParams is None:
                 continue
-            currentTime = 0
-            volleyParams = drone.getVolleyParameters()
-            for cycleTimeMs, inactiveTimeMs, isInactivityReload in cycleParams.iterCycles():
-                cycleVolleys = []
-                for volleyTimeMs, volley in volleyParams.items():
-                    cycleVolleys.append(volley)
-                    addDmg(drone, currentTime + volleyTimeMs / 1000, volley)
-                addDpsVolley(drone, currentTime, currentTime + cycleTimeMs / 1000, cycleVolleys)
-                if currentTime > maxTime:
-                    break
-                currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
+            pairs.append((drone, self._iterCycles(cycleParams=cycleParams, volleyParams=drone.getVolleyParameters())))
         # Fighters
         for fighter in src.item.activeFightersIter():
             if not fighter.isDealingDamage():
@@ -238,31 +177,46 @@ class TimeCache(FitDataCache):
             for effectID, abilityCycleParams in cycleParams.items():
                 if effectID not in volleyParams:
                     continue
-                currentTime = 0
-                abilityVolleyParams = volleyParams[effectID]
-                for cycleTimeMs, inactiveTimeMs, isInactivityReload in abilityCycleParams.iterCycles():
-                    cycleVolleys = []
-                    for volleyTimeMs, volley in abilityVolleyParams.items():
-                        cycleVolleys.append(volley)
-                        addDmg((fighter, effectID), currentTime + volleyTimeMs / 1000, volley)
-                    addDpsVolley((fighter, effectID), currentTime, currentTime + cycleTimeMs / 1000, cycleVolleys)
-                    if currentTime > maxTime:
-                        break
-                    currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
-
-    def _isTimeCacheValid(self, src, maxTime):
-        try:
-            cacheMaxTime = self._data[src.item.ID]['maxTime']
-        except KeyError:
-            return False
-        return maxTime <= cacheMaxTime
-
-    def _getDataPoint(self, src, time, dataFunc):
-        data = dataFunc(src)
-        timesBefore = [t for t in data if floatUnerr(t) <= floatUnerr(time)]
-        try:
-            time = max(timesBefore)
-        except ValueError:
-            return {}
-        else:
-            return data[time]
+                pairs.append(((fighter, effectID), self._iterCycles(
+                    cycleParams=abilityCycleParams, volleyParams=volleyParams[effectID])))
+        return pairs
+
+    @staticmethod
+    def _iterModuleCycles(mod, cycleParams):
+        """
+        Yield (cycle start time, damage start time, damage end time, [(time, volley)])
+        tuples for every cycle of module.
+        """
+        currentTime = 0
+        nonstopCycles = 0
+        isBreacher = mod.isBreacher
+        for cycleTimeMs, inactiveTimeMs, isInactivityReload in cycleParams.iterCycles():
+            cycleVolleys = []
+            volleyParams = mod.getVolleyParameters(spoolOptions=SpoolOptions(SpoolType.CYCLES, nonstopCycles, True))
+            for volleyTimeMs, volley in volleyParams.items():
+                time = currentTime + volleyTimeMs / 1000
+                if isBreacher:
+                    time += 1
+                cycleVolleys.append((time, volley))
+                if isBreacher:
+                    break
+            timeStart = currentTime
+            timeFinish = currentTime + cycleTimeMs / 1000
+            if isBreacher:
+                timeStart += 1
+                timeFinish += 1
+            yield currentTime, timeStart, timeFinish, cycleVolleys
+            if inactiveTimeMs > 0:
+                nonstopCycles = 0
+            else:
+                nonstopCycles += 1
+            currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
+
+    @staticmethod
+    def _iterCycles(cycleParams, volleyParams):
+        """Same as _iterModuleCycles, but for items with constant volleys."""
+        currentTime = 0
+        for cycleTimeMs, inactiveTimeMs, isInactivityReload in cycleParams.iterCycles():
+            cycleVolleys = [(currentTime + volleyTimeMs / 1000, volley) for volleyTimeMs, volley in volleyParams.items()]
+            yield currentTime, currentTime, currentTime + cycleTimeMs / 1000, cycleVolleys
+            currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
@@ -21,10 +21,12 @@
 import math
 from functools import lru_cache
 
-from eos.calc import calculateRangeFactor
+import numpy
+
+from eos.calc import calculateRangeFactor, calculateRangeFactorArray
 from eos.const import FittingHardpoint
-from eos.utils.float import floatUnerr
-from graphs.calc import checkLockRange, checkDroneControlRange
+from eos.utils.float import floatUnerr, floatUnerrArray
+from graphs.calc import checkLockRange, checkLockRangeArray, checkDroneControlRange, checkDroneControlRangeArray
 from service.attribute import Attribute
 from service.const import GraphDpsDroneMode
 from service.settings import GraphSettings
@@ -140,6 +142,120 @@ def getApplicationPerKey(src, tgt, atkSpeed, atkAngle, distance, tgtSpeed, tgtAn
     return applicationMap
 
 
+def getApplicationPerKeyArray(src, tgt, atkSpeed, atkAngle, distance, tgtSpeed, tgtAngle, tgtSigRadius):
+    """
+    Same as getApplicationPerKey, but distance, target speed and target
+    signature radius can be numpy arrays of values for multiple points, and
+    application is returned as array per key.
+    """
+    size = max(numpy.size(v) for v in (distance, tgtSpeed, tgtSigRadius) if v is not None)
+    distance = None if distance is None else _asArray(distance, size)
+    tgtSpeed = _asArray(tgtSpeed, size)
+    tgtSigRadius = _asArray(tgtSigRadius, size)
+    inLockRange = checkLockRangeArray(src=src, distances=distance, size=size)
+    inDroneRange = checkDroneControlRangeArray(src=src, distances=distance, size=size)
+    applicationMap = {}
+    for mod in src.item.activeModulesIter():
+        if not mod.isDealingDamage():
+            continue
+        if "ChainLightning" in mod.item.effects:
+            applicationMap[mod] = inLockRange * getVortonMultArray(
+                mod=mod,
+                distance=distance,
+                tgtSpeed=tgtSpeed,
+                tgtSigRadius=tgtSigRadius)
+        elif mod.hardpoint == FittingHardpoint.TURRET:
+            applicationMap[mod] = inLockRange * getTurretMultArray(
+                mod=mod,
+                src=src,
+                tgt=tgt,
+                atkSpeed=atkSpeed,
+                atkAngle=atkAngle,
+                distance=distance,
+                tgtSpeed=tgtSpeed,
+                tgtAngle=tgtAngle,
+                tgtSigRadius=tgtSigRadius)
+        elif mod.hardpoint == FittingHardpoint.MISSILE:
+            mult = getLauncherMultArray(
+                mod=mod,
+                distance=distance,
+                tgtSpeed=tgtSpeed,
+                tgtSigRadius=tgtSigRadius)
+            # FoF missiles can shoot beyond lock range
+            if mod.charge is None or 'fofMissileLaunching' not in mod.charge.effects:
+                mult = inLockRange * mult
+            applicationMap[mod] = mult
+        elif mod.item.group.name in ('Smart Bomb', 'Structure Area Denial Module'):
+            applicationMap[mod] = getSmartbombMultArray(
+                mod=mod,
+                distance=distance,
+                size=size)
+        elif mod.item.group.name == 'Missile Launcher Bomb':
+            applicationMap[mod] = getBombMultArray(
+                mod=mod,
+                src=src,
+                tgt=tgt,
+                distance=distance,
+                tgtSigRadius=tgtSigRadius)
+        elif mod.item.group.name == 'Structure Guided Bomb Launcher':
+            applicationMap[mod] = inLockRange * getGuidedBombMultArray(
+                mod=mod,
+                src=src,
+                distance=distance,
+                tgtSigRadius=tgtSigRadius)
+        elif mod.item.group.name in ('Super Weapon', 'Structure Doomsday Weapon'):
+            mult = getDoomsdayMultArray(
+                mod=mod,
+                tgt=tgt,
+                distance=distance,
+                tgtSigRadius=tgtSigRadius)
+            # Only single-target DDs need locks
+            if {'superWeaponAmarr', 'superWeaponCaldari', 'superWeaponGallente', 'superWeaponMinmatar', 'lightningWeapon'}.intersection(mod.item.effects):
+                mult = inLockRange * mult
+            applicationMap[mod] = mult
+        elif mod.isBreacher:
+            applicationMap[mod] = inLockRange * getBreacherMultArray(mod=mod, distance=distance, size=size)
+    for drone in src.item.activeDronesIter():
+        if not drone.isDealingDamage():
+            continue
+        applicationMap[drone] = (inLockRange & inDroneRange) * getDroneMultArray(
+            drone=drone,
+            src=src,
+            tgt=tgt,
+            atkSpeed=atkSpeed,
+            atkAngle=atkAngle,
+            distance=distance,
+            tgtSpeed=tgtSpeed,
+            tgtAngle=tgtAngle,
+            tgtSigRadius=tgtSigRadius)
+    for fighter in src.item.activeFightersIter():
+        if not fighter.isDealingDamage():
+            continue
+        for ability in fighter.abilities:
+            if not ability.dealsDamage or not ability.active:
+                continue
+            mult = getFighterAbilityMultArray(
+                fighter=fighter,
+                ability=ability,
+                src=src,
+                tgt=tgt,
+                distance=distance,
+                tgtSpeed=tgtSpeed,
+                tgtSigRadius=tgtSigRadius)
+            # Bomb launching doesn't need locks
+            if ability.effect.name != 'fighterAbilityLaunchBomb':
+                mult = inLockRange * mult
+            applicationMap[(fighter, ability.effectID)] = mult
+    # Ensure consistent results - round off a little to avoid float errors
+    for k, v in applicationMap.items():
+        applicationMap[k] = floatUnerrArray(v)
+    return applicationMap
+
+
+def _asArray(value, size):
+    return numpy.broadcast_to(numpy.asarray(value, dtype=float), (size,))
+
+
 # Item application multiplier calculation
 def getTurretMult(mod, src, tgt, atkSpeed, atkAngle, distance, tgtSpeed, tgtAngle, tgtSigRadius):
     cth = _calcTurretChanceToHit(
@@ -357,6 +473,201 @@ def getFighterAbilityMult(fighter, ability, src, tgt, distance, tgtSpeed, tgtSig
     return mult
 
 
+# Array versions of item application multiplier calculation
+def getTurretMultArray(mod, src, tgt, atkSpeed, atkAngle, distance, tgtSpeed, tgtAngle, tgtSigRadius):
+    cth = _calcTurretChanceToHitArray(
+        atkSpeed=atkSpeed,
+        atkAngle=atkAngle,
+        atkRadius=src.getRadius(),
+        atkOptimalRange=mod.maxRange or 0,
+        atkFalloffRange=mod.falloff or 0,
+        atkTracking=mod.getModifiedItemAttr('trackingSpeed'),
+        atkOptimalSigRadius=mod.getModifiedItemAttr('optimalSigRadius'),
+        distance=distance,
+        tgtSpeed=tgtSpeed,
+        tgtAngle=tgtAngle,
+        tgtRadius=tgt.getRadius(),
+        tgtSigRadius=tgtSigRadius)
+    return _calcTurretMultArray(cth)
+
+
+def getVortonMultArray(mod, distance, tgtSpeed, tgtSigRadius):
+    applicationFactor = _calcMissileFactorArray(
+        atkEr=mod.getModifiedItemAttr('aoeCloudSize'),
+        atkEv=mod.getModifiedItemAttr('aoeVelocity'),
+        atkDrf=mod.getModifiedItemAttr('aoeDamageReductionFactor'),
+        tgtSpeed=tgtSpeed,
+        tgtSigRadius=tgtSigRadius)
+    if distance is None:
+        return applicationFactor
+    return calculateRangeFactorArray(mod.getModifiedItemAttr('maxRange'), 0, distance) * applicationFactor
+
+
+def getLauncherMultArray(mod, distance, tgtSpeed, tgtSigRadius):
+    distanceFactor = _calcMissileDistanceFactorArray(mod=mod, distance=distance, size=len(tgtSpeed))
+    applicationFactor = _calcMissileFactorArray(
+        atkEr=mod.getModifiedChargeAttr('aoeCloudSize'),
+        atkEv=mod.getModifiedChargeAttr('aoeVelocity'),
+        atkDrf=mod.getModifiedChargeAttr('aoeDamageReductionFactor'),
+        tgtSpeed=tgtSpeed,
+        tgtSigRadius=tgtSigRadius)
+    return distanceFactor * applicationFactor
+
+
+def getBreacherMultArray(mod, distance, size):
+    return _calcMissileDistanceFactorArray(mod=mod, distance=distance, size=size)
+
+
+def getSmartbombMultArray(mod, distance, size):
+    modRange = mod.maxRange
+    if modRange is None:
+        return numpy.zeros(size)
+    if distance is None:
+        return numpy.ones(size)
+    return numpy.where(distance > modRange, 0.0, 1.0)
+
+
+def getDoomsdayMultArray(mod, tgt, distance, tgtSigRadius):
+    # Single-target titan DDs are vs capitals only
+    if {'superWeaponAmarr', 'superWeaponCaldari', 'superWeaponGallente', 'superWeaponMinmatar'}.intersection(mod.item.effects):
+        # Disallow only against subcaps, allow against caps and tgt profiles
+        if tgt.isFit and not tgt.item.ship.item.requiresSkill('Capital Ships'):
+            return numpy.zeros(len(tgtSigRadius))
+    damageSig = mod.getModifiedItemAttr('signatureRadius')
+    if not damageSig:
+        mult = numpy.ones(len(tgtSigRadius))
+    else:
+        mult = numpy.minimum(1, tgtSigRadius / damageSig)
+    modRange = mod.maxRange
+    # Single-target DDs have no range limit
+    if distance is not None and modRange:
+        mult[distance > modRange] = 0
+    return mult
+
+
+def getBombMultArray(mod, src, tgt, distance, tgtSigRadius):
+    modRange = mod.maxRange
+    if modRange is None:
+        return numpy.zeros(len(tgtSigRadius))
+    mult = _calcBombFactorArray(atkEr=mod.getModifiedChargeAttr('aoeCloudSize'), tgtSigRadius=tgtSigRadius)
+    if distance is not None:
+        blastRadius = mod.getModifiedChargeAttr('explosionRange')
+        atkRadius = src.getRadius()
+        tgtRadius = tgt.getRadius()
+        mult[distance < max(0, modRange - atkRadius - tgtRadius - blastRadius)] = 0
+        mult[distance > max(0, modRange - atkRadius + tgtRadius + blastRadius)] = 0
+    return mult
+
+
+def getGuidedBombMultArray(mod, src, distance, tgtSigRadius):
+    modRange = mod.maxRange
+    if modRange is None:
+        return numpy.zeros(len(tgtSigRadius))
+    mult = _calcBombFactorArray(atkEr=mod.getModifiedChargeAttr('aoeCloudSize'), tgtSigRadius=tgtSigRadius)
+    if distance is not None:
+        mult[distance > modRange - src.getRadius()] = 0
+    return mult
+
+
+def getDroneMultArray(drone, src, tgt, atkSpeed, atkAngle, distance, tgtSpeed, tgtAngle, tgtSigRadius):
+    droneSpeed = drone.getModifiedItemAttr('maxVelocity')
+    # Hard to simulate drone behavior, so assume chance to hit is 1 for mobile drones
+    # which catch up with target
+    droneOpt = GraphSettings.getInstance().get('mobileDroneMode')
+    if droneSpeed > 1 and droneOpt == GraphDpsDroneMode.followTarget:
+        catchingUp = numpy.ones(len(tgtSpeed), dtype=bool)
+    elif droneSpeed > 1 and droneOpt == GraphDpsDroneMode.auto:
+        catchingUp = droneSpeed >= tgtSpeed
+    else:
+        catchingUp = numpy.zeros(len(tgtSpeed), dtype=bool)
+    if catchingUp.all():
+        cth = numpy.ones(len(tgtSpeed))
+    # Otherwise put the drone into center of the ship, move it at its max speed or ship's speed
+    # (whichever is lower) towards direction of attacking ship and see how well it projects
+    else:
+        droneRadius = drone.getModifiedItemAttr('radius')
+        # As distance is ship surface to ship surface, we adjust it according
+        # to attacker ship's radiuses to have drone surface to ship surface distance
+        cthDistance = None if distance is None else distance + src.getRadius() - droneRadius
+        cth = _calcTurretChanceToHitArray(
+            atkSpeed=min(atkSpeed, droneSpeed),
+            atkAngle=atkAngle,
+            atkRadius=droneRadius,
+            atkOptimalRange=drone.maxRange or 0,
+            atkFalloffRange=drone.falloff or 0,
+            atkTracking=drone.getModifiedItemAttr('trackingSpeed'),
+            atkOptimalSigRadius=drone.getModifiedItemAttr('optimalSigRadius'),
+            distance=cthDistance,
+            tgtSpeed=tgtSpeed,
+            tgtAngle=tgtAngle,
+            tgtRadius=tgt.getRadius(),
+            tgtSigRadius=tgtSigRadius)
+        cth = numpy.where(catchingUp, 1.0, cth)
+    mult = _calcTurretMultArray(cth)
+    if distance is not None:
+        if not GraphSettings.getInstance().get('ignoreDCR'):
+            mult[distance > src.item.extraAttributes['droneControlRange']] = 0
+        if not GraphSettings.getInstance().get('ignoreLockRange'):
+            mult[distance > src.item.maxTargetRange] = 0
+    return mult
+
+
+def getFighterAbilityMultArray(fighter, ability, src, tgt, distance, tgtSpeed, tgtSigRadius):
+    fighterSpeed = fighter.getModifiedItemAttr('maxVelocity')
+    attrPrefix = ability.attrPrefix
+    # It's bomb attack
+    if attrPrefix == 'fighterAbilityLaunchBomb':
+        # Just assume we can land bomb anywhere
+        return _calcBombFactorArray(
+            atkEr=fighter.getModifiedChargeAttr('aoeCloudSize'),
+            tgtSigRadius=tgtSigRadius)
+    droneOpt = GraphSettings.getInstance().get('mobileDroneMode')
+    # It's regular missile-based attack
+    if droneOpt == GraphDpsDroneMode.followTarget or distance is None:
+        rangeFactor = 1
+    # Same as with drones, if fighters are slower - put them to center of
+    # the ship and see how they apply
+    else:
+        rangeFactor = calculateRangeFactorArray(
+            srcOptimalRange=fighter.getModifiedItemAttr('{}RangeOptimal'.format(attrPrefix)) or fighter.getModifiedItemAttr('{}Range'.format(attrPrefix)),
+            srcFalloffRange=fighter.getModifiedItemAttr('{}RangeFalloff'.format(attrPrefix)),
+            distances=distance + src.getRadius() - fighter.getModifiedItemAttr('radius'))
+        if droneOpt == GraphDpsDroneMode.auto:
+            rangeFactor = numpy.where(fighterSpeed >= tgtSpeed, 1.0, rangeFactor)
+    drf = fighter.getModifiedItemAttr('{}ReductionFactor'.format(attrPrefix), None)
+    if drf is None:
+        drf = fighter.getModifiedItemAttr('{}DamageReductionFactor'.format(attrPrefix))
+    drs = fighter.getModifiedItemAttr('{}ReductionSensitivity'.format(attrPrefix), None)
+    if drs is None:
+        drs = fighter.getModifiedItemAttr('{}DamageReductionSensitivity'.format(attrPrefix))
+    missileFactor = _calcMissileFactorArray(
+        atkEr=fighter.getModifiedItemAttr('{}ExplosionRadius'.format(attrPrefix)),
+        atkEv=fighter.getModifiedItemAttr('{}ExplosionVelocity'.format(attrPrefix)),
+        atkDrf=_calcAggregatedDrf(reductionFactor=drf, reductionSensitivity=drs),
+        tgtSpeed=tgtSpeed,
+        tgtSigRadius=tgtSigRadius)
+    resistMult = 1
+    if tgt.isFit:
+        resistAttrID = fighter.getModifiedItemAttr('{}ResistanceID'.format(attrPrefix))
+        if resistAttrID:
+            resistAttrInfo = Attribute.getInstance().getAttributeInfo(resistAttrID)
+            if resistAttrInfo is not None:
+                resistMult = tgt.item.ship.getModifiedItemAttr(resistAttrInfo.name, 1)
+    mult = rangeFactor * missileFactor * resistMult
+    return mult
+
+
+def _calcMissileDistanceFactorArray(mod, distance, size):
+    missileMaxRangeData = mod.missileMaxRangeData
+    if missileMaxRangeData is None:
+        return numpy.zeros(size)
+    if distance is None:
+        return numpy.ones(size)
+    # The ranges already consider ship radius
+    lowerRange, higherRange, higherChance = missileMaxRangeData
+    return numpy.select([distance <= lowerRange, distance <= higherRange], [1.0, higherChance], 0.0)
+
+
 # Turret-specific math
 @lru_cache(maxsize=50)
 def _calcTurretMult(chanceToHit):
@@ -409,6 +720,49 @@ def _calcTrackingFactor(atkTracking, atkOptimalSigRadius, angularSpeed, tgtSigRa
     return 0.5 ** (((angularSpeed * atkOptimalSigRadius) / (atkTracking * tgtSigRadius)) ** 2)
 
 
+def _calcTurretMultArray(chanceToHit):
+    """Calculate damage multipliers for turret-based weapons, for array of chances to hit."""
+    wreckingChance = numpy.minimum(chanceToHit, 0.01)
+    normalChance = chanceToHit - wreckingChance
+    avgDamageMult = (0.01 + chanceToHit) / 2 + 0.49
+    normalPart = numpy.where(normalChance > 0, normalChance * avgDamageMult, 0)
+    return normalPart + wreckingChance * 3
+
+
+def _calcTurretChanceToHitArray(
+    atkSpeed, atkAngle, atkRadius, atkOptimalRange, atkFalloffRange, atkTracking, atkOptimalSigRadius,
+    distance, tgtSpeed, tgtAngle, tgtRadius, tgtSigRadius
+):
+    """Calculate chances to hit for turret-based weapons, for arrays of distances and target parameters."""
+    angularSpeed = _calcAngularSpeedArray(atkSpeed, atkAngle, atkRadius, distance, tgtSpeed, tgtAngle, tgtRadius)
+    trackingFactor = _calcTrackingFactorArray(atkTracking, atkOptimalSigRadius, angularSpeed, tgtSigRadius)
+    if distance is None:
+        return trackingFactor
+    # Turrets can be activated regardless of range to target
+    rangeFactor = calculateRangeFactorArray(atkOptimalRange, atkFalloffRange, distance, restrictedRange=False)
+    return rangeFactor * trackingFactor
+
+
+def _calcAngularSpeedArray(atkSpeed, atkAngle, atkRadius, distance, tgtSpeed, tgtAngle, tgtRadius):
+    """Calculate angular speeds based on mobility parameters of two ships, for arrays of distances and target speeds."""
+    if distance is None:
+        return numpy.zeros(len(tgtSpeed))
+    atkAngle = atkAngle * math.pi / 180
+    tgtAngle = tgtAngle * math.pi / 180
+    ctcDistance = atkRadius + distance + tgtRadius
+    # Target is to the right of the attacker, so transversal is projection onto Y axis
+    transSpeed = numpy.abs(atkSpeed * math.sin(atkAngle) - tgtSpeed * math.sin(tgtAngle))
+    angularSpeed = numpy.where(transSpeed == 0, 0.0, math.inf)
+    numpy.divide(transSpeed, ctcDistance, out=angularSpeed, where=ctcDistance != 0)
+    return angularSpeed
+
+
+def _calcTrackingFactorArray(atkTracking, atkOptimalSigRadius, angularSpeed, tgtSigRadius):
+    """Calculate tracking chance to hit component, for arrays of angular speeds and target signature radii."""
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        return 0.5 ** (((angularSpeed * atkOptimalSigRadius) / (atkTracking * tgtSigRadius)) ** 2)
+
+
 # Missile-specific math
 @lru_cache(maxsize=200)
 def _calcMissileFactor(atkEr, atkEv, atkDrf, tgtSpeed, tgtSigRadius):
@@ -424,6 +778,21 @@ def _calcMissileFactor(atkEr, atkEv, atkDrf, tgtSpeed, tgtSigRadius):
     return totalMult
 
 
+def _calcMissileFactorArray(atkEr, atkEv, atkDrf, tgtSpeed, tgtSigRadius):
+    """Missile application, for arrays of target speeds and signature radii."""
+    totalMult = numpy.ones(len(tgtSigRadius))
+    # "Slow" part
+    if atkEr > 0:
+        totalMult = numpy.minimum(totalMult, tgtSigRadius / atkEr)
+    # "Fast" part
+    moving = tgtSpeed > 0
+    if moving.any():
+        with numpy.errstate(divide='ignore', over='ignore'):
+            fastMult = ((atkEv * tgtSigRadius[moving]) / (atkEr * tgtSpeed[moving])) ** atkDrf
+        totalMult[moving] = numpy.minimum(totalMult[moving], fastMult)
+    return totalMult
+
+
 def _calcAggregatedDrf(reductionFactor, reductionSensitivity):
     """
     Sometimes DRF is specified as 2 separate numbers,
@@ -438,3 +807,10 @@ def _calcBombFactor(atkEr, tgtSigRadius):
         return 1
     else:
         return min(1, tgtSigRadius / atkEr)
+
+
+def _calcBombFactorArray(atkEr, tgtSigRadius):
+    if atkEr == 0:
+        return numpy.ones(len(tgtSigRadius))
+    else:
+        return numpy.minimum(1, tgtSigRadius / atkEr)
@@ -18,13 +18,15 @@
 # =============================================================================
 
 
+import numpy
+
 import eos.config
 from eos.saveddata.targetProfile import TargetProfile
 from eos.utils.spoolSupport import SpoolOptions, SpoolType
 from eos.utils.stats import DmgTypes
 from graphs.data.base import PointGetter, SmoothPointGetter
 from service.settings import GraphSettings
-from .calc.application import getApplicationPerKey
+from .calc.application import getApplicationPerKey, getApplicationPerKeyArray
 from .calc.projected import getScramRange, getScrammables, getTackledSpeed, getSigRadiusMult
 
 
@@ -41,6 +43,35 @@ def applyDamage(dmgMap, applicationMap, tgtResists, tgtFullHp):
     return total
 
 
+def applyDamageArray(dmgMap, applicationMap, tgtResists, tgtFullHp, size):
+    """Same as applyDamage, but for application arrays; returns array of total damage"""
+    # Breacher damage depends on target HP and is not summed across items,
+    # so it can't be calculated for all points at once
+    if any(dmg.pure for dmg in dmgMap.values()):
+        return numpy.array([
+            applyDamage(
+                dmgMap=dmgMap,
+                applicationMap={k: v[i] for k, v in applicationMap.items()},
+                tgtResists=tgtResists,
+                tgtFullHp=tgtFullHp).total
+            for i in range(size)])
+    if not GraphSettings.getInstance().get('ignoreResists'):
+        emRes, thermRes, kinRes, exploRes = tgtResists
+    else:
+        emRes = thermRes = kinRes = exploRes = 0
+    profile = TargetProfile(
+        emAmount=emRes, thermalAmount=thermRes, kineticAmount=kinRes, explosiveAmount=exploRes, hp=tgtFullHp)
+    total = numpy.zeros(size)
+    for key, dmg in dmgMap.items():
+        application = applicationMap.get(key)
+        if application is None:
+            continue
+        resistedDmg = dmg * 1
+        resistedDmg.profile = profile
+        total += resistedDmg.total * application
+    return total
+
+
 # Y mixins
 class YDpsMixin:
 
@@ -149,6 +180,47 @@ class XDistanceMixin(SmoothPointGetter):
 
     def _calculatePoint(self, x, miscParams, src, tgt, commonData):
         distance = x
+        tgtSpeed, tgtSigRadius = self._getTgtParams(distance=distance, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+        applicationMap = getApplicationPerKey(
+            src=src,
+            tgt=tgt,
+            atkSpeed=miscParams['atkSpeed'],
+            atkAngle=miscParams['atkAngle'],
+            distance=distance,
+            tgtSpeed=tgtSpeed,
+            tgtAngle=miscParams['tgtAngle'],
+            tgtSigRadius=tgtSigRadius)
+        y = applyDamage(
+            dmgMap=commonData['dmgMap'],
+            applicationMap=applicationMap,
+            tgtResists=commonData['tgtResists'],
+            tgtFullHp=commonData['tgtFullHp']).total
+        return y
+
+    def _calculateRange(self, xs, miscParams, src, tgt, commonData):
+        # Projected effects are stacking penalized against target's own
+        # modifications, so speed and signature are fetched point by point
+        tgtParams = [
+            self._getTgtParams(distance=x, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+            for x in xs]
+        applicationMap = getApplicationPerKeyArray(
+            src=src,
+            tgt=tgt,
+            atkSpeed=miscParams['atkSpeed'],
+            atkAngle=miscParams['atkAngle'],
+            distance=numpy.array(xs, dtype=float),
+            tgtSpeed=numpy.array([p[0] for p in tgtParams], dtype=float),
+            tgtAngle=miscParams['tgtAngle'],
+            tgtSigRadius=numpy.array([p[1] for p in tgtParams], dtype=float))
+        ys = applyDamageArray(
+            dmgMap=commonData['dmgMap'],
+            applicationMap=applicationMap,
+            tgtResists=commonData['tgtResists'],
+            tgtFullHp=commonData['tgtFullHp'],
+            size=len(xs))
+        return ys.tolist()
+
+    def _getTgtParams(self, distance, miscParams, src, tgt, commonData):
         tgtSpeed = miscParams['tgtSpeed']
         tgtSigRadius = tgt.getSigRadius()
         if commonData['applyProjected']:
@@ -175,21 +247,7 @@ class XDistanceMixin(SmoothPointGetter):
                 tpDrones=tpDrones,
                 tpFighters=tpFighters,
                 distance=distance)
-        applicationMap = getApplicationPerKey(
-            src=src,
-            tgt=tgt,
-            atkSpeed=miscParams['atkSpeed'],
-            atkAngle=miscParams['atkAngle'],
-            distance=distance,
-            tgtSpeed=tgtSpeed,
-            tgtAngle=miscParams['tgtAngle'],
-            tgtSigRadius=tgtSigRadius)
-        y = applyDamage(
-            dmgMap=commonData['dmgMap'],
-            applicationMap=applicationMap,
-            tgtResists=commonData['tgtResists'],
-            tgtFullHp=commonData['tgtFullHp']).total
-        return y
+        return tgtSpeed, tgtSigRadius
 
 
 class XTimeMixin(PointGetter):
@@ -246,9 +304,8 @@ class XTimeMixin(PointGetter):
         # Custom iteration for time graph to show all data points
         currentDmg = None
         currentTime = None
-        for currentTime in sorted(timeCache):
+        for currentTime, currentDmgData in timeCache.iterPoints():
             prevDmg = currentDmg
-            currentDmgData = timeCache[currentTime]
             currentDmg = applyDamage(
                 dmgMap=currentDmgData,
                 applicationMap=applicationMap,
@@ -323,7 +380,52 @@ class XTgtSpeedMixin(SmoothPointGetter):
             'tgtFullHp': tgt.getFullHp()}
 
     def _calculatePoint(self, x, miscParams, src, tgt, commonData):
-        tgtSpeed = x
+        tgtSpeed, tgtSigRadius = self._getTgtParams(untackledSpeed=x, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+        applicationMap = getApplicationPerKey(
+            src=src,
+            tgt=tgt,
+            atkSpeed=miscParams['atkSpeed'],
+            atkAngle=miscParams['atkAngle'],
+            distance=miscParams['distance'],
+            tgtSpeed=tgtSpeed,
+            tgtAngle=miscParams['tgtAngle'],
+            tgtSigRadius=tgtSigRadius)
+        y = applyDamage(
+            dmgMap=commonData['dmgMap'],
+            applicationMap=applicationMap,
+            tgtResists=commonData['tgtResists'],
+            tgtFullHp=commonData['tgtFullHp']).total
+        return y
+
+    def _calculateRange(self, xs, miscParams, src, tgt, commonData):
+        if commonData['applyProjected']:
+            tgtParams = [
+                self._getTgtParams(untackledSpeed=x, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+                for x in xs]
+            tgtSpeeds = numpy.array([p[0] for p in tgtParams], dtype=float)
+            tgtSigRadii = numpy.array([p[1] for p in tgtParams], dtype=float)
+        else:
+            tgtSpeeds = numpy.array(xs, dtype=float)
+            tgtSigRadii = tgt.getSigRadius()
+        applicationMap = getApplicationPerKeyArray(
+            src=src,
+            tgt=tgt,
+            atkSpeed=miscParams['atkSpeed'],
+            atkAngle=miscParams['atkAngle'],
+            distance=miscParams['distance'],
+            tgtSpeed=tgtSpeeds,
+            tgtAngle=miscParams['tgtAngle'],
+            tgtSigRadius=tgtSigRadii)
+        ys = applyDamageArray(
+            dmgMap=commonData['dmgMap'],
+            applicationMap=applicationMap,
+            tgtResists=commonData['tgtResists'],
+            tgtFullHp=commonData['tgtFullHp'],
+            size=len(xs))
+        return ys.tolist()
+
+    def _getTgtParams(self, untackledSpeed, miscParams, src, tgt, commonData):
+        tgtSpeed = untackledSpeed
         tgtSigRadius = tgt.getSigRadius()
         if commonData['applyProjected']:
             srcScramRange = getScramRange(src=src)
@@ -351,21 +453,7 @@ class XTgtSpeedMixin(SmoothPointGetter):
                 tpDrones=tpDrones,
                 tpFighters=tpFighters,
                 distance=miscParams['distance'])
-        applicationMap = getApplicationPerKey(
-            src=src,
-            tgt=tgt,
-            atkSpeed=miscParams['atkSpeed'],
-            atkAngle=miscParams['atkAngle'],
-            distance=miscParams['distance'],
-            tgtSpeed=tgtSpeed,
-            tgtAngle=miscParams['tgtAngle'],
-            tgtSigRadius=tgtSigRadius)
-        y = applyDamage(
-            dmgMap=commonData['dmgMap'],
-            applicationMap=applicationMap,
-            tgtResists=commonData['tgtResists'],
-            tgtFullHp=commonData['tgtFullHp']).total
-        return y
+        return tgtSpeed, tgtSigRadius
 
 
 class XTgtSigRadiusMixin(SmoothPointGetter):
@@ -430,6 +518,24 @@ class XTgtSigRadiusMixin(SmoothPointGetter):
             tgtFullHp=commonData['tgtFullHp']).total
         return y
 
+    def _calculateRange(self, xs, miscParams, src, tgt, commonData):
+        applicationMap = getApplicationPerKeyArray(
+            src=src,
+            tgt=tgt,
+            atkSpeed=miscParams['atkSpeed'],
+            atkAngle=miscParams['atkAngle'],
+            distance=miscParams['distance'],
+            tgtSpeed=commonData['tgtSpeed'],
+            tgtAngle=miscParams['tgtAngle'],
+            tgtSigRadius=numpy.array(xs, dtype=float) * commonData['tgtSigMult'])
+        ys = applyDamageArray(
+            dmgMap=commonData['dmgMap'],
+            applicationMap=applicationMap,
+            tgtResists=commonData['tgtResists'],
+            tgtFullHp=commonData['tgtFullHp'],
+            size=len(xs))
+        return ys.tolist()
+
 
 # Final getters
 class Distance2DpsGetter(XDistanceMixin, YDpsMixin):
@@ -75,6 +75,7 @@ class FitDamageStatsGraph(FitGraph):
     tgtVectorDef = VectorDef(lengthHandle='tgtSpeed', lengthUnit='%', angleHandle='tgtAngle', angleUnit='degrees', label=_t('Target'))
     hasTargets = True
     srcExtraCols = ('Dps', 'Volley', 'Speed', 'Radius')
+    usedSettings = ('mobileDroneMode', 'ignoreDCR', 'ignoreResists', 'ignoreLockRange', 'applyProjected')
 
     @property
     def yDefs(self):
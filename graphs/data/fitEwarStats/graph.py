@@ -43,6 +43,7 @@ class FitEwarStatsGraph(FitGraph):
     inputs = [
         Input(handle='distance', unit='km', label=_t('Distance'), iconID=1391, defaultValue=None, defaultRange=(0, 100)),
         Input(handle='resist', unit='%', label=_t('Target resistance'), iconID=1393, defaultValue=0, defaultRange=(0, 100))]
+    usedSettings = ('ignoreLockRange', 'ignoreDCR')
 
     # Calculation stuff
     _normalizers = {
@@ -18,133 +18,116 @@
 # =============================================================================
 
 
-from copy import copy
-
 from eos.utils.float import floatUnerr
 from eos.utils.spoolSupport import SpoolOptions, SpoolType
 from eos.utils.stats import RRTypes
-from graphs.data.base import FitDataCache
+from graphs.data.base import FitDataCache, TimeSeries
 
 
 class TimeCache(FitDataCache):
 
     # Whole data getters
     def getRpsData(self, src, ancReload):
-        """Return RPS data in {time: {key: rps}} format."""
-        return self._data[src.item.ID][ancReload]['finalRps']
+        """Return RPS data as TimeSeries of {key: rps}."""
+        return self._data[src.item.ID][ancReload]['rps']
 
     def getRepAmountData(self, src, ancReload):
-        """Return rep amount data in {time: {key: amount}} format."""
-        return self._data[src.item.ID][ancReload]['finalRepAmount']
+        """Return rep amount data as TimeSeries of {key: amount}."""
+        return self._data[src.item.ID][ancReload]['repAmount']
 
     # Specific data point getters
     def getRpsDataPoint(self, src, ancReload, time):
         """Get RPS data by specified time in {key: rps} format."""
-        return self._getDataPoint(src=src, ancReload=ancReload, time=time, dataFunc=self.getRpsData)
+        return self.getRpsData(src=src, ancReload=ancReload).getPoint(time)
 
     def getRepAmountDataPoint(self, src, ancReload, time):
         """Get rep amount data by specified time in {key: amount} format."""
-        return self._getDataPoint(src=src, ancReload=ancReload, time=time, dataFunc=self.getRepAmountData)
+        return self.getRepAmountData(src=src, ancReload=ancReload).getPoint(time)
 
     # Preparation functions
     def prepareRpsData(self, src, ancReload, maxTime):
-        # Time is none means that time parameter has to be ignored,
-        # we do not need cache for that
-        if maxTime is None:
-            return True
-        self._generateInternalForm(src=src, ancReload=ancReload, maxTime=maxTime)
-        fitCache = self._data[src.item.ID][ancReload]
-        # Final cache has been generated already, don't do anything
-        if 'finalRps' in fitCache:
-            return
-        # Convert cache from segments with assigned values into points
-        # which are located at times when rps value changes
-        pointCache = {}
-        for key, rpsList in fitCache['internalRps'].items():
-            pointData = pointCache[key] = {}
-            prevRps = None
-            prevTimeEnd = None
-            for timeStart, timeEnd, rps in rpsList:
-                # First item
-                if not pointData:
-                    pointData[timeStart] = rps
-                # Gap between items
-                elif floatUnerr(prevTimeEnd) < floatUnerr(timeStart):
-                    pointData[prevTimeEnd] = RRTypes(0, 0, 0, 0)
-                    pointData[timeStart] = rps
-                # Changed value
-                elif rps != prevRps:
-                    pointData[timeStart] = rps
-                prevRps = rps
-                prevTimeEnd = timeEnd
-        # We have data in another form, do not need old one any longer
-        del fitCache['internalRps']
-        changesByTime = {}
-        for key, rpsMap in pointCache.items():
-            for time in rpsMap:
-                changesByTime.setdefault(time, []).append(key)
-        # Here we convert cache to following format:
-        # {time: {key: rps}
-        finalRpsCache = fitCache['finalRps'] = {}
-        timeRpsData = {}
-        for time in sorted(changesByTime):
-            timeRpsData = copy(timeRpsData)
-            for key in changesByTime[time]:
-                timeRpsData[key] = pointCache[key][time]
-            finalRpsCache[time] = timeRpsData
+        self._prepareData(src=src, ancReload=ancReload, maxTime=maxTime)
 
     def prepareRepAmountData(self, src, ancReload, maxTime):
+        self._prepareData(src=src, ancReload=ancReload, maxTime=maxTime)
+
+    # Private stuff
+    def _prepareData(self, src, ancReload, maxTime):
         # Time is none means that time parameter has to be ignored,
         # we do not need cache for that
         if maxTime is None:
             return
-        self._generateInternalForm(src=src, ancReload=ancReload, maxTime=maxTime)
-        fitCache = self._data[src.item.ID][ancReload]
-        # Final cache has been generated already, don't do anything
-        if 'finalRepAmount' in fitCache:
+        fitCaches = self._data.setdefault(src.item.ID, {})
+        try:
+            fitCache = fitCaches[ancReload]
+        except KeyError:
+            fitCache = fitCaches[ancReload] = {
+                'maxTime': None,
+                # [key, cycle iterator, start time of last generated cycle]
+                'sources': [[k, c, None] for k, c in self._iterSourceCycles(src=src, ancReload=ancReload)],
+                # {key: (rps, end time) of last generated cycle}
+                'lastCycles': {},
+                'rps': TimeSeries(),
+                'repAmount': TimeSeries()}
+        # Cache is generated up to requested time already
+        if fitCache['maxTime'] is not None and maxTime <= fitCache['maxTime']:
             return
-        intCache = fitCache['internalRepAmount']
-        changesByTime = {}
-        for key, remAmountMap in intCache.items():
-            for time in remAmountMap:
-                changesByTime.setdefault(time, []).append(key)
-        # Here we convert cache to following format:
-        # {time: {key: hp repaired by key at this time}}
-        finalCache = fitCache['finalRepAmount'] = {}
-        timeRepAmountData = {}
-        for time in sorted(changesByTime):
-            timeRepAmountData = copy(timeRepAmountData)
-            for key in changesByTime[time]:
-                keyRepAmount = intCache[key][time]
-                if key in timeRepAmountData:
-                    timeRepAmountData[key] = timeRepAmountData[key] + keyRepAmount
-                else:
-                    timeRepAmountData[key] = keyRepAmount
-            finalCache[time] = timeRepAmountData
-        # We do not need internal cache once we have final
-        del fitCache['internalRepAmount']
-
-    # Private stuff
-    def _generateInternalForm(self, src, ancReload, maxTime):
-        if self._isTimeCacheValid(src=src, ancReload=ancReload, maxTime=maxTime):
+        fitCache['maxTime'] = maxTime
+        # Data is generated lazily - only as far as it was requested. Cycles
+        # which start after requested time are kept unconsumed in iterators
+        # until longer time is requested
+        for source in fitCache['sources']:
+            key, cycles, lastCycleStart = source
+            while lastCycleStart is None or lastCycleStart <= maxTime:
+                try:
+                    cycleStart, cycleFinish, repAmounts = next(cycles)
+                except StopIteration:
+                    break
+                for time, repAmount in repAmounts:
+                    self._addRepAmount(fitCache=fitCache, key=key, time=time, repAmount=repAmount)
+                self._addRps(
+                    fitCache=fitCache, key=key, timeStart=cycleStart, timeFinish=cycleFinish,
+                    repAmounts=[r for t, r in repAmounts])
+                lastCycleStart = cycleStart
+            source[2] = lastCycleStart
+
+    @staticmethod
+    def _addRps(fitCache, key, timeStart, timeFinish, repAmounts):
+        if not repAmounts:
             return
-        fitCache = self._data.setdefault(src.item.ID, {})[ancReload] = {'maxTime': maxTime}
-        intCacheRps = fitCache['internalRps'] = {}
-        intCacheRepAmount = fitCache['internalRepAmount'] = {}
-
-        def addRps(rrKey, addedTimeStart, addedTimeFinish, addedRepAmounts):
-            if not addedRepAmounts:
-                return
-            repAmountSum = sum(addedRepAmounts, RRTypes(0, 0, 0, 0))
-            if repAmountSum.shield > 0 or repAmountSum.armor > 0 or repAmountSum.hull > 0:
-                addedRps = repAmountSum / (addedTimeFinish - addedTimeStart)
-                rrCacheRps = intCacheRps.setdefault(rrKey, [])
-                rrCacheRps.append((addedTimeStart, addedTimeFinish, addedRps))
-
-        def addRepAmount(rrKey, addedTime, addedRepAmount):
-            if addedRepAmount.shield > 0 or addedRepAmount.armor > 0 or addedRepAmount.hull > 0:
-                intCacheRepAmount.setdefault(rrKey, {})[addedTime] = addedRepAmount
-
+        repAmountSum = sum(repAmounts, RRTypes(0, 0, 0, 0))
+        if repAmountSum.shield <= 0 and repAmountSum.armor <= 0 and repAmountSum.hull <= 0:
+            return
+        rps = repAmountSum / (timeFinish - timeStart)
+        rpsData = fitCache['rps']
+        # Store only points where rps value changes
+        try:
+            prevRps, prevTimeEnd = fitCache['lastCycles'][key]
+        # First item
+        except KeyError:
+            rpsData.add(key, timeStart, rps)
+        else:
+            # Gap between items
+            if floatUnerr(prevTimeEnd) < floatUnerr(timeStart):
+                rpsData.add(key, prevTimeEnd, RRTypes(0, 0, 0, 0))
+                rpsData.add(key, timeStart, rps)
+            # Changed value
+            elif rps != prevRps:
+                rpsData.add(key, timeStart, rps)
+        fitCache['lastCycles'][key] = (rps, timeFinish)
+
+    @staticmethod
+    def _addRepAmount(fitCache, key, time, repAmount):
+        if repAmount.shield <= 0 and repAmount.armor <= 0 and repAmount.hull <= 0:
+            return
+        # Rep amount is stored as total HP repaired by key by specified time
+        repAmountData = fitCache['repAmount']
+        prevRepAmount = repAmountData.getLast(key)
+        repAmountData.add(key, time, repAmount if prevRepAmount is None else prevRepAmount + repAmount)
+
+    def _iterSourceCycles(self, src, ancReload):
+        """Return (key, iterator over rep cycles) pairs for all remote reppers of fit."""
+        pairs = []
         # Modules
         for mod in src.item.activeModulesIter():
             if not mod.isRemoteRepping():
@@ -157,30 +140,8 @@ class TimeCache(FitDataCache):
                 cycleParams = mod.getCycleParameters(reloadOverride=True)
             if cycleParams is None:
                 continue
-            currentTime = 0
-            nonstopCycles = 0
-            cyclesWithoutReload = 0
-            cyclesUntilReload = mod.numShots
-            for cycleTimeMs, inactiveTimeMs, isInactivityReload in cycleParams.iterCycles():
-                cyclesWithoutReload += 1
-                cycleRepAmounts = []
-                repAmountParams = mod.getRepAmountParameters(spoolOptions=SpoolOptions(SpoolType.CYCLES, nonstopCycles, True))
-                for repTimeMs, repAmount in repAmountParams.items():
-                    # Loaded ancillary armor rep can keep running at less efficiency if we decide to not reload
-                    if isAncArmor and mod.charge and not ancReload and cyclesWithoutReload > cyclesUntilReload:
-                        repAmount = repAmount / mod.getModifiedItemAttr('chargedArmorDamageMultiplier', 1)
-                    cycleRepAmounts.append(repAmount)
-                    addRepAmount(mod, currentTime + repTimeMs / 1000, repAmount)
-                addRps(mod, currentTime, currentTime + cycleTimeMs / 1000, cycleRepAmounts)
-                if inactiveTimeMs > 0:
-                    nonstopCycles = 0
-                else:
-                    nonstopCycles += 1
-                if isInactivityReload:
-                    cyclesWithoutReload = 0
-                if currentTime > maxTime:
-                    break
-                currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
+            pairs.append((mod, self._iterModuleCycles(
+                mod=mod, cycleParams=cycleParams, isAncArmor=isAncArmor, ancReload=ancReload)))
         # Drones
         for drone in src.item.activeDronesIter():
             if not drone.isRemoteRepping():
@@ -188,31 +149,39 @@ class TimeCache(FitDataCache):
             cycleParams = drone.getCycleParameters(reloadOverride=True)
             if cycleParams is None:
                 continue
-            currentTime = 0
-            repAmountParams = drone.getRepAmountParameters()
-            for cycleTimeMs, inactiveTimeMs, isInactivityReload in cycleParams.iterCycles():
-                cycleRepAmounts = []
-                for repTimeMs, repAmount in repAmountParams.items():
-                    cycleRepAmounts.append(repAmount)
-                    addRepAmount(drone, currentTime + repTimeMs / 1000, repAmount)
-                addRps(drone, currentTime, currentTime + cycleTimeMs / 1000, cycleRepAmounts)
-                if currentTime > maxTime:
-                    break
-                currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
-
-    def _isTimeCacheValid(self, src, ancReload, maxTime):
-        try:
-            cacheMaxTime = self._data[src.item.ID][ancReload]['maxTime']
-        except KeyError:
-            return False
-        return maxTime <= cacheMaxTime
-
-    def _getDataPoint(self, src, ancReload, time, dataFunc):
-        data = dataFunc(src=src, ancReload=ancReload)
-        timesBefore = [t for t in data if floatUnerr(t) <= floatUnerr(time)]
-        try:
-            time = max(timesBefore)
-        except ValueError:
-            return {}
-        else:
-            return data[time]
+            pairs.append((drone, self._iterDroneCycles(cycleParams=cycleParams, repAmountParams=drone.getRepAmountParameters())))
+        return pairs
+
+    @staticmethod
+    def _iterModuleCycles(mod, cycleParams, isAncArmor, ancReload):
+        """Yield (cycle start time, cycle end time, [(time, rep amount)]) tuples for every cycle of module."""
+        currentTime = 0
+        nonstopCycles = 0
+        cyclesWithoutReload = 0
+        cyclesUntilReload = mod.numShots
+        for cycleTimeMs, inactiveTimeMs, isInactivityReload in cycleParams.iterCycles():
+            cyclesWithoutReload += 1
+            cycleRepAmounts = []
+            repAmountParams = mod.getRepAmountParameters(spoolOptions=SpoolOptions(SpoolType.CYCLES, nonstopCycles, True))
+            for repTimeMs, repAmount in repAmountParams.items():
+                # Loaded ancillary armor rep can keep running at less efficiency if we decide to not reload
+                if isAncArmor and mod.charge and not ancReload and cyclesWithoutReload > cyclesUntilReload:
+                    repAmount = repAmount / mod.getModifiedItemAttr('chargedArmorDamageMultiplier', 1)
+                cycleRepAmounts.append((currentTime + repTimeMs / 1000, repAmount))
+            yield currentTime, currentTime + cycleTimeMs / 1000, cycleRepAmounts
+            if inactiveTimeMs > 0:
+                nonstopCycles = 0
+            else:
+                nonstopCycles += 1
+            if isInactivityReload:
+                cyclesWithoutReload = 0
+            currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
+
+    @staticmethod
+    def _iterDroneCycles(cycleParams, repAmountParams):
+        """Same as _iterModuleCycles, but for drones."""
+        currentTime = 0
+        for cycleTimeMs, inactiveTimeMs, isInactivityReload in cycleParams.iterCycles():
+            cycleRepAmounts = [(currentTime + repTimeMs / 1000, repAmount) for repTimeMs, repAmount in repAmountParams.items()]
+            yield currentTime, currentTime + cycleTimeMs / 1000, cycleRepAmounts
+            currentTime += cycleTimeMs / 1000 + inactiveTimeMs / 1000
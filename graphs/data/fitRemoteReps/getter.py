@@ -120,9 +120,8 @@ class XTimeMixin(PointGetter):
         # Custom iteration for time graph to show all data points
         currentRepAmount = None
         currentTime = None
-        for currentTime in sorted(timeCache):
+        for currentTime, currentRepAmountData in timeCache.iterPoints():
             prevRepAmount = currentRepAmount
-            currentRepAmountData = timeCache[currentTime]
             currentRepAmount = applyReps(rrMap=currentRepAmountData, applicationMap=applicationMap)
             if currentTime < minTime:
                 continue
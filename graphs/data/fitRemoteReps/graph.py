@@ -60,6 +60,7 @@ class FitRemoteRepsGraph(FitGraph):
               secondaryTooltip=_t('Distance between the repairing ship and the target, as seen in overview (surface-to-surface)'))]
     srcExtraCols = ('ShieldRR', 'ArmorRR', 'HullRR')
     checkboxes = [InputCheckbox(handle='ancReload', label=_t('Reload ancillary RRs'), defaultValue=True)]
+    usedSettings = ('ignoreLockRange', 'ignoreDCR')
 
     # Calculation stuff
     _normalizers = {('distance', 'km'): lambda v, src, tgt: None if v is None else v * 1000}
@@ -51,6 +51,8 @@ class FitWarpTimeGraph(FitGraph):
         Input(handle='distance', unit='AU', label=_t('Distance'), iconID=1391, defaultValue=20, defaultRange=(0, 50)),
         Input(handle='distance', unit='km', label=_t('Distance'), iconID=1391, defaultValue=1000, defaultRange=(150, 5000))]
     srcExtraCols = ('WarpSpeed', 'WarpDistance')
+    # Subwarp speed cache switches modules off and recalculates source fit
+    threadSafe = False
 
     # Calculation stuff
     _normalizers = {
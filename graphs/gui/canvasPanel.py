@@ -18,6 +18,7 @@
 # =============================================================================
 
 
+import functools
 import itertools
 import math
 import os
@@ -31,6 +32,7 @@ from logbook import Logger
 
 
 from graphs.style import BASE_COLORS, LIGHTNESSES, STYLES, hsl_to_hsv
+from graphs.worker import JobCancelled, PlotWorker
 from gui.utils.numberFormatter import roundToPrec
 
 
@@ -101,13 +103,13 @@ class GraphCanvasPanel(wx.Panel):
         self.mplOnDragHandler = None
         self.mplOnReleaseHandler = None
 
+        self.__worker = PlotWorker()
+        self.__drawData = None
+
     def draw(self, accurateMarks=True):
+        self.cancelDraw()
         self.subplot.clear()
         self.subplot.grid(True)
-        allXs = set()
-        allYs = set()
-        plotData = {}
-        legendData = []
         chosenX = self.graphFrame.ctrlPanel.xType
         chosenY = self.graphFrame.ctrlPanel.yType
         self.subplot.set(
@@ -122,80 +124,193 @@ class GraphCanvasPanel(wx.Panel):
         else:
             iterList = tuple((f, None) for f in sources)
 
-        # Draw plot lines and get data for legend
+        drawData = self.__drawData = _DrawData(
+            view=view, xSpec=chosenX, ySpec=chosenY, mainInput=mainInput, miscInputs=miscInputs,
+            xMark=self.xMark, accurateMarks=accurateMarks)
+        # Series we have everything for in cache are drawn right away, the rest
+        # is calculated by jobs, one per source fit
+        # Format: {source: [(target, cached plot data or None), ...]}
+        pending = {}
         for source, target in iterList:
-            # Get line style data
-            try:
-                colorData = BASE_COLORS[source.colorID]
-            except KeyError:
-                pyfalog.warning('Invalid color "{}" for "{}"'.format(source.colorID, source.name))
+            lineData = self.__getLineData(source, target)
+            if lineData is None:
                 continue
-            color = colorData.hsl
-            lineStyle = 'solid'
-            if target is not None:
-                try:
-                    lightnessData = LIGHTNESSES[target.lightnessID]
-                except KeyError:
-                    pyfalog.warning('Invalid lightness "{}" for "{}"'.format(target.lightnessID, target.name))
-                    continue
-                color = lightnessData.func(color)
-                try:
-                    lineStyleData = STYLES[target.lineStyleID]
-                except KeyError:
-                    pyfalog.warning('Invalid line style "{}" for "{}"'.format(target.lightnessID, target.name))
+            drawData.lines[(source, target)] = lineData
+            plotData = view.getCachedPlotPoints(mainInput=mainInput, miscInputs=miscInputs, xSpec=chosenX, ySpec=chosenY, src=source, tgt=target)
+            if plotData is not None and drawData.needsPointAtMark(plotData):
+                y = view.getCachedPoint(x=drawData.xMark, miscInputs=miscInputs, xSpec=chosenX, ySpec=chosenY, src=source, tgt=target)
+                if y is not None:
+                    drawData.pointsAtMark[(source, target)] = y
+                else:
+                    pending.setdefault(source, []).append((target, plotData))
                     continue
-                lineStyle = lineStyleData.mplSpec
-            color = hsv_to_rgb(hsl_to_hsv(color))
+            if plotData is None:
+                pending.setdefault(source, []).append((target, None))
+                continue
+            self.__addSeries(drawData, (source, target), plotData)
+
+        if not pending:
+            self.__finishDraw(drawData)
+            return
+        jobs = [functools.partial(self.__calcSeries, drawData, source, targets) for source, targets in pending.items()]
+        if view.threadSafe:
+            self.__worker.submit(
+                jobs,
+                onResult=functools.partial(wx.CallAfter, self.__onSeriesReady, drawData),
+                onFinish=functools.partial(wx.CallAfter, self.__onDrawFinished, drawData))
+        else:
+            self.__worker.submit(
+                jobs,
+                onResult=functools.partial(self.__onSeriesReady, drawData),
+                onFinish=functools.partial(self.__onDrawFinished, drawData),
+                background=False)
+
+    def cancelDraw(self):
+        """Stop calculations of current drawing, without touching what is already drawn"""
+        self.__drawData = None
+        self.__worker.cancel()
 
-            # Get point data
+    def shutdown(self):
+        self.__drawData = None
+        self.__worker.shutdown()
+
+    @staticmethod
+    def __calcSeries(drawData, source, targets):
+        """Job which calculates data of all pending series of one source fit, in worker thread"""
+        view = drawData.view
+        for target, plotData in targets:
+            if plotData is None:
+                try:
+                    plotData = view.calcPlotPoints(
+                        mainInput=drawData.mainInput,
+                        miscInputs=drawData.miscInputs,
+                        xSpec=drawData.xSpec,
+                        ySpec=drawData.ySpec,
+                        src=source,
+                        tgt=target)
+                except (KeyboardInterrupt, SystemExit, JobCancelled):
+                    raise
+                except Exception:
+                    yield (source, target), None, False, None
+                    return
+            hasPoint = False
+            y = None
+            if drawData.needsPointAtMark(plotData):
+                try:
+                    y = view.calcPoint(
+                        x=drawData.xMark,
+                        miscInputs=drawData.miscInputs,
+                        xSpec=drawData.xSpec,
+                        ySpec=drawData.ySpec,
+                        src=source,
+                        tgt=target)
+                    hasPoint = True
+                except (KeyboardInterrupt, SystemExit, JobCancelled):
+                    raise
+                except Exception:
+                    pyfalog.warning('Failed to get X mark for "{}" vs "{}"'.format(source.name, '' if target is None else target.name))
+            yield (source, target), plotData, hasPoint, y
+
+    def __onSeriesReady(self, drawData, result):
+        # Results of cancelled drawings might still be in event queue
+        if drawData is not self.__drawData:
+            return
+        (source, target), plotData, hasPoint, y = result
+        if plotData is None:
+            pyfalog.warning('Failed to plot "{}" vs "{}"'.format(source.name, '' if target is None else target.name))
+            self.cancelDraw()
+            self.canvas.draw()
+            self.Refresh()
+            return
+        view = drawData.view
+        view.cachePlotPoints(
+            plotData=plotData, mainInput=drawData.mainInput, miscInputs=drawData.miscInputs,
+            xSpec=drawData.xSpec, ySpec=drawData.ySpec, src=source, tgt=target)
+        if hasPoint:
+            view.cachePoint(
+                y=y, x=drawData.xMark, miscInputs=drawData.miscInputs,
+                xSpec=drawData.xSpec, ySpec=drawData.ySpec, src=source, tgt=target)
+            drawData.pointsAtMark[(source, target)] = y
+        self.__addSeries(drawData, (source, target), plotData)
+        # Show what we have so far, marks and legend are added when everything is ready
+        self.__setLimits(drawData)
+        self.canvas.draw_idle()
+
+    def __onDrawFinished(self, drawData):
+        if drawData is not self.__drawData:
+            return
+        self.__finishDraw(drawData)
+
+    def __getLineData(self, source, target):
+        """Return color, line style and legend label of series, or None if source or target style is invalid"""
+        try:
+            colorData = BASE_COLORS[source.colorID]
+        except KeyError:
+            pyfalog.warning('Invalid color "{}" for "{}"'.format(source.colorID, source.name))
+            return None
+        color = colorData.hsl
+        lineStyle = 'solid'
+        if target is not None:
             try:
-                xs, ys = view.getPlotPoints(
-                    mainInput=mainInput,
-                    miscInputs=miscInputs,
-                    xSpec=chosenX,
-                    ySpec=chosenY,
-                    src=source,
-                    tgt=target)
-                if not self.__checkNumbers(xs, ys):
-                    pyfalog.warning('Failed to plot "{}" vs "{}" due to inf or NaN in values'.format(source.name, '' if target is None else target.name))
-                    continue
-                plotData[(source, target)] = (xs, ys)
-                allXs.update(xs)
-                allYs.update(ys)
-                # If we have single data point, show marker - otherwise line won't be shown
-                if len(xs) == 1 and len(ys) == 1:
-                    self.subplot.plot(xs, ys, color=color, linestyle=lineStyle, marker='.')
-                else:
-                    self.subplot.plot(xs, ys, color=color, linestyle=lineStyle)
-                # Fill data for legend
-                if target is None:
-                    legendData.append((color, lineStyle, source.shortName))
-                else:
-                    legendData.append((color, lineStyle, '{} vs {}'.format(source.shortName, target.shortName)))
-            except (KeyboardInterrupt, SystemExit):
-                raise
-            except Exception:
-                pyfalog.warning('Failed to plot "{}" vs "{}"'.format(source.name, '' if target is None else target.name))
-                self.canvas.draw()
-                self.Refresh()
-                return
-
-        # Setting Y limits for canvas
+                lightnessData = LIGHTNESSES[target.lightnessID]
+            except KeyError:
+                pyfalog.warning('Invalid lightness "{}" for "{}"'.format(target.lightnessID, target.name))
+                return None
+            color = lightnessData.func(color)
+            try:
+                lineStyleData = STYLES[target.lineStyleID]
+            except KeyError:
+                pyfalog.warning('Invalid line style "{}" for "{}"'.format(target.lightnessID, target.name))
+                return None
+            lineStyle = lineStyleData.mplSpec
+        color = hsv_to_rgb(hsl_to_hsv(color))
+        if target is None:
+            label = source.shortName
+        else:
+            label = '{} vs {}'.format(source.shortName, target.shortName)
+        return color, lineStyle, label
+
+    def __addSeries(self, drawData, key, plotData):
+        source, target = key
+        xs, ys = plotData
+        if not self.__checkNumbers(xs, ys):
+            pyfalog.warning('Failed to plot "{}" vs "{}" due to inf or NaN in values'.format(source.name, '' if target is None else target.name))
+            return
+        color, lineStyle, label = drawData.lines[key]
+        drawData.plotData[key] = plotData
+        drawData.allXs.update(xs)
+        drawData.allYs.update(ys)
+        # If we have single data point, show marker - otherwise line won't be shown
+        if len(xs) == 1 and len(ys) == 1:
+            self.subplot.plot(xs, ys, color=color, linestyle=lineStyle, marker='.')
+        else:
+            self.subplot.plot(xs, ys, color=color, linestyle=lineStyle)
+
+    def __setLimits(self, drawData):
+        allYs = drawData.allYs
         if self.graphFrame.ctrlPanel.showY0:
-            allYs.add(0)
+            allYs = allYs | {0}
         canvasMinY, canvasMaxY = self._getLimits(allYs, minExtra=0.05, maxExtra=0.1)
-        canvasMinX, canvasMaxX = self._getLimits(allXs, minExtra=0.02, maxExtra=0.02)
+        canvasMinX, canvasMaxX = self._getLimits(drawData.allXs, minExtra=0.02, maxExtra=0.02)
         self.subplot.set_ylim(bottom=canvasMinY, top=canvasMaxY)
         self.subplot.set_xlim(left=canvasMinX, right=canvasMaxX)
+        return canvasMinX, canvasMaxX, canvasMinY, canvasMaxY
+
+    def __finishDraw(self, drawData):
+        chosenX = drawData.xSpec
+        allXs = drawData.allXs
+        allYs = drawData.allYs
+        # Setting limits for canvas
+        canvasMinX, canvasMaxX, canvasMinY, canvasMaxY = self.__setLimits(drawData)
         # Process X marks line
-        if self.xMark is not None:
+        if drawData.xMark is not None:
             minX = min(allXs, default=None)
             maxX = max(allXs, default=None)
             if minX is not None and maxX is not None:
                 minY = min(allYs, default=None)
                 maxY = max(allYs, default=None)
                 yDiff = (maxY or 0) - (minY or 0)
-                xMark = max(min(self.xMark, maxX), minX)
+                xMark = max(min(drawData.xMark, maxX), minX)
                 # If in top 10% of X coordinates, align labels differently
                 if xMark > canvasMinX + 0.9 * (canvasMaxX - canvasMinX):
                     labelAlignment = 'right'
@@ -232,37 +347,29 @@ class GraphCanvasPanel(wx.Panel):
                     if minY <= val <= maxY or minY <= rounded <= maxY:
                         yMarks.add(rounded)
 
-                for source, target in iterList:
-                    xs, ys = plotData[(source, target)]
+                for key in drawData.lines:
+                    if key not in drawData.plotData:
+                        continue
+                    xs, ys = drawData.plotData[key]
                     if not xs or xMark < min(xs) or xMark > max(xs):
                         continue
-                    # Fetch values from graphs when we're asked to provide accurate data
-                    if accurateMarks:
-                        try:
-                            y = view.getPoint(
-                                x=xMark,
-                                miscInputs=miscInputs,
-                                xSpec=chosenX,
-                                ySpec=chosenY,
-                                src=source,
-                                tgt=target)
-                            addYMark(y)
-                        except (KeyboardInterrupt, SystemExit):
-                            raise
-                        except Exception:
-                            pyfalog.warning('Failed to get X mark for "{}" vs "{}"'.format(source.name, '' if target is None else target.name))
-                            # Silently skip this mark, otherwise other marks and legend display will fail
-                            continue
+                    # Values from graphs are fetched along with plot data when
+                    # we're asked to provide accurate data
+                    if drawData.accurateMarks and xMark == drawData.xMark:
+                        # If there is no value, we failed to get it - silently
+                        # skip this mark, otherwise other marks and legend display will fail
+                        if key in drawData.pointsAtMark:
+                            addYMark(drawData.pointsAtMark[key])
+                        continue
                     # Otherwise just do linear interpolation between two points
-                    else:
-                        if xMark in xs:
-                            # We might have multiples of the same value in our sequence, pick value for the last one
-                            idx = len(xs) - xs[::-1].index(xMark) - 1
-                            addYMark(ys[idx])
-                            continue
-                        idx = bisect(xs, xMark)
-                        yMark = self._interpolateX(x=xMark, x1=xs[idx - 1], y1=ys[idx - 1], x2=xs[idx], y2=ys[idx])
-                        addYMark(yMark)
+                    if xMark in xs:
+                        # We might have multiples of the same value in our sequence, pick value for the last one
+                        idx = len(xs) - xs[::-1].index(xMark) - 1
+                        addYMark(ys[idx])
+                        continue
+                    idx = bisect(xs, xMark)
+                    yMark = self._interpolateX(x=xMark, x1=xs[idx - 1], y1=ys[idx - 1], x2=xs[idx], y2=ys[idx])
+                    addYMark(yMark)
 
                 # Draw Y values
                 for yMark in yMarks:
@@ -271,8 +378,9 @@ class GraphCanvasPanel(wx.Panel):
                         textcoords='offset pixels', ha=labelAlignment, va='center', fontsize='small')
 
         legendLines = []
-        for i, iData in enumerate(legendData):
-            color, lineStyle, label = iData
+        for key, (color, lineStyle, label) in drawData.lines.items():
+            if key not in drawData.plotData:
+                continue
             legendLines.append(Line2D([0], [0], color=color, linestyle=lineStyle, label=label.replace('$', r'\$')))
 
         if len(legendLines) > 0 and self.graphFrame.ctrlPanel.showLegend:
@@ -352,3 +460,32 @@ class GraphCanvasPanel(wx.Panel):
             # we just re-use coordinates set on click/drag and just request to redraw
             # using accurate data
             self.draw(accurateMarks=True)
+
+
+class _DrawData:
+    """Inputs and results of one drawing, which is finished after its series are calculated"""
+
+    def __init__(self, view, xSpec, ySpec, mainInput, miscInputs, xMark, accurateMarks):
+        self.view = view
+        self.xSpec = xSpec
+        self.ySpec = ySpec
+        self.mainInput = mainInput
+        self.miscInputs = miscInputs
+        self.xMark = xMark
+        self.accurateMarks = accurateMarks
+        # Series in order they are shown in legend
+        # Format: {(source, target): (color, line style, label)}
+        self.lines = {}
+        # Format: {(source, target): (xs, ys)}
+        self.plotData = {}
+        # Accurate Y values at X mark
+        # Format: {(source, target): y}
+        self.pointsAtMark = {}
+        self.allXs = set()
+        self.allYs = set()
+
+    def needsPointAtMark(self, plotData):
+        if not self.accurateMarks or self.xMark is None:
+            return False
+        xs = plotData[0]
+        return bool(xs) and min(xs) <= self.xMark <= max(xs)
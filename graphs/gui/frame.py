@@ -182,7 +182,7 @@ class GraphFrame(AuxiliaryFrame):
                 self.ctrlPanel.refreshColumns()
             self.Layout()
             self.ctrlPanel.Thaw()
-        self.clearCache(reason=GraphCacheCleanupReason.optionChanged)
+        self.clearCache(reason=GraphCacheCleanupReason.optionChanged, extraData=getattr(event, 'setting', None))
         self.draw()
 
     def OnEffectiveHpToggled(self, event):
@@ -229,6 +229,7 @@ class GraphFrame(AuxiliaryFrame):
         self.mainFrame.Unbind(RESIST_MODE_CHANGED, handler=self.OnResistModeChanged)
         self.mainFrame.Unbind(GE.GRAPH_OPTION_CHANGED, handler=self.OnGraphOptionChanged)
         self.mainFrame.Unbind(GE.EFFECTIVE_HP_TOGGLED, handler=self.OnEffectiveHpToggled)
+        self.canvasPanel.shutdown()
         event.Skip()
 
     def getView(self, idx=None):
@@ -237,7 +238,16 @@ class GraphFrame(AuxiliaryFrame):
         return self.graphSelection.GetClientData(idx)
 
     def clearCache(self, reason, extraData=None):
-        self.getView().clearCache(reason, extraData)
+        # Running calculations could put outdated data into cache
+        self.canvasPanel.cancelDraw()
+        if reason == GraphCacheCleanupReason.graphSwitched:
+            views = (self.getView(),)
+        # Caches of graphs which are not shown are kept up to date as well,
+        # so that switching graphs does not have to drop them
+        else:
+            views = [self.getView(idx=idx) for idx in range(self.graphSelection.GetCount())]
+        for view in views:
+            view.clearCache(reason, extraData)
 
     def draw(self):
         self.canvasPanel.draw()
@@ -0,0 +1,150 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+import concurrent.futures
+import os
+import threading
+
+from logbook import Logger
+
+
+pyfalog = Logger(__name__)
+
+
+# Token of the job current thread is running
+_local = threading.local()
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class CancelToken:
+
+    def __init__(self):
+        self.__event = threading.Event()
+
+    def cancel(self):
+        self.__event.set()
+
+    @property
+    def cancelled(self):
+        return self.__event.is_set()
+
+
+def checkCancelled():
+    """
+    Abort job current thread is running if it got cancelled. Called by getters
+    in their loops, so that long calculations do not have to finish before we
+    can start with new inputs. Does nothing outside of jobs.
+    """
+    token = getattr(_local, 'token', None)
+    if token is not None and token.cancelled:
+        raise JobCancelled
+
+
+class PlotWorker:
+    """
+    Runs plot calculation jobs in thread pool. Jobs are generator functions;
+    every value job yields is passed to result callback as soon as it is ready,
+    and once all jobs of a submission are done, finish callback is called.
+    Callbacks are called from worker threads, and are not called for results
+    of cancelled submissions.
+
+    Only one submission runs at a time: submitting new jobs cancels previous
+    ones, and waits for them to stop, so that jobs never touch data of the
+    same graph from different submissions.
+    """
+
+    def __init__(self, maxWorkers=None):
+        self.__maxWorkers = maxWorkers or min(4, os.cpu_count() or 1)
+        self.__executor = None
+        self.__token = None
+        self.__futures = []
+
+    def submit(self, jobs, onResult, onFinish, background=True):
+        """
+        Start jobs, returns cancel token of submission. Without background
+        flag, jobs are run right away in current thread.
+        """
+        self.cancel()
+        token = self.__token = CancelToken()
+        if not background:
+            for job in jobs:
+                self.__runJob(token, job, onResult)
+            if not token.cancelled:
+                onFinish()
+            return token
+        if not jobs:
+            onFinish()
+            return token
+        if self.__executor is None:
+            self.__executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.__maxWorkers, thread_name_prefix='GraphWorker')
+        remaining = [len(jobs)]
+        remainingLock = threading.Lock()
+
+        def run(job):
+            try:
+                self.__runJob(token, job, onResult)
+            finally:
+                with remainingLock:
+                    remaining[0] -= 1
+                    done = remaining[0] == 0
+                if done and not token.cancelled:
+                    onFinish()
+
+        self.__futures = [self.__executor.submit(run, job) for job in jobs]
+        return token
+
+    def cancel(self):
+        """Cancel current submission and wait for its running jobs to stop"""
+        if self.__token is not None:
+            self.__token.cancel()
+            self.__token = None
+        for future in self.__futures:
+            future.cancel()
+        concurrent.futures.wait(self.__futures)
+        self.__futures = []
+
+    def shutdown(self):
+        self.cancel()
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
+    @staticmethod
+    def __runJob(token, job, onResult):
+        if token.cancelled:
+            return
+        _local.token = token
+        try:
+            for result in job():
+                if token.cancelled:
+                    return
+                onResult(result)
+        except JobCancelled:
+            pass
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception:
+            pyfalog.exception('Plot calculation job failed')
+        finally:
+            _local.token = None
@@ -24,7 +24,7 @@ class GraphDmgApplyProjectedMenu(ContextMenuUnconditional):
 
     def activate(self, callingWindow, fullContext, i):
         self.settings.set('applyProjected', not self.settings.get('applyProjected'))
-        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged())
+        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged(setting='applyProjected'))
 
     def isChecked(self, i):
         return self.settings.get('applyProjected')
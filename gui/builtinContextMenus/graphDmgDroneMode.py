@@ -30,7 +30,7 @@ class GraphDmgDroneModeMenu(ContextMenuUnconditional):
         if option == self.settings.get('mobileDroneMode'):
             return
         self.settings.set('mobileDroneMode', option)
-        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged())
+        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged(setting='mobileDroneMode'))
 
     def getSubMenu(self, callingWindow, context, rootMenu, i, pitem):
         m = wx.Menu()
@@ -24,7 +24,7 @@ class GraphDmgIgnoreResistsMenu(ContextMenuUnconditional):
 
     def activate(self, callingWindow, fullContext, i):
         self.settings.set('ignoreResists', not self.settings.get('ignoreResists'))
-        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged(refreshAxeLabels=True, refreshColumns=True))
+        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged(setting='ignoreResists', refreshAxeLabels=True, refreshColumns=True))
 
     def isChecked(self, i):
         return self.settings.get('ignoreResists')
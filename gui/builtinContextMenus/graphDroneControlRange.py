@@ -24,7 +24,7 @@ class GraphIgnoreDcrMenu(ContextMenuUnconditional):
 
     def activate(self, callingWindow, fullContext, i):
         self.settings.set('ignoreDCR', not self.settings.get('ignoreDCR'))
-        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged())
+        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged(setting='ignoreDCR'))
 
     def isChecked(self, i):
         return self.settings.get('ignoreDCR')
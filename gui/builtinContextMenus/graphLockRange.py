@@ -24,7 +24,7 @@ class GraphIgnoreLockRangeMenu(ContextMenuUnconditional):
 
     def activate(self, callingWindow, fullContext, i):
         self.settings.set('ignoreLockRange', not self.settings.get('ignoreLockRange'))
-        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged())
+        wx.PostEvent(self.mainFrame, GE.GraphOptionChanged(setting='ignoreLockRange'))
 
     def isChecked(self, i):
         return self.settings.get('ignoreLockRange')
@@ -57,6 +57,17 @@ class PFFittingEnginePref(PreferenceView):
 
         mainSizer.Add(self.cbStrictSkillLevels, 0, wx.ALL | wx.EXPAND, 5)
 
+        self.cbIncrementalCalc = wx.CheckBox(panel, wx.ID_ANY,
+                                             _t("Recalculate only affected attributes when module states change"),
+                                             wx.DefaultPosition, wx.DefaultSize, 0)
+        self.cbIncrementalCalc.SetCursor(helpCursor)
+        self.cbIncrementalCalc.SetToolTip(wx.ToolTip(
+                _t('When enabled, pyfa remembers which attributes each effect has used, and when module states or charges '
+                   'change, re-runs only effects which depend on the change. Fits with projected or command fits are '
+                   'always fully recalculated.')))
+
+        mainSizer.Add(self.cbIncrementalCalc, 0, wx.ALL | wx.EXPAND, 5)
+
         spoolup_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
         self.spool_up_label = wx.StaticText(panel, wx.ID_ANY, _t("Global Default Spoolup Percentage:"), wx.DefaultPosition, wx.DefaultSize, 0)
@@ -104,6 +115,9 @@ class PFFittingEnginePref(PreferenceView):
         self.cbStrictSkillLevels.SetValue(self.engine_settings.get("strictSkillLevels"))
         self.cbStrictSkillLevels.Bind(wx.EVT_CHECKBOX, self.OnCBStrictSkillLevelsChange)
 
+        self.cbIncrementalCalc.SetValue(self.engine_settings.get("incrementalCalc"))
+        self.cbIncrementalCalc.Bind(wx.EVT_CHECKBOX, self.OnCBIncrementalCalcChange)
+
         self.spoolup_value.SetValue(int(self.engine_settings.get("globalDefaultSpoolupPercentage") * 100))
         self.spoolup_value.Bind(wx.lib.intctrl.EVT_INT, self.OnSpoolupChange)
 
@@ -120,6 +134,9 @@ class PFFittingEnginePref(PreferenceView):
     def OnCBStrictSkillLevelsChange(self, event):
         self.engine_settings.set("strictSkillLevels", self.cbStrictSkillLevels.GetValue())
 
+    def OnCBIncrementalCalcChange(self, event):
+        self.engine_settings.set("incrementalCalc", self.cbIncrementalCalc.GetValue())
+
 
     def getImage(self):
         return BitmapLoader.getBitmap("settings_fitting", "gui")
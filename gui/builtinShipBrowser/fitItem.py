@@ -16,6 +16,7 @@ import gui.utils.draw as drawUtils
 import gui.utils.fonts as fonts
 from gui.bitmap_loader import BitmapLoader
 from gui.builtinShipBrowser.pfBitmapFrame import PFBitmapFrame
+from gui.utils.numberFormatter import formatAmount
 from service.fit import Fit
 from .events import BoosterListUpdated, FitSelected, ImportSelected, SearchSelected, Stage3Selected
 
@@ -25,7 +26,7 @@ _t = wx.GetTranslation
 
 class FitItem(SFItem.SFBrowserItem):
     def __init__(self, parent, fitID=None, shipFittingInfo=("Test", "TestTrait", "cnc's avatar", 0, 0, None), shipID=None,
-                 itemData=None, graphicID=None,
+                 itemData=None, graphicID=None, stats=None,
                  id=wx.ID_ANY, pos=wx.DefaultPosition,
                  size=(0, 40), style=0):
 
@@ -46,6 +47,11 @@ class FitItem(SFItem.SFBrowserItem):
 
         self.shipID = shipID
 
+        # Headline stats (eos.fitBatch.FitStats) shown in tooltip, if available;
+        # ones which are not cached are requested when mouse enters the item
+        self.stats = stats
+        self.statsRequested = stats is not None
+
         self.shipBrowser = self.Parent.Parent
 
         self.shipBmp = None
@@ -162,7 +168,20 @@ class FitItem(SFItem.SFBrowserItem):
             notes = ""
             if self.notes:
                 notes = '─' * 20 + "\nNotes: {}\n".format(self.notes[:197] + '...' if len(self.notes) > 200 else self.notes)
-            self.SetToolTip(wx.ToolTip('{}\n{}{}\n{}'.format(self.shipName, notes, '─' * 20, self.shipTrait)))
+            stats = ""
+            if self.stats is not None:
+                stats = '─' * 20 + "\n{} DPS, {} EHP, {} m/s\n".format(
+                    formatAmount(self.stats.dps, 3, 0, 3),
+                    formatAmount(self.stats.ehp, 3, 0, 9),
+                    formatAmount(self.stats.maxSpeed, 3, 0, 3))
+            self.SetToolTip(wx.ToolTip('{}\n{}{}{}\n{}'.format(self.shipName, notes, stats, '─' * 20, self.shipTrait)))
+
+    def OnEnterWindow(self, event):
+        if not self.statsRequested:
+            self.statsRequested = True
+            self.stats = self.shipBrowser.getFitStats([self.fitID], calculate=True).get(self.fitID)
+            self.__setToolTip()
+        SFItem.SFBrowserItem.OnEnterWindow(self, event)
 
     def OnKeyUp(self, event):
         if event.GetKeyCode() in (32, 13):  # space and enter
@@ -565,6 +584,9 @@ class FitItem(SFItem.SFBrowserItem):
             if fit is not None:  # sometimes happens when deleting fits, dunno why.
                 self.timestamp = fit.modifiedCoalesce
                 self.notes = fit.notes
+                # Fit might have been changed, stats are fetched again when needed
+                self.stats = None
+                self.statsRequested = False
                 self.__setToolTip()
 
         SFItem.SFBrowserItem.Refresh(self)
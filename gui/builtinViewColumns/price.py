@@ -20,6 +20,7 @@
 # noinspection PyPackageRequirements
 import wx
 
+from eos.gamedata import Item
 from eos.saveddata.cargo import Cargo
 from eos.saveddata.drone import Drone
 from eos.saveddata.fighter import Fighter
@@ -51,6 +52,14 @@ class Price(ViewColumn):
         self.mask = wx.LIST_MASK_IMAGE
         self.bitmap = BitmapLoader.getBitmap("totalPrice_small", "gui")
         self.imageId = fittingView.imageList.GetImageIndex("totalPrice_small", "gui")
+        # Rows waiting for prices, requested at once when refresh is finished
+        # Format: [(stuff, list item)]
+        self.delayed = []
+
+    def prepareRefresh(self, stuff):
+        # Load prices of all rows with one query, not one query per row
+        items = [getattr(st, "item", None) for st in stuff]
+        Item.loadPrices([i for i in items if i is not None])
 
     def getText(self, stuff):
         if stuff.item is None or stuff.item.group.name == "Ship Modifiers":
@@ -71,15 +80,21 @@ class Price(ViewColumn):
         return formatPrice(stuff, priceObj)
 
     def delayedText(self, mod, display, colItem):
-        sPrice = ServicePrice.getInstance()
+        self.delayed.append((mod, colItem))
 
-        def callback(item):
-            priceObj = item[0]
-            colItem.SetText(formatPrice(mod, priceObj))
+    def finishRefresh(self, display):
+        if not self.delayed:
+            return
+        delayed = self.delayed
+        self.delayed = []
+        sPrice = ServicePrice.getInstance()
 
-            display.SetItem(colItem)
+        def callback(prices):
+            for (mod, colItem), priceObj in zip(delayed, prices):
+                colItem.SetText(formatPrice(mod, priceObj))
+                display.SetItem(colItem)
 
-        sPrice.getPrices([mod.item], callback, waitforthread=True)
+        sPrice.getPrices([mod.item for mod, _ in delayed], callback, waitforthread=True)
 
     def getImageId(self, mod):
         return -1
@@ -207,6 +207,8 @@ class Display(wx.ListCtrl):
     def refresh(self, stuff):
         if stuff is None:
             return
+        for col in self.activeColumns:
+            col.prepareRefresh(stuff)
         item = -1
         for id_, st in enumerate(stuff):
 
@@ -247,6 +249,9 @@ class Display(wx.ListCtrl):
 
                 self.SetItemData(item, id_)
 
+        for col in self.activeColumns:
+            col.finishRefresh(self)
+
         for i, col in enumerate(self.activeColumns):
             if not col.resized:
                 if col.size == wx.LIST_AUTOSIZE_USEHEADER:
@@ -50,7 +50,7 @@ class CalcChangeModuleChargesCommand(wx.Command):
         if not changes:
             return False
         if self.recalc:
-            sFit.recalc(fit)
+            sFit.recalc(fit, incremental=True)
             self.savedStateCheckChanges = sFit.checkStates(fit, None)
         return True
 
@@ -48,7 +48,7 @@ class CalcChangeLocalModuleStatesCommand(wx.Command):
                 changed = True
         if not changed:
             return False
-        sFit.recalc(fit)
+        sFit.recalc(fit, incremental=True)
         self.savedStateCheckChanges = sFit.checkStates(fit, mainMod)
         return True
 
@@ -526,6 +526,8 @@ class MainFrame(wx.Frame):
         self.Bind(wx.EVT_MENU, self.importCharacter, id=menuBar.importCharacterId)
         # Export HTML
         self.Bind(wx.EVT_MENU, self.exportHtml, id=menuBar.exportHtmlId)
+        # Export fit stats
+        self.Bind(wx.EVT_MENU, self.exportFitStatsTable, id=menuBar.exportFitStatsId)
         # Preference dialog
         self.Bind(wx.EVT_MENU, self.OnShowPreferenceDialog, id=wx.ID_PREFERENCES)
         # User guide
@@ -882,6 +884,33 @@ class MainFrame(wx.Frame):
                     progress=progress,
                     errMsgLbl=_t("Export Error"))
 
+    def exportFitStatsTable(self, event):
+        """ Export stats of all fits to CSV file """
+        defaultFile = "pyfa-fit-stats-%s.csv" % strftime("%Y%m%d_%H%M%S", gmtime())
+
+        with wx.FileDialog(
+                self,
+                _t("Save Fit Stats As..."),
+                wildcard=_t("CSV file") + " (*.csv)|*.csv",
+                style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+                defaultFile=defaultFile) as fileDlg:
+            if fileDlg.ShowModal() == wx.ID_OK:
+                filePath = fileDlg.GetPath()
+                if '.' not in os.path.basename(filePath):
+                    filePath += ".csv"
+
+                fitAmount = Fit.getInstance().countAllFits()
+                progress = ProgressHelper(
+                    message=_t("Exporting stats of {} fits to: {}").format(fitAmount, filePath),
+                    maximum=fitAmount)
+                call = (Port.exportFitStatsTableThreaded, [filePath, progress], {})
+                self.handleProgress(
+                    title=_t("Export fit stats"),
+                    style=wx.PD_CAN_ABORT | wx.PD_SMOOTH | wx.PD_ELAPSED_TIME | wx.PD_APP_MODAL | wx.PD_AUTO_HIDE,
+                    call=call,
+                    progress=progress,
+                    errMsgLbl=_t("Export Error"))
+
     def exportHtml(self, event):
         from gui.utils.exportHtml import exportHtml
 
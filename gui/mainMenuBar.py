@@ -41,6 +41,7 @@ class MainMenuBar(wx.MenuBar):
         self.implantSetEditorId = wx.NewId()
         self.graphFrameId = wx.NewId()
         self.backupFitsId = wx.NewId()
+        self.exportFitStatsId = wx.NewId()
         self.exportSkillsNeededId = wx.NewId()
         self.importCharacterId = wx.NewId()
         self.exportHtmlId = wx.NewId()
@@ -72,6 +73,7 @@ class MainMenuBar(wx.MenuBar):
         fileMenu.AppendSeparator()
         fileMenu.Append(self.backupFitsId, _t("&Backup All Fittings"), _t("Backup all fittings to a XML file"))
         fileMenu.Append(self.exportHtmlId, _t("Export All Fittings to &HTML"), _t("Export fits to HTML file (set in Preferences)"))
+        fileMenu.Append(self.exportFitStatsId, _t("Export All Fitting &Stats"), _t("Export stats of all fits to a CSV file"))
 
         fileMenu.AppendSeparator()
         fileMenu.Append(wx.ID_EXIT)
@@ -337,13 +337,28 @@ class ShipBrowser(wx.Panel):
 
         shipTrait = ship.traits.display if (ship.traits is not None) else ""  # empty string if no traits
 
+        fitStats = self.getFitStats([fit[0] for fit in fitList])
         for ID, name, booster, timestamp, notes, graphicID in fitList:
-            self.lpane.AddWidget(FitItem(self.lpane, ID, (shipName, shipTrait, name, booster, timestamp, notes), shipID, graphicID=graphicID))
+            self.lpane.AddWidget(FitItem(
+                self.lpane, ID, (shipName, shipTrait, name, booster, timestamp, notes), shipID,
+                graphicID=graphicID, stats=fitStats.get(ID)))
 
         self.lpane.RefreshList()
         self.lpane.Thaw()
         self.raceselect.RebuildRaces(self.RACE_ORDER)
 
+    @staticmethod
+    def getFitStats(fitIDs, calculate=False):
+        """
+        Return {fitID: stats} for fit items, stats are shown only in tooltips.
+        Lists are filled with cached stats only, fit items calculate the rest
+        when mouse gets to them.
+        """
+        sFit = Fit.getInstance()
+        if not sFit.serviceFittingOptions["showShipBrowserTooltip"]:
+            return {}
+        return sFit.getFitStats(fitIDs, calculate=calculate)
+
     def searchStage(self, event):
 
         self.lpane.ShowLoading(False)
@@ -378,6 +393,7 @@ class ShipBrowser(wx.Panel):
                     ShipItem(self.lpane, ship.ID, (ship.name, shipTrait, len(sFit.getFitsWithShip(ship.ID))),
                              ship.race, ship.graphicID))
 
+            fitStats = self.getFitStats([fit[0] for fit in fitList])
             for ID, name, shipID, shipName, booster, timestamp, notes in fitList:
                 ship = sMkt.getItem(shipID)
 
@@ -386,7 +402,9 @@ class ShipBrowser(wx.Panel):
 
                 shipTrait = ship.traits.display if (ship.traits is not None) else ""  # empty string if no traits
 
-                self.lpane.AddWidget(FitItem(self.lpane, ID, (shipName, shipTrait, name, booster, timestamp, notes), shipID, graphicID=ship.graphicID))
+                self.lpane.AddWidget(FitItem(
+                    self.lpane, ID, (shipName, shipTrait, name, booster, timestamp, notes), shipID,
+                    graphicID=ship.graphicID, stats=fitStats.get(ID)))
             if len(ships) == 0 and len(fitList) == 0:
                 self.lpane.AddWidget(PFStaticText(self.lpane, label="No matching results."))
             self.lpane.RefreshList(doFocus=False)
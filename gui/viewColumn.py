@@ -66,6 +66,14 @@ class ViewColumn:
     def delayedText(self, display, colItem):
         raise NotImplementedError()
 
+    def prepareRefresh(self, stuff):
+        """Called before rows of display are refreshed, with objects of all rows"""
+        pass
+
+    def finishRefresh(self, display):
+        """Called after all rows of display are refreshed"""
+        pass
+
 
 # noinspection PyUnresolvedReferences
 from gui.builtinViewColumns import (  # noqa: E402, F401
@@ -20,6 +20,7 @@
 
 
 import datetime
+import multiprocessing
 import os
 import sys
 from optparse import AmbiguousOptionError, BadOptionError, OptionParser
@@ -79,6 +80,9 @@ parser.add_option("-i", "--language", action="store", dest="language", help="Set
 
 if __name__ == "__main__":
 
+    # Frozen builds start worker processes of FitCalcPool through this executable
+    multiprocessing.freeze_support()
+
     try:
         # first and foremost - check required libraries
         version_precheck()
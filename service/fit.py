@@ -19,14 +19,18 @@
 
 import copy
 import datetime
+import os
 from time import time
 from weakref import WeakSet
 
 import wx
 from logbook import Logger
 
+import config
 import eos.db
 from eos.const import FittingModuleState, ImplantLocation
+from eos.fitBatch import FitStats, evaluateFits
+from eos.fitStatsCache import FitStatsCache, getFitStatsKey
 from eos.saveddata.character import Character as saveddata_Character
 from eos.saveddata.citadel import Citadel as es_Citadel
 from eos.saveddata.damagePattern import DamagePattern as es_DamagePattern
@@ -56,6 +60,7 @@ class DeferRecalc:
 
 class Fit:
     instance = None
+    statsCache = None
     processors = {}
 
     @classmethod
@@ -99,6 +104,35 @@ class Fit:
         self.serviceFittingOptions = SettingsProvider.getInstance().getSettings(
             "pyfaServiceFittingOptions", serviceFittingDefaultOptions)
 
+    @classmethod
+    def getStatsCache(cls):
+        if cls.statsCache is None:
+            cls.statsCache = FitStatsCache(os.path.join(config.savePath, "fitStatsCache.db"))
+        return cls.statsCache
+
+    def getFitStats(self, fitIDs, calculate=True):
+        """
+        Get headline stats of fits as {fitID: eos.fitBatch.FitStats}, for
+        fit lists and such. Stats come from persistent cache; fits which are
+        not there are calculated only if calculate is set. Fits with projected
+        or command fits are skipped, their stats can't be cached and they'd be
+        calculated on every lookup.
+        """
+        cache = self.getStatsCache()
+        fits = [eos.db.getFit(fitID) for fitID in fitIDs]
+        fits = [f for f in fits if f is not None and not f.isInvalid]
+        keys = {f.ID: getFitStatsKey(f) for f in fits}
+        fits = [f for f in fits if keys[f.ID] is not None]
+        if calculate:
+            # Batch evaluation leaves calculated fits calculated, and does not
+            # touch fits with cached stats at all
+            rows = evaluateFits(fits, cache=cache)
+            return {row.fit.ID: row for row in rows}
+        cached = cache.getMany(keys.values())
+        return {
+            f.ID: FitStats(fit=f, character=f.character, damagePattern=f.damagePattern, **cached[keys[f.ID]])
+            for f in fits if keys[f.ID] in cached}
+
     @staticmethod
     def getAllFits():
         pyfalog.debug("Fetching all fits")
@@ -528,15 +562,23 @@ class Fit:
         self.recalc(fit)
         self.fill(fit)
 
-    def recalc(self, fit):
+    def recalc(self, fit, incremental=False):
+        """
+        Recalculate fit. If incremental flag is set, caller guarantees that only
+        states, charges or amounts of items already on the fit have changed, and
+        the fit will try to re-run only effects affected by those changes
+        """
         if isinstance(fit, int):
             fit = self.getFit(fit)
         start_time = time()
         pyfalog.info("=" * 10 + "recalc: {0}" + "=" * 10, fit.name)
 
         fit.factorReload = self.serviceFittingOptions["useGlobalForceReload"]
-        fit.clear()
-        fit.calculateModifiedAttributes()
+        if incremental:
+            fit.calculateModifiedAttributesIncremental()
+        else:
+            fit.clear()
+            fit.calculateModifiedAttributes()
         pyfalog.info("=" * 10 + "recalc time: " + str(time() - start_time) + "=" * 10)
 
     def fill(self, fit):
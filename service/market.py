@@ -26,7 +26,6 @@ from itertools import chain
 # noinspection PyPackageRequirements
 import wx
 from logbook import Logger
-from sqlalchemy.sql import or_
 
 import config
 import eos.db
@@ -128,21 +127,15 @@ class SearchWorkerThread(threading.Thread):
             sMkt = Market.getInstance()
             if filterName == 'market':
                 # Rely on category data provided by eos as we don't hardcode them much in service
-                filters = [or_(
-                    types_Category.name.in_(sMkt.SEARCH_CATEGORIES),
-                    types_Group.name.in_(sMkt.SEARCH_GROUPS))]
+                filters = [(sMkt.SEARCH_CATEGORIES, sMkt.SEARCH_GROUPS)]
             # Used in implant editor
             elif filterName == 'implants':
-                filters = [types_Category.name == 'Implant']
+                filters = [(('Implant',), ())]
             # Actually not everything, just market search + ships
             elif filterName == 'everything':
                 filters = [
-                    or_(
-                        types_Category.name.in_(sMkt.FIT_CATEGORIES),
-                        types_Group.name.in_(sMkt.FIT_GROUPS)),
-                    or_(
-                        types_Category.name.in_(sMkt.SEARCH_CATEGORIES),
-                        types_Group.name.in_(sMkt.SEARCH_GROUPS))]
+                    (sMkt.FIT_CATEGORIES, sMkt.FIT_GROUPS),
+                    (sMkt.SEARCH_CATEGORIES, sMkt.SEARCH_GROUPS)]
             else:
                 filters = [None]
 
@@ -152,24 +145,19 @@ class SearchWorkerThread(threading.Thread):
                 requestTokens = self._prepareRequestNormal(request)
             requestTokens = self.jargonLoader.get_jargon().apply(requestTokens)
 
-            all_results = set()
+            item_IDs = set()
             joinedTokens = ' '.join(requestTokens)
             if (
                 (isStringCjk(joinedTokens) and len(joinedTokens) >= config.minItemSearchLengthCjk)
                 or len(joinedTokens) >= config.minItemSearchLength
             ):
                 for filter_ in filters:
-                    filtered_results = eos.db.searchItemsRegex(
-                        requestTokens, where=filter_,
-                        join=(types_Item.group, types_Group.category),
-                        eager=("group.category", "metaGroup"))
-                    all_results.update(filtered_results)
-
-            item_IDs = set()
-            # Return only published items, consult with Market service this time
-            for item in all_results:
-                if sMkt.getPublicityByItem(item):
-                    item_IDs.add(item.ID)
+                    # Return only published items, index consults with
+                    # Market service overrides for that
+                    item_IDs.update(eos.db.searchItemIDs(
+                        requestTokens,
+                        filters=None if filter_ is None else [filter_],
+                        forcePublished=sMkt.ITEMS_FORCEPUBLISHED))
             wx.CallAfter(callback, sorted(item_IDs))
 
     def scheduleSearch(self, text, callback, filterName=None):
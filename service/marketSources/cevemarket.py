@@ -24,7 +24,7 @@ from logbook import Logger
 
 from eos.saveddata.price import PriceStatus
 from service.network import Network
-from service.price import Price
+from service.price import Price, chunkTypeIDs
 
 pyfalog = Logger(__name__)
 
@@ -34,14 +34,20 @@ class CEveMarketBase:
 
     @staticmethod
     def fetchPrices(priceMap, fetchTimeout, system=None, serenity=False):
-        params = {'typeid': {typeID for typeID in priceMap}}
-        if system is not None:
-            params['usesystem'] = system
         baseurl = 'https://www.ceve-market.org/api/marketstat' if serenity else 'https://www.ceve-market.org/tqapi/marketstat'
+        requestArgs = []
+        for typeIDs in chunkTypeIDs(priceMap):
+            params = {'typeid': set(typeIDs)}
+            if system is not None:
+                params['usesystem'] = system
+            requestArgs.append((baseurl, params))
         network = Network.getInstance()
-        data = network.get(url=baseurl, type=network.PRICES, params=params, timeout=fetchTimeout)
-        xml = minidom.parseString(data.text)
-        types = xml.getElementsByTagName('marketstat').item(0).getElementsByTagName('type')
+        types = []
+        for data in network.getMany(requestArgs, type=network.PRICES, timeout=fetchTimeout):
+            if data is None:
+                continue
+            xml = minidom.parseString(data.text)
+            types.extend(xml.getElementsByTagName('marketstat').item(0).getElementsByTagName('type'))
         # Cycle through all types we've got from request
         for type_ in types:
             # Get data out of each typeID details tree
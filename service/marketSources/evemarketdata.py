@@ -24,7 +24,7 @@ from logbook import Logger
 
 from eos.saveddata.price import PriceStatus
 from service.network import Network
-from service.price import Price
+from service.price import Price, chunkTypeIDs
 
 pyfalog = Logger(__name__)
 
@@ -43,14 +43,20 @@ class EveMarketData:
 
     @staticmethod
     def fetchPrices(priceMap, fetchTimeout, system=None):
-        params = {'type_ids': ','.join(str(typeID) for typeID in priceMap)}
-        if system is not None:
-            params['system_id'] = system
         baseurl = 'https://eve-marketdata.com/api/item_prices.xml'
+        requestArgs = []
+        for typeIDs in chunkTypeIDs(priceMap):
+            params = {'type_ids': ','.join(str(typeID) for typeID in typeIDs)}
+            if system is not None:
+                params['system_id'] = system
+            requestArgs.append((baseurl, params))
         network = Network.getInstance()
-        data = network.get(url=baseurl, type=network.PRICES, params=params, timeout=fetchTimeout)
-        xml = minidom.parseString(data.text)
-        types = xml.getElementsByTagName('eve').item(0).getElementsByTagName('price')
+        types = []
+        for data in network.getMany(requestArgs, type=network.PRICES, timeout=fetchTimeout):
+            if data is None:
+                continue
+            xml = minidom.parseString(data.text)
+            types.extend(xml.getElementsByTagName('eve').item(0).getElementsByTagName('price'))
 
         # Cycle through all types we've got from request
         for type_ in types:
@@ -21,7 +21,7 @@ from logbook import Logger
 
 from eos.saveddata.price import PriceStatus
 from service.network import Network
-from service.price import Price
+from service.price import Price, chunkTypeIDs
 
 pyfalog = Logger(__name__)
 
@@ -48,11 +48,13 @@ class EveTycoon:
         regionID, stationID = locations.get(system, locations[30000142])
         baseurl = 'https://evetycoon.com/api/v1/market/stats'
         network = Network.getInstance()
+        # Source takes one type per request, send them all at once
+        typeIDs = tuple(priceMap)
+        requestArgs = [(f'{baseurl}/{regionID}/{typeID}', {'locationId': stationID}) for typeID in typeIDs]
+        resps = network.getMany(requestArgs, type=network.PRICES, timeout=fetchTimeout)
         # Cycle through all types we've got from request
-        for typeID in tuple(priceMap):
-            url = f'{baseurl}/{regionID}/{typeID}'
-            resp = network.get(url=url, params={'locationId': stationID}, type=network.PRICES, timeout=fetchTimeout)
-            if resp.status_code != 200:
+        for typeID, resp in zip(typeIDs, resps):
+            if resp is None or resp.status_code != 200:
                 continue
             price = resp.json()['sellAvgFivePercent']
             # Price is 0 - no data
@@ -22,7 +22,7 @@ from logbook import Logger
 
 from eos.saveddata.price import PriceStatus
 from service.network import Network
-from service.price import Price
+from service.price import Price, chunkTypeIDs
 
 pyfalog = Logger(__name__)
 
@@ -50,13 +50,18 @@ class FuzzworkMarket:
 
     @staticmethod
     def fetchPrices(priceMap, fetchTimeout, system=None):
-        params = {'types': ','.join(str(typeID) for typeID in priceMap)}
-        for k, v in locations.get(system, {}).items():
-            params[k] = v
         baseurl = 'https://market.fuzzwork.co.uk/aggregates/'
+        requestArgs = []
+        for typeIDs in chunkTypeIDs(priceMap):
+            params = {'types': ','.join(str(typeID) for typeID in typeIDs)}
+            for k, v in locations.get(system, {}).items():
+                params[k] = v
+            requestArgs.append((baseurl, params))
         network = Network.getInstance()
-        resp = network.get(url=baseurl, type=network.PRICES, params=params, timeout=fetchTimeout)
-        data = resp.json()
+        data = {}
+        for resp in network.getMany(requestArgs, type=network.PRICES, timeout=fetchTimeout):
+            if resp is not None:
+                data.update(resp.json())
         # Cycle through all types we've got from request
         for typeID, typeData in data.items():
             try:
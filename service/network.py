@@ -18,9 +18,13 @@
 # =============================================================================
 
 
+import http.cookiejar
 import requests
 import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from logbook import Logger
+from requests.adapters import HTTPAdapter
 
 import config
 from service.settings import NetworkSettings
@@ -30,6 +34,8 @@ pyfalog = Logger(__name__)
 # network timeout, otherwise pyfa hangs for a long while if no internet connection
 timeout = 3
 socket.setdefaulttimeout(timeout)
+# Connections kept alive per host, also max amount of requests getMany() runs at once
+poolSize = 8
 
 
 class Error(Exception):
@@ -70,6 +76,11 @@ class Network:
 
         return cls._instance
 
+    def __init__(self):
+        self.__session = None
+        self.__executor = None
+        self.__sessionLock = threading.Lock()
+
     def get(self, url, type, **kwargs):
         self.__networkAccessCheck(type)
 
@@ -77,7 +88,7 @@ class Network:
         proxies = self.__getProxies()
 
         try:
-            resp = requests.get(url, headers=headers, proxies=proxies, **kwargs)
+            resp = self.__getSession().get(url, headers=headers, proxies=proxies, **kwargs)
             resp.raise_for_status()
             return resp
         except requests.exceptions.HTTPError as error:
@@ -104,7 +115,7 @@ class Network:
         proxies = self.__getProxies()
 
         try:
-            resp = requests.post(url, json=jsonData, headers=headers, proxies=proxies, **kwargs)
+            resp = self.__getSession().post(url, json=jsonData, headers=headers, proxies=proxies, **kwargs)
             resp.raise_for_status()
             return resp
         except requests.exceptions.HTTPError as error:
@@ -124,6 +135,51 @@ class Network:
         except Exception as error:
             raise Error(error)
 
+    def getMany(self, requestArgs, type, **kwargs):
+        """
+        Send GET requests concurrently over pooled connections. requestArgs is
+        iterable of (url, params) pairs, kwargs are passed to every request.
+        Returns responses in order of requests, with None in place of failed
+        ones; when all requests fail, error of the first one is raised.
+        """
+        self.__networkAccessCheck(type)
+        requestArgs = list(requestArgs)
+        if not requestArgs:
+            return []
+        self.__getSession()
+        futures = [self.__executor.submit(self.get, url, type, params=params, **kwargs) for url, params in requestArgs]
+        responses = []
+        errors = []
+        for future in futures:
+            try:
+                responses.append(future.result())
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as error:
+                responses.append(None)
+                errors.append(error)
+        if errors:
+            if len(errors) == len(responses):
+                raise errors[0]
+            pyfalog.warning('{} of {} requests failed', len(errors), len(responses))
+        return responses
+
+    def __getSession(self):
+        # Session keeps connections alive, so that subsequent requests to the
+        # same host do not have to go through TCP and TLS handshakes again
+        with self.__sessionLock:
+            if self.__session is None:
+                session = requests.Session()
+                # Keep requests independent from each other, like they were
+                # without session
+                session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self.__session = session
+                self.__executor = ThreadPoolExecutor(max_workers=poolSize, thread_name_prefix='Network')
+            return self.__session
+
     def __networkAccessCheck(self, type):
         # Make sure request is enabled
         access = NetworkSettings.getInstance().getAccess()
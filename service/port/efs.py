@@ -4,22 +4,17 @@ from numbers import Number
 
 from logbook import Logger
 
-import eos.db
 from config import getVersion
-from service.fit import Fit
 from service.market import Market
 from eos.const import FittingModuleState, FittingHardpoint, FittingSlot
 from service.const import PortEftRigSize
 from eos.saveddata.module import Module
 from eos.saveddata.drone import Drone
 from eos.effectHandlerHelpers import HandledList
+from eos.fitScenario import FitScenario
 from eos.db import gamedata_session, getCategory, getAttributeInfo, getGroup
 from eos.gamedata import Attribute, Effect, Group, Item, ItemEffect
 from eos.utils.spoolSupport import SpoolType, SpoolOptions
-from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
-from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModulesCommand
-from gui.fitCommands.calc.module.changeCharges import CalcChangeModuleChargesCommand
-from gui.fitCommands.helpers import ModuleInfo
 
 
 pyfalog = Logger(__name__)
@@ -36,8 +31,7 @@ class EfsPort:
             target[val] = source.getModifiedItemAttr(val)
 
     @staticmethod
-    def getT2MwdSpeed(fit, sFit):
-        fitID = fit.ID
+    def getT2MwdSpeed(fit, scenario):
         propID = None
         shipHasMedSlots = fit.ship.getModifiedItemAttr("medSlots") > 0
         shipPower = fit.ship.getModifiedItemAttr("powerOutput")
@@ -68,33 +62,38 @@ class EfsPort:
 
         if propID is None:
             return None
-        cmd = CalcAddLocalModuleCommand(fitID, ModuleInfo(itemID=propID))
-        cmd.Do()
-        if cmd.needsGuiRecalc:
-            sFit.recalc(fit)
-        fit = eos.db.getFit(fitID)
-        mwdPropSpeed = fit.maxSpeed
-        mwdPosition = list(filter(lambda mod: mod.item and mod.item.ID == propID, fit.modules))[0].position
-        cmd = CalcRemoveLocalModulesCommand(fitID, [mwdPosition])
-        cmd.Do()
-        if cmd.needsGuiRecalc:
-            sFit.recalc(fit)
-        fit = eos.db.getFit(fitID)
+        mwd = Module(Market.getInstance().getItem(propID))
+        if mwd.isValidState(FittingModuleState.ACTIVE):
+            mwd.state = FittingModuleState.ACTIVE
+        if not scenario.addModule(mwd):
+            return None
+        scenarioFit = scenario.evaluate()
+        mwdPropSpeed = None
+        if mwd.fits(scenarioFit):
+            # Other prop mods can't stay active alongside the MWD, same as when it is added to the fit by user
+            for mod in scenarioFit.modules:
+                if mod is mwd or mod.isEmpty:
+                    continue
+                canHaveState = mod.canHaveState(mod.state)
+                if canHaveState is not True:
+                    scenario.setModuleState(mod, canHaveState)
+                elif not mod.isValidState(mod.state):
+                    scenario.setModuleState(mod, FittingModuleState.ONLINE)
+            mwdPropSpeed = scenario.evaluate().maxSpeed
+        scenario.revert()
         return mwdPropSpeed
 
     @staticmethod
-    def getPropData(fit, sFit):
+    def getPropData(fit, scenario):
         propMods = filter(lambda mod: mod.item and mod.item.group.name == "Propulsion Module", fit.modules)
         activePropWBloomFilter = lambda mod: mod.state > 0 and "signatureRadiusBonus" in mod.item.attributes
         propWithBloom = next(filter(activePropWBloomFilter, propMods), None)
         if propWithBloom is not None:
-            oldPropState = propWithBloom.state
-            propWithBloom.state = FittingModuleState.ONLINE
-            sFit.recalc(fit)
-            sp = fit.maxSpeed
-            sig = fit.ship.getModifiedItemAttr("signatureRadius")
-            propWithBloom.state = oldPropState
-            sFit.recalc(fit)
+            scenario.setModuleState(propWithBloom, FittingModuleState.ONLINE)
+            scenarioFit = scenario.evaluate()
+            sp = scenarioFit.maxSpeed
+            sig = scenarioFit.ship.getModifiedItemAttr("signatureRadius")
+            scenario.revert()
             return {"usingMWD": True, "unpropedSpeed": sp, "unpropedSig": sig}
         return {
             "usingMWD": False,
@@ -112,7 +111,7 @@ class EfsPort:
 
     # Note this also includes data for any cap boosters as they "repair" cap.
     @staticmethod
-    def getRepairData(fit, sFit):
+    def getRepairData(fit, scenario):
         modGroupNames = [
             "Shield Booster", "Armor Repair Unit",
             "Ancillary Shield Booster", "Ancillary Armor Repairer",
@@ -135,22 +134,11 @@ class EfsPort:
                 if mod.item.group.name == "Ancillary Shield Booster":
                     stats["numShots"] = mod.numShots
                     EfsPort.attrDirectMap(["reloadTime"], stats, mod)
-                    c = mod.charge
-                    if c:
-                        sFit.recalc(fit)
-                        CalcChangeModuleChargesCommand(
-                            fit.ID,
-                            projected=False,
-                            chargeMap={mod.position: None},
-                            recalc=False).Do()
-                        sFit.recalc(fit)
-                        stats["unloadedCapacitorNeed"] = mod.getModifiedItemAttr("capacitorNeed")
-                        CalcChangeModuleChargesCommand(
-                            fit.ID,
-                            projected=False,
-                            chargeMap={mod.position: c.typeID},
-                            recalc=False).Do()
-                        sFit.recalc(fit)
+                    if mod.charge:
+                        scenario.setCharge(mod, None)
+                        scenario.evaluate()
+                        stats["unloadedCapacitorNeed"] = scenario.getModule(mod).getModifiedItemAttr("capacitorNeed")
+                        scenario.revert()
             elif mod.item.group.name == "Capacitor Booster":
                 # The capacitorNeed is negative, which provides the boost.
                 stats["type"] = "Capacitor Booster"
@@ -558,7 +546,7 @@ class EfsPort:
         return modSet
 
     @staticmethod
-    def getWeaponBonusMultipliers(fit):
+    def getWeaponBonusMultipliers(fit, scenario):
         def sumDamage(attr):
             totalDamage = 0
             for damageType in ["emDamage", "thermalDamage", "kineticDamage", "explosiveDamage"]:
@@ -581,6 +569,9 @@ class EfsPort:
             return fitMultipliers
 
         multipliers = {"turret": 1, "launcher": 1, "droneBandwidth": 1}
+        # Ship effects are run against scenario fit, as they modify ship attributes
+        fit = scenario.evaluate()
+        scenario.markDirty()
         drones = EfsPort.getTestSet("drone")
         launchers = EfsPort.getTestSet("launcher")
         turrets = EfsPort.getTestSet("turret")
@@ -623,7 +614,6 @@ class EfsPort:
         multipliers["turret"] = round(getMaxRatio(preTraitMultipliers, postTraitMultipliers, "turrets"), 6)
         multipliers["launcher"] = round(getMaxRatio(preTraitMultipliers, postTraitMultipliers, "launchers"), 6)
         multipliers["droneBandwidth"] = round(getMaxRatio(preTraitMultipliers, postTraitMultipliers, "drones"), 6)
-        Fit.getInstance().recalc(fit)
         return multipliers
 
     @staticmethod
@@ -659,7 +649,6 @@ class EfsPort:
 
     @staticmethod
     def exportEfs(fit, typeNotFitFlag, callback):
-        sFit = Fit.getInstance()
         includeShipTypeData = typeNotFitFlag > 0
         if includeShipTypeData:
             fitName = fit.name
@@ -667,10 +656,15 @@ class EfsPort:
             fitName = fit.ship.name + ": " + fit.name
         pyfalog.info("Creating Eve Fleet Simulator data for: " + fit.name)
         fitModAttr = fit.ship.getModifiedItemAttr
-        propData = EfsPort.getPropData(fit, sFit)
         mwdPropSpeed = fit.maxSpeed
-        if includeShipTypeData:
-            mwdPropSpeed = EfsPort.getT2MwdSpeed(fit, sFit)
+        # What-if stats are calculated on a copy of the fit, fit itself stays as is
+        with FitScenario(fit) as scenario:
+            propData = EfsPort.getPropData(fit, scenario)
+            repairs = EfsPort.getRepairData(fit, scenario)
+            if includeShipTypeData:
+                mwdPropSpeed = EfsPort.getT2MwdSpeed(fit, scenario)
+            # Modifies ship of scenario fit, has to go last
+            weaponBonusMultipliers = EfsPort.getWeaponBonusMultipliers(fit, scenario)
         projections = EfsPort.getOutgoingProjectionData(fit)
         modInfo = EfsPort.getModuleInfo(fit)
         moduleNames = modInfo["moduleNames"]
@@ -681,7 +675,6 @@ class EfsPort:
         turretSlots = fitModAttr("turretSlotsLeft") if fitModAttr("turretSlotsLeft") is not None else 0
         launcherSlots = fitModAttr("launcherSlotsLeft") if fitModAttr("launcherSlotsLeft") is not None else 0
         droneBandwidth = fitModAttr("droneBandwidth") if fitModAttr("droneBandwidth") is not None else 0
-        weaponBonusMultipliers = EfsPort.getWeaponBonusMultipliers(fit)
         effectiveTurretSlots = round(turretSlots * weaponBonusMultipliers["turret"], 2)
         effectiveLauncherSlots = round(launcherSlots * weaponBonusMultipliers["launcher"], 2)
         effectiveDroneBandwidth = round(droneBandwidth * weaponBonusMultipliers["droneBandwidth"], 2)
@@ -712,8 +705,6 @@ class EfsPort:
         for cargo in fit.cargo:
             cargoIDs.append(cargo.itemID)
 
-        repairs = EfsPort.getRepairData(fit, sFit)
-
         def roundNumbers(data, digits):
             if isinstance(data, str):
                 return
@@ -18,18 +18,21 @@
 # =============================================================================
 
 
+import csv
 import re
 import os
 import threading
 import xml.dom
 import xml.parsers.expat
 from codecs import open
+from xml.etree import ElementTree
 
 from bs4 import UnicodeDammit
 from logbook import Logger
 
 from eos import db
 from eos.const import ImplantLocation
+from eos.fitPool import FitCalcPool
 from service.fit import Fit as svcFit
 from service.port.dna import exportDna, importDna, importDnaAlt
 from service.port.eft import (
@@ -39,7 +42,7 @@ from service.port.eft import (
 from service.port.esi import exportESI, importESI
 from service.port.multibuy import exportMultiBuy
 from service.port.shipstats import exportFitStats
-from service.port.xml import importXml, exportXml
+from service.port.xml import importXml, iterXml, exportXml, writeXml
 from service.port.muta import parseMutant, parseDynamicItemString, fetchDynamicItem
 
 
@@ -48,6 +51,9 @@ pyfalog = Logger(__name__)
 # 2017/04/05 NOTE: simple validation, for xml file
 RE_XML_START = r'<\?xml\s+version="1.0"[^<>]*\?>'
 
+# Amount of fits saved per database transaction when importing from files
+IMPORT_CHUNK_SIZE = 500
+
 
 class Port:
     """Service which houses all import/export format functions"""
@@ -77,16 +83,7 @@ class Port:
 
         def backupFitsWorkerFunc(path, progress):
             try:
-                backedUpFits = Port.exportXml(svcFit.getInstance().getAllFits(), progress)
-                if backedUpFits:
-                    progress.message = f'writing {path}'
-                    backupFile = open(path, "w", encoding="utf-8")
-                    backupFile.write(backedUpFits)
-                    backupFile.close()
-            except (KeyboardInterrupt, SystemExit):
-                raise
-            except Exception as e:
-                progress.error = f'{e}'
+                Port.writeBackup(svcFit.getInstance().getAllFits(), path, progress)
             finally:
                 progress.current += 1
                 progress.workerWorking = False
@@ -96,6 +93,41 @@ class Port:
             args=(path, progress)
         ).start()
 
+    @staticmethod
+    def writeBackup(fits, path, progress):
+        """
+        Write fits as XML backup. Fits are written as they are converted; until
+        backup is complete, it lives in temporary file next to the target, so
+        that cancelled or failed backup does not overwrite previous one.
+        """
+        tmpPath = path + ".tmp"
+        try:
+            with open(tmpPath, "w", encoding="utf-8") as backupFile:
+                finished = Port.writeXml(fits, backupFile, progress)
+            if finished:
+                os.replace(tmpPath, path)
+            else:
+                os.remove(tmpPath)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            progress.error = f'{e}'
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+
+    @staticmethod
+    def exportFitStatsTableThreaded(path, progress):
+        """Write stats of all fits into CSV file in background"""
+        pyfalog.debug("Starting fit stats export thread.")
+
+        def exportFitStatsTableWorkerFunc(path, progress):
+            Port.exportFitStatsTable(svcFit.getInstance().getAllFits(), path, progress=progress)
+
+        threading.Thread(
+            target=exportFitStatsTableWorkerFunc,
+            args=(path, progress)
+        ).start()
+
     @staticmethod
     def importFitsThreaded(paths, progress):
         """
@@ -113,66 +145,76 @@ class Port:
         ).start()
 
     @staticmethod
-    def importFitFromFiles(paths, progress=None):
+    def importFitFromFiles(paths, progress=None, chunkSize=IMPORT_CHUNK_SIZE):
         """
-        Imports fits from file(s). First processes all provided paths and stores
-        assembled fits into a list. This allows us to call back to the GUI as
-        fits are processed as well as when fits are being saved.
+        Imports fits from file(s). Files are processed one by one, and assembled
+        fits are saved as they are produced, committing once per chunkSize fits
+        (or once for all fits if chunkSize is None). This allows us to call back
+        to the GUI as fits are processed as well as when fits are being saved.
+        On error or cancellation, fits which were saved already are removed.
         returns
         """
 
         sFit = svcFit.getInstance()
 
         fit_list = []
-        try:
+        currentPath = [None]
+        savedAmount = [0]
+
+        def iterFits():
             for path in paths:
                 if progress:
-                    if progress and progress.userCancelled:
-                        progress.workerWorking = False
-                        return False, "Cancelled by user"
+                    if progress.userCancelled:
+                        return
                     msg = "Processing file:\n%s" % path
                     progress.message = msg
                     pyfalog.debug(msg)
+                currentPath[0] = path
+                for fit in Port._iterFileFits(path, progress):
+                    # Set some more fit attributes; relations to objects from
+                    # session are set by saveFits
+                    if len(fit.implants) > 0:
+                        fit.implantLocation = ImplantLocation.FIT
+                    else:
+                        useCharImplants = sFit.serviceFittingOptions["useCharacterImplantsByDefault"]
+                        fit.implantLocation = ImplantLocation.CHARACTER if useCharImplants else ImplantLocation.FIT
+                    fit_list.append(fit)
+                    yield fit
+
+        def savedCallback(amount):
+            pyfalog.debug("Saving fits to database: {0}", amount)
+            savedAmount[0] = amount
+            if progress:
+                if progress.userCancelled:
+                    return False
+                progress.message = "Saving fits to database\n(%d saved)" % amount
 
-                with open(path, "rb") as file_:
-                    srcString = file_.read()
-                    dammit = UnicodeDammit(srcString)
-                    srcString = dammit.unicode_markup
-
-                if len(srcString) == 0:  # ignore blank files
-                    pyfalog.debug("File is blank.")
-                    continue
+        def removeSaved():
+            # Fits are saved in the order they were produced
+            if savedAmount[0]:
+                pyfalog.debug("Removing {0} already saved fits", savedAmount[0])
+                db.removeFits(fit_list[:savedAmount[0]])
 
-                try:
-                    importType, makesNewFits, fitsImport = Port.importAuto(srcString, path, progress=progress)
-                    fit_list += fitsImport
-                except xml.parsers.expat.ExpatError:
-                    pyfalog.warning("Malformed XML in:\n{0}", path)
-                    msg = "Malformed XML in %s" % path
-                    if progress:
-                        progress.error = msg
-                        progress.workerWorking = False
-                    return False, msg
-
-            numFits = len(fit_list)
-            for idx, fit in enumerate(fit_list):
-                if progress and progress.userCancelled:
-                    progress.workerWorking = False
-                    return False, "Cancelled by user"
-                # Set some more fit attributes and save
-                fit.character = sFit.character
-                fit.damagePattern = sFit.pattern
-                fit.targetProfile = sFit.targetProfile
-                if len(fit.implants) > 0:
-                    fit.implantLocation = ImplantLocation.FIT
-                else:
-                    useCharImplants = sFit.serviceFittingOptions["useCharacterImplantsByDefault"]
-                    fit.implantLocation = ImplantLocation.CHARACTER if useCharImplants else ImplantLocation.FIT
-                db.save(fit)
-                # IDs.append(fit.ID)
-                if progress:
-                    pyfalog.debug("Processing complete, saving fits to database: {0}/{1}", idx + 1, numFits)
-                    progress.message = "Processing complete, saving fits to database\n(%d/%d) %s" % (idx + 1, numFits, fit.ship.name)
+        attrs = {'character': sFit.character, 'damagePattern': sFit.pattern, 'targetProfile': sFit.targetProfile}
+        try:
+            try:
+                db.saveFits(iterFits(), chunkSize=chunkSize, callback=savedCallback, attrs=attrs)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception:
+                removeSaved()
+                raise
+            if progress and progress.userCancelled:
+                removeSaved()
+                progress.workerWorking = False
+                return False, "Cancelled by user"
+        except (xml.parsers.expat.ExpatError, ElementTree.ParseError):
+            pyfalog.warning("Malformed XML in:\n{0}", currentPath[0])
+            msg = "Malformed XML in %s" % currentPath[0]
+            if progress:
+                progress.error = msg
+                progress.workerWorking = False
+            return False, msg
         except (KeyboardInterrupt, SystemExit):
             raise
         except Exception as e:
@@ -189,6 +231,39 @@ class Port:
             progress.workerWorking = False
         return True, fit_list
 
+    @staticmethod
+    def _iterFileFits(path, progress):
+        """
+        Yield fits imported from file. XML files (e.g. backups) can be huge,
+        they are parsed straight from the file as it is read instead of loading
+        it whole. When XML file can't be parsed as is (e.g. its encoding is
+        declared wrong) and no fits were taken from it yet, it's left for
+        generic import, which has encoding detection.
+        """
+        with open(path, "rb") as file_:
+            head = UnicodeDammit(file_.read(1024)).unicode_markup or ""
+            firstLine = next((line.strip() for line in head.splitlines() if line.strip()), "")
+            if re.search(RE_XML_START, firstLine):
+                file_.seek(0)
+                yielded = False
+                try:
+                    for fit in Port.iterXml(file_, progress):
+                        yielded = True
+                        yield fit
+                    return
+                except ElementTree.ParseError:
+                    if yielded:
+                        raise
+            file_.seek(0)
+            srcString = UnicodeDammit(file_.read()).unicode_markup
+
+        if len(srcString) == 0:  # ignore blank files
+            pyfalog.debug("File is blank.")
+            return
+
+        importType, makesNewFits, fitsImport = Port.importAuto(srcString, path, progress=progress)
+        yield from fitsImport
+
     @staticmethod
     def importFitFromBuffer(bufferStr, activeFit=None):
         # type: (str, object) -> object
@@ -330,10 +405,18 @@ class Port:
     def importXml(text, progress=None):
         return importXml(text, progress)
 
+    @staticmethod
+    def iterXml(source, progress=None):
+        return iterXml(source, progress)
+
     @staticmethod
     def exportXml(fits, progress=None, callback=None):
         return exportXml(fits, progress, callback=callback)
 
+    @staticmethod
+    def writeXml(fits, file, progress=None):
+        return writeXml(fits, file, progress)
+
     # Multibuy-related methods
     @staticmethod
     def exportMultiBuy(fit, options, callback=None):
@@ -342,3 +425,45 @@ class Port:
     @staticmethod
     def exportFitStats(fit, callback=None):
         return exportFitStats(fit, callback=callback)
+
+    @staticmethod
+    def exportFitStatsTable(fits, path, characters=None, damagePatterns=None, processes=None, progress=None):
+        """
+        Calculate stats of many fits in a pool of worker processes, and write
+        them into CSV file, one row per fit, character and damage pattern.
+        Stats found in persistent fit stats cache are not recalculated.
+        """
+        pyfalog.debug("Exporting stats of {} fits to {}", len(fits), path)
+        try:
+            with FitCalcPool(characters=characters, damagePatterns=damagePatterns, processes=processes) as pool:
+                rows = pool.evaluate(fits, progress=progress, cache=svcFit.getStatsCache())
+            if progress and progress.userCancelled:
+                return False
+            with open(path, "w", encoding="utf-8") as statsFile:
+                writer = csv.writer(statsFile, lineterminator="\n")
+                writer.writerow((
+                    "Fit ID", "Ship", "Fit", "Character", "Damage Pattern", "DPS", "Volley", "EHP",
+                    "Cap Stable", "Cap State", "Max Speed", "Align Time", "Error"))
+                for row in rows:
+                    writer.writerow((
+                        row.fit.ID, row.fit.ship.item.name, row.fit.name, row.character.name, row.damagePattern.name,
+                        round(row.dps, 2), round(row.volley, 2), round(row.ehp, 2),
+                        row.capStable, round(row.capState, 2), round(row.maxSpeed, 2), round(row.alignTime, 2), ""))
+                # Fits which could not be calculated get row too, so that none
+                # goes missing from the table unnoticed
+                for fit, message in pool.failures:
+                    writer.writerow((fit.ID, fit.ship.item.name, fit.name) + ("",) * 9 + (message,))
+            if pool.failures:
+                pyfalog.warning("Stats of {} fits could not be calculated", len(pool.failures))
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.critical("Failed to export fit stats to {}", path)
+            pyfalog.critical(e)
+            if progress:
+                progress.error = f'{e}'
+            return False
+        finally:
+            if progress:
+                progress.workerWorking = False
+        return True
@@ -17,9 +17,10 @@
 # along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
 # =============================================================================
 
+import io
 import re
-import xml.dom
-import xml.parsers.expat
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
 from logbook import Logger
 
@@ -47,6 +48,8 @@ RE_LTGT = "&(lt|gt);"
 L_MARK = "&lt;localized hint=&quot;"
 # &lt;localized hint=&quot;([^"]+)&quot;&gt;([^\*]+)\*&lt;\/localized&gt;
 LOCALIZED_PATTERN = re.compile(r'<localized hint="([^"]+)">([^\*]+)\*</localized>')
+# L_MARK as it looks like after parsing
+L_MARK_PARSED = '<localized hint="'
 
 
 class ExtractingError(Exception):
@@ -62,13 +65,13 @@ def _extract_match(t):
 
 
 def _resolve_ship(fitting, sMkt, b_localized):
-    # type: (xml.dom.minidom.Element, service.market.Market, bool) -> eos.saveddata.fit.Fit
+    # type: (xml.etree.ElementTree.Element, service.market.Market, bool) -> eos.saveddata.fit.Fit
     """ NOTE: Since it is meaningless unless a correct ship object can be constructed,
         process flow changed
     """
     # ------ Confirm ship
     # <localized hint="Maelstrom">Maelstrom</localized>
-    shipType = fitting.getElementsByTagName("shipType").item(0).getAttribute("value")
+    shipType = fitting.find(".//shipType").get("value", "")
     anything = None
     if b_localized:
         try:
@@ -104,7 +107,7 @@ def _resolve_ship(fitting, sMkt, b_localized):
 
     fitobj = Fit(ship=ship)
     # ------ Confirm fit name
-    anything = fitting.getAttribute("name")
+    anything = fitting.get("name", "")
     # 2017/03/29 NOTE:
     #    if fit name contained "<" or ">" then reprace to named html entity by EVE client
     # if re.search(RE_LTGT, anything):
@@ -116,8 +119,8 @@ def _resolve_ship(fitting, sMkt, b_localized):
 
 
 def _resolve_module(hardware, sMkt, b_localized):
-    # type: (xml.dom.minidom.Element, service.market.Market, bool) -> eos.saveddata.module.Module
-    moduleName = hardware.getAttribute("base_type") or hardware.getAttribute("type")
+    # type: (xml.etree.ElementTree.Element, service.market.Market, bool) -> eos.saveddata.module.Module
+    moduleName = hardware.get("base_type") or hardware.get("type", "")
     emergency = None
     if b_localized:
         try:
@@ -145,256 +148,288 @@ def _resolve_module(hardware, sMkt, b_localized):
         if not must_retry:
             break
 
-    mutaplasmidName = hardware.getAttribute("mutaplasmid")
+    mutaplasmidName = hardware.get("mutaplasmid")
     mutaplasmidItem = fetchItem(mutaplasmidName) if mutaplasmidName else None
 
-    mutatedAttrsText = hardware.getAttribute("mutated_attrs")
+    mutatedAttrsText = hardware.get("mutated_attrs")
     mutatedAttrs = parseMutantAttrs(mutatedAttrsText) if mutatedAttrsText else None
 
     return item, mutaplasmidItem, mutatedAttrs
 
 
+def iterXml(source, progress):
+    """
+    Parse fits from XML incrementally, yielding every fit as soon as its
+    <fitting> element is read. Parsed elements are dropped right away, so
+    memory use does not depend on size of the file. Source is file object
+    (binary one lets parser use encoding declared in the document) or path.
+    """
+    root = None
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        if element.tag != "fitting":
+            continue
+        if progress and progress.userCancelled:
+            return
+        fitobj = _parse_fitting(element)
+        # Everything before this element has been processed already
+        root.clear()
+        if fitobj is None:
+            continue
+        if progress:
+            progress.message = "Processing %s\n%s" % (fitobj.ship.name, fitobj.name)
+        yield fitobj
+
+
 def importXml(text, progress):
+    fit_list = list(iterXml(io.StringIO(text), progress))
+    if progress and progress.userCancelled:
+        return []
+    return fit_list
+
+
+def _parse_fitting(fitting):
+    # type: (xml.etree.ElementTree.Element) -> eos.saveddata.fit.Fit
     from .port import Port
     sMkt = Market.getInstance()
-    doc = xml.dom.minidom.parseString(text)
     # NOTE:
     #   When L_MARK is included at this point,
     #   Decided to be localized data
-    b_localized = L_MARK in text
-    fittings = doc.getElementsByTagName("fittings").item(0)
-    fittings = fittings.getElementsByTagName("fitting")
-    fit_list = []
-    failed = 0
-
-    for fitting in fittings:
-        if progress and progress.userCancelled:
-            return []
-
+    b_localized = any(
+        L_MARK_PARSED in value
+        for element in fitting.iter() for value in element.attrib.values())
+
+    try:
+        fitobj = _resolve_ship(fitting, sMkt, b_localized)
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except:
+        return None
+
+    # -- 170327 Ignored description --
+    # read description from exported xml. (EVE client, EFT)
+    descriptionElement = fitting.find(".//description")
+    description = descriptionElement.get("value", "") if descriptionElement is not None else ""
+    if len(description):
+        # convert <br> to "\n" and remove html tags.
+        if Port.is_tag_replace():
+            description = replace_ltgt(
+                sequential_rep(description, r"<(br|BR)>", "\n", r"<[^<>]+>", "")
+            )
+    fitobj.notes = description
+
+    hardwares = fitting.iter("hardware")
+    moduleList = []
+    for hardware in hardwares:
         try:
-            fitobj = _resolve_ship(fitting, sMkt, b_localized)
-        except (KeyboardInterrupt, SystemExit):
-            raise
-        except:
-            failed += 1
-            continue
-
-        # -- 170327 Ignored description --
-        # read description from exported xml. (EVE client, EFT)
-        description = fitting.getElementsByTagName("description").item(0).getAttribute("value")
-        if description is None:
-            description = ""
-        elif len(description):
-            # convert <br> to "\n" and remove html tags.
-            if Port.is_tag_replace():
-                description = replace_ltgt(
-                    sequential_rep(description, r"<(br|BR)>", "\n", r"<[^<>]+>", "")
-                )
-        fitobj.notes = description
-
-        hardwares = fitting.getElementsByTagName("hardware")
-        moduleList = []
-        for hardware in hardwares:
-            try:
-                item, mutaItem, mutaAttrs = _resolve_module(hardware, sMkt, b_localized)
-                if not item or not item.published:
-                    continue
+            item, mutaItem, mutaAttrs = _resolve_module(hardware, sMkt, b_localized)
+            if not item or not item.published:
+                continue
 
-                if item.category.name == "Drone":
-                    d = None
+            if item.category.name == "Drone":
+                d = None
+                if mutaItem:
+                    mutaplasmid = getDynamicItem(mutaItem.ID)
+                    if mutaplasmid:
+                        try:
+                            d = Drone(mutaplasmid.resultingItem, item, mutaplasmid)
+                        except ValueError:
+                            pass
+                        else:
+                            for attrID, mutator in d.mutators.items():
+                                if attrID in mutaAttrs:
+                                    mutator.value = mutaAttrs[attrID]
+                if d is None:
+                    d = Drone(item)
+                d.amount = int(hardware.get("qty"))
+                fitobj.drones.append(d)
+            elif item.category.name == "Fighter":
+                ft = Fighter(item)
+                ft.amount = int(hardware.get("qty")) if ft.amount <= ft.fighterSquadronMaxSize else ft.fighterSquadronMaxSize
+                fitobj.fighters.append(ft)
+            elif hardware.get("slot", "").lower() == "cargo":
+                # although the eve client only support charges in cargo, third-party programs
+                # may support items or "refits" in cargo. Support these by blindly adding all
+                # cargo, not just charges
+                c = Cargo(item)
+                c.amount = int(hardware.get("qty"))
+                fitobj.cargo.append(c)
+            else:
+                m = None
+                try:
                     if mutaItem:
                         mutaplasmid = getDynamicItem(mutaItem.ID)
                         if mutaplasmid:
                             try:
-                                d = Drone(mutaplasmid.resultingItem, item, mutaplasmid)
+                                m = Module(mutaplasmid.resultingItem, item, mutaplasmid)
                             except ValueError:
                                 pass
                             else:
-                                for attrID, mutator in d.mutators.items():
+                                for attrID, mutator in m.mutators.items():
                                     if attrID in mutaAttrs:
                                         mutator.value = mutaAttrs[attrID]
-                    if d is None:
-                        d = Drone(item)
-                    d.amount = int(hardware.getAttribute("qty"))
-                    fitobj.drones.append(d)
-                elif item.category.name == "Fighter":
-                    ft = Fighter(item)
-                    ft.amount = int(hardware.getAttribute("qty")) if ft.amount <= ft.fighterSquadronMaxSize else ft.fighterSquadronMaxSize
-                    fitobj.fighters.append(ft)
-                elif hardware.getAttribute("slot").lower() == "cargo":
-                    # although the eve client only support charges in cargo, third-party programs
-                    # may support items or "refits" in cargo. Support these by blindly adding all
-                    # cargo, not just charges
-                    c = Cargo(item)
-                    c.amount = int(hardware.getAttribute("qty"))
-                    fitobj.cargo.append(c)
+                    if m is None:
+                        m = Module(item)
+                # When item can't be added to any slot (unknown item or just charge), ignore it
+                except ValueError:
+                    pyfalog.warning("item can't be added to any slot (unknown item or just charge), ignore it")
+                    continue
+                # Add subsystems before modules to make sure T3 cruisers have subsystems installed
+                if item.category.name == "Subsystem":
+                    if m.fits(fitobj):
+                        m.owner = fitobj
+                        fitobj.modules.append(m)
                 else:
-                    m = None
-                    try:
-                        if mutaItem:
-                            mutaplasmid = getDynamicItem(mutaItem.ID)
-                            if mutaplasmid:
-                                try:
-                                    m = Module(mutaplasmid.resultingItem, item, mutaplasmid)
-                                except ValueError:
-                                    pass
-                                else:
-                                    for attrID, mutator in m.mutators.items():
-                                        if attrID in mutaAttrs:
-                                            mutator.value = mutaAttrs[attrID]
-                        if m is None:
-                            m = Module(item)
-                    # When item can't be added to any slot (unknown item or just charge), ignore it
-                    except ValueError:
-                        pyfalog.warning("item can't be added to any slot (unknown item or just charge), ignore it")
-                        continue
-                    # Add subsystems before modules to make sure T3 cruisers have subsystems installed
-                    if item.category.name == "Subsystem":
-                        if m.fits(fitobj):
-                            m.owner = fitobj
-                            fitobj.modules.append(m)
-                    else:
-                        if m.isValidState(FittingModuleState.ACTIVE):
-                            m.state = activeStateLimit(m.item)
-
-                        moduleList.append(m)
-
-            except KeyboardInterrupt:
-                pyfalog.warning("Keyboard Interrupt")
-                continue
+                    if m.isValidState(FittingModuleState.ACTIVE):
+                        m.state = activeStateLimit(m.item)
 
-        # Recalc to get slot numbers correct for T3 cruisers
-        sFit = svcFit.getInstance()
-        sFit.recalc(fitobj)
-        sFit.fill(fitobj)
+                    moduleList.append(m)
 
-        for module in moduleList:
-            if module.fits(fitobj):
-                module.owner = fitobj
-                fitobj.modules.append(module)
+        except KeyboardInterrupt:
+            pyfalog.warning("Keyboard Interrupt")
+            continue
 
-        fit_list.append(fitobj)
-        if progress:
-            progress.message = "Processing %s\n%s" % (fitobj.ship.name, fitobj.name)
+    # Recalc to get slot numbers correct for T3 cruisers
+    sFit = svcFit.getInstance()
+    sFit.recalc(fitobj)
+    sFit.fill(fitobj)
 
-    return fit_list
+    for module in moduleList:
+        if module.fits(fitobj):
+            module.owner = fitobj
+            fitobj.modules.append(module)
+
+    return fitobj
 
 
 def exportXml(fits, progress, callback):
-    doc = xml.dom.minidom.Document()
-    fittings = doc.createElement("fittings")
-    # fit count
-    fit_count = len(fits)
-    fittings.setAttribute("count", "%s" % fit_count)
-    doc.appendChild(fittings)
+    buffer = io.StringIO()
+    if not writeXml(fits, buffer, progress):
+        return None
+    text = buffer.getvalue()
 
-    def addMutantAttributes(node, mutant):
-        node.setAttribute("base_type", mutant.baseItem.name)
-        node.setAttribute("mutaplasmid", mutant.mutaplasmid.item.name)
-        node.setAttribute("mutated_attrs", renderMutantAttrs(mutant))
+    if callback:
+        callback(text)
+    else:
+        return text
 
+
+def writeXml(fits, file, progress):
+    """
+    Write fits as XML into text file object. Every <fitting> is rendered and
+    written on its own, without building document for all fits in memory.
+    Returns False if cancelled by user.
+    """
+    # fit count
+    fit_count = len(fits)
+    file.write('<?xml version="1.0" ?>\n')
+    file.write('<fittings count="%s">\n' % fit_count)
     for i, fit in enumerate(fits):
         if progress:
             if progress.userCancelled:
-                return None
+                return False
             processedFits = i + 1
             progress.current = processedFits
             progress.message = "converting to xml (%s/%s) %s" % (processedFits, fit_count, fit.ship.name)
         try:
-            fitting = doc.createElement("fitting")
-            fitting.setAttribute("name", fit.name)
-            fittings.appendChild(fitting)
-            description = doc.createElement("description")
-            # -- 170327 Ignored description --
-            try:
-                notes = fit.notes  # unicode
-
-                if notes:
-                    notes = notes[:397] + '...' if len(notes) > 400 else notes
-
-                description.setAttribute(
-                    "value", re.sub("(\r|\n|\r\n)+", "<br>", notes) if notes is not None else ""
-                )
-            except (KeyboardInterrupt, SystemExit):
-                raise
-            except Exception as e:
-                pyfalog.warning("read description is failed, msg=%s\n" % e.args)
-
-            fitting.appendChild(description)
-            shipType = doc.createElement("shipType")
-            shipType.setAttribute("value", fit.ship.name)
-            fitting.appendChild(shipType)
-
-            charges = {}
-            slotNum = {}
-            for module in fit.modules:
-                if module.isEmpty:
-                    continue
-
-                slot = module.slot
-
-                if slot == FittingSlot.SUBSYSTEM:
-                    # Order of subsystem matters based on this attr. See GH issue #130
-                    slotId = module.getModifiedItemAttr("subSystemSlot") - 125
-                else:
-                    if slot not in slotNum:
-                        slotNum[slot] = 0
-
-                    slotId = slotNum[slot]
-                    slotNum[slot] += 1
-
-                hardware = doc.createElement("hardware")
-                hardware.setAttribute("type", module.item.name)
-                slotName = FittingSlot(slot).name.lower()
-                slotName = slotName if slotName != "high" else "hi"
-                hardware.setAttribute("slot", "%s slot %d" % (slotName, slotId))
-                if module.isMutated:
-                    addMutantAttributes(hardware, module)
-
-                fitting.appendChild(hardware)
-
-                if module.charge:
-                    if module.charge.name not in charges:
-                        charges[module.charge.name] = 0
-                    # `or 1` because some charges (ie scripts) are without qty
-                    charges[module.charge.name] += module.numCharges or 1
-
-            for drone in fit.drones:
-                hardware = doc.createElement("hardware")
-                hardware.setAttribute("qty", "%d" % drone.amount)
-                hardware.setAttribute("slot", "drone bay")
-                hardware.setAttribute("type", drone.item.name)
-                if drone.isMutated:
-                    addMutantAttributes(hardware, drone)
-
-                fitting.appendChild(hardware)
-
-            for fighter in fit.fighters:
-                hardware = doc.createElement("hardware")
-                hardware.setAttribute("qty", "%d" % fighter.amount)
-                hardware.setAttribute("slot", "fighter bay")
-                hardware.setAttribute("type", fighter.item.name)
-                fitting.appendChild(hardware)
-
-            for cargo in fit.cargo:
-                if cargo.item.name not in charges:
-                    charges[cargo.item.name] = 0
-                charges[cargo.item.name] += cargo.amount
-
-            for name, qty in list(charges.items()):
-                hardware = doc.createElement("hardware")
-                hardware.setAttribute("qty", "%d" % qty)
-                hardware.setAttribute("slot", "cargo")
-                hardware.setAttribute("type", name)
-                fitting.appendChild(hardware)
+            fitting = _render_fitting(fit)
         except (KeyboardInterrupt, SystemExit):
             raise
         except Exception as e:
-            pyfalog.error("Failed on fitID: %d, message: %s" % e.message)
+            pyfalog.error("Failed on fitID: {}, message: {}", fit.ID, e)
             continue
-    text = doc.toprettyxml()
+        file.write(fitting)
+    file.write('</fittings>\n')
+    return True
 
-    if callback:
-        callback(text)
-    else:
-        return text
+
+def _quote_attr(value):
+    # Same quoting minidom used when documents were built with it
+    return '"%s"' % escape(value, {'"': "&quot;"})
+
+
+def _render_element(depth, tag, attrs):
+    return '%s<%s%s/>\n' % (
+        '\t' * depth, tag, ''.join(' %s=%s' % (name, _quote_attr(value)) for name, value in attrs))
+
+
+def _render_fitting(fit):
+    def mutantAttributes(mutant):
+        return [
+            ("base_type", mutant.baseItem.name),
+            ("mutaplasmid", mutant.mutaplasmid.item.name),
+            ("mutated_attrs", renderMutantAttrs(mutant))]
+
+    parts = ['\t<fitting name=%s>\n' % _quote_attr(fit.name)]
+    # -- 170327 Ignored description --
+    descriptionAttrs = []
+    try:
+        notes = fit.notes  # unicode
+
+        if notes:
+            notes = notes[:397] + '...' if len(notes) > 400 else notes
+
+        descriptionAttrs.append(("value", re.sub("(\r|\n|\r\n)+", "<br>", notes) if notes is not None else ""))
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except Exception as e:
+        pyfalog.warning("read description is failed, msg=%s\n" % e.args)
+
+    parts.append(_render_element(2, "description", descriptionAttrs))
+    parts.append(_render_element(2, "shipType", [("value", fit.ship.name)]))
+
+    charges = {}
+    slotNum = {}
+    for module in fit.modules:
+        if module.isEmpty:
+            continue
+
+        slot = module.slot
+
+        if slot == FittingSlot.SUBSYSTEM:
+            # Order of subsystem matters based on this attr. See GH issue #130
+            slotId = module.getModifiedItemAttr("subSystemSlot") - 125
+        else:
+            if slot not in slotNum:
+                slotNum[slot] = 0
+
+            slotId = slotNum[slot]
+            slotNum[slot] += 1
+
+        slotName = FittingSlot(slot).name.lower()
+        slotName = slotName if slotName != "high" else "hi"
+        hardwareAttrs = [("type", module.item.name), ("slot", "%s slot %d" % (slotName, slotId))]
+        if module.isMutated:
+            hardwareAttrs.extend(mutantAttributes(module))
+
+        parts.append(_render_element(2, "hardware", hardwareAttrs))
+
+        if module.charge:
+            if module.charge.name not in charges:
+                charges[module.charge.name] = 0
+            # `or 1` because some charges (ie scripts) are without qty
+            charges[module.charge.name] += module.numCharges or 1
+
+    for drone in fit.drones:
+        hardwareAttrs = [("qty", "%d" % drone.amount), ("slot", "drone bay"), ("type", drone.item.name)]
+        if drone.isMutated:
+            hardwareAttrs.extend(mutantAttributes(drone))
+
+        parts.append(_render_element(2, "hardware", hardwareAttrs))
+
+    for fighter in fit.fighters:
+        parts.append(_render_element(2, "hardware", [
+            ("qty", "%d" % fighter.amount), ("slot", "fighter bay"), ("type", fighter.item.name)]))
+
+    for cargo in fit.cargo:
+        if cargo.item.name not in charges:
+            charges[cargo.item.name] = 0
+        charges[cargo.item.name] += cargo.amount
+
+    for name, qty in list(charges.items()):
+        parts.append(_render_element(2, "hardware", [("qty", "%d" % qty), ("slot", "cargo"), ("type", name)]))
+    parts.append('\t</fitting>\n')
+    return ''.join(parts)
@@ -18,8 +18,9 @@
 # =============================================================================
 
 
-import queue
+import concurrent.futures
 import threading
+import time
 import timeit
 from itertools import chain
 
@@ -28,6 +29,7 @@ import wx
 from logbook import Logger
 
 from eos import db
+from eos.gamedata import Item
 from eos.saveddata.price import PriceStatus
 from service.fit import Fit
 from service.market import Market
@@ -36,6 +38,49 @@ from service.network import TimeoutError
 
 pyfalog = Logger(__name__)
 
+# Max amount of items requested from price source at once, longer lists are
+# split into several requests which are sent concurrently
+TYPEIDS_PER_REQUEST = 100
+
+
+def chunkTypeIDs(typeIDs):
+    """Split type IDs into lists small enough to be requested at once"""
+    typeIDs = sorted(typeIDs)
+    return [typeIDs[i:i + TYPEIDS_PER_REQUEST] for i in range(0, len(typeIDs), TYPEIDS_PER_REQUEST)]
+
+
+class PriceSourceStats:
+    """Latency and outcomes of fetches from single price source"""
+
+    def __init__(self):
+        self.fetches = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.totalTime = 0
+        self.lastTime = None
+
+    @property
+    def averageTime(self):
+        if not self.fetches:
+            return None
+        return self.totalTime / self.fetches
+
+    def __repr__(self):
+        return 'PriceSourceStats(fetches={}, failures={}, timeouts={}, averageTime={})'.format(
+            self.fetches, self.failures, self.timeouts, self.averageTime)
+
+
+class _FetchedPrice:
+    """Stand-in for price object, keeps what price source fetched for it"""
+
+    def __init__(self):
+        self.status = None
+        self.price = 0
+
+    def update(self, status, price=0):
+        self.status = status
+        self.price = price
+
 
 class Price:
     instance = None
@@ -49,6 +94,9 @@ class Price:
     }
 
     sources = {}
+    # Format: {source name: PriceSourceStats}
+    sourceStats = {}
+    sourceStatsLock = threading.Lock()
 
     def __init__(self):
         # Start price fetcher
@@ -110,47 +158,41 @@ class Price:
         # tranquility data for serenity or vice versa
         sourceAll = list(n for n, s in cls.sources.items() if s.group == cls.sources[sourcePrimary].group)
 
-        # Format: {source name: timeout weight}
-        sources = {sourcePrimary: len(sourceAll)}
-        for source in sourceAll:
-            if source == sourcePrimary:
-                continue
-            sources[source] = min(sources.values()) - 1
+        system = cls.systemsList[sFit.serviceFittingOptions["priceSystem"]]
+        # All sources are queried at once, prices are taken from the source which
+        # finishes first. Primary source goes first, so it wins if several
+        # sources finish at the same time
+        sourceNames = [sourcePrimary] + [n for n in sourceAll if n != sourcePrimary]
+        # Format: {future: (source name, {type ID: fetched price})}
+        futures = {}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(sourceNames), thread_name_prefix='PriceSource')
+        for sourceName in sourceNames:
+            # Every source works on its own stand-ins, which we apply to actual
+            # prices when source is done
+            fetchedPrices = {typeID: _FetchedPrice() for typeID in priceMap}
+            future = executor.submit(cls.__fetchFromSource, sourceName, dict(fetchedPrices), system, fetchTimeout)
+            futures[future] = (sourceName, fetchedPrices)
+        # Do not wait for sources which are still running when we are done
+        executor.shutdown(wait=False)
 
         # Record timeouts as it will affect our final decision
         timedOutSources = {}
 
-        remainingTime = fetchTimeout
-
-        for source in sorted(sources, key=sources.get, reverse=True):
-            timeBefore = timeit.default_timer()
-            pyfalog.info('Trying {}'.format(source))
-            timedOutSources[source] = False
-            # Time we allocate for a source depends on source weight and remaining time
-            sourceFetchTimeout = remainingTime * sources[source] / sum(sources.values())
-            try:
-                sourceCls = cls.sources.get(source)
-                sourceCls(priceMap, cls.systemsList[sFit.serviceFittingOptions["priceSystem"]], sourceFetchTimeout)
-            except TimeoutError:
-                pyfalog.warning("Price fetch timeout for source {}".format(source))
-                timedOutSources[source] = True
-            except (KeyboardInterrupt, SystemExit):
-                raise
-            except Exception as e:
-                pyfalog.warn('Failed to fetch prices from price source {}: {}'.format(source, e))
-            # Sources remove price map items as they fetch info, if none remain then we're done
-            if not priceMap:
-                break
-            timeAfter = timeit.default_timer()
-            # Remove source so it doesn't affect time weights of sources we're going to use next
-            del sources[source]
-            remainingTime -= timeAfter - timeBefore
-            # No time remaining (should not happen) - mark remaining sources as timeout
-            if remainingTime <= 0:
-                for source in sources:
-                    timedOutSources[source] = True
-                break
-
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=fetchTimeout):
+                sourceName, fetchedPrices = futures[future]
+                timedOutSources[sourceName] = future.result()
+                for typeID, fetchedPrice in fetchedPrices.items():
+                    if fetchedPrice.status is not None and typeID in priceMap:
+                        priceMap.pop(typeID).update(fetchedPrice.status, fetchedPrice.price)
+                # Nothing left to fetch, no reason to wait for slower sources
+                if not priceMap:
+                    return
+        except concurrent.futures.TimeoutError:
+            # Sources which did not make it in time are considered timed out
+            for future, (sourceName, _) in futures.items():
+                if not future.done():
+                    timedOutSources[sourceName] = True
 
         # If we get to this point, then we've failed to get price with all our sources
         # If all sources failed due to timeouts, set one status
@@ -163,6 +205,40 @@ class Price:
             for typeID in priceMap.keys():
                 priceMap[typeID].update(PriceStatus.fetchFail)
 
+    @classmethod
+    def __fetchFromSource(cls, sourceName, priceMap, system, fetchTimeout):
+        """Fetch prices from source into passed price map, return True if it timed out"""
+        pyfalog.info('Trying {}'.format(sourceName))
+        timeBefore = timeit.default_timer()
+        timedOut = failed = False
+        try:
+            sourceCls = cls.sources.get(sourceName)
+            sourceCls(priceMap, system, fetchTimeout)
+        except TimeoutError:
+            pyfalog.warning("Price fetch timeout for source {}".format(sourceName))
+            timedOut = True
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            pyfalog.warn('Failed to fetch prices from price source {}: {}'.format(sourceName, e))
+            failed = True
+        elapsed = timeit.default_timer() - timeBefore
+        with cls.sourceStatsLock:
+            stats = cls.sourceStats.setdefault(sourceName, PriceSourceStats())
+            stats.fetches += 1
+            stats.failures += failed
+            stats.timeouts += timedOut
+            stats.totalTime += elapsed
+            stats.lastTime = elapsed
+        pyfalog.debug('Price source {} finished in {:.3f}s', sourceName, elapsed)
+        return timedOut
+
+    @classmethod
+    def getSourceStats(cls):
+        """Return {source name: PriceSourceStats} of sources used so far"""
+        with cls.sourceStatsLock:
+            return dict(cls.sourceStats)
+
     def getPriceNow(self, objitem):
         """Get price for provided typeID"""
         sMkt = Market.getInstance()
@@ -174,8 +250,10 @@ class Price:
         """Get prices for multiple typeIDs"""
         requests = []
         sMkt = Market.getInstance()
-        for objitem in objitems:
-            item = sMkt.getItem(objitem)
+        items = [sMkt.getItem(objitem) for objitem in objitems]
+        # Load all price objects at once rather than one query per item
+        Item.loadPrices(items)
+        for item in items:
             requests.append(item.price)
 
         def cb():
@@ -233,46 +311,114 @@ class Price:
 
 class PriceWorkerThread(threading.Thread):
 
+    # Time to let other requests join the one which woke the worker up, so
+    # that items requested by several views at once are fetched only once
+    COALESCE_DELAY = 0.1
+
     def __init__(self):
         threading.Thread.__init__(self)
         self.name = "PriceWorker"
-        self.queue = queue.Queue()
+        self.condition = threading.Condition()
+        # Requests which have not been picked up yet
+        # Format: [(callback, prices, fetch timeout, validity override)]
+        self.pending = []
+        # Type IDs of prices which are being fetched right now
+        self.inFlight = set()
+        # Format: {type ID: [callbacks]}
         self.wait = {}
         self.running = True
         pyfalog.debug("Initialize PriceWorkerThread.")
 
     def run(self):
-        queue = self.queue
         while True:
-            if not self.running:
-                break
-            # Grab our data
-            callback, requests, fetchTimeout, validityOverride = queue.get()
-
-            # Grab prices, this is the time-consuming part
-            if len(requests) > 0:
-                Price.fetchPrices(requests, fetchTimeout, validityOverride)
-
+            with self.condition:
+                while self.running and not self.pending:
+                    self.condition.wait()
+                if not self.running:
+                    break
+            time.sleep(self.COALESCE_DELAY)
+            with self.condition:
+                batch = self.pending
+                self.pending = []
+                self.inFlight = {price.typeID for _, prices, _, _ in batch for price in prices}
+            try:
+                self.processBatch(batch)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except Exception as e:
+                pyfalog.critical("Failed to process price requests.")
+                pyfalog.critical(e)
+            self.finishBatch(batch)
+
+    def processBatch(self, batch):
+        """Fetch prices of all requests in batch, each type only once"""
+        # Format: {type ID: [price objects]}
+        pricesByTypeID = {}
+        # Format: {type ID: price object}
+        toFetch = {}
+        fetchTimeout = 0
+        for _, prices, requestTimeout, validityOverride in batch:
+            fetchTimeout = max(fetchTimeout, requestTimeout)
+            for price in prices:
+                typePrices = pricesByTypeID.setdefault(price.typeID, [])
+                if not any(p is price for p in typePrices):
+                    typePrices.append(price)
+                if price.typeID not in toFetch and not price.isValid(validityOverride):
+                    toFetch[price.typeID] = price
+        if not toFetch:
+            return
+        # Prices were picked because they are outdated for at least one of the
+        # requests, zero override makes sure none is skipped as still valid
+        Price.fetchPrices(list(toFetch.values()), fetchTimeout, 0)
+        # Same type can be requested via different price objects
+        for typeID, fetchedPrice in toFetch.items():
+            for price in pricesByTypeID[typeID]:
+                if price is not fetchedPrice:
+                    price.price = fetchedPrice.price
+                    price.time = fetchedPrice.time
+                    price.status = fetchedPrice.status
+
+    def finishBatch(self, batch):
+        """Notify everyone who waits for prices of the batch, once per callback"""
+        callbacks = [callback for callback, _, _, _ in batch]
+        with self.condition:
+            for typeID in self.inFlight:
+                callbacks.extend(self.wait.pop(typeID, ()))
+            self.inFlight = set()
+        seen = set()
+        for callback in callbacks:
+            if id(callback) in seen:
+                continue
+            seen.add(id(callback))
             wx.CallAfter(callback)
-            queue.task_done()
-
-            # After we fetch prices, go through the list of waiting items and call their callbacks
-            for price in requests:
-                callbacks = self.wait.pop(price.typeID, None)
-                if callbacks:
-                    for callback in callbacks:
-                        wx.CallAfter(callback)
 
     def trigger(self, prices, callbacks, fetchTimeout, validityOverride):
-        self.queue.put((callbacks, prices, fetchTimeout, validityOverride))
+        with self.condition:
+            self.pending.append((callbacks, prices, fetchTimeout, validityOverride))
+            self.condition.notify()
 
     def setToWait(self, prices, callback):
-        for price in prices:
-            callbacks = self.wait.setdefault(price.typeID, [])
-            callbacks.append(callback)
+        """Call callback when prices are fetched by request from someone else"""
+        waiting = False
+        with self.condition:
+            scheduledTypeIDs = set(self.inFlight)
+            for _, pendingPrices, _, _ in self.pending:
+                scheduledTypeIDs.update(p.typeID for p in pendingPrices)
+            for price in prices:
+                # No reason to wait for prices which are valid and are not
+                # going to change soon
+                if price.typeID not in scheduledTypeIDs and price.isValid():
+                    continue
+                callbacks = self.wait.setdefault(price.typeID, [])
+                callbacks.append(callback)
+                waiting = True
+        if not waiting:
+            wx.CallAfter(callback)
 
     def stop(self):
-        self.running = False
+        with self.condition:
+            self.running = False
+            self.condition.notify()
 
 
 # Import market sources only to initialize price source modules, they register on their own
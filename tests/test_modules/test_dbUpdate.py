@@ -0,0 +1,125 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import itertools
+import os
+import random
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..')))
+
+from db_update import findReplacements
+
+
+SKILL_REQ_ATTRIBS = {182: 277, 183: 278, 184: 279, 1285: 1286, 1289: 1287, 1290: 1288}
+IGNORED_ATTRIBS = (4, 124, 162, 422, 633, 1692, 1768)
+CATEGORIES = (6, 7, 8, 18, 20, 22, 23, 32, 35, 65, 66, 87)
+
+
+def _findReplacementsPairwise(eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData):
+    # Replacement search as it was done before grouping by attributes, by
+    # comparing attributes of every pair of types from the same group
+    def compareAttrs(attrs1, attrs2):
+        if len(attrs1) == 0 and len(attrs2) == 0:
+            return False
+        if set(attrs1) != set(attrs2):
+            return False
+        return all(attrs1[aid] == attrs2[aid] for aid in attrs1)
+
+    skillReqAttribsFlat = set(SKILL_REQ_ATTRIBS).union(SKILL_REQ_ATTRIBS.values())
+    typesGroups = {row['typeID']: row['groupID'] for row in eveTypesData}
+    typesEffects = {}
+    for row in dogmaTypeEffectsData:
+        typesEffects.setdefault(row['typeID'], set()).add(row['effectID'])
+    typesNormalAttribs = {}
+    typesSkillAttribs = {}
+    for row in dogmaTypeAttributesData:
+        if row['attributeID'] in skillReqAttribsFlat:
+            typesSkillAttribs.setdefault(row['typeID'], {})[row['attributeID']] = row['value']
+        elif row['attributeID'] not in IGNORED_ATTRIBS:
+            typesNormalAttribs.setdefault(row['typeID'], {})[row['attributeID']] = row['value']
+    typesSkillReqs = {}
+    for typeID, typeSkillAttribs in typesSkillAttribs.items():
+        typeSkillReqs = typesSkillReqs.setdefault(typeID, {})
+        for skillreqTypeAttr, skillreqLevelAttr in SKILL_REQ_ATTRIBS.items():
+            try:
+                typeSkillReqs[int(typeSkillAttribs[skillreqTypeAttr])] = int(typeSkillAttribs[skillreqLevelAttr])
+            except (KeyError, ValueError):
+                continue
+    groupCategories = {row['groupID']: row['categoryID'] for row in eveGroupsData}
+    groupedData = {}
+    for row in eveTypesData:
+        typeID = row['typeID']
+        if groupCategories[typesGroups[typeID]] not in CATEGORIES:
+            continue
+        typeAttribs = typesNormalAttribs.get(typeID, {})
+        if not typeAttribs:
+            continue
+        key = (typesGroups[typeID], frozenset(typesSkillReqs.get(typeID, {})), frozenset(typesEffects.get(typeID, ())))
+        groupedData.setdefault(key, []).append((typeID, typeAttribs))
+    replacements = {}
+    for groupData in groupedData.values():
+        for type1, type2 in itertools.combinations(groupData, 2):
+            if compareAttrs(type1[1], type2[1]):
+                replacements.setdefault(type1[0], set()).add(type2[0])
+                replacements.setdefault(type2[0], set()).add(type1[0])
+    return replacements
+
+
+def _makeData(seed, typeAmount):
+    rng = random.Random(seed)
+    eveGroupsData = [
+        {'groupID': 1, 'categoryID': 7},
+        {'groupID': 2, 'categoryID': 8},
+        {'groupID': 3, 'categoryID': 18},
+        # Category which is not looked at
+        {'groupID': 4, 'categoryID': 9}]
+    eveTypesData = []
+    dogmaTypeAttributesData = []
+    dogmaTypeEffectsData = []
+    for typeID in range(1, typeAmount + 1):
+        eveTypesData.append({'typeID': typeID, 'groupID': rng.randint(1, 4)})
+        # Few distinct values, so that there are plenty of matches; int and
+        # float forms of the same value have to be considered equal
+        for attrID in rng.sample((20, 30, 37, 51, 54), rng.randint(0, 3)):
+            value = rng.choice((1, 1.0, 2.5, 3))
+            dogmaTypeAttributesData.append({'typeID': typeID, 'attributeID': attrID, 'value': value})
+        # Ignored attributes must not prevent types from being matched
+        for attrID in rng.sample(IGNORED_ATTRIBS, rng.randint(0, 2)):
+            dogmaTypeAttributesData.append({'typeID': typeID, 'attributeID': attrID, 'value': rng.random()})
+        # Skill types matter, skill levels do not
+        if rng.random() < 0.5:
+            dogmaTypeAttributesData.append({'typeID': typeID, 'attributeID': 182, 'value': rng.choice((3300, 3301))})
+            dogmaTypeAttributesData.append({'typeID': typeID, 'attributeID': 277, 'value': rng.randint(1, 5)})
+        if rng.random() < 0.3:
+            dogmaTypeEffectsData.append({'typeID': typeID, 'effectID': rng.choice((11, 12))})
+    return eveTypesData, eveGroupsData, dogmaTypeAttributesData, dogmaTypeEffectsData
+
+
+def test_findReplacements_matchesPairwise():
+    for seed in range(20):
+        data = _makeData(seed, 300)
+        expected = _findReplacementsPairwise(*data)
+        assert expected
+        assert findReplacements(*data) == expected
+
+
+def test_findReplacements():
+    eveGroupsData = [{'groupID': 1, 'categoryID': 8}, {'groupID': 2, 'categoryID': 8}]
+    eveTypesData = [
+        {'typeID': 1, 'groupID': 1},
+        {'typeID': 2, 'groupID': 1},
+        {'typeID': 3, 'groupID': 1},
+        # Same attributes, different group
+        {'typeID': 4, 'groupID': 2},
+        # No attributes at all
+        {'typeID': 5, 'groupID': 1},
+        {'typeID': 6, 'groupID': 1}]
+    dogmaTypeAttributesData = [
+        {'typeID': 1, 'attributeID': 20, 'value': 5},
+        {'typeID': 1, 'attributeID': 4, 'value': 100},
+        {'typeID': 2, 'attributeID': 20, 'value': 5.0},
+        {'typeID': 2, 'attributeID': 4, 'value': 200},
+        {'typeID': 3, 'attributeID': 20, 'value': 6},
+        {'typeID': 4, 'attributeID': 20, 'value': 5}]
+    assert findReplacements(eveTypesData, eveGroupsData, dogmaTypeAttributesData, []) == {1: {2}, 2: {1}}
@@ -0,0 +1,56 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import math
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from eos.calc import applyPenalizedChain, calculateMultiplier, calculateRangeFactor, calculateRangeFactorArray, splitPenalizedChain
+
+
+def _penalize(multipliers):
+    val = 1
+    for chain in ([m for m in multipliers if m > 1], [m for m in multipliers if m < 1]):
+        chain.sort(key=lambda m: -abs(m - 1))
+        for i, mult in enumerate(chain):
+            val *= 1 + (mult - 1) * math.exp(- i ** 2 / 7.1289)
+    return val
+
+
+def test_splitPenalizedChain():
+    bonuses, penalties = splitPenalizedChain([1.1, 0.5, 1.3, 1, 0.9, 1.2])
+    assert bonuses == [1.3, 1.2, 1.1]
+    assert penalties == [0.5, 0.9]
+
+
+def test_applyPenalizedChain():
+    multipliers = [1.3, 1.25, 1.2, 1.15, 1.1]
+    assert applyPenalizedChain(10, multipliers) == 10 * _penalize(multipliers)
+
+
+def test_applyPenalizedChain_long():
+    # Long chains go through numpy, results can differ only by rounding
+    multipliers = [1 + i / 100 for i in range(60, 0, -1)]
+    assert math.isclose(applyPenalizedChain(1, multipliers), _penalize(multipliers), rel_tol=1e-12)
+
+
+def test_calculateMultiplier():
+    multipliers = {
+        'default': [(1.5, None), (0.7, None), (1.5, None)],
+        'postMul': [(0.8, None)]}
+    assert calculateMultiplier(multipliers) == _penalize([1.5, 0.7, 1.5]) * _penalize([0.8])
+
+
+def test_calculateRangeFactorArray():
+    # Array version has to give the same factors as point-by-point one, numpy
+    # power can differ from python one only by rounding
+    distances = [0, 5000, 10000, 10001, 20000, 39999, 40000, 40001, 100000]
+    for optimal, falloff in ((10000, 10000), (10000, 0), (0, 5000)):
+        for restricted in (True, False):
+            factors = calculateRangeFactorArray(optimal, falloff, distances, restrictedRange=restricted)
+            expected = [calculateRangeFactor(optimal, falloff, d, restrictedRange=restricted) for d in distances]
+            assert len(factors) == len(expected)
+            for factor, expectedFactor in zip(factors, expected):
+                assert math.isclose(factor, expectedFactor, rel_tol=1e-12)
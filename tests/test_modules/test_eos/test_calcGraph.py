@@ -0,0 +1,98 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+from eos.const import FittingModuleState
+
+
+def _addModule(DB, Saveddata, fit, name, state):
+    mod = Saveddata['Module'](DB['db'].getItem(name))
+    mod.owner = fit
+    fit.modules.append(mod)
+    mod.state = state
+    return mod
+
+
+def _getAttrs(fit):
+    attrs = {'ship': dict(fit.ship.itemModifiedAttributes)}
+    for i, mod in enumerate(fit.modules):
+        attrs[i] = (dict(mod.itemModifiedAttributes), mod.reloadTime)
+    return attrs
+
+
+def _getFullAttrs(fit):
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    return _getAttrs(fit)
+
+
+def test_incremental_matchesFull(DB, Saveddata, RifterFit):
+    RifterFit.character = Saveddata['Character'].getAll5()
+    RifterFit.recordCalcGraph = True
+    ab = _addModule(DB, Saveddata, RifterFit, "1MN Afterburner II", FittingModuleState.ONLINE)
+    _addModule(DB, Saveddata, RifterFit, "Overdrive Injector System II", FittingModuleState.ONLINE)
+    RifterFit.calculateModifiedAttributes()
+
+    for state in (FittingModuleState.ACTIVE, FittingModuleState.OVERHEATED, FittingModuleState.ONLINE):
+        ab.state = state
+        assert RifterFit.calculateModifiedAttributesIncremental()
+        incremental = _getAttrs(RifterFit)
+        assert incremental == _getFullAttrs(RifterFit)
+
+
+def test_incremental_effectDataOnFit(DB, Saveddata, RifterFit):
+    # Remote repairer stores repair data on fit directly, which graph can't
+    # replay; updating fit has to give the same results as full calculation,
+    # and must not store the data twice
+    RifterFit.character = Saveddata['Character'].getAll5()
+    RifterFit.recordCalcGraph = True
+    rep = Saveddata['Module'](DB['db'].getItem("Small Remote Armor Repairer II"))
+    RifterFit.projectedModules.append(rep)
+    rep.state = FittingModuleState.ONLINE
+    RifterFit.calculateModifiedAttributes()
+    assert not RifterFit._armorRr
+
+    rep.state = FittingModuleState.ACTIVE
+    RifterFit.calculateModifiedAttributesIncremental()
+    incremental = _getAttrs(RifterFit)
+    armorRr = list(RifterFit._armorRr)
+    assert len(armorRr) == 1
+    assert incremental == _getFullAttrs(RifterFit)
+    assert armorRr == RifterFit._armorRr
+
+
+def test_activeGraph_threadLocal():
+    from eos import calcGraph
+    graph = object()
+    seen = []
+    calcGraph.state.active = graph
+    try:
+        # Calculations in other threads must not report to the graph
+        thread = threading.Thread(target=lambda: seen.append(calcGraph.state.active))
+        thread.start()
+        thread.join()
+        assert seen == [None]
+        assert calcGraph.state.active is graph
+    finally:
+        calcGraph.state.active = None
+
+
+def test_skillTemplate_restoresActiveGraph():
+    from eos import calcGraph
+    from eos.skillTemplate import SkillTemplate
+    fit = SimpleNamespace(ship=None, mode=None, modules=[], drones=[], fighters=[], appliedImplants=[], boosters=[])
+    graph = object()
+    calcGraph.state.active = graph
+    try:
+        template = SkillTemplate.record(fit, [], "normal")
+        assert calcGraph.state.active is graph
+    finally:
+        calcGraph.state.active = None
+    assert template.operations == []
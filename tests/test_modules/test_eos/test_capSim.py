@@ -0,0 +1,58 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import math
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from eos.capSim import CapSimulator
+
+
+# (duration, capNeed, clipSize, disableStagger, reloadTime, isInjector)
+RELOADING_MODULES = [
+    (3000, 15, 20, False, 10000, False),
+    (5000, 20, 8, False, 5000, False),
+    (7000, 25, 0, False, 0, False),
+    (2500, 12, 0, False, 0, False)]
+
+
+def _runSim(modules, capNeedFactor=1, optimizeRepeats=True, replayPeriods=True, tMax=6 * 60 * 60 * 1000):
+    sim = CapSimulator()
+    sim.init([(d, c * capNeedFactor, cs, ds, rt, i) for d, c, cs, ds, rt, i in modules])
+    sim.capacitorCapacity = 2000
+    sim.capacitorRecharge = 300000
+    sim.startingCapacity = 2000
+    sim.stagger = True
+    sim.reload = True
+    sim.t_max = tMax
+    sim.optimize_repeats = optimizeRepeats
+    sim.replay_periods = replayPeriods
+    sim.run()
+    return sim
+
+
+def test_replayPeriods_sameAsQueue():
+    queued = _runSim(RELOADING_MODULES, optimizeRepeats=False, replayPeriods=False, tMax=3600 * 1000)
+    replayed = _runSim(RELOADING_MODULES, optimizeRepeats=False, tMax=3600 * 1000)
+    assert replayed.result_replayed_periods > 0
+    assert len(replayed.saved_changes) == len(queued.saved_changes)
+    for (qTime, qCap), (rTime, rCap) in zip(queued.saved_changes, replayed.saved_changes):
+        assert qTime == rTime
+        assert math.isclose(qCap, rCap, rel_tol=1e-9)
+
+
+def test_replayPeriods_unstable():
+    queued = _runSim(RELOADING_MODULES, capNeedFactor=3, replayPeriods=False)
+    replayed = _runSim(RELOADING_MODULES, capNeedFactor=3)
+    assert queued.cap_stable_low == replayed.cap_stable_low == 0
+    assert queued.t == replayed.t
+
+
+def test_stableWithReloads_detectedEarly():
+    sim = _runSim(RELOADING_MODULES)
+    assert sim.result_optimized_repeats
+    assert sim.t < sim.t_max / 2
+    full = _runSim(RELOADING_MODULES, optimizeRepeats=False)
+    assert math.isclose(sim.cap_stable_low, full.cap_stable_low, rel_tol=1e-3)
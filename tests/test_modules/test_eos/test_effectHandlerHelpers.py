@@ -0,0 +1,90 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+from collections import namedtuple
+from types import SimpleNamespace
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from eos.effectHandlerHelpers import HandledList, chargeGroupIs, itemCategoryIs, itemGroupIs, itemRequiresSkill
+
+
+Skill = namedtuple('Skill', ('ID', 'typeName'))
+GUNNERY = Skill(3300, 'Gunnery')
+SMALL_PROJECTILE = Skill(3301, 'Small Projectile Turret')
+MISSILES = Skill(3319, 'Missile Launcher Operation')
+
+
+class FakeItem:
+
+    def __init__(self, skills, groupID, groupName, categoryID=7, categoryName='Module'):
+        self.requiredSkills = {s: 1 for s in skills}
+        self.group = SimpleNamespace(ID=groupID, name=groupName)
+        self.category = SimpleNamespace(ID=categoryID, name=categoryName)
+
+    def requiresSkill(self, skill):
+        return any(skill in (s.ID, s.typeName) for s in self.requiredSkills)
+
+
+class FakeModule:
+
+    def __init__(self, item, charge=None):
+        self.item = item
+        self.charge = charge
+        self.increased = []
+
+    def increaseItemAttr(self, attr, value):
+        self.increased.append((attr, value))
+
+    def increaseChargeAttr(self, attr, value):
+        self.increased.append((attr, value))
+
+
+def _makeList():
+    ammo = FakeItem((), 83, 'Projectile Ammo', 8, 'Charge')
+    return HandledList([
+        FakeModule(FakeItem((GUNNERY, SMALL_PROJECTILE), 55, 'Projectile Weapon'), ammo),
+        FakeModule(FakeItem((MISSILES,), 507, 'Missile Launcher Rocket')),
+        FakeModule(FakeItem((GUNNERY,), 55, 'Projectile Weapon')),
+        FakeModule(FakeItem((), 46, 'Propulsion Module'))])
+
+
+def _getAffected(filter):
+    hl = _makeList()
+    hl.filteredItemIncrease(filter, 'damageMultiplier', 1)
+    hl.filteredChargeIncrease(filter, 'emDamage', 1)
+    return [i for i, mod in enumerate(hl) if mod.increased]
+
+
+def test_indexedFilters_matchCallables():
+    # Indexed filters have to affect the same elements plain callables do
+    cases = (
+        (itemRequiresSkill('Gunnery'), lambda mod: mod.item.requiresSkill('Gunnery')),
+        (itemRequiresSkill(SMALL_PROJECTILE.ID), lambda mod: mod.item.requiresSkill(SMALL_PROJECTILE.ID)),
+        (itemRequiresSkill(SimpleNamespace(item=MISSILES)), lambda mod: mod.item.requiresSkill('Missile Launcher Operation')),
+        (itemRequiresSkill('Gunnery', 'Missile Launcher Operation'),
+         lambda mod: mod.item.requiresSkill('Gunnery') or mod.item.requiresSkill('Missile Launcher Operation')),
+        (itemGroupIs('Propulsion Module'), lambda mod: mod.item.group.name == 'Propulsion Module'),
+        (itemGroupIs(55, 507), lambda mod: mod.item.group.ID in (55, 507)),
+        (itemCategoryIs('Module'), lambda mod: mod.item.category.name == 'Module'),
+        (chargeGroupIs('Projectile Ammo'), lambda mod: mod.charge.group.name == 'Projectile Ammo'))
+    for indexed, plain in cases:
+        assert _getAffected(indexed) == _getAffected(plain)
+    assert _getAffected(itemRequiresSkill('Gunnery')) == [0, 2]
+    assert _getAffected(chargeGroupIs('Projectile Ammo')) == [0]
+
+
+def test_indexedFilters_listChanges():
+    hl = _makeList()
+    filter = itemGroupIs('Projectile Weapon')
+    hl.filteredItemIncrease(filter, 'damageMultiplier', 1)
+    # Index is built now, and has to follow changes of the list
+    del hl[0]
+    hl.append(FakeModule(FakeItem((GUNNERY,), 55, 'Projectile Weapon')))
+    hl[0] = FakeModule(FakeItem((GUNNERY,), 55, 'Projectile Weapon'))
+    for mod in hl:
+        mod.increased.clear()
+    hl.filteredItemIncrease(filter, 'damageMultiplier', 1)
+    assert [i for i, mod in enumerate(hl) if mod.increased] == [0, 1, 3]
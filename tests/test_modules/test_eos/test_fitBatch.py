@@ -0,0 +1,69 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from eos.fitBatch import evaluateFits
+
+
+def test_evaluateFits_matchesFitStats(DB, Saveddata, RifterFit):
+    char5 = Saveddata['Character'].getAll5()
+    rows = evaluateFits([RifterFit], characters=[char5])
+    assert len(rows) == 1
+    assert rows[0].character is char5
+
+    RifterFit.character = char5
+    RifterFit.calculateModifiedAttributes()
+    assert rows[0].maxSpeed == RifterFit.maxSpeed
+    assert rows[0].alignTime == RifterFit.alignTime
+    assert rows[0].ehp == sum(RifterFit.damagePattern.calculateEhp(RifterFit.ship).values())
+
+
+def test_evaluateFits_restoresFit(DB, Saveddata, RifterFit):
+    # Fit without character must not get the default one assigned
+    evaluateFits([RifterFit], characters=[Saveddata['Character'].getAll5()])
+    assert RifterFit._Fit__character is None
+    assert not RifterFit.calculated
+
+    # Calculated fit has to stay calculated, with its own character
+    char0 = Saveddata['Character'].getAll0()
+    RifterFit.character = char0
+    RifterFit.calculateModifiedAttributes()
+    speed = RifterFit.maxSpeed
+    evaluateFits([RifterFit], characters=[Saveddata['Character'].getAll5()])
+    assert RifterFit.character is char0
+    assert RifterFit.calculated
+    assert RifterFit.maxSpeed == speed
+
+
+def test_evaluateFits_calculations(DB, Saveddata, RifterFit, monkeypatch):
+    from eos.saveddata.fit import Fit
+    calculate = Fit.calculateModifiedAttributes
+    calculations = []
+
+    def countingCalculate(self, *args, **kwargs):
+        calculations.append(self)
+        return calculate(self, *args, **kwargs)
+
+    char0 = Saveddata['Character'].getAll0()
+    char5 = Saveddata['Character'].getAll5()
+    RifterFit.character = char0
+    RifterFit.calculateModifiedAttributes()
+    monkeypatch.setattr(Fit, 'calculateModifiedAttributes', countingCalculate)
+    # Calculated fit is used as is for its own character
+    rows = evaluateFits([RifterFit], factorReload=RifterFit.factorReload)
+    assert len(calculations) == 0
+    assert rows[0].maxSpeed == RifterFit.maxSpeed
+    # Once per other character, and once to restore the fit
+    evaluateFits([RifterFit], characters=[char0, char5, char5], factorReload=RifterFit.factorReload)
+    assert len(calculations) == 2
+    assert RifterFit.calculated
+    # Fit which was not calculated is not restored
+    RifterFit.clear()
+    del calculations[:]
+    evaluateFits([RifterFit], characters=[char0, char5])
+    assert len(calculations) == 2
+    assert not RifterFit.calculated
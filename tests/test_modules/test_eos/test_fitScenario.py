@@ -0,0 +1,31 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+from eos.const import FittingModuleState
+from eos.fitScenario import FitScenario
+
+
+def test_scenario_doesNotTouchFit(DB, Saveddata, RifterFit):
+    RifterFit.character = Saveddata['Character'].getAll5()
+    RifterFit.calculateModifiedAttributes()
+    speed = RifterFit.maxSpeed
+    modCount = len(RifterFit.modules)
+
+    with FitScenario(RifterFit) as scenario:
+        ab = Saveddata['Module'](DB['db'].getItem("1MN Afterburner II"))
+        ab.state = FittingModuleState.ACTIVE
+        assert scenario.addModule(ab)
+        assert scenario.evaluate().maxSpeed > speed
+        scenario.setModuleState(ab, FittingModuleState.ONLINE)
+        assert scenario.evaluate().maxSpeed == speed
+        scenario.revert()
+        assert scenario.evaluate().maxSpeed == speed
+
+    assert len(RifterFit.modules) == modCount
+    assert RifterFit.maxSpeed == speed
@@ -0,0 +1,70 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import eos.config
+from eos.fitStatsCache import FitStatsCache
+
+
+STATS = {'dps': 512.5, 'volley': 3000, 'ehp': 45000.0, 'capStable': False, 'capState': 120.5, 'maxSpeed': 350.0, 'alignTime': 6.2}
+
+
+def test_fitStatsCache_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(eos.config, 'gamedata_version', '1')
+    cache = FitStatsCache(str(tmp_path / 'stats.db'))
+    cache.setMany({'a': STATS, 'b': dict(STATS, dps=0)})
+    assert cache.get('a') == STATS
+    assert cache.get('missing') is None
+    assert cache.getMany(['a', 'b', 'c', None]) == {'a': STATS, 'b': dict(STATS, dps=0)}
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_fitStatsCache_gamedataVersion(tmp_path, monkeypatch):
+    path = str(tmp_path / 'stats.db')
+    monkeypatch.setattr(eos.config, 'gamedata_version', '1')
+    cache = FitStatsCache(path)
+    cache.set('a', STATS)
+    cache.close()
+    # Entries survive reopening, but not gamedata update
+    cache = FitStatsCache(path)
+    assert cache.get('a') == STATS
+    cache.close()
+    monkeypatch.setattr(eos.config, 'gamedata_version', '2')
+    cache = FitStatsCache(path)
+    assert cache.get('a') is None
+    cache.close()
+
+
+def test_fitStatsCache_noGamedataVersion(tmp_path, monkeypatch):
+    path = str(tmp_path / 'stats.db')
+    monkeypatch.setattr(eos.config, 'gamedata_version', '1')
+    cache = FitStatsCache(path)
+    cache.set('a', STATS)
+    cache.close()
+    # Without version, stats can't be matched to gamedata they were calculated with
+    monkeypatch.setattr(eos.config, 'gamedata_version', None)
+    cache = FitStatsCache(path)
+    assert cache.get('a') is None
+    cache.set('b', STATS)
+    cache.close()
+    monkeypatch.setattr(eos.config, 'gamedata_version', '1')
+    cache = FitStatsCache(path)
+    assert cache.getMany(['a', 'b']) == {'a': STATS}
+    cache.close()
+
+
+def test_getFitStatsKey_rahPattern(DB, Saveddata, RifterFit):
+    from eos.fitStatsCache import getFitStatsKey
+    from eos.saveddata.damagePattern import DamagePattern
+    mod = Saveddata['Module'](DB['db'].getItem("Reactive Armor Hardener"))
+    mod.owner = RifterFit
+    RifterFit.modules.append(mod)
+    key = getFitStatsKey(RifterFit)
+    mod.rahPatternOverride = DamagePattern(10, 20, 30, 40)
+    assert getFitStatsKey(RifterFit) != key
@@ -2,6 +2,9 @@
 # This must be done on every test in order to pass in Travis
 import os
 import sys
+
+import pytest
+
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
 
@@ -13,3 +16,137 @@ def test_race(DB, RifterFit, KeepstarFit):
     """
     assert RifterFit.ship.item.race == 'minmatar'
     assert KeepstarFit.ship.item.race == 'upwell'
+
+
+def test_queryCaches():
+    """
+    Test registry of gamedata query caches
+    """
+    import eos.db
+    from eos.db.gamedata import queries
+    stats = queries.getQueryCacheStats()
+    assert queries.getQueryName(eos.db.getItem) == 'eos.db.gamedata.queries.getItem'
+    assert 'eos.db.gamedata.queries.getItem' in stats
+    queries.setQueryCacheSize(eos.db.getItem, 1000)
+    assert queries.getQueryCache(eos.db.getItem).maxSize == 1000
+    queries.setQueryCacheSize(eos.db.getItem, None)
+    queries.clearQueryCaches()
+
+
+def test_getItems_itemCache(DB):
+    """
+    Test that items fetched in bulk and one by one are the same objects
+    """
+    rifter = DB['db'].getItem("Rifter")
+    keepstar = DB['db'].getItem("Keepstar")
+    DB['db'].clearQueryCaches()
+    items = DB['db'].getItems([keepstar.ID, rifter.ID, keepstar.ID])
+    assert [i.ID for i in items] == [keepstar.ID, rifter.ID]
+    assert DB['db'].getItem(rifter.ID) is items[1]
+    assert DB['db'].getItems((rifter.ID,)) == [items[1]]
+
+
+def test_loadPrices(monkeypatch):
+    """
+    Test that prices loaded in bulk are the ones items get one by one
+    """
+    import eos.db
+    from eos.gamedata import Item
+    from eos.saveddata.price import Price
+
+    def makeItem(typeID):
+        item = Item()
+        item.init()
+        item.ID = typeID
+        return item
+
+    stored = Price(900001)
+    stored.price = 5
+    eos.db.add(stored)
+    eos.db.flush()
+    try:
+        # Items which already have price do not need to be loaded again
+        preloaded = makeItem(900003)
+        preloadedPrice = preloaded.price
+        items = [makeItem(900001), makeItem(900001), makeItem(900002), preloaded]
+        getPrice = eos.db.getPrice
+        monkeypatch.setattr(eos.db, 'getPrice', lambda typeID: pytest.fail('Price queried one by one'))
+        Item.loadPrices(items)
+        assert items[0].price is stored
+        assert items[1].price is stored
+        assert items[2].price.typeID == 900002
+        assert items[3].price is preloadedPrice
+        monkeypatch.setattr(eos.db, 'getPrice', getPrice)
+        # Prices which did not exist are stored, as if they were requested one by one
+        for item in items:
+            assert makeItem(item.ID).price is item.price
+            assert eos.db.getPrice(item.ID) is item.price
+    finally:
+        eos.db.saveddata_session.rollback()
+
+
+def test_getEffects_activeByDefault():
+    """
+    Test that effect tables of items follow toggling of effects
+    """
+    import eos.db
+    from eos.gamedata import Effect, Item
+
+    def makeEffect(effectID, name):
+        effect = Effect()
+        effect.init()
+        effect.ID = effectID
+        effect.name = name
+        return effect
+
+    effect1 = makeEffect(-1, 'effect1')
+    effect2 = makeEffect(-2, 'effect2')
+    item1 = Item()
+    item1.init()
+    item1.ID = -1
+    item1.effects = {'effect1': effect1, 'effect2': effect2}
+    item2 = Item()
+    item2.init()
+    item2.ID = -2
+    item2.effects = {'effect1': effect1}
+    assert item1.getEffects('normal') == (effect1, effect2)
+    assert item2.getEffects('normal') == (effect1,)
+    # Effect is shared, toggling it affects all items which have it
+    effect1.activeByDefault = False
+    assert item1.getEffects('normal') == (effect2,)
+    assert item1.getEffects('normal', activeOnly=False) == (effect1, effect2)
+    assert item2.getEffects('normal') == ()
+    effect1.activeByDefault = True
+    assert item1.getEffects('normal') == (effect1, effect2)
+    assert item2.getEffects('normal') == (effect1,)
+
+
+def test_effectToggle_dispatch(DB, Saveddata, RifterFit):
+    """
+    Test that effects toggled off are not run on calculation, and are run
+    again once toggled back on
+    """
+    ship = RifterFit.ship
+    effect = next(e for e in ship.item.effects.values() if e.isType('passive') and e.activeByDefault)
+    handler = effect.handler
+    calls = []
+
+    def countingHandler(*args, **kwargs):
+        calls.append(args[1])
+        return handler(*args, **kwargs)
+
+    effect._Effect__handler = countingHandler
+    try:
+        RifterFit.calculateModifiedAttributes()
+        assert calls == [ship]
+        effect.activeByDefault = False
+        RifterFit.clear()
+        RifterFit.calculateModifiedAttributes()
+        assert calls == [ship]
+        effect.activeByDefault = True
+        RifterFit.clear()
+        RifterFit.calculateModifiedAttributes()
+        assert calls == [ship, ship]
+    finally:
+        effect._Effect__handler = handler
+        effect.activeByDefault = True
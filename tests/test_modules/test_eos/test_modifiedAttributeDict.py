@@ -46,3 +46,83 @@ def test_multiply_stacking_penalties(DB, Saveddata, RifterFit):
 
         assert em_resist == calculated_resist
         # print(str(em_resist) + "==" + str(calculated_resist))
+
+
+def test_mutators_followCollectionChanges():
+    """
+    Tests that mutators keyed by name reflect in-place changes of the
+    mutator collection, not only changes of its size
+    """
+    from types import SimpleNamespace
+    import eos.db  # noqa: F401
+    from eos.modifiedAttributeDict import ModifiedAttributeDict
+
+    def makeMutator(name):
+        return SimpleNamespace(attribute=SimpleNamespace(name=name))
+
+    attrs = ModifiedAttributeDict()
+    collection = {1: makeMutator('maxRange')}
+    attrs.mutators = collection
+    assert list(attrs.mutators) == ['maxRange']
+    collection[1] = replacement = makeMutator('maxRange')
+    assert attrs.mutators['maxRange'] is replacement
+    del collection[1]
+    collection[2] = makeMutator('cpu')
+    assert list(attrs.mutators) == ['cpu']
+
+
+def _makeExtendedDict(monkeypatch):
+    from types import SimpleNamespace
+    import eos.db  # noqa: F401
+    import eos.modifiedAttributeDict as mad
+
+    resAttrInfo = SimpleNamespace(ID=1, name='speedFactorResistance', attributeName='speedFactorResistance')
+    monkeypatch.setattr(mad, 'getAttributeInfo', lambda key: resAttrInfo if key == 1 else None)
+    monkeypatch.setattr(mad, 'defaultValuesCache', {})
+    monkeypatch.setattr(mad, 'cappingAttrKeyCache', {})
+    class FakeFit:
+        ship = SimpleNamespace(itemModifiedAttributes={'speedFactorResistance': 1})
+        modifier = None
+
+        def getOrigin(self):
+            return None
+
+        def getModifier(self):
+            return self.modifier
+
+    fit = FakeFit()
+    attrs = mad.ModifiedAttributeDict(fit=fit)
+    attrs.original = {'maxVelocity': SimpleNamespace(value=100)}
+    return attrs, fit
+
+
+def test_getExtended_shipResistance(monkeypatch):
+    """
+    Tests that remembered results of extended getter follow ship resistances
+    """
+    attrs, fit = _makeExtendedDict(monkeypatch)
+    extraMultipliers = {'default': [(0.5, 1)]}
+    assert attrs.getExtended('maxVelocity', extraMultipliers=extraMultipliers) == 50
+    fit.ship.itemModifiedAttributes['speedFactorResistance'] = 0.5
+    assert attrs.getExtended('maxVelocity', extraMultipliers=extraMultipliers) == 75
+    fit.ship.itemModifiedAttributes['speedFactorResistance'] = 1
+    assert attrs.getExtended('maxVelocity', extraMultipliers=extraMultipliers) == 50
+
+
+def test_getExtended_ignoreAfflictors(monkeypatch):
+    """
+    Tests that remembered results of extended getter are keyed by afflictors
+    themselves, and match results calculated without remembering them
+    """
+    class Afflictor:
+        pass
+
+    attrs, fit = _makeExtendedDict(monkeypatch)
+    fit.modifier = propMod = Afflictor()
+    attrs.multiply('maxVelocity', 2)
+    assert attrs.getExtended('maxVelocity') == 200
+    assert attrs.getExtended('maxVelocity', ignoreAfflictors=[propMod]) == 100
+    # Afflictor which is gone can't be confused with a new one
+    for i in range(100):
+        assert attrs.getExtended('maxVelocity', ignoreAfflictors=[Afflictor()]) == 200
+    assert attrs.getExtended('maxVelocity', ignoreAfflictors=[propMod]) == 100
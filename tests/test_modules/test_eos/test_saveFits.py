@@ -0,0 +1,118 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+import pytest
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+from eos.const import FittingModuleState
+
+
+def _makeFit(DB, Gamedata, Saveddata, name):
+    from eos.saveddata.cargo import Cargo
+    from eos.saveddata.drone import Drone
+    item = DB['gamedata_session'].query(Gamedata['Item']).filter(Gamedata['Item'].name == "Rifter").first()
+    fit = Saveddata['Fit'](Saveddata['Ship'](item), name)
+    for modName, state in (
+            ("1MN Afterburner II", FittingModuleState.ACTIVE),
+            ("200mm AutoCannon II", FittingModuleState.ONLINE),
+            ("200mm AutoCannon II", FittingModuleState.OFFLINE)):
+        mod = Saveddata['Module'](DB['db'].getItem(modName))
+        mod.owner = fit
+        fit.modules.append(mod)
+        mod.state = state
+    projected = Saveddata['Module'](DB['db'].getItem("Small Remote Armor Repairer II"))
+    fit.projectedModules.append(projected)
+    projected.state = FittingModuleState.ACTIVE
+    drone = Drone(DB['db'].getItem("Hobgoblin I"))
+    drone.amount = 2
+    drone.amountActive = 1
+    fit.drones.append(drone)
+    cargo = Cargo(DB['db'].getItem("EMP S"))
+    cargo.amount = 100
+    fit.cargo.append(cargo)
+    return fit
+
+
+def _getRows(DB, fit):
+    # Everything but IDs and timestamps
+    queries = (
+        "SELECT itemID, chargeID, state, projected, position FROM modules WHERE fitID = :fitID ORDER BY projected, position",
+        "SELECT itemID, amount, amountActive, projected FROM drones WHERE fitID = :fitID ORDER BY itemID",
+        "SELECT itemID, amount FROM cargo WHERE fitID = :fitID ORDER BY itemID")
+    rows = [DB['saveddata_session'].execute(query, {'fitID': fit.ID}).fetchall() for query in queries]
+    rows.append(DB['saveddata_session'].execute(
+        "SELECT shipID, name FROM fits WHERE ID = :fitID", {'fitID': fit.ID}).fetchall())
+    return [[tuple(row) for row in tableRows] for tableRows in rows]
+
+
+def test_saveFits_matchesSave(DB, Gamedata, Saveddata):
+    # Bulk save has to store the same rows one-by-one saving did
+    oldFit = _makeFit(DB, Gamedata, Saveddata, "Fit")
+    DB['db'].save(oldFit)
+    newFits = [_makeFit(DB, Gamedata, Saveddata, "Fit") for _ in range(3)]
+    assert DB['db'].saveFits(newFits) == 3
+
+    oldRows = _getRows(DB, oldFit)
+    assert all(len(tableRows) > 0 for tableRows in oldRows)
+    for fit in newFits:
+        assert _getRows(DB, fit) == oldRows
+
+    # Assigned IDs have to continue after existing ones, without collisions
+    fitIDs = [f.ID for f in (oldFit, *newFits)]
+    assert fitIDs == list(range(oldFit.ID, oldFit.ID + 4))
+    moduleIDs = [m.ID for f in (oldFit, *newFits) for m in (*f.modules, *f.projectedModules)]
+    assert len(set(moduleIDs)) == len(moduleIDs)
+    assert min(moduleIDs[4:]) > max(moduleIDs[:4])
+
+    for fit in (oldFit, *newFits):
+        DB['db'].remove(fit)
+
+
+def test_saveFits_chunks(DB, Gamedata, Saveddata):
+    fits = [_makeFit(DB, Gamedata, Saveddata, "Fit {}".format(i)) for i in range(5)]
+    savedAmounts = []
+
+    def callback(savedAmount):
+        savedAmounts.append(savedAmount)
+        # Stop after second chunk
+        return savedAmount < 4
+
+    assert DB['db'].saveFits(fits, chunkSize=2, callback=callback) == 4
+    assert savedAmounts == [2, 4]
+    assert all(DB['db'].getFit(fit.ID) is fit for fit in fits[:4])
+    assert fits[4].ID is None
+
+    for fit in fits[:4]:
+        DB['db'].remove(fit)
+
+
+def test_saveFits_failedChunk(DB, Gamedata, Saveddata, monkeypatch):
+    char5 = Saveddata['Character'].getAll5()
+    fits = [_makeFit(DB, Gamedata, Saveddata, "Fit {}".format(i)) for i in range(4)]
+    commit = DB['saveddata_session'].commit
+    commits = []
+
+    def failingCommit():
+        commits.append(None)
+        if len(commits) == 2:
+            raise RuntimeError('failed')
+        commit()
+
+    monkeypatch.setattr(DB['saveddata_session'], 'commit', failingCommit)
+    with pytest.raises(RuntimeError):
+        DB['db'].saveFits(fits, chunkSize=2, attrs={'character': char5})
+    monkeypatch.undo()
+    # Attributes are set on fits of every chunk which was processed
+    assert all(fit.character is char5 for fit in fits)
+    # Failed chunk is rolled back, including fits made pending via character
+    assert not DB['saveddata_session'].new
+    assert all(DB['db'].getFit(fit.ID) is fit for fit in fits[:2])
+    assert all(fit not in DB['saveddata_session'] for fit in fits[2:])
+
+    DB['db'].removeFits(fits[:2])
+    assert all(DB['db'].getFit(fit.ID) is None for fit in fits[:2])
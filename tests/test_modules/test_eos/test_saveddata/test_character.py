@@ -0,0 +1,81 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import eos.config
+
+
+def _getShipAttrs(fit):
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    attrs = fit.ship.itemModifiedAttributes
+    return {key: attrs[key] for key in attrs.iterAfflictions()}
+
+
+def test_skillTemplates_replay(DB, Saveddata, RifterFit):
+    RifterFit.character = Saveddata['Character'].getAll5()
+    eos.config.settings['skillTemplates'] = False
+    try:
+        expected = _getShipAttrs(RifterFit)
+    finally:
+        eos.config.settings['skillTemplates'] = True
+    # First calculation records template, second replays it
+    assert _getShipAttrs(RifterFit) == expected
+    assert _getShipAttrs(RifterFit) == expected
+
+
+def test_skillTemplates_setLevel(DB, Saveddata, RifterFit):
+    character = Saveddata['Character']("Test Character", 5)
+    RifterFit.character = character
+    speed = _getShipAttrs(RifterFit)['maxVelocity']
+    character.getSkill("Navigation").setLevel(0, ignoreRestrict=True)
+    assert _getShipAttrs(RifterFit)['maxVelocity'] < speed
+
+
+def _getAllAttrs(fit):
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    attrs = {'ship': dict(fit.ship.itemModifiedAttributes)}
+    for i, mod in enumerate(fit.modules):
+        attrs['module', i] = dict(mod.itemModifiedAttributes)
+        attrs['charge', i] = dict(mod.chargeModifiedAttributes)
+    for i, drone in enumerate(fit.drones):
+        attrs['drone', i] = dict(drone.itemModifiedAttributes)
+    return attrs
+
+
+def test_skillTemplates_replayAllItems(DB, Saveddata, RifterFit, monkeypatch):
+    from eos.saveddata.drone import Drone
+    from eos.skillTemplate import SkillTemplate
+    RifterFit.character = Saveddata['Character'].getAll5()
+    for name in ("200mm AutoCannon II", "1MN Afterburner II", "Gyrostabilizer II"):
+        mod = Saveddata['Module'](DB['db'].getItem(name))
+        mod.owner = RifterFit
+        RifterFit.modules.append(mod)
+        mod.state = Saveddata['State'].ACTIVE if mod.isValidState(Saveddata['State'].ACTIVE) else Saveddata['State'].ONLINE
+    RifterFit.modules[0].charge = DB['db'].getItem("EMP S")
+    drone = Drone(DB['db'].getItem("Warrior II"))
+    drone.amount = drone.amountActive = 2
+    RifterFit.drones.append(drone)
+
+    monkeypatch.setitem(eos.config.settings, 'skillTemplates', False)
+    expected = _getAllAttrs(RifterFit)
+    monkeypatch.setitem(eos.config.settings, 'skillTemplates', True)
+    replays = []
+    replay = SkillTemplate.replay
+
+    def countingReplay(self, fit):
+        replays.append(fit)
+        return replay(self, fit)
+
+    monkeypatch.setattr(SkillTemplate, 'replay', countingReplay)
+    # First calculation records templates, second replays them
+    assert _getAllAttrs(RifterFit) == expected
+    assert not replays
+    assert _getAllAttrs(RifterFit) == expected
+    assert replays
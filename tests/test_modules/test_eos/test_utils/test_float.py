@@ -0,0 +1,19 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import math
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+from eos.utils.float import floatUnerr, floatUnerrArray
+
+
+def test_floatUnerrArray():
+    # Array version has to round the same way as scalar one, and leave
+    # values it can't round intact
+    values = [0, 0.1 + 0.2, 1 / 3, -2.675, 1e-300, 123456789.123456789, 7e22 / 3]
+    assert list(floatUnerrArray(values)) == [floatUnerr(v) for v in values]
+    assert list(floatUnerrArray([math.inf, -math.inf])) == [math.inf, -math.inf]
+    assert math.isnan(floatUnerrArray([math.nan])[0])
@@ -0,0 +1,54 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+from eos.utils.lruCache import LRUCache
+
+
+def test_lruCache_evictsLeastRecentlyUsed():
+    cache = LRUCache(maxSize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    stats = cache.getStats()
+    assert stats.hits == 3
+    assert stats.misses == 0
+    assert stats.evictions == 1
+    assert stats.size == 2
+
+
+def test_lruCache_unlimited():
+    cache = LRUCache()
+    for i in range(1000):
+        cache.set(i, i)
+    assert len(cache) == 1000
+    assert cache.get(1000) is None
+    assert cache.getStats().misses == 1
+
+
+def test_lruCache_shrink():
+    cache = LRUCache()
+    for i in range(10):
+        cache.set(i, i)
+    cache.maxSize = 3
+    assert len(cache) == 3
+    assert cache.get(9) == 9
+    assert cache.get(0) is None
+    assert cache.getStats().evictions == 7
+
+
+def test_lruCache_onEvict():
+    evicted = []
+    cache = LRUCache(maxSize=2, onEvict=lambda k, v: evicted.append((k, v)))
+    for i in range(4):
+        cache.set(i, i * 10)
+    cache.pop(3)
+    assert evicted == [(0, 0), (1, 10)]
@@ -0,0 +1,44 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+from eos.utils.searchIndex import SearchEntry, SearchIndex
+
+
+def _getIndex():
+    return SearchIndex([
+        SearchEntry(4, 'Large Shield Extender II', 'Large Shield Extender II', 'Shield Extender', 'Module', True),
+        SearchEntry(1, 'Medium Shield Extender II', 'Medium Shield Extender II', 'Shield Extender', 'Module', True),
+        SearchEntry(2, 'Large Armor Repairer II', 'Large Armor Repairer II', 'Armor Repair Unit', 'Module', True),
+        SearchEntry(3, 'Rifter', 'Rifter', 'Frigate', 'Ship', True),
+        SearchEntry(5, 'Hidden Rifter', 'Hidden Rifter', 'Frigate', 'Ship', False)])
+
+
+def test_search_plain():
+    index = _getIndex()
+    assert index.search(['shield', 'large']) == [4]
+    assert index.search(['ii']) == [1, 2, 4]
+    assert index.search(['missing']) == []
+
+
+def test_search_regex():
+    index = _getIndex()
+    # Jargon-expanded alternatives and wildcards
+    assert index.search(['(lse|large shield)']) == [4]
+    assert index.search(['l\\w*e shield']) == [4]
+    assert index.search(['^rift']) == [3]
+    # Broken regex matches nothing
+    assert index.search(['rifter(']) == []
+
+
+def test_search_filters():
+    index = _getIndex()
+    assert index.search(['r'], filters=[(('Ship',), ())]) == [3, 5]
+    assert index.search(['r'], filters=[((), ('Armor Repair Unit',)), (('Ship',), ())]) == [2, 3, 5]
+    assert index.search(['rifter'], forcePublished={}) == [3]
+    assert index.search(['rifter'], forcePublished={'Hidden Rifter': True}) == [3, 5]
+    assert index.search(['ii'], limit=2) == [1, 2]
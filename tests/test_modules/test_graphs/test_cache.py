@@ -0,0 +1,100 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import random
+import sys
+from copy import copy
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from eos.utils.float import floatUnerr
+from graphs.cache import PlotCache, TimeSeries
+
+
+def test_plotCache_invalidate():
+    cache = PlotCache(maxSize=10)
+    cache.set((1, None), 'a', [('fit', 1)])
+    cache.set((1, 2), 'b', [('fit', 1), ('fit', 2), ('setting', 'applyProjected')])
+    cache.set((3, 2), 'c', [('fit', 3), ('fit', 2)])
+    cache.invalidate(('setting', 'applyProjected'))
+    assert (1, 2) not in cache
+    assert cache.get((1, None)) == 'a'
+    cache.invalidate(('fit', 2))
+    assert (3, 2) not in cache
+    assert cache.get((1, None)) == 'a'
+    cache.invalidate(('fit', 1))
+    assert len(cache) == 0
+
+
+def test_plotCache_evictsLeastRecentlyUsed():
+    cache = PlotCache(maxSize=2)
+    cache.set('a', 1, [('fit', 1)])
+    cache.set('b', 2, [('fit', 1)])
+    assert cache.get('a') == 1
+    cache.set('c', 3, [('fit', 2)])
+    assert 'b' not in cache
+    # Evicted entry is not tracked by its tags anymore
+    cache.set('b', 4, [('fit', 2)])
+    cache.invalidate(('fit', 1))
+    assert 'b' in cache
+    assert 'a' not in cache
+
+
+def _makeChanges():
+    rng = random.Random(42)
+    changes = {}
+    for key in ('drone', 'launcher', 'turret'):
+        time = rng.choice((0, 0.3))
+        changes[key] = []
+        for _ in range(50):
+            changes[key].append((time, rng.randint(0, 5)))
+            time += rng.choice((0.1, 1.1, 2.7, 10))
+    return changes
+
+
+def _getSnapshots(changes):
+    """Time cache format used before series, full {key: value} copy per change time"""
+    changesByTime = {}
+    for key, keyChanges in changes.items():
+        for time, value in keyChanges:
+            changesByTime.setdefault(time, {})[key] = value
+    snapshots = {}
+    data = {}
+    for time in sorted(changesByTime):
+        data = copy(data)
+        data.update(changesByTime[time])
+        snapshots[time] = data
+    return snapshots
+
+
+def _getSnapshotPoint(snapshots, time):
+    timesBefore = [t for t in snapshots if floatUnerr(t) <= floatUnerr(time)]
+    if not timesBefore:
+        return {}
+    return snapshots[max(timesBefore)]
+
+
+def test_timeSeries_matchesSnapshots():
+    changes = _makeChanges()
+    series = TimeSeries()
+    for key, keyChanges in changes.items():
+        for time, value in keyChanges:
+            series.add(key, time, value)
+    snapshots = _getSnapshots(changes)
+    assert [(t, dict(d)) for t, d in series.iterPoints()] == list(snapshots.items())
+    for time in [-1, 0, 0.1 + 0.2, 0.3, 5.5, 100, 1000] + list(snapshots):
+        assert series.getPoint(time) == _getSnapshotPoint(snapshots, time)
+    for key, keyChanges in changes.items():
+        assert series.getLast(key) == keyChanges[-1][1]
+    assert series.getLast('missing', 7) == 7
+
+
+def test_timeSeries_sameTime():
+    # Value set again at the same time replaces previous one
+    series = TimeSeries()
+    series.add('a', 0, 1)
+    series.add('a', 1, 2)
+    series.add('a', 1, 3)
+    assert list((t, dict(d)) for t, d in series.iterPoints()) == [(0, {'a': 1}), (1, {'a': 3})]
+    assert series.getPoint(1) == {'a': 3}
@@ -0,0 +1,57 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import math
+import os
+import sys
+
+import numpy
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+from graphs.data.fitDamageStats.calc import application
+
+
+DISTANCES = [0, 1000, 7500, 15000, 30000, 60000]
+TGT_SPEEDS = [0, 50, 150, 400, 1200, 3000]
+TGT_SIG_RADII = [25, 40, 125, 400, 1000, 40000]
+
+
+def _assertClose(values, expected):
+    assert len(values) == len(expected)
+    for value, expectedValue in zip(values, expected):
+        assert math.isclose(value, expectedValue, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def test_turretArrays_matchScalar():
+    # Array versions of application math have to give the same results as
+    # point-by-point versions they replace in getters
+    for atkSpeed, atkAngle, tgtAngle in ((0, 0, 0), (300, 90, 0), (1500, 45, 180)):
+        args = (atkSpeed, atkAngle, 50, 10000, 5000, 0.05, 40)
+        tgtArgs = (tgtAngle, 35)
+        chances = application._calcTurretChanceToHitArray(
+            *args, numpy.array(DISTANCES, dtype=float), numpy.array(TGT_SPEEDS, dtype=float),
+            *tgtArgs, numpy.array(TGT_SIG_RADII, dtype=float))
+        expected = [
+            application._calcTurretChanceToHit(*args, d, s, tgtAngle, 35, r)
+            for d, s, r in zip(DISTANCES, TGT_SPEEDS, TGT_SIG_RADII)]
+        _assertClose(chances, expected)
+        _assertClose(application._calcTurretMultArray(chances), [application._calcTurretMult(c) for c in expected])
+
+
+def test_missileArrays_matchScalar():
+    for atkEr, atkEv, atkDrf in ((40, 150, 0.882), (125, 69, 0.5), (400, 100, 0.944)):
+        factors = application._calcMissileFactorArray(
+            atkEr, atkEv, atkDrf, numpy.array(TGT_SPEEDS, dtype=float), numpy.array(TGT_SIG_RADII, dtype=float))
+        expected = [
+            application._calcMissileFactor(atkEr, atkEv, atkDrf, s, r)
+            for s, r in zip(TGT_SPEEDS, TGT_SIG_RADII)]
+        _assertClose(factors, expected)
+
+
+def test_bombArrays_matchScalar():
+    for atkEr in (0, 40, 400):
+        factors = application._calcBombFactorArray(atkEr, numpy.array(TGT_SIG_RADII, dtype=float))
+        _assertClose(factors, [application._calcBombFactor(atkEr, r) for r in TGT_SIG_RADII])
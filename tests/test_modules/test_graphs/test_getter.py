@@ -0,0 +1,63 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import math
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+from graphs.data.base import SmoothPointGetter
+
+
+class StepGetter(SmoothPointGetter):
+
+    _baseResolution = 20
+    _extraDepth = 2
+
+    def _calculatePoint(self, x, miscParams, src, tgt, commonData):
+        return math.floor(math.sin(x) * 4) / 4
+
+
+class RangeStepGetter(StepGetter):
+
+    def _calculateRange(self, xs, miscParams, src, tgt, commonData):
+        # Getters processing arrays calculate all points of a level at once
+        return [self._calculatePoint(x, miscParams, src, tgt, commonData) for x in xs]
+
+
+def _getRangeRecursive(getter, xRange):
+    """Point-by-point recursive refinement getters used before points were batched"""
+    xs = []
+    ys = []
+
+    def addExtraPoints(x1, y1, x2, y2, depth):
+        if depth <= 0 or y1 == y2:
+            return
+        newX = (x1 + x2) / 2
+        newY = getter._calculatePoint(x=newX, miscParams=None, src=None, tgt=None, commonData={})
+        addExtraPoints(x1=prevX, y1=prevY, x2=newX, y2=newY, depth=depth - 1)
+        xs.append(newX)
+        ys.append(newY)
+        addExtraPoints(x1=newX, y1=newY, x2=x2, y2=y2, depth=depth - 1)
+
+    prevX = None
+    prevY = None
+    for x in getter._xIterLinear(xRange):
+        y = getter._calculatePoint(x=x, miscParams=None, src=None, tgt=None, commonData={})
+        if prevX is not None and prevY is not None:
+            addExtraPoints(x1=prevX, y1=prevY, x2=x, y2=y, depth=getter._extraDepth)
+        prevX = x
+        prevY = y
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
+
+
+def test_smoothPointGetter_matchesRecursive():
+    for getterClass in (StepGetter, RangeStepGetter):
+        getter = getterClass(graph=None)
+        for xRange in ((0, 10), (-3, 3), (5, 5)):
+            assert getter.getRange(xRange=xRange, miscParams=None, src=None, tgt=None) == _getRangeRecursive(getter, xRange)
@@ -0,0 +1,47 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+import threading
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from graphs.worker import PlotWorker, checkCancelled
+
+
+def test_submit_resultsAndFinish():
+    worker = PlotWorker(maxWorkers=3)
+    results = []
+    finished = threading.Event()
+
+    def job(i):
+        for j in range(3):
+            yield i, j
+
+    jobs = [lambda i=i: job(i) for i in range(5)]
+    worker.submit(jobs, onResult=results.append, onFinish=finished.set)
+    assert finished.wait(5)
+    assert sorted(results) == [(i, j) for i in range(5) for j in range(3)]
+    worker.shutdown()
+
+
+def test_submit_cancelsPrevious():
+    worker = PlotWorker(maxWorkers=2)
+    started = threading.Event()
+    results = []
+    finished = []
+
+    def endlessJob():
+        started.set()
+        while True:
+            checkCancelled()
+            yield None
+
+    worker.submit([endlessJob], onResult=lambda r: None, onFinish=lambda: finished.append('stale'))
+    assert started.wait(5)
+    # Waits for the endless job to stop
+    worker.submit([lambda: iter([1])], onResult=results.append, onFinish=lambda: finished.append('current'), background=False)
+    assert results == [1]
+    assert finished == ['current']
+    worker.shutdown()
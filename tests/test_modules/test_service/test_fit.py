@@ -8,6 +8,9 @@ sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
 # This import is here to hack around circular import issues
 import gui.mainFrame
 # noinspection PyPackageRequirements
+import eos.config
+from eos.const import FittingModuleState
+from eos.fitStatsCache import FitStatsCache
 from service.fit import Fit
 
 
@@ -31,3 +34,25 @@ def test_getFitsWithShip_RifterFit(DB, RifterFit):
     assert Fit.getFitsWithShip(587)[0][1] == 'My Rifter Fit'
 
     DB['db'].remove(RifterFit)
+
+
+def test_getFitStats(DB, Saveddata, RifterFit, monkeypatch, tmp_path):
+    monkeypatch.setattr(eos.config, 'gamedata_version', '1')
+    monkeypatch.setattr(Fit, 'statsCache', FitStatsCache(str(tmp_path / 'stats.db')))
+    sFit = Fit.getInstance()
+    DB['db'].save(RifterFit)
+
+    # Lookup without calculation gives only what is cached
+    assert sFit.getFitStats([RifterFit.ID], calculate=False) == {}
+    calculated = sFit.getFitStats([RifterFit.ID])[RifterFit.ID]
+    cached = sFit.getFitStats([RifterFit.ID], calculate=False)[RifterFit.ID]
+    assert cached.fit is RifterFit
+    assert (cached.dps, cached.ehp, cached.maxSpeed) == (calculated.dps, calculated.ehp, calculated.maxSpeed)
+
+    # Stats of fits affected by projections are never cached, so they are skipped
+    projected = Saveddata['Module'](DB['db'].getItem("Small Remote Armor Repairer II"))
+    RifterFit.projectedModules.append(projected)
+    projected.state = FittingModuleState.ACTIVE
+    assert sFit.getFitStats([RifterFit.ID]) == {}
+
+    DB['db'].remove(RifterFit)
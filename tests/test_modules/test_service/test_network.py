@@ -0,0 +1,82 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from service.network import Network, RequestError
+from service.settings import NetworkSettings
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Client ports requests came from
+    ports = []
+
+    def do_GET(self):
+        self.ports.append(self.client_address[1])
+        url = urlparse(self.path)
+        if url.path == '/missing':
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = json.dumps({'path': url.path, 'query': parse_qs(url.query)}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stubUrl():
+    settings = NetworkSettings.getInstance()
+    oldMode = settings.getMode()
+    # Local server should not be reached through proxy from environment
+    settings.setMode(NetworkSettings.PROXY_MODE_NONE)
+    _StubHandler.ports = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:{}'.format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+    settings.setMode(oldMode)
+
+
+def test_get_reusesConnection(stubUrl):
+    network = Network.getInstance()
+    for i in range(5):
+        resp = network.get('{}/item/{}'.format(stubUrl, i), Network.PRICES, timeout=5)
+        assert resp.json()['path'] == '/item/{}'.format(i)
+    assert len(set(_StubHandler.ports)) == 1
+
+
+def test_getMany(stubUrl):
+    network = Network.getInstance()
+    requestArgs = [('{}/item/{}'.format(stubUrl, i), {'types': str(i)}) for i in range(20)]
+    requestArgs.insert(3, ('{}/missing'.format(stubUrl), None))
+    resps = network.getMany(requestArgs, Network.PRICES, timeout=5)
+    assert len(resps) == 21
+    assert resps[3] is None
+    resps.pop(3)
+    for i, resp in enumerate(resps):
+        assert resp.json() == {'path': '/item/{}'.format(i), 'query': {'types': [str(i)]}}
+
+
+def test_getMany_allFailed(stubUrl):
+    network = Network.getInstance()
+    with pytest.raises(RequestError):
+        network.getMany([('{}/missing'.format(stubUrl), None)] * 3, Network.PRICES, timeout=5)
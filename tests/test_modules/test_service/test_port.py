@@ -0,0 +1,160 @@
+# Add root folder to python paths
+import csv
+import io
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+# noinspection PyPackageRequirements
+from eos.fitBatch import evaluateFits
+from eos.fitPool import _evaluateChunk, serializeCharacter, serializeDamagePattern, serializeFit
+from eos.fitStatsCache import FitStatsCache
+from gui.utils.progressHelper import ProgressHelper
+from service.fit import Fit
+from service.port import Port
+
+
+def test_exportFitStatsTable(DB, Saveddata, RifterFit, monkeypatch, tmp_path):
+    monkeypatch.setattr(Fit, 'statsCache', FitStatsCache(str(tmp_path / 'stats.db')))
+    DB['db'].save(RifterFit)
+    char5 = Saveddata['Character'].getAll5()
+    path = str(tmp_path / 'stats.csv')
+
+    assert Port.exportFitStatsTable([RifterFit], path, characters=[char5], processes=1)
+    with open(path, encoding='utf-8') as statsFile:
+        header, *lines = list(csv.reader(statsFile))
+    assert header[:5] == ["Fit ID", "Ship", "Fit", "Character", "Damage Pattern"]
+    assert len(lines) == 1
+
+    expected = evaluateFits([RifterFit], characters=[char5])[0]
+    line = dict(zip(header, lines[0]))
+    assert int(line["Fit ID"]) == RifterFit.ID
+    assert line["Ship"] == "Rifter"
+    assert line["Character"] == char5.name
+    assert float(line["DPS"]) == round(expected.dps, 2)
+    assert float(line["EHP"]) == round(expected.ehp, 2)
+    assert float(line["Max Speed"]) == round(expected.maxSpeed, 2)
+
+    DB['db'].remove(RifterFit)
+
+
+def test_evaluateChunk_failures(DB, Saveddata, RifterFit):
+    from eos.saveddata.damagePattern import DamagePattern
+    DB['db'].save(RifterFit)
+    charData = serializeCharacter(Saveddata['Character'].getAll5())
+    patternData = serializeDamagePattern(DamagePattern.getDefaultBuiltin())
+    entries = [
+        (0, {'ID': 1000}, charData, patternData),
+        (1, serializeFit(RifterFit), charData, patternData)]
+    # Broken fit is reported, and does not prevent others from being calculated
+    fitCount, results, failures = _evaluateChunk((entries, False))
+    assert fitCount == 2
+    assert [r[:3] for r in results] == [(1, 0, 0)]
+    assert [f[0] for f in failures] == [0]
+    assert failures[0][1].startswith('KeyError')
+
+    DB['db'].remove(RifterFit)
+
+
+def _getContents(fit):
+    return (
+        fit.ship.name, fit.name, fit.notes,
+        [m.item.name for m in fit.modules if not m.isEmpty],
+        [(d.item.name, d.amount) for d in fit.drones],
+        [(c.item.name, c.amount) for c in fit.cargo])
+
+
+def _writeXml(fits):
+    buffer = io.StringIO()
+    assert Port.writeXml(fits, buffer)
+    return buffer.getvalue()
+
+
+def test_xml_roundTrip(DB, Saveddata, RifterFit):
+    from eos.saveddata.cargo import Cargo
+    from eos.saveddata.drone import Drone
+    RifterFit.notes = 'Line 1\nLine "2" & 3'
+    for name in ("200mm AutoCannon II", "200mm AutoCannon II", "1MN Afterburner II"):
+        mod = Saveddata['Module'](DB['db'].getItem(name))
+        mod.owner = RifterFit
+        RifterFit.modules.append(mod)
+    drone = Drone(DB['db'].getItem("Warrior II"))
+    drone.amount = 2
+    RifterFit.drones.append(drone)
+    cargo = Cargo(DB['db'].getItem("EMP S"))
+    cargo.amount = 200
+    RifterFit.cargo.append(cargo)
+
+    text = _writeXml([RifterFit, RifterFit])
+    assert text.startswith('<?xml version="1.0" ?>\n<fittings count="2">\n')
+    # Binary source lets parser pick encoding from the document itself
+    fits = list(Port.iterXml(io.BytesIO(text.encode('utf-8'))))
+    assert len(fits) == 2
+    for fit in fits:
+        assert _getContents(fit) == _getContents(RifterFit)
+    # Parsed fits have to produce the very same document
+    assert _writeXml(fits) == text
+
+
+def test_iterXml_cancel(DB, RifterFit):
+    text = _writeXml([RifterFit, RifterFit])
+    progress = ProgressHelper("")
+    fits = Port.iterXml(io.StringIO(text), progress)
+    assert next(fits).ship.name == "Rifter"
+    progress.dlgWorking = False
+    assert list(fits) == []
+
+
+def test_importFitFromFiles_failed(DB, RifterFit, tmp_path):
+    # Fits saved before error must not stay in database
+    sFit = Fit.getInstance()
+    fitAmount = sFit.countAllFits()
+    goodPath = tmp_path / 'good.xml'
+    goodPath.write_text(_writeXml([RifterFit] * 3), encoding='utf-8')
+    brokenText = _writeXml([RifterFit] * 2)
+    brokenPath = tmp_path / 'broken.xml'
+    brokenPath.write_text(brokenText[:brokenText.index('</fitting>') + 20], encoding='utf-8')
+
+    success, message = Port.importFitFromFiles([str(goodPath), str(brokenPath)], chunkSize=2)
+    assert not success
+    assert message.startswith('Malformed XML')
+    assert sFit.countAllFits() == fitAmount
+    assert not DB['saveddata_session'].new
+
+
+def test_writeBackup(DB, RifterFit, tmp_path):
+    path = tmp_path / 'backup.xml'
+    path.write_text('old backup')
+    Port.writeBackup([RifterFit], str(path), ProgressHelper(""))
+    assert path.read_text(encoding='utf-8') == _writeXml([RifterFit])
+    assert os.listdir(str(tmp_path)) == ['backup.xml']
+
+
+def test_writeBackup_cancelled(DB, RifterFit, tmp_path):
+    # Previous backup must stay untouched, and temporary file removed
+    path = tmp_path / 'backup.xml'
+    path.write_text('old backup')
+    progress = ProgressHelper("")
+    progress.dlgWorking = False
+    Port.writeBackup([RifterFit], str(path), progress)
+    assert path.read_text() == 'old backup'
+    assert os.listdir(str(tmp_path)) == ['backup.xml']
+
+
+def test_writeBackup_failed(tmp_path, monkeypatch):
+    def writeXml(fits, file, progress=None):
+        file.write('<?xml version="1.0" ?>\n')
+        raise IOError('disk full')
+
+    monkeypatch.setattr(Port, 'writeXml', writeXml)
+    path = tmp_path / 'backup.xml'
+    path.write_text('old backup')
+    progress = ProgressHelper("")
+    Port.writeBackup([], str(path), progress)
+    assert progress.error == 'disk full'
+    assert path.read_text() == 'old backup'
+    assert os.listdir(str(tmp_path)) == ['backup.xml']
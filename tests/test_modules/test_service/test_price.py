@@ -0,0 +1,142 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+import threading
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# This import is here to hack around circular import issues
+import gui.mainFrame
+# noinspection PyPackageRequirements
+import service.price
+from service.price import Price, PriceWorkerThread
+
+
+class FakePrice:
+
+    def __init__(self, typeID, valid=False):
+        self.typeID = typeID
+        self.valid = valid
+        self.price = 0
+        self.time = 0
+        self.status = None
+
+    def isValid(self, validityOverride=None):
+        return self.valid
+
+
+def _recordFetches(monkeypatch):
+    fetches = []
+
+    def fetchPrices(prices, fetchTimeout, validityOverride):
+        fetches.append((sorted(p.typeID for p in prices), fetchTimeout, validityOverride))
+        for price in prices:
+            price.price = price.typeID * 10
+            price.time = 1
+            price.status = 'fetched'
+
+    monkeypatch.setattr(Price, 'fetchPrices', fetchPrices)
+    return fetches
+
+
+def _recordCallAfter(monkeypatch):
+    called = []
+    monkeypatch.setattr(service.price.wx, 'CallAfter', lambda callback: called.append(callback))
+    return called
+
+
+def test_processBatch_fetchesTypesOnce(monkeypatch):
+    fetches = _recordFetches(monkeypatch)
+    price1 = FakePrice(1)
+    price1Dupe = FakePrice(1)
+    price2 = FakePrice(2, valid=True)
+    price3 = FakePrice(3)
+    batch = [
+        (None, [price1, price2], 5, None),
+        (None, [price1Dupe, price3, price1], 30, None)]
+    PriceWorkerThread().processBatch(batch)
+    # Everything outdated is fetched in one go, with the longest timeout
+    assert fetches == [([1, 3], 30, 0)]
+    # Other objects of the same type get fetched data too
+    assert (price1Dupe.price, price1Dupe.status) == (10, 'fetched')
+    assert price2.status is None
+
+
+def test_processBatch_allValid(monkeypatch):
+    fetches = _recordFetches(monkeypatch)
+    PriceWorkerThread().processBatch([(None, [FakePrice(1, valid=True)], 5, None)])
+    assert fetches == []
+
+
+def test_finishBatch_callbacks(monkeypatch):
+    called = _recordCallAfter(monkeypatch)
+    worker = PriceWorkerThread()
+
+    def callback1():
+        pass
+
+    def callback2():
+        pass
+
+    def callback3():
+        pass
+
+    worker.inFlight = {1, 2}
+    worker.wait = {1: [callback1, callback2], 3: [callback3]}
+    worker.finishBatch([(callback1, [FakePrice(1)], 5, None), (callback1, [FakePrice(2)], 5, None)])
+    # Every callback is notified once, waiters for other types keep waiting
+    assert called == [callback1, callback2]
+    assert worker.wait == {3: [callback3]}
+    assert worker.inFlight == set()
+
+
+def test_setToWait(monkeypatch):
+    called = _recordCallAfter(monkeypatch)
+    worker = PriceWorkerThread()
+
+    def callback():
+        pass
+
+    # Valid prices which are not going to be fetched are reported right away
+    worker.setToWait([FakePrice(1, valid=True)], callback)
+    assert called == [callback]
+    assert worker.wait == {}
+    # Valid prices which are scheduled for fetching will change soon
+    worker.trigger([FakePrice(1)], None, 5, None)
+    worker.setToWait([FakePrice(1, valid=True)], callback)
+    assert called == [callback]
+    assert worker.wait == {1: [callback]}
+
+
+def test_worker_coalescesRequests(monkeypatch):
+    fetches = _recordFetches(monkeypatch)
+    monkeypatch.setattr(service.price.wx, 'CallAfter', lambda callback: callback())
+    monkeypatch.setattr(PriceWorkerThread, 'COALESCE_DELAY', 0.01)
+    worker = PriceWorkerThread()
+    worker.daemon = True
+    done = threading.Event()
+    notified = []
+
+    def makeCallback(name):
+        def callback():
+            notified.append(name)
+            if len(notified) == 3:
+                done.set()
+        return callback
+
+    # Requests made before worker gets to them are processed as one batch
+    worker.trigger([FakePrice(1), FakePrice(2)], makeCallback('first'), 5, None)
+    worker.trigger([FakePrice(2), FakePrice(3)], makeCallback('second'), 10, None)
+    worker.setToWait([FakePrice(3)], makeCallback('waiter'))
+    worker.start()
+    try:
+        assert done.wait(5)
+    finally:
+        worker.stop()
+        worker.join(5)
+    assert fetches == [([1, 2, 3], 10, 0)]
+    assert sorted(notified) == ['first', 'second', 'waiter']
+    assert worker.wait == {}
+    assert not worker.is_alive()